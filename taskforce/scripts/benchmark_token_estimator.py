@@ -0,0 +1,69 @@
+"""
+Benchmark the heuristic and tokenizer token estimators on recorded traces.
+
+Reports the mean absolute error of each estimator against the recorded
+prompt_tokens and its throughput. Recorded prompt_tokens also include tool
+schemas that are not part of the trace, so both errors are upper bounds.
+
+Usage:
+    python scripts/benchmark_token_estimator.py [traces.jsonl] [--encoding o200k_base]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import structlog
+
+from taskforce.core.domain.token_budgeter import HeuristicTokenEstimator, TokenBudgeter
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
+from taskforce.infrastructure.llm.token_estimator import TiktokenEstimator, load_local_encoding
+from taskforce.infrastructure.llm.trace_format import iter_traces
+
+DEFAULT_TRACES = Path(__file__).parents[1] / "traces" / "llm_traces.jsonl"
+
+
+def run(estimator: TokenEstimatorProtocol, traces: list[dict]) -> tuple[float, float]:
+    """Return (mean absolute % error vs. prompt_tokens, estimates per second)."""
+    budgeter = TokenBudgeter(estimator=estimator)
+    errors = []
+    start = time.perf_counter()
+    for record in traces:
+        actual = record["usage"]["prompt_tokens"]
+        errors.append(abs(budgeter.estimate_tokens(record["messages"]) - actual) / actual)
+    elapsed = time.perf_counter() - start
+    return sum(errors) / len(errors) * 100, len(traces) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("traces", nargs="?", type=Path, default=DEFAULT_TRACES)
+    parser.add_argument("--encoding", default="o200k_base")
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+
+    traces = [r for r in iter_traces(args.traces) if r.get("usage", {}).get("prompt_tokens")]
+    if not traces:
+        print(f"No traces with usage data in {args.traces}", file=sys.stderr)
+        return 1
+
+    estimators: list[tuple[str, TokenEstimatorProtocol]] = [
+        ("heuristic", HeuristicTokenEstimator())
+    ]
+    encoding = load_local_encoding(args.encoding)
+    if encoding is None:
+        print(f"Encoding {args.encoding} not available locally", file=sys.stderr)
+    else:
+        estimators.append((f"tiktoken:{args.encoding}", TiktokenEstimator(encoding)))
+
+    print(f"{len(traces)} traces from {args.traces}")
+    for name, estimator in estimators:
+        error, rate = run(estimator, traces)
+        print(f"{name:<22} {error:6.1f}% mean abs error  {rate:10.0f} prompts/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ from rich.text import Text
 from taskforce.api.cli.output_formatter import TaskforceConsole
 from taskforce.application.executor import AgentExecutor
 from taskforce.application.factory import AgentFactory
+from taskforce.infrastructure.llm.trace_writer import close_trace_writers
 from taskforce.infrastructure.tracing import init_tracing, shutdown_tracing
 
 app = typer.Typer(help="Interactive chat mode")
@@ -258,6 +259,8 @@ def chat(
             # Clean up MCP connections to avoid cancel scope errors
             if agent:
                 await agent.close()
+            # Write pending LLM traces
+            await close_trace_writers()
 
     # Run the async loop
     try:
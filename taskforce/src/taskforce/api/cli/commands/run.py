@@ -1,16 +1,20 @@
 """Run command - Execute agent missions."""
 
 import asyncio
+import json
+from pathlib import Path
 
 import typer
 from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 from rich.text import Text
 
 from taskforce.api.cli.output_formatter import TaskforceConsole
 from taskforce.application.executor import AgentExecutor
+from taskforce.infrastructure.llm.trace_writer import close_trace_writers
 
 app = typer.Typer(help="Execute agent missions")
 
@@ -109,6 +113,130 @@ def run_mission(
         )
 
 
+@app.command("batch")
+def run_batch(
+    ctx: typer.Context,
+    missions_file: Path = typer.Argument(
+        ..., help="File with missions: one per line, or a JSON list of strings"
+    ),
+    profile: str | None = typer.Option(None, "--profile", "-p", help="Configuration profile (overrides global --profile)"),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-c", min=1, help="Maximum number of missions running at once"
+    ),
+    lean: bool = typer.Option(
+        False, "--lean", "-l", help="Use LeanAgent (native tool calling, PlannerTool)"
+    ),
+    output: Path | None = typer.Option(
+        None, "--output", "-o", help="Write per-mission results as JSON lines to this file"
+    ),
+):
+    """Execute a batch of missions with bounded concurrency.
+
+    Results are printed as missions finish, followed by throughput,
+    token usage and p50/p95 latency of the whole batch.
+
+    Examples:
+        # Run missions from a text file, 8 at a time
+        taskforce run batch missions.txt --concurrency 8 --lean
+
+        # Store results for later analysis
+        taskforce run batch missions.json -o results.jsonl
+    """
+    global_opts = ctx.obj or {}
+    profile = profile or global_opts.get("profile", "dev")
+
+    tf_console = TaskforceConsole(debug=global_opts.get("debug", False))
+    if not missions_file.exists():
+        tf_console.print_error(f"Missions file not found: {missions_file}")
+        raise typer.Exit(1)
+
+    missions = _load_batch_missions(missions_file)
+    if not missions:
+        tf_console.print_error(f"No missions found in {missions_file}")
+        raise typer.Exit(1)
+
+    tf_console.print_system_message(
+        f"Batch: {len(missions)} missions, concurrency {concurrency}", "system"
+    )
+    tf_console.print_system_message(f"Profile: {profile}", "info")
+    tf_console.print_divider()
+
+    asyncio.run(_execute_batch(
+        missions=missions,
+        profile=profile,
+        concurrency=concurrency,
+        lean=lean,
+        output=output,
+        console=tf_console.console,
+    ))
+
+
+def _load_batch_missions(path: Path) -> list[str]:
+    """Read missions from a JSON list or a file with one mission per line."""
+    content = path.read_text(encoding="utf-8")
+    if content.lstrip().startswith("["):
+        return [str(mission) for mission in json.loads(content) if str(mission).strip()]
+    return [line.strip() for line in content.splitlines() if line.strip()]
+
+
+async def _execute_batch(
+    missions: list[str],
+    profile: str,
+    concurrency: int,
+    lean: bool,
+    output: Path | None,
+    console: Console,
+) -> None:
+    """Execute batch and print results as they finish."""
+    executor = AgentExecutor()
+    output_file = output.open("w", encoding="utf-8") if output else None
+
+    try:
+        async for update in executor.execute_batch_streaming(
+            missions=missions,
+            profile=profile,
+            max_concurrency=concurrency,
+            use_lean_agent=lean,
+        ):
+            if update.event_type == "mission_complete":
+                details = update.details
+                style = "green" if details["status"] == "completed" else "red"
+                console.print(
+                    f"[{style}]{details['status']:>9}[/{style}] "
+                    f"[dim]{details['duration_seconds']:6.2f}s[/dim] "
+                    f"#{details['index'] + 1} {details['mission'][:60]}"
+                )
+                if output_file:
+                    output_file.write(json.dumps(details, default=str) + "\n")
+
+            elif update.event_type == "batch_complete":
+                _print_batch_summary(update.details, console)
+    finally:
+        if output_file:
+            output_file.close()
+        await executor.close()
+        await close_trace_writers()
+
+
+def _print_batch_summary(summary: dict, console: Console) -> None:
+    """Print aggregate batch metrics as a table."""
+    table = Table(title="Batch Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white")
+
+    table.add_row("Missions", f"{summary['completed']}/{summary['total']} completed")
+    table.add_row("Failed", str(summary["failed"]))
+    table.add_row("Duration", f"{summary['duration_seconds']:.2f}s")
+    table.add_row("Throughput", f"{summary['missions_per_second']:.2f} missions/s")
+    table.add_row("Latency p50", f"{summary['latency_p50_seconds']:.2f}s")
+    table.add_row("Latency p95", f"{summary['latency_p95_seconds']:.2f}s")
+    for key, value in summary["token_usage"].items():
+        table.add_row(key.replace("_", " ").capitalize(), str(value))
+
+    console.print()
+    console.print(table)
+
+
 def _execute_standard_mission(
     mission: str,
     profile: str,
@@ -134,15 +262,20 @@ def _execute_standard_mission(
                 progress.update(task, description="[>] Working...")
 
         # Execute mission with progress tracking
-        result = asyncio.run(
-            executor.execute_mission(
-                mission=mission,
-                profile=profile,
-                session_id=session_id,
-                progress_callback=progress_callback,
-                use_lean_agent=lean,
-            )
-        )
+        async def execute():
+            try:
+                return await executor.execute_mission(
+                    mission=mission,
+                    profile=profile,
+                    session_id=session_id,
+                    progress_callback=progress_callback,
+                    use_lean_agent=lean,
+                )
+            finally:
+                # Write pending LLM traces before the event loop closes
+                await close_trace_writers()
+
+        result = asyncio.run(execute())
 
     tf_console.print_divider()
 
@@ -287,6 +420,9 @@ async def _execute_streaming_mission(
             if should_update:
                 live.update(build_display())
 
+    # Write pending LLM traces before the event loop closes
+    await close_trace_writers()
+
     # Final summary
     console.print()
     final_text = "".join(final_answer_tokens) if final_answer_tokens else "No answer generated"
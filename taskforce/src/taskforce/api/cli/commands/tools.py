@@ -75,3 +75,46 @@ def inspect_tool(
 
     asyncio.run(_inspect_tool())
 
+
+
+@app.command("migrate-results")
+def migrate_results(
+    store_dir: str = typer.Argument("./tool_results", help="FileToolResultStore directory"),
+    db_path: str = typer.Option(
+        None, "--db", help="Target SQLite database (default: <store_dir>/tool_results.sqlite3)"
+    ),
+    inline_threshold: int = typer.Option(
+        64 * 1024, "--inline-threshold", help="Largest payload in bytes stored inline"
+    ),
+):
+    """Migrate stored tool results from the directory layout to SQLite."""
+    from pathlib import Path
+
+    from taskforce.infrastructure.cache.sqlite_tool_result_store import (
+        SQLiteToolResultStore,
+    )
+
+    if not Path(store_dir, "handles").is_dir():
+        console.print(f"[red]No tool result store found in '{store_dir}'[/red]")
+        raise typer.Exit(1)
+
+    async def _migrate():
+        store = SQLiteToolResultStore(
+            db_path or Path(store_dir) / "tool_results.sqlite3",
+            inline_threshold=inline_threshold,
+        )
+        try:
+            report = await store.migrate_from_file_store(store_dir)
+            stats = await store.get_stats()
+        finally:
+            store.close()
+
+        console.print(
+            f"[green]Migrated {report['migrated']} results[/green] "
+            f"(skipped {report['skipped']}, failed {report['failed']}) "
+            f"to [cyan]{stats['db_path']}[/cyan]"
+        )
+        if report["failed"]:
+            raise typer.Exit(1)
+
+    asyncio.run(_migrate())
@@ -8,6 +8,8 @@ Supports synchronous and streaming (SSE) execution modes.
 Endpoints:
 - POST /execute - Synchronous mission execution
 - POST /execute/stream - Streaming mission execution via SSE
+- POST /execute/batch - Synchronous batch execution with bounded concurrency
+- POST /execute/batch/stream - Batch execution streaming results via SSE
 
 Both endpoints support:
 - Legacy Agent (ReAct loop with TodoList planning)
@@ -22,7 +24,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 
 from taskforce.application.executor import AgentExecutor
 
@@ -142,6 +144,101 @@ class ExecuteMissionResponse(BaseModel):
     )
 
 
+class ExecuteBatchRequest(BaseModel):
+    """Request body for batch mission execution.
+
+    Used by both `/execute/batch` and `/execute/batch/stream` endpoints.
+    Every mission runs in its own session; agents are shared across
+    missions of the batch.
+
+    Example::
+
+        {
+            "missions": ["Summarize doc A", "Summarize doc B"],
+            "profile": "dev",
+            "max_concurrency": 8,
+            "lean": true
+        }
+    """
+
+    missions: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Mission descriptions to execute.",
+    )
+    profile: str = Field(
+        default="dev",
+        description="Configuration profile (dev/staging/prod).",
+    )
+    max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum number of missions running at once.",
+    )
+    user_id: Optional[str] = Field(
+        default=None,
+        description="User ID for RAG security filtering."
+    )
+    org_id: Optional[str] = Field(
+        default=None,
+        description="Organization ID for RAG security filtering."
+    )
+    scope: Optional[str] = Field(
+        default=None,
+        description="Access scope for RAG security filtering."
+    )
+    lean: bool = Field(
+        default=False,
+        description="Use LeanAgent (native tool calling) instead of legacy."
+    )
+    agent_id: Optional[str] = Field(
+        default=None,
+        description="Custom agent ID to use (forces LeanAgent)."
+    )
+
+
+class BatchMissionResponse(BaseModel):
+    """Result of one mission within a batch."""
+
+    index: int = Field(..., description="Position of the mission in the request.")
+    session_id: str = Field(..., description="Session the mission ran in.")
+    status: str = Field(..., description="Execution status.")
+    message: str = Field(..., description="Final message or error description.")
+    duration_seconds: float = Field(..., description="Mission latency.")
+    token_usage: Optional[Dict[str, int]] = Field(
+        default=None, description="Token counts reported by the agent."
+    )
+    error: Optional[str] = Field(default=None, description="Error if the mission raised.")
+
+
+class ExecuteBatchResponse(BaseModel):
+    """Response from synchronous batch execution.
+
+    Attributes:
+        results: Per-mission results in request order.
+        summary: Aggregate metrics (total, completed, failed,
+            duration_seconds, missions_per_second, latency_p50_seconds,
+            latency_p95_seconds, token_usage).
+    """
+
+    results: List[BatchMissionResponse]
+    summary: Dict[str, Any]
+
+
+def _build_user_context(
+    request: Union[ExecuteMissionRequest, ExecuteBatchRequest],
+) -> Optional[Dict[str, Any]]:
+    """Build RAG user context if any security parameter is provided."""
+    if request.user_id or request.org_id or request.scope:
+        return {
+            "user_id": request.user_id,
+            "org_id": request.org_id,
+            "scope": request.scope,
+        }
+    return None
+
+
 @router.post("/execute", response_model=ExecuteMissionResponse)
 async def execute_mission(request: ExecuteMissionRequest):
     """Execute agent mission synchronously.
@@ -520,3 +617,92 @@ async def execute_mission_stream(request: ExecuteMissionRequest):
         event_generator(),
         media_type="text/event-stream"
     )
+
+
+@router.post("/execute/batch", response_model=ExecuteBatchResponse)
+async def execute_batch(request: ExecuteBatchRequest):
+    """Execute a batch of missions synchronously.
+
+    Runs up to `max_concurrency` missions at once and returns when all
+    missions have finished. A failing mission is reported with status
+    `failed` and does not abort the batch.
+
+    **Returns:**
+
+    - `results`: Per-mission results in request order
+    - `summary`: Throughput, token usage and p50/p95 latency
+
+    **Error Handling:**
+
+    - Returns HTTP 500 with error details if the batch cannot run
+    """
+    try:
+        batch = await executor.execute_batch(
+            missions=request.missions,
+            profile=request.profile,
+            max_concurrency=request.max_concurrency,
+            user_context=_build_user_context(request),
+            use_lean_agent=request.lean,
+            agent_id=request.agent_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return ExecuteBatchResponse(
+        results=[
+            BatchMissionResponse(
+                index=result.index,
+                session_id=result.session_id,
+                status=result.status,
+                message=result.final_message,
+                duration_seconds=result.duration_seconds,
+                token_usage=result.token_usage,
+                error=result.error,
+            )
+            for result in batch.results
+        ],
+        summary=asdict(batch.summary),
+    )
+
+
+@router.post("/execute/batch/stream")
+async def execute_batch_stream(request: ExecuteBatchRequest):
+    """Execute a batch of missions streaming results via Server-Sent Events.
+
+    Events are JSON-encoded `ProgressUpdate` objects:
+
+    - `batch_started`: once, with `total`, `profile` and `max_concurrency`
+    - `mission_complete`: per mission in completion order, with `index`,
+      `mission`, `session_id`, `status`, `final_message`,
+      `duration_seconds`, `token_usage` and `error`
+    - `batch_complete`: final event with the aggregate summary
+    - `error`: the batch could not run
+    """
+
+    async def event_generator():
+        try:
+            async for update in executor.execute_batch_streaming(
+                missions=request.missions,
+                profile=request.profile,
+                max_concurrency=request.max_concurrency,
+                user_context=_build_user_context(request),
+                use_lean_agent=request.lean,
+                agent_id=request.agent_id,
+            ):
+                data = json.dumps(asdict(update), default=str)
+                yield f"data: {data}\n\n"
+        except Exception as e:
+            error_data = json.dumps({
+                "timestamp": datetime.now().isoformat(),
+                "event_type": "error",
+                "message": f"Batch execution failed: {str(e)}",
+                "details": {"error": str(e), "error_type": type(e).__name__, "status_code": 500}
+            })
+            yield f"data: {error_data}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream"
+    )
@@ -1,12 +1,50 @@
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
+from taskforce.infrastructure.llm.load_balancer import get_pool_health
+from taskforce.infrastructure.llm.stream_metrics import get_stream_stats
+
 router = APIRouter()
 
 class HealthResponse(BaseModel):
     status: str
     version: str
 
+class DeploymentHealthResponse(BaseModel):
+    model: str
+    weight: float
+    state: str
+    latency_ewma_ms: float | None
+    latency_p95_ms: float | None
+    error_rate: float
+    requests: int
+    failures: int
+    consecutive_failures: int
+
+class ModelPoolHealthResponse(BaseModel):
+    alias: str
+    fallback: str | None
+    available: bool
+    hedges: int
+    hedge_wins: int
+    deployments: list[DeploymentHealthResponse]
+
+class StreamStatsResponse(BaseModel):
+    profile: str | None
+    model_alias: str
+    model: str
+    streams: int
+    ttft_p50_ms: float | None
+    ttft_p95_ms: float | None
+    first_tool_call_p50_ms: float | None
+    inter_token_mean_ms: float | None
+    tokens_per_second_p50: float | None
+
+class LLMHealthResponse(BaseModel):
+    status: str
+    pools: list[ModelPoolHealthResponse]
+    streaming: list[StreamStatsResponse]
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
     """Liveness probe - is the service running?"""
@@ -26,3 +64,24 @@ async def readiness_check():
             detail=f"Service not ready: {str(e)}"
         )
 
+@router.get("/health/llm", response_model=LLMHealthResponse)
+async def llm_health_check():
+    """LLM deployment health - latency, error rate and circuit state per deployment.
+
+    Status is "degraded" while any circuit is not closed and "unavailable"
+    while an alias has no deployment accepting requests. Streaming timings
+    are aggregated per profile, model alias and deployment.
+    """
+    pools = get_pool_health()
+    states = [d["state"] for pool in pools for d in pool["deployments"]]
+    if not all(pool["available"] for pool in pools):
+        llm_status = "unavailable"
+    elif any(state != "closed" for state in states):
+        llm_status = "degraded"
+    else:
+        llm_status = "healthy"
+    return LLMHealthResponse(
+        status=llm_status,
+        pools=[ModelPoolHealthResponse(**pool) for pool in pools],
+        streaming=[StreamStatsResponse(**stats) for stats in get_stream_stats()],
+    )
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from taskforce.api.routes import agents, execution, health, sessions, tools
+from taskforce.infrastructure.llm.trace_writer import close_trace_writers
 from taskforce.infrastructure.tracing import init_tracing, shutdown_tracing
 
 # Configure logging based on LOGLEVEL environment variable
@@ -43,6 +44,12 @@ async def lifespan(app: FastAPI):
         "fastapi.shutdown", message="Taskforce API shutting down..."
     )
 
+    # Close warm agents (MCP connections) held by the execution pool
+    await execution.executor.close()
+
+    # Write pending LLM interaction traces and close the trace file
+    await close_trace_writers()
+
     # Shutdown tracing last (flush all pending spans)
     shutdown_tracing()
 
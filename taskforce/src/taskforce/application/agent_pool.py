@@ -0,0 +1,323 @@
+"""
+Application Layer - Warm Agent Pool
+
+Keeps fully built agents (LLM provider, tools, MCP connections) between
+missions so AgentExecutor does not pay the factory setup cost - profile
+YAML parsing, LLM provider initialization, tool imports and MCP connects -
+on every request.
+
+Agents are pooled per key (profile, agent_id, lean flag and RAG user
+context - security filters are bound into the RAG tools at creation time).
+Each pooled agent serves one mission at a time; per-session state (plan,
+context pack, session-scoped tool cache) is reset when it is returned.
+Before an idle agent is reused, check_agent_connections() pings its MCP
+servers; agents with a dead connection are closed and rebuilt.
+
+Configuration (environment):
+    AGENT_POOL_ENABLED: "true" to pool agents (default: "false")
+    AGENT_POOL_MAX_SIZE: Max idle agents overall (default: 16)
+    AGENT_POOL_MAX_IDLE_PER_KEY: Max idle agents per key (default: 4)
+    AGENT_POOL_IDLE_TTL_SECONDS: Close agents idle longer than this (default: 300)
+    AGENT_POOL_MAX_USES: Recycle an agent after this many missions (default: 100)
+"""
+
+import inspect
+import json
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+PoolKey = tuple[str, str | None, bool, str | None]
+
+
+@dataclass
+class AgentPoolConfig:
+    """
+    Configuration for the warm agent pool.
+
+    Attributes:
+        enabled: Whether agents are pooled
+        max_size: Maximum idle agents across all keys
+        max_idle_per_key: Maximum idle agents per key
+        idle_ttl_seconds: Idle agents older than this are closed
+        max_uses: Missions served before an agent is recycled (0 = unlimited)
+    """
+
+    enabled: bool = False
+    max_size: int = 16
+    max_idle_per_key: int = 4
+    idle_ttl_seconds: float = 300.0
+    max_uses: int = 100
+
+    @classmethod
+    def from_env(cls) -> "AgentPoolConfig":
+        """
+        Create config from environment variables.
+
+        Environment Variables:
+            AGENT_POOL_ENABLED: "true" or "false" (default: "false")
+            AGENT_POOL_MAX_SIZE: Max idle agents overall (default: 16)
+            AGENT_POOL_MAX_IDLE_PER_KEY: Max idle agents per key (default: 4)
+            AGENT_POOL_IDLE_TTL_SECONDS: Idle eviction age (default: 300)
+            AGENT_POOL_MAX_USES: Missions per agent (default: 100)
+        """
+        return cls(
+            enabled=os.getenv("AGENT_POOL_ENABLED", "false").lower() == "true",
+            max_size=int(os.getenv("AGENT_POOL_MAX_SIZE", "16")),
+            max_idle_per_key=int(os.getenv("AGENT_POOL_MAX_IDLE_PER_KEY", "4")),
+            idle_ttl_seconds=float(os.getenv("AGENT_POOL_IDLE_TTL_SECONDS", "300")),
+            max_uses=int(os.getenv("AGENT_POOL_MAX_USES", "100")),
+        )
+
+
+async def check_agent_connections(agent: Any) -> bool:
+    """
+    Health check for pooled agents: every MCP connection answers a ping.
+
+    Connections opened by the factory are MCPConnections, which report
+    whether their owner task is alive and the server responds.
+
+    Args:
+        agent: Idle agent about to be reused
+
+    Returns:
+        True if all connections are healthy (or the agent has none)
+    """
+    for connection in getattr(agent, "_mcp_contexts", None) or []:
+        is_healthy = getattr(connection, "is_healthy", None)
+        if is_healthy is not None and not await is_healthy():
+            return False
+    return True
+
+
+@dataclass
+class _PooledAgent:
+    """Idle agent with its bookkeeping."""
+
+    agent: Any
+    uses: int
+    idle_since: float
+
+
+class AgentPool:
+    """
+    Pool of warm agents keyed by profile / agent definition.
+
+    acquire() returns an idle agent for the key (after a health check) or
+    builds a new one; release() resets the agent's per-session state and
+    returns it to the pool, or closes it when it failed, is worn out or the
+    pool is full. Idle agents are evicted after idle_ttl_seconds (checked on
+    every acquire/release and via evict_idle()).
+    """
+
+    def __init__(
+        self,
+        config: AgentPoolConfig | None = None,
+        health_check: Callable[[Any], bool | Awaitable[bool]] | None = None,
+    ):
+        """
+        Initialize agent pool.
+
+        Args:
+            config: Pool configuration (default: AgentPoolConfig())
+            health_check: Optional check run before an idle agent is reused;
+                returning False closes the agent and builds a new one
+        """
+        self.config = config or AgentPoolConfig(enabled=True)
+        self._health_check = health_check
+        # key -> idle agents, most recently released last
+        self._idle: dict[PoolKey, list[_PooledAgent]] = {}
+        # id(agent) -> use count of checked-out agents
+        self._in_use: dict[int, int] = {}
+        # Global LRU order of idle agents for max_size eviction
+        self._lru: OrderedDict[int, PoolKey] = OrderedDict()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "closed": 0,
+            "evicted_idle": 0,
+            "unhealthy": 0,
+        }
+        self.logger = logger.bind(component="agent_pool")
+
+    @staticmethod
+    def key_for(
+        profile: str,
+        agent_id: str | None = None,
+        use_lean_agent: bool = False,
+        user_context: dict[str, Any] | None = None,
+    ) -> PoolKey:
+        """
+        Build the pool key for an agent request.
+
+        Args:
+            profile: Configuration profile name
+            agent_id: Optional custom agent ID
+            use_lean_agent: Whether a LeanAgent is requested
+            user_context: Optional RAG user context (bound into RAG tools)
+
+        Returns:
+            Hashable pool key
+        """
+        context_key = json.dumps(user_context, sort_keys=True, default=str) if user_context else None
+        return (profile, agent_id, use_lean_agent, context_key)
+
+    @property
+    def idle_count(self) -> int:
+        """Number of idle agents across all keys."""
+        return len(self._lru)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with hits, misses, created, closed, evicted_idle,
+            unhealthy, idle and in_use counts
+        """
+        return {**self._stats, "idle": self.idle_count, "in_use": len(self._in_use)}
+
+    async def acquire(self, key: PoolKey, create: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a warm agent for the key, building one if none is idle.
+
+        Args:
+            key: Pool key from key_for()
+            create: Coroutine factory building a new agent
+
+        Returns:
+            Agent checked out for exclusive use until release()
+        """
+        await self.evict_idle()
+
+        idle = self._idle.get(key, [])
+        while idle:
+            pooled = idle.pop()
+            self._lru.pop(id(pooled.agent), None)
+            if await self._is_healthy(pooled.agent):
+                self._stats["hits"] += 1
+                self._in_use[id(pooled.agent)] = pooled.uses
+                return pooled.agent
+            self._stats["unhealthy"] += 1
+            await self._close(pooled.agent, reason="unhealthy")
+
+        self._stats["misses"] += 1
+        agent = await create()
+        self._stats["created"] += 1
+        self._in_use[id(agent)] = 0
+        self.logger.debug("agent_pool_created", profile=key[0], agent_id=key[1])
+        return agent
+
+    async def release(self, key: PoolKey, agent: Any, healthy: bool = True) -> None:
+        """
+        Return an agent after a mission.
+
+        Args:
+            key: Pool key the agent was acquired with
+            agent: Agent returned by acquire()
+            healthy: False if the mission failed with an exception - the
+                agent (and its connections) are discarded
+        """
+        uses = self._in_use.pop(id(agent), 0) + 1
+
+        if not healthy:
+            await self._close(agent, reason="failed")
+            return
+        if self.config.max_uses and uses >= self.config.max_uses:
+            await self._close(agent, reason="max_uses")
+            return
+
+        try:
+            reset = getattr(agent, "reset_session", None)
+            if reset is not None:
+                result = reset()
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            self.logger.warning("agent_pool_reset_failed", error=str(e))
+            await self._close(agent, reason="reset_failed")
+            return
+
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.config.max_idle_per_key:
+            await self._close(agent, reason="key_full")
+            return
+
+        idle.append(_PooledAgent(agent=agent, uses=uses, idle_since=time.monotonic()))
+        self._lru[id(agent)] = key
+        while len(self._lru) > self.config.max_size:
+            await self._evict_lru()
+
+        await self.evict_idle()
+
+    async def evict_idle(self) -> int:
+        """
+        Close agents idle longer than idle_ttl_seconds.
+
+        Returns:
+            Number of agents closed
+        """
+        if not self.config.idle_ttl_seconds:
+            return 0
+
+        cutoff = time.monotonic() - self.config.idle_ttl_seconds
+        expired: list[Any] = []
+        for key, idle in self._idle.items():
+            keep = [pooled for pooled in idle if pooled.idle_since > cutoff]
+            expired.extend(pooled.agent for pooled in idle if pooled.idle_since <= cutoff)
+            self._idle[key] = keep
+
+        for agent in expired:
+            self._lru.pop(id(agent), None)
+            self._stats["evicted_idle"] += 1
+            await self._close(agent, reason="idle")
+        return len(expired)
+
+    async def close(self) -> None:
+        """Close all idle agents (application shutdown)."""
+        idle = [pooled.agent for pooled_list in self._idle.values() for pooled in pooled_list]
+        self._idle.clear()
+        self._lru.clear()
+        for agent in idle:
+            await self._close(agent, reason="shutdown")
+
+    async def _evict_lru(self) -> None:
+        """Close the least recently released idle agent (pool over max_size)."""
+        agent_ref, key = self._lru.popitem(last=False)
+        idle = self._idle.get(key, [])
+        for index, pooled in enumerate(idle):
+            if id(pooled.agent) == agent_ref:
+                del idle[index]
+                await self._close(pooled.agent, reason="pool_full")
+                return
+
+    async def _is_healthy(self, agent: Any) -> bool:
+        """Run the configured health check (healthy if none configured)."""
+        if self._health_check is None:
+            return True
+        try:
+            result = self._health_check(agent)
+            if inspect.isawaitable(result):
+                result = await result
+            return bool(result)
+        except Exception as e:
+            self.logger.warning("agent_pool_health_check_failed", error=str(e))
+            return False
+
+    async def _close(self, agent: Any, reason: str) -> None:
+        """Close an agent that leaves the pool."""
+        self._stats["closed"] += 1
+        self.logger.debug("agent_pool_closed", reason=reason)
+        try:
+            await agent.close()
+        except Exception as e:
+            self.logger.warning("agent_pool_close_failed", error=str(e), reason=reason)
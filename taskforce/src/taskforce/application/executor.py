@@ -5,22 +5,32 @@ This module provides the service layer orchestrating agent execution.
 Both CLI and API entrypoints use this unified execution logic.
 
 The AgentExecutor:
-- Creates agents using AgentFactory based on profile
+- Creates agents using AgentFactory based on profile (or reuses warm
+  agents from an AgentPool when pooling is enabled)
 - Manages session lifecycle (load/create state)
 - Executes agent ReAct loop
 - Provides progress tracking via callbacks or streaming
+- Runs batches of missions with bounded concurrency and aggregate metrics
 - Handles comprehensive structured logging
 - Provides error handling with clear messages
 """
 
+import asyncio
+import math
+import time
 import uuid
 from collections.abc import AsyncIterator, Callable
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any
 
 import structlog
 
+from taskforce.application.agent_pool import (
+    AgentPool,
+    AgentPoolConfig,
+    check_agent_connections,
+)
 from taskforce.application.factory import AgentFactory
 from taskforce.core.domain.agent import Agent
 from taskforce.core.domain.lean_agent import LeanAgent
@@ -49,6 +59,73 @@ class ProgressUpdate:
     details: dict
 
 
+@dataclass
+class BatchMissionResult:
+    """Outcome of a single mission within a batch run.
+
+    Attributes:
+        index: Position of the mission in the submitted batch
+        mission: Mission description
+        session_id: Session the mission was executed in
+        status: Execution status (completed, failed, paused, pending)
+        final_message: Final agent message or error description
+        duration_seconds: Wall-clock latency of this mission
+        token_usage: Token counts reported by the agent (if any)
+        error: Error message if the mission raised an exception
+    """
+
+    index: int
+    mission: str
+    session_id: str
+    status: str
+    final_message: str
+    duration_seconds: float
+    token_usage: dict[str, int] | None = None
+    error: str | None = None
+
+
+@dataclass
+class BatchSummary:
+    """Aggregate metrics of a batch run.
+
+    Attributes:
+        total: Number of missions in the batch
+        completed: Missions finished with status "completed"
+        failed: Missions that raised an exception
+        duration_seconds: Wall-clock duration of the whole batch
+        missions_per_second: Throughput over the whole batch
+        latency_p50_seconds: Median mission latency
+        latency_p95_seconds: 95th percentile mission latency
+        token_usage: Token counts summed over all missions
+    """
+
+    total: int
+    completed: int
+    failed: int
+    duration_seconds: float
+    missions_per_second: float
+    latency_p50_seconds: float
+    latency_p95_seconds: float
+    token_usage: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """Per-mission results (in submission order) and aggregate summary."""
+
+    results: list[BatchMissionResult]
+    summary: BatchSummary
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of values (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
 class AgentExecutor:
     """Service layer orchestrating agent execution.
 
@@ -61,14 +138,27 @@ class AgentExecutor:
     different interfaces.
     """
 
-    def __init__(self, factory: AgentFactory | None = None):
+    def __init__(
+        self,
+        factory: AgentFactory | None = None,
+        agent_pool: AgentPool | None = None,
+    ):
         """Initialize AgentExecutor with optional factory.
 
         Args:
             factory: Optional AgentFactory instance. If not provided,
                     creates a default factory.
+            agent_pool: Optional pool of warm agents reused across missions.
+                    If not provided, a pool is created when AGENT_POOL_ENABLED
+                    is "true"; otherwise every mission builds and closes its
+                    own agent.
         """
         self.factory = factory or AgentFactory()
+        if agent_pool is None:
+            pool_config = AgentPoolConfig.from_env()
+            if pool_config.enabled:
+                agent_pool = AgentPool(pool_config, health_check=check_agent_connections)
+        self.agent_pool = agent_pool
         self.logger = logger.bind(component="agent_executor")
 
     async def execute_mission(
@@ -130,10 +220,13 @@ class AgentExecutor:
             agent_id=agent_id,
         )
 
+        pool_key = AgentPool.key_for(profile, agent_id, use_lean_agent, user_context)
         agent = None
+        completed = False
         try:
             # Create agent with appropriate adapters
-            agent = await self._create_agent(
+            agent = await self._acquire_agent(
+                pool_key,
                 profile,
                 user_context=user_context,
                 use_lean_agent=use_lean_agent,
@@ -163,6 +256,7 @@ class AgentExecutor:
                 duration_seconds=duration,
                 agent_id=agent_id,
             )
+            completed = True
 
             return result
 
@@ -180,9 +274,9 @@ class AgentExecutor:
             raise
 
         finally:
-            # Clean up MCP connections to avoid cancel scope errors
+            # Return to pool or clean up MCP connections to avoid cancel scope errors
             if agent:
-                await agent.close()
+                await self._release_agent(pool_key, agent, healthy=completed)
 
     async def execute_mission_streaming(
         self,
@@ -242,10 +336,13 @@ class AgentExecutor:
             },
         )
 
+        pool_key = AgentPool.key_for(profile, agent_id, use_lean_agent, user_context)
         agent = None
+        completed = False
         try:
             # Create agent
-            agent = await self._create_agent(
+            agent = await self._acquire_agent(
+                pool_key,
                 profile,
                 user_context=user_context,
                 use_lean_agent=use_lean_agent,
@@ -265,6 +362,7 @@ class AgentExecutor:
             self.logger.info(
                 "mission.streaming.completed", session_id=session_id, agent_id=agent_id
             )
+            completed = True
 
         except Exception as e:
             self.logger.error(
@@ -286,9 +384,298 @@ class AgentExecutor:
             raise
 
         finally:
-            # Clean up MCP connections to avoid cancel scope errors
+            # Return to pool or clean up MCP connections to avoid cancel scope errors.
+            # Streams abandoned by the consumer are not reused either.
+            if agent:
+                await self._release_agent(pool_key, agent, healthy=completed)
+
+    async def execute_batch(
+        self,
+        missions: list[str],
+        profile: str = "dev",
+        max_concurrency: int = 4,
+        user_context: dict[str, Any] | None = None,
+        use_lean_agent: bool = False,
+        agent_id: str | None = None,
+        result_callback: Callable[[BatchMissionResult], None] | None = None,
+    ) -> BatchResult:
+        """Execute a batch of missions with bounded concurrency.
+
+        Each mission runs in its own session. Agents (LLM service, tool
+        instances, MCP connections) are shared across missions through the
+        agent pool: at most max_concurrency agents are built for the batch.
+        A failing mission is reported in its result and does not abort the
+        batch.
+
+        Args:
+            missions: Mission descriptions
+            profile: Configuration profile (dev/staging/prod)
+            max_concurrency: Maximum number of missions running at once
+            user_context: Optional user context for RAG security filtering
+            use_lean_agent: If True, use LeanAgent instead of legacy Agent
+            agent_id: Optional custom agent ID (forces LeanAgent)
+            result_callback: Optional callback invoked as each mission finishes
+
+        Returns:
+            BatchResult with per-mission results in submission order and
+            aggregate throughput, token and latency metrics
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        start = time.perf_counter()
+        results: list[BatchMissionResult] = []
+        async for result in self._run_batch(
+            missions, profile, max_concurrency, user_context, use_lean_agent, agent_id
+        ):
+            results.append(result)
+            if result_callback:
+                result_callback(result)
+
+        summary = self._summarize_batch(results, time.perf_counter() - start)
+        results.sort(key=lambda result: result.index)
+        return BatchResult(results=results, summary=summary)
+
+    async def execute_batch_streaming(
+        self,
+        missions: list[str],
+        profile: str = "dev",
+        max_concurrency: int = 4,
+        user_context: dict[str, Any] | None = None,
+        use_lean_agent: bool = False,
+        agent_id: str | None = None,
+    ) -> AsyncIterator[ProgressUpdate]:
+        """Execute a batch of missions, streaming results as they finish.
+
+        Yields a "batch_started" update, one "mission_complete" update per
+        mission in completion order (details: BatchMissionResult fields) and
+        a final "batch_complete" update (details: BatchSummary fields).
+
+        Args:
+            missions: Mission descriptions
+            profile: Configuration profile (dev/staging/prod)
+            max_concurrency: Maximum number of missions running at once
+            user_context: Optional user context for RAG security filtering
+            use_lean_agent: If True, use LeanAgent instead of legacy Agent
+            agent_id: Optional custom agent ID (forces LeanAgent)
+
+        Yields:
+            ProgressUpdate objects for batch and mission events
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        start = time.perf_counter()
+        yield ProgressUpdate(
+            timestamp=datetime.now(),
+            event_type="batch_started",
+            message=f"Starting batch of {len(missions)} missions",
+            details={
+                "total": len(missions),
+                "profile": profile,
+                "max_concurrency": max_concurrency,
+                "agent_id": agent_id,
+            },
+        )
+
+        results: list[BatchMissionResult] = []
+        async for result in self._run_batch(
+            missions, profile, max_concurrency, user_context, use_lean_agent, agent_id
+        ):
+            results.append(result)
+            yield ProgressUpdate(
+                timestamp=datetime.now(),
+                event_type="mission_complete",
+                message=f"Mission {result.index + 1}/{len(missions)}: {result.status}",
+                details=asdict(result),
+            )
+
+        summary = self._summarize_batch(results, time.perf_counter() - start)
+        yield ProgressUpdate(
+            timestamp=datetime.now(),
+            event_type="batch_complete",
+            message=f"Batch finished: {summary.completed}/{summary.total} completed",
+            details=asdict(summary),
+        )
+
+    async def close(self) -> None:
+        """Close all warm agents held by the agent pool (application shutdown)."""
+        if self.agent_pool is not None:
+            await self.agent_pool.close()
+
+    async def _run_batch(
+        self,
+        missions: list[str],
+        profile: str,
+        max_concurrency: int,
+        user_context: dict[str, Any] | None,
+        use_lean_agent: bool,
+        agent_id: str | None,
+    ) -> AsyncIterator[BatchMissionResult]:
+        """Run missions concurrently and yield results in completion order."""
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.logger.info(
+            "batch.execution.started",
+            total=len(missions),
+            profile=profile,
+            max_concurrency=max_concurrency,
+            use_lean_agent=use_lean_agent,
+            agent_id=agent_id,
+        )
+
+        # Without an application-wide pool, share agents within this batch only
+        pool = self.agent_pool
+        owns_pool = pool is None
+        if pool is None:
+            pool = AgentPool(
+                AgentPoolConfig(
+                    enabled=True,
+                    max_size=max_concurrency,
+                    max_idle_per_key=max_concurrency,
+                    idle_ttl_seconds=0,
+                    max_uses=0,
+                ),
+                health_check=check_agent_connections,
+            )
+        pool_key = AgentPool.key_for(profile, agent_id, use_lean_agent, user_context)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create() -> Agent | LeanAgent:
+            return await self._create_agent(
+                profile,
+                user_context=user_context,
+                use_lean_agent=use_lean_agent,
+                agent_id=agent_id,
+            )
+
+        async def run(index: int, mission: str) -> BatchMissionResult:
+            async with semaphore:
+                return await self._run_batch_mission(pool, pool_key, create, index, mission)
+
+        tasks = [asyncio.create_task(run(index, mission)) for index, mission in enumerate(missions)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owns_pool:
+                # Agents were built in the mission tasks; their MCPConnections
+                # close in their own owner tasks, so closing from here is safe
+                await pool.close()
+
+    async def _run_batch_mission(
+        self,
+        pool: AgentPool,
+        pool_key: tuple,
+        create: Callable[[], Any],
+        index: int,
+        mission: str,
+    ) -> BatchMissionResult:
+        """Execute one batch mission on a pooled agent, capturing failures."""
+        session_id = self._generate_session_id()
+        start = time.perf_counter()
+        agent = None
+        completed = False
+        try:
+            agent = await pool.acquire(pool_key, create)
+            result = await self._execute_with_progress(
+                agent=agent,
+                mission=mission,
+                session_id=session_id,
+                progress_callback=None,
+            )
+            completed = True
+            return BatchMissionResult(
+                index=index,
+                mission=mission,
+                session_id=session_id,
+                status=result.status,
+                final_message=result.final_message,
+                duration_seconds=time.perf_counter() - start,
+                token_usage=result.token_usage,
+            )
+
+        except Exception as e:
+            self.logger.error(
+                "batch.mission.failed",
+                index=index,
+                session_id=session_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return BatchMissionResult(
+                index=index,
+                mission=mission,
+                session_id=session_id,
+                status="failed",
+                final_message=f"Execution failed: {str(e)}",
+                duration_seconds=time.perf_counter() - start,
+                error=str(e),
+            )
+
+        finally:
             if agent:
-                await agent.close()
+                await pool.release(pool_key, agent, healthy=completed)
+
+    def _summarize_batch(
+        self, results: list[BatchMissionResult], duration_seconds: float
+    ) -> BatchSummary:
+        """Aggregate throughput, token usage and latency percentiles."""
+        latencies = [result.duration_seconds for result in results]
+        token_usage: dict[str, int] = {}
+        for result in results:
+            for key, value in (result.token_usage or {}).items():
+                if isinstance(value, int):
+                    token_usage[key] = token_usage.get(key, 0) + value
+
+        summary = BatchSummary(
+            total=len(results),
+            completed=sum(1 for result in results if result.status == "completed"),
+            failed=sum(1 for result in results if result.error is not None),
+            duration_seconds=duration_seconds,
+            missions_per_second=len(results) / duration_seconds if duration_seconds > 0 else 0.0,
+            latency_p50_seconds=_percentile(latencies, 0.5),
+            latency_p95_seconds=_percentile(latencies, 0.95),
+            token_usage=token_usage,
+        )
+        self.logger.info("batch.execution.completed", **asdict(summary))
+        return summary
+
+    async def _acquire_agent(
+        self,
+        pool_key: tuple,
+        profile: str,
+        user_context: dict[str, Any] | None = None,
+        use_lean_agent: bool = False,
+        agent_id: str | None = None,
+    ) -> Agent | LeanAgent:
+        """Get a warm agent from the pool, or create a fresh one without pool."""
+
+        async def create() -> Agent | LeanAgent:
+            return await self._create_agent(
+                profile,
+                user_context=user_context,
+                use_lean_agent=use_lean_agent,
+                agent_id=agent_id,
+            )
+
+        if self.agent_pool is None:
+            return await create()
+        agent: Agent | LeanAgent = await self.agent_pool.acquire(pool_key, create)
+        return agent
+
+    async def _release_agent(
+        self, pool_key: tuple, agent: Agent | LeanAgent, healthy: bool
+    ) -> None:
+        """Return agent to the pool, or close it when pooling is disabled."""
+        if self.agent_pool is None:
+            await agent.close()
+            return
+        await self.agent_pool.release(pool_key, agent, healthy=healthy)
 
     async def _create_agent(
         self,
@@ -27,9 +27,11 @@ from taskforce.core.domain.context_policy import ContextPolicy
 from taskforce.core.domain.lean_agent import LeanAgent
 from taskforce.core.domain.router import QueryRouter
 from taskforce.core.interfaces.llm import LLMProviderProtocol
+from taskforce.infrastructure.cache.single_flight import ToolCallCoalescer
 from taskforce.infrastructure.cache.tool_cache import ToolResultCache
 from taskforce.infrastructure.persistence.file_todolist import FileTodoListManager
 from taskforce.core.interfaces.state import StateManagerProtocol
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
 from taskforce.core.interfaces.tools import ToolProtocol
 from taskforce.core.prompts import build_system_prompt, format_tools_description
 from taskforce.infrastructure.tools.filters import simplify_wiki_list_output
@@ -117,7 +119,7 @@ class AgentFactory:
 
         # Instantiate infrastructure adapters
         state_manager = self._create_state_manager(config)
-        llm_provider = self._create_llm_provider(config)
+        llm_provider = self._create_llm_provider(config, profile)
 
         # Select tools: config tools override specialist defaults
         tools_config = config.get("tools", [])
@@ -175,8 +177,7 @@ class AgentFactory:
         # TTL can be configured per profile (default: 1 hour, 0 = session lifetime)
         cache_config = config.get("cache", {})
         cache_ttl = cache_config.get("tool_cache_ttl", 3600)
-        enable_cache = cache_config.get("enable_tool_cache", True)
-        tool_cache = ToolResultCache(default_ttl=cache_ttl) if enable_cache else None
+        tool_cache = self._create_tool_cache(config)
 
         if tool_cache:
             self.logger.debug(
@@ -270,7 +271,7 @@ class AgentFactory:
 
         # Instantiate infrastructure adapters
         state_manager = self._create_state_manager(config)
-        llm_provider = self._create_llm_provider(config)
+        llm_provider = self._create_llm_provider(config, profile)
 
         # RAG agent tools are now specified in config (includes RAG + native tools)
         # user_context is injected into RAG tools
@@ -290,8 +291,7 @@ class AgentFactory:
         # Create tool result cache for session-scoped caching
         cache_config = config.get("cache", {})
         cache_ttl = cache_config.get("tool_cache_ttl", 3600)
-        enable_cache = cache_config.get("enable_tool_cache", True)
-        tool_cache = ToolResultCache(default_ttl=cache_ttl) if enable_cache else None
+        tool_cache = self._create_tool_cache(config)
 
         if tool_cache:
             self.logger.debug(
@@ -392,7 +392,7 @@ class AgentFactory:
 
         # Instantiate infrastructure adapters (reuse existing methods)
         state_manager = self._create_state_manager(config)
-        llm_provider = self._create_llm_provider(config)
+        llm_provider = self._create_llm_provider(config, profile)
 
         # Create tools - LeanAgent will add PlannerTool if not present
         # Pass user_context for RAG tools if provided
@@ -422,6 +422,18 @@ class AgentFactory:
         # Get max_steps from config (defaults to LeanAgent.DEFAULT_MAX_STEPS if not specified)
         agent_config = config.get("agent", {})
         max_steps = agent_config.get("max_steps")  # None means use agent default
+        parallel_tool_calls = agent_config.get("parallel_tool_calls", False)
+        max_parallel_tools = agent_config.get("max_parallel_tools")
+        token_estimator = self._create_token_estimator(config, model_alias)
+        enable_checkpoints = agent_config.get("checkpointing", False)
+        eager_tool_dispatch = agent_config.get("eager_tool_dispatch", False)
+        prompt_cache_layout = agent_config.get("prompt_cache_layout", False)
+        tool_selection_top_k = agent_config.get("tool_selection_top_k")
+        tool_cache = self._create_tool_cache(config)
+        tool_coalescer = self._create_tool_coalescer(agent_config)
+        background_compaction = agent_config.get("background_compaction", False)
+        compaction_model_alias = agent_config.get("compaction_model", "fast")
+        summarize_history = agent_config.get("summarize_history", True)
 
         self.logger.debug(
             "lean_agent_created",
@@ -430,6 +442,7 @@ class AgentFactory:
             model_alias=model_alias,
             context_policy_max_items=context_policy.max_items,
             max_steps=max_steps or "default",
+            parallel_tool_calls=parallel_tool_calls,
         )
 
         agent = LeanAgent(
@@ -440,6 +453,18 @@ class AgentFactory:
             model_alias=model_alias,
             context_policy=context_policy,
             max_steps=max_steps,
+            parallel_tool_calls=parallel_tool_calls,
+            max_parallel_tools=max_parallel_tools,
+            token_estimator=token_estimator,
+            enable_checkpoints=enable_checkpoints,
+            eager_tool_dispatch=eager_tool_dispatch,
+            prompt_cache_layout=prompt_cache_layout,
+            tool_selection_top_k=tool_selection_top_k,
+            tool_cache=tool_cache,
+            tool_coalescer=tool_coalescer,
+            background_compaction=background_compaction,
+            compaction_model_alias=compaction_model_alias,
+            summarize_history=summarize_history,
         )
 
         # Store MCP contexts on agent for lifecycle management
@@ -561,7 +586,7 @@ class AgentFactory:
 
         # Instantiate infrastructure adapters
         state_manager = self._create_state_manager(config)
-        llm_provider = self._create_llm_provider(config)
+        llm_provider = self._create_llm_provider(config, profile)
 
         # Create tools filtered by allowlist
         tools = await self._create_tools_from_allowlist(
@@ -586,6 +611,18 @@ class AgentFactory:
         # Get max_steps from config (defaults to LeanAgent.DEFAULT_MAX_STEPS if not specified)
         agent_config = config.get("agent", {})
         max_steps = agent_config.get("max_steps")  # None means use agent default
+        parallel_tool_calls = agent_config.get("parallel_tool_calls", False)
+        max_parallel_tools = agent_config.get("max_parallel_tools")
+        token_estimator = self._create_token_estimator(config, model_alias)
+        enable_checkpoints = agent_config.get("checkpointing", False)
+        eager_tool_dispatch = agent_config.get("eager_tool_dispatch", False)
+        prompt_cache_layout = agent_config.get("prompt_cache_layout", False)
+        tool_selection_top_k = agent_config.get("tool_selection_top_k")
+        tool_cache = self._create_tool_cache(config)
+        tool_coalescer = self._create_tool_coalescer(agent_config)
+        background_compaction = agent_config.get("background_compaction", False)
+        compaction_model_alias = agent_config.get("compaction_model", "fast")
+        summarize_history = agent_config.get("summarize_history", True)
 
         self.logger.debug(
             "lean_agent_from_definition_created",
@@ -595,6 +632,7 @@ class AgentFactory:
             prompt_length=len(system_prompt),
             context_policy_max_items=context_policy.max_items,
             max_steps=max_steps or "default",
+            parallel_tool_calls=parallel_tool_calls,
         )
 
         agent = LeanAgent(
@@ -605,6 +643,18 @@ class AgentFactory:
             model_alias=model_alias,
             context_policy=context_policy,
             max_steps=max_steps,
+            parallel_tool_calls=parallel_tool_calls,
+            max_parallel_tools=max_parallel_tools,
+            token_estimator=token_estimator,
+            enable_checkpoints=enable_checkpoints,
+            eager_tool_dispatch=eager_tool_dispatch,
+            prompt_cache_layout=prompt_cache_layout,
+            tool_selection_top_k=tool_selection_top_k,
+            tool_cache=tool_cache,
+            tool_coalescer=tool_coalescer,
+            background_compaction=background_compaction,
+            compaction_model_alias=compaction_model_alias,
+            summarize_history=summarize_history,
         )
 
         # Store MCP contexts on agent for lifecycle management
@@ -830,22 +880,87 @@ class AgentFactory:
         else:
             raise ValueError(f"Unknown persistence type: {persistence_type}")
 
-    def _create_llm_provider(self, config: dict) -> LLMProviderProtocol:
+    def _create_llm_provider(
+        self, config: dict, profile: Optional[str] = None
+    ) -> LLMProviderProtocol:
         """
         Create LLM provider based on configuration.
 
         Args:
             config: Configuration dictionary
+            profile: Profile name (groups the provider's streaming metrics)
 
         Returns:
-            LLM provider implementation (OpenAI)
+            LLM provider implementation (OpenAI, or replay of recorded traces)
         """
+        llm_config = config.get("llm", {})
+
+        if llm_config.get("provider") == "replay":
+            from taskforce.infrastructure.llm.replay_service import ReplayLLMProvider
+
+            return ReplayLLMProvider.from_config(llm_config.get("replay", {}))
+
         from taskforce.infrastructure.llm.openai_service import OpenAIService
 
+        config_path = llm_config.get("config_path", "configs/llm_config.yaml")
+
+        return OpenAIService(config_path=config_path, profile=profile)
+
+    def _create_token_estimator(
+        self, config: dict, model_alias: str
+    ) -> TokenEstimatorProtocol:
+        """
+        Create tokenizer-backed token estimator for the agent's model alias.
+
+        Args:
+            config: Configuration dictionary
+            model_alias: Model alias used by the agent
+
+        Returns:
+            Token estimator (falls back to the heuristic if no local tokenizer)
+        """
+        from taskforce.infrastructure.llm.token_estimator import create_token_estimator
+
         llm_config = config.get("llm", {})
         config_path = llm_config.get("config_path", "configs/llm_config.yaml")
 
-        return OpenAIService(config_path=config_path)
+        return create_token_estimator(config_path=config_path, model_alias=model_alias)
+
+    def _create_tool_cache(self, config: dict) -> Optional[ToolResultCache]:
+        """
+        Create session-scoped tool result cache for LeanAgent memoization.
+
+        Args:
+            config: Configuration dictionary (cache.enable_tool_cache, cache.tool_cache_ttl,
+                cache.tool_cache_max_bytes, cache.tool_cache_max_entries)
+
+        Returns:
+            ToolResultCache, or None if disabled
+        """
+        cache_config = config.get("cache", {})
+        if not cache_config.get("enable_tool_cache", True):
+            return None
+        return ToolResultCache(
+            default_ttl=cache_config.get("tool_cache_ttl", 3600),
+            max_bytes=cache_config.get("tool_cache_max_bytes", ToolResultCache.DEFAULT_MAX_BYTES),
+            max_entries=cache_config.get(
+                "tool_cache_max_entries", ToolResultCache.DEFAULT_MAX_ENTRIES
+            ),
+        )
+
+    def _create_tool_coalescer(self, agent_config: dict) -> ToolCallCoalescer | None:
+        """
+        Create the tool call coalescer for LeanAgent.
+
+        Args:
+            agent_config: Agent configuration (agent.coalesce_tool_calls)
+
+        Returns:
+            ToolCallCoalescer on the process-wide "tools" group, or None if disabled
+        """
+        if not agent_config.get("coalesce_tool_calls", False):
+            return None
+        return ToolCallCoalescer()
 
     def _create_native_tools(
         self, config: dict, llm_provider: LLMProviderProtocol, user_context: Optional[dict[str, Any]] = None
@@ -916,8 +1031,10 @@ class AgentFactory:
                 env: {"API_KEY": "value"}
               - type: sse
                 url: http://localhost:8000/sse
+                parallel_tools: ["wiki_get_page", "wiki_search"]
+                cacheable_tools: ["wiki_get_page", "wiki_search"]
         """
-        from taskforce.infrastructure.tools.mcp.client import MCPClient
+        from taskforce.infrastructure.tools.mcp.client import MCPClient, MCPConnection
         from taskforce.infrastructure.tools.mcp.wrapper import MCPToolWrapper
 
         mcp_servers_config = config.get("mcp_servers", [])
@@ -926,11 +1043,15 @@ class AgentFactory:
             self.logger.debug("no_mcp_servers_configured")
             return [], []
         
-        mcp_tools = []
-        client_contexts = []
+        mcp_tools: list[ToolProtocol] = []
+        client_contexts: list[Any] = []
         
         for server_config in mcp_servers_config:
             server_type = server_config.get("type")
+            # Read-only MCP tools that may run concurrently (e.g. wiki_get_page)
+            parallel_tools = set(server_config.get("parallel_tools", []))
+            # Read-only MCP tools whose results may be memoized per session
+            cacheable_tools = set(server_config.get("cacheable_tools", []))
             
             try:
                 if server_type == "stdio":
@@ -954,8 +1075,11 @@ class AgentFactory:
                         args=args,
                     )
                     
-                    # Create context manager but don't enter yet
-                    ctx = MCPClient.create_stdio(command, args, env)
+                    # Non-cacheable tools of this server invalidate its cached reads
+                    cache_resource = f"mcp:{command}"
+
+                    # Owner task keeps the context closable from any task (agent pool)
+                    ctx = MCPConnection(MCPClient.create_stdio(command, args, env))
                     client = await ctx.__aenter__()
                     client_contexts.append(ctx)
                     
@@ -971,7 +1095,14 @@ class AgentFactory:
                     
                     # Wrap each tool
                     for tool_def in tools_list:
-                        wrapper = MCPToolWrapper(client, tool_def)
+                        wrapper = MCPToolWrapper(
+                            client,
+                            tool_def,
+                            supports_parallelism=tool_def["name"] in parallel_tools,
+                            cacheable=tool_def["name"] in cacheable_tools,
+                            cache_resource=cache_resource,
+                            mutates=tool_def["name"] not in cacheable_tools,
+                        )
 
                         # Apply output filtering for specific tools
                         if wrapper.name == "list_wiki":
@@ -1005,8 +1136,11 @@ class AgentFactory:
                         url=url,
                     )
                     
-                    # Create context manager but don't enter yet
-                    ctx = MCPClient.create_sse(url)
+                    # Non-cacheable tools of this server invalidate its cached reads
+                    cache_resource = f"mcp:{url}"
+
+                    # Owner task keeps the context closable from any task (agent pool)
+                    ctx = MCPConnection(MCPClient.create_sse(url))
                     client = await ctx.__aenter__()
                     client_contexts.append(ctx)
                     
@@ -1022,7 +1156,14 @@ class AgentFactory:
                     
                     # Wrap each tool
                     for tool_def in tools_list:
-                        wrapper = MCPToolWrapper(client, tool_def)
+                        wrapper = MCPToolWrapper(
+                            client,
+                            tool_def,
+                            supports_parallelism=tool_def["name"] in parallel_tools,
+                            cacheable=tool_def["name"] in cacheable_tools,
+                            cache_resource=cache_resource,
+                            mutates=tool_def["name"] not in cacheable_tools,
+                        )
 
                         # Apply output filtering for specific tools
                         if wrapper.name == "list_wiki":
@@ -1765,6 +1765,17 @@ Anweisung:
         # Fallback: return default message
         return "All tasks completed successfully."
 
+    def reset_session(self) -> None:
+        """
+        Drop per-session state so the agent can serve another mission.
+
+        Called by the agent pool before a warm agent is reused. Plans and
+        conversation state live in the state manager per session; only the
+        session-scoped tool cache is held by the agent itself.
+        """
+        if self._tool_cache:
+            self._tool_cache.clear()
+
     async def close(self) -> None:
         """
         Clean up agent resources, especially MCP client connections.
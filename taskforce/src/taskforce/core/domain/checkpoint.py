@@ -0,0 +1,132 @@
+"""
+Mission Checkpointing
+
+Write-behind checkpoint writer for step-level persistence of running
+missions. Checkpoints capture the message history, planner state and
+execution history after each completed tool turn, so a mission interrupted
+by a crash or redeploy can resume from the last completed turn instead of
+restarting (and re-paying for every LLM and tool call).
+
+Key Features:
+- Non-blocking: the agent loop only schedules a snapshot
+- Coalescing: snapshots scheduled while a write is in flight are merged,
+  only the latest one is written
+- Persistence via StateManagerProtocol (checkpoint stored under
+  state["checkpoint"], removed when the mission finishes)
+- Implicit resume: running the same mission again in the same session
+  (LeanAgent.execute() or execute_stream()) continues from the checkpoint
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import structlog
+
+from taskforce.core.interfaces.state import StateManagerProtocol
+
+CHECKPOINT_KEY = "checkpoint"
+CHECKPOINT_VERSION = 1
+
+
+def build_checkpoint(
+    mission: str,
+    step: int,
+    messages: list[dict[str, Any]],
+    execution_history: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Build a checkpoint payload for the current loop position.
+
+    The system prompt (messages[0]) is not stored - it is rebuilt from the
+    base prompt, plan and context pack on every loop iteration anyway.
+
+    Args:
+        mission: Mission being executed
+        step: Number of completed progress steps
+        messages: Current message history (system prompt first)
+        execution_history: Execution history so far
+
+    Returns:
+        Checkpoint dictionary (shallow copies of the lists)
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "mission": mission,
+        "step": step,
+        "messages": list(messages[1:]),
+        "execution_history": list(execution_history),
+        "created_at": datetime.now().isoformat(),
+    }
+
+
+class CheckpointWriter:
+    """
+    Write-behind, coalescing checkpoint writer for one session.
+
+    schedule() stores the latest snapshot and returns immediately. A single
+    background task persists snapshots through the state manager; snapshots
+    scheduled while a write is running replace each other, so at most one
+    write is pending at any time. flush() waits until everything scheduled
+    so far has been written.
+    """
+
+    def __init__(self, state_manager: StateManagerProtocol, session_id: str):
+        """
+        Initialize checkpoint writer.
+
+        Args:
+            state_manager: State persistence backend
+            session_id: Session the checkpoints belong to
+        """
+        self.state_manager = state_manager
+        self.session_id = session_id
+        self._pending: dict[str, Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._writes = 0
+        self._coalesced = 0
+        self.logger = structlog.get_logger().bind(
+            component="checkpoint_writer", session_id=session_id
+        )
+
+    def schedule(self, state_snapshot: dict[str, Any]) -> None:
+        """
+        Schedule a state snapshot for persistence (non-blocking).
+
+        Args:
+            state_snapshot: Complete state to persist (must not be mutated
+                by the caller afterwards)
+        """
+        if self._pending is not None:
+            self._coalesced += 1
+        self._pending = state_snapshot
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+
+    async def flush(self) -> None:
+        """Wait until all scheduled snapshots are persisted."""
+        while self._task is not None and not self._task.done():
+            await self._task
+
+    async def _drain(self) -> None:
+        """Persist pending snapshots until none is left."""
+        while self._pending is not None:
+            snapshot = self._pending
+            self._pending = None
+            try:
+                await self.state_manager.save_state(self.session_id, snapshot)
+                self._writes += 1
+            except Exception as e:
+                # Checkpoints are best-effort - never break the mission
+                self.logger.warning("checkpoint_write_failed", error=str(e))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with completed writes and coalesced snapshots
+        """
+        return {"writes": self._writes, "coalesced": self._coalesced}
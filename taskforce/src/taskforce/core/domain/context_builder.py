@@ -10,9 +10,12 @@ Key Features:
 - Budget-safe: Never exceeds policy limits
 - No LLM dependency: Pure function-based construction
 - Selector support: Extract specific parts of tool results (MVP: first_chars)
+- Incremental mode: Each tool message is parsed once, packs are re-rendered
+  only when their inputs change (flat per-iteration cost in long sessions)
 """
 
 import json
+from collections import deque
 from typing import Any
 
 from taskforce.core.domain.context_policy import ContextPolicy
@@ -31,16 +34,50 @@ class ContextBuilder:
     - Budget-first: Always respect policy caps
     - Latest-first: Prioritize recent tool results
     - Transparent: Clear headers for LLM interpretation
+
+    Incremental Mode:
+        With ``incremental=True`` the builder remembers how far it has read
+        the message list passed to build_context_pack(). Only newly appended
+        messages are parsed; their previews are kept in a ring bounded by
+        ``include_latest_tool_previews_n``. The rendered pack is cached and
+        reused while mission, previews and plan summary are unchanged. If a
+        different list is passed (new session, compression), the builder
+        re-scans it once and continues incrementally from there.
     """
 
-    def __init__(self, policy: ContextPolicy):
+    def __init__(self, policy: ContextPolicy, incremental: bool = False):
         """
         Initialize builder with a policy.
 
         Args:
             policy: ContextPolicy defining budget constraints
+            incremental: Consume message history incrementally and cache the
+                rendered pack (default: False, full re-scan on every build)
         """
         self.policy = policy
+        self.incremental = incremental
+
+        # Incremental state (only used when incremental=True)
+        self._previews: deque[dict[str, Any]] = deque(
+            maxlen=policy.include_latest_tool_previews_n
+        )
+        self._previews_version = 0
+        self._source_messages: list[dict[str, Any]] | None = None
+        self._consumed_count = 0
+        self._last_consumed: dict[str, Any] | None = None
+        self._render_key: tuple[Any, ...] | None = None
+        self._rendered_pack = ""
+
+    def reset(self) -> None:
+        """Drop all incremental state (previews ring and cached pack)."""
+        if self._previews:
+            self._previews.clear()
+            self._previews_version += 1
+        self._source_messages = None
+        self._consumed_count = 0
+        self._last_consumed = None
+        self._render_key = None
+        self._rendered_pack = ""
 
     def build_context_pack(
         self,
@@ -69,6 +106,9 @@ class ContextBuilder:
         state = state or {}
         messages = messages or []
 
+        if self.incremental:
+            return self._build_context_pack_incremental(mission, state, messages)
+
         # Build sections
         sections: list[str] = []
 
@@ -95,6 +135,132 @@ class ContextBuilder:
 
         return context_pack
 
+    def _build_context_pack_incremental(
+        self,
+        mission: str | None,
+        state: dict[str, Any],
+        messages: list[dict[str, Any]],
+    ) -> str:
+        """
+        Build the context pack from incrementally consumed messages.
+
+        Produces the same output as the full build, but parses only messages
+        appended since the previous call and returns the cached pack when
+        none of its inputs changed.
+
+        Args:
+            mission: Optional mission description
+            state: Session state dictionary
+            messages: Message history (may have grown since the last call)
+
+        Returns:
+            Formatted context pack string ready for injection
+        """
+        self._consume_messages(messages)
+
+        mission_section = None
+        if mission and len(mission) <= self.policy.max_chars_per_item:
+            mission_section = f"**Mission:** {mission}"
+
+        plan_summary = None
+        plan_state = state.get("planner_state")
+        if plan_state:
+            plan_summary = self._build_plan_summary(plan_state)
+
+        render_key = (mission_section, self._previews_version, plan_summary)
+        if render_key == self._render_key:
+            return self._rendered_pack
+
+        sections: list[str] = []
+        if mission_section:
+            sections.append(mission_section)
+
+        preview_section = self._build_tool_preview_section(list(self._previews))
+        if preview_section:
+            sections.append(preview_section)
+
+        if plan_summary:
+            sections.append(plan_summary)
+
+        self._rendered_pack = self._combine_sections(sections)
+        self._render_key = render_key
+        return self._rendered_pack
+
+    def _consume_messages(self, messages: list[dict[str, Any]]) -> None:
+        """
+        Parse tool messages appended since the last call.
+
+        The history is treated as append-only. If a different list is passed,
+        or the already consumed prefix was modified, state is reset and the
+        list is scanned once from the beginning.
+
+        Args:
+            messages: Current message history
+        """
+        consumed = self._consumed_count
+        if (
+            messages is not self._source_messages
+            or len(messages) < consumed
+            or (consumed and messages[consumed - 1] is not self._last_consumed)
+        ):
+            self.reset()
+            self._source_messages = messages
+            consumed = 0
+
+        if consumed == len(messages):
+            return
+
+        for msg in messages[consumed:]:
+            preview = self._parse_tool_preview(msg)
+            if preview is not None:
+                self._previews.append(preview)
+                self._previews_version += 1
+
+        self._consumed_count = len(messages)
+        self._last_consumed = messages[-1]
+
+    def _parse_tool_preview(self, msg: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Parse a single tool message into a preview dictionary.
+
+        Args:
+            msg: Message from the history
+
+        Returns:
+            Preview dictionary, or None if the message is not an allowed
+            tool result preview.
+        """
+        if msg.get("role") != "tool":
+            return None
+
+        # Check if message has preview data (Story 9.1 format)
+        content = msg.get("content", "")
+        if not content or '"preview_text"' not in content:
+            return None
+
+        # Try to parse as JSON (preview format)
+        try:
+            parsed = json.loads(content)
+            if "handle" not in parsed or "preview_text" not in parsed:
+                return None
+
+            handle_data = parsed["handle"]
+            tool_name = handle_data.get("tool", "unknown")
+
+            # Check if tool is allowed by policy
+            if not self.policy.is_tool_allowed(tool_name):
+                return None
+
+            return {
+                "tool": tool_name,
+                "preview": parsed["preview_text"],
+                "truncated": parsed.get("truncated", False),
+                "size_chars": handle_data.get("size_chars", 0),
+            }
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            # Not a preview message, skip
+            return None
+
     def _extract_tool_previews(
         self, messages: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -114,39 +280,15 @@ class ContextBuilder:
 
         # Scan messages in reverse (latest first)
         for msg in reversed(messages):
-            if msg.get("role") != "tool":
+            preview = self._parse_tool_preview(msg)
+            if preview is None:
                 continue
 
-            # Check if message has preview data (Story 9.1 format)
-            content = msg.get("content", "")
-            if not content:
-                continue
+            previews.append(preview)
 
-            # Try to parse as JSON (preview format)
-            try:
-                parsed = json.loads(content)
-                if "handle" in parsed and "preview_text" in parsed:
-                    # This is a preview message
-                    handle_data = parsed["handle"]
-                    tool_name = handle_data.get("tool", "unknown")
-
-                    # Check if tool is allowed by policy
-                    if not self.policy.is_tool_allowed(tool_name):
-                        continue
-
-                    previews.append({
-                        "tool": tool_name,
-                        "preview": parsed["preview_text"],
-                        "truncated": parsed.get("truncated", False),
-                        "size_chars": handle_data.get("size_chars", 0),
-                    })
-
-                    # Stop when we have enough
-                    if len(previews) >= self.policy.include_latest_tool_previews_n:
-                        break
-            except (json.JSONDecodeError, KeyError):
-                # Not a preview message, skip
-                continue
+            # Stop when we have enough
+            if len(previews) >= self.policy.include_latest_tool_previews_n:
+                break
 
         # Return in chronological order (oldest first)
         return list(reversed(previews))
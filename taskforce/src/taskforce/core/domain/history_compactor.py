@@ -0,0 +1,304 @@
+"""
+Background History Compaction
+
+Summarizes the oldest segment of the message history in a background task,
+off the agent loop's critical path. Once history crosses the soft threshold
+the agent starts a compaction; the summary is spliced in at the next
+iteration boundary after it is ready. Reasoning steps never wait on
+summarization unless the hard token budget is actually exceeded.
+
+Key Features:
+- Cheap model alias (default "fast") for summaries
+- Segments end on a tool-call group boundary (an assistant message with
+  tool_calls always stays together with its tool results)
+- The user mission is never summarized away - it stays right after the
+  system prompt
+- Splices are validated by message identity - if the history was rewritten
+  in the meantime (e.g. deterministic hard-limit compression), the summary
+  is discarded
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from taskforce.core.interfaces.llm import LLMProviderProtocol
+
+MAX_SUMMARY_INPUT_CHARS = 50000  # ~12.5k tokens
+SUMMARY_PREFIX = "[Previous Context Summary]"
+KEEP_RECENT_MESSAGES = 10  # Most recent messages never summarized or dropped
+
+
+def find_mission_index(messages: list[dict[str, Any]]) -> int | None:
+    """
+    Locate the user mission in a message history.
+
+    The mission is the last user message before the first tool-call turn or
+    inserted system message (summary, compression note). Earlier user
+    messages are conversation history of previous chat turns.
+
+    Args:
+        messages: Message history (system prompt first)
+
+    Returns:
+        Index of the mission message, or None if there is no user message
+    """
+    mission = None
+    for index in range(1, len(messages)):
+        message = messages[index]
+        role = message.get("role")
+        if role in ("system", "tool") or (role == "assistant" and message.get("tool_calls")):
+            break
+        if role == "user":
+            mission = index
+    return mission
+
+
+def find_turn_start(messages: list[dict[str, Any]], index: int) -> int:
+    """
+    Move a cut point back to the start of its assistant/tool group.
+
+    Tool messages must follow the assistant message whose tool_calls
+    requested them; a history starting with a tool message is rejected by
+    the provider.
+
+    Args:
+        messages: Message history (system prompt first)
+        index: Proposed cut point (first message to keep)
+
+    Returns:
+        Cut point that does not separate tool results from their call
+    """
+    index = max(index, 1)
+    while 1 < index < len(messages) and messages[index].get("role") == "tool":
+        index -= 1
+    return index
+
+
+def split_history(
+    messages: list[dict[str, Any]], keep_recent: int = KEEP_RECENT_MESSAGES
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split a history into the head to keep, the span to drop and the recent tail.
+
+    The head is the system prompt plus the mission (unless the mission is
+    part of the tail anyway). The tail holds at least keep_recent messages
+    and starts on an assistant/tool group boundary. Everything in between
+    is dropped - callers summarize exactly this span.
+
+    Args:
+        messages: Message history (system prompt first)
+        keep_recent: Minimum number of recent messages to keep
+
+    Returns:
+        Tuple of (head, dropped, recent)
+    """
+    cut = find_turn_start(messages, len(messages) - keep_recent)
+    mission = find_mission_index(messages)
+    head = messages[:1]
+    dropped = messages[1:cut]
+    if mission is not None and mission < cut:
+        head = [messages[0], messages[mission]]
+        dropped = messages[1:mission] + messages[mission + 1 : cut]
+    return head, dropped, messages[cut:]
+
+
+def build_summary_prompt(summary_input: str) -> str:
+    """
+    Build the summarization prompt for a history segment.
+
+    Args:
+        summary_input: Safe text representation of the messages
+
+    Returns:
+        Prompt asking for a concise factual summary
+    """
+    return f"""Summarize this conversation history concisely:
+
+{summary_input}
+
+Provide a 2-3 paragraph summary of:
+- Key decisions made
+- Important tool results and findings
+- Context needed for understanding recent messages
+
+Keep it factual and concise."""
+
+
+class HistoryCompactor:
+    """
+    Background summarizer for one mission's message history.
+
+    start() launches a summary of the span split_history() drops (everything
+    but the system prompt, the mission and the most recent messages) and
+    returns immediately. apply()
+    splices a finished summary into the current history without blocking,
+    wait() blocks until the running summary is done (hard-limit path only).
+    """
+
+    def __init__(
+        self,
+        llm_provider: LLMProviderProtocol,
+        build_summary_input: Callable[[list[dict[str, Any]]], str],
+        model_alias: str = "fast",
+        keep_recent: int = 10,
+    ):
+        """
+        Initialize compactor.
+
+        Args:
+            llm_provider: LLM provider used for summaries
+            build_summary_input: Converts messages to safe summary input text
+            model_alias: Model alias for summaries (default: "fast")
+            keep_recent: Number of most recent messages never summarized
+        """
+        self.llm_provider = llm_provider
+        self.build_summary_input = build_summary_input
+        self.model_alias = model_alias
+        self.keep_recent = keep_recent
+        self._task: asyncio.Task[str | None] | None = None
+        self._mission: list[dict[str, Any]] = []
+        self._span: list[dict[str, Any]] = []
+        self._stats = {"started": 0, "applied": 0, "discarded": 0, "failed": 0, "waited": 0}
+        self.logger = structlog.get_logger().bind(component="history_compactor")
+
+    @property
+    def pending(self) -> bool:
+        """Whether a compaction was started and not yet applied or discarded."""
+        return self._task is not None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get compaction statistics.
+
+        Returns:
+            Dictionary with started, applied, discarded, failed and waited counts
+        """
+        return dict(self._stats)
+
+    def start(self, messages: list[dict[str, Any]]) -> bool:
+        """
+        Start summarizing the oldest history segment in the background.
+
+        Args:
+            messages: Current message history (system prompt first)
+
+        Returns:
+            True if a compaction was started, False if one is already running
+            or there is nothing to summarize
+        """
+        if self._task is not None:
+            return False
+
+        head, segment, recent = split_history(messages, self.keep_recent)
+        if len(segment) < 2:  # Summarizing a single message gains nothing
+            return False
+
+        summary_input = self.build_summary_input(segment)
+        if len(summary_input) > MAX_SUMMARY_INPUT_CHARS:
+            self.logger.warning(
+                "compaction_input_too_large",
+                input_length=len(summary_input),
+                action="hard_limit_fallback_only",
+            )
+            return False
+
+        # Contiguous span after the system prompt (mission included) that the
+        # splice replaces; apply() checks it is still unchanged. The system
+        # prompt itself is refreshed every iteration, so only the mission is kept
+        self._mission, self._span = head[1:], messages[1 : len(messages) - len(recent)]
+        self._task = asyncio.create_task(self._summarize(summary_input))
+        self._stats["started"] += 1
+        self.logger.info(
+            "compaction_started", segment_messages=len(segment), model=self.model_alias
+        )
+        return True
+
+    def apply(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Splice a finished summary into the history (non-blocking).
+
+        Args:
+            messages: Current message history
+
+        Returns:
+            Compacted history, or the unchanged list if no summary is ready
+        """
+        if self._task is None or not self._task.done():
+            return messages
+
+        task, mission, span = self._task, self._mission, self._span
+        self._task, self._mission, self._span = None, [], []
+
+        summary = None if task.cancelled() or task.exception() else task.result()
+        if not summary:
+            self._stats["failed"] += 1
+            return messages
+
+        # History must still start with the summarized span
+        current = messages[1 : 1 + len(span)]
+        if len(current) != len(span) or any(a is not b for a, b in zip(current, span, strict=True)):
+            self._stats["discarded"] += 1
+            self.logger.info("compaction_discarded", reason="history_changed")
+            return messages
+
+        compacted = [
+            messages[0],
+            *mission,
+            {"role": "system", "content": f"{SUMMARY_PREFIX}\n{summary}"},
+            *messages[1 + len(span) :],
+        ]
+        self._stats["applied"] += 1
+        self.logger.info(
+            "compaction_applied",
+            original_count=len(messages),
+            compacted_count=len(compacted),
+            summary_length=len(summary),
+        )
+        return compacted
+
+    async def wait(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Wait for the running compaction and splice it in.
+
+        Only used when the hard budget is exceeded.
+
+        Args:
+            messages: Current message history
+
+        Returns:
+            Compacted history, or the unchanged list if nothing was running
+        """
+        if self._task is None:
+            return messages
+        if not self._task.done():
+            self._stats["waited"] += 1
+            await asyncio.wait([self._task])
+        return self.apply(messages)
+
+    async def cancel(self) -> None:
+        """Cancel a running compaction (end of mission)."""
+        task, self._task, self._mission, self._span = self._task, None, [], []
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _summarize(self, summary_input: str) -> str | None:
+        """Summarize the segment with the compaction model."""
+        try:
+            result = await self.llm_provider.complete(
+                messages=[{"role": "user", "content": build_summary_prompt(summary_input)}],
+                model=self.model_alias,
+                temperature=0,
+            )
+        except Exception as e:
+            self.logger.error("compaction_exception", error=str(e))
+            return None
+
+        if not result.get("success"):
+            self.logger.error("compaction_failed", error=result.get("error"))
+            return None
+        return result.get("content") or None
@@ -10,6 +10,14 @@ Key features:
 - Dynamic context injection: plan status injected into system prompt each loop
 - Robust error handling with automatic retry context
 - Clean message history management
+- Optional concurrent dispatch of parallel-safe tool calls within one turn
+- Optional step-level checkpoints with resume from the last completed tool turn
+- Optional eager dispatch of read-only tools while the LLM stream is still running
+- Optional prompt-cache-friendly layout: byte-stable system prompt, plan status
+  and context pack sent as a trailing message
+- Optional per-step tool subset selection (top-k relevant tool schemas)
+- Optional session-scoped memoization of cacheable tool results
+- Optional background history compaction off the LLM critical path
 
 Key differences from legacy Agent:
 - No TodoListManager dependency
@@ -19,21 +27,35 @@ Key differences from legacy Agent:
 - Native function calling for tool invocation
 """
 
+import asyncio
+import copy
 import json
 from collections.abc import AsyncIterator
 from typing import Any
 
 import structlog
 
+from taskforce.core.domain.checkpoint import CHECKPOINT_KEY, CheckpointWriter, build_checkpoint
 from taskforce.core.domain.context_builder import ContextBuilder
 from taskforce.core.domain.context_policy import ContextPolicy
+from taskforce.core.domain.history_compactor import (
+    MAX_SUMMARY_INPUT_CHARS,
+    SUMMARY_PREFIX,
+    HistoryCompactor,
+    build_summary_prompt,
+    split_history,
+)
 from taskforce.core.domain.models import ExecutionResult, StreamEvent
 from taskforce.core.domain.token_budgeter import TokenBudgeter
+from taskforce.core.domain.tool_selector import ToolSelection, ToolSelector
+from taskforce.core.interfaces.cache import ToolCacheProtocol, ToolCallCoalescerProtocol
 from taskforce.core.interfaces.llm import LLMProviderProtocol
 from taskforce.core.interfaces.state import StateManagerProtocol
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
 from taskforce.core.interfaces.tool_result_store import ToolResultStoreProtocol
 from taskforce.core.interfaces.tools import ToolProtocol
 from taskforce.core.prompts.autonomous_prompts import LEAN_KERNEL_PROMPT
+from taskforce.core.tools.fetch_tool_result_tool import FetchToolResultTool
 from taskforce.core.tools.planner_tool import PlannerTool
 from taskforce.infrastructure.tools.tool_converter import (
     assistant_tool_calls_to_message,
@@ -67,6 +89,8 @@ class LeanAgent:
     # Token budget defaults
     DEFAULT_MAX_INPUT_TOKENS = 100000  # ~100k tokens for input
     DEFAULT_COMPRESSION_TRIGGER = 80000  # Trigger compression at 80% of max
+    # Concurrent tool dispatch defaults
+    DEFAULT_MAX_PARALLEL_TOOLS = 4  # Max tool calls of one turn running at once
 
     def __init__(
         self,
@@ -80,6 +104,18 @@ class LeanAgent:
         max_input_tokens: int | None = None,
         compression_trigger: int | None = None,
         max_steps: int | None = None,
+        parallel_tool_calls: bool = False,
+        max_parallel_tools: int | None = None,
+        token_estimator: TokenEstimatorProtocol | None = None,
+        enable_checkpoints: bool = False,
+        eager_tool_dispatch: bool = False,
+        prompt_cache_layout: bool = False,
+        tool_selection_top_k: int | None = None,
+        tool_cache: ToolCacheProtocol | None = None,
+        tool_coalescer: ToolCallCoalescerProtocol | None = None,
+        background_compaction: bool = False,
+        compaction_model_alias: str = "fast",
+        summarize_history: bool = True,
     ):
         """
         Initialize LeanAgent with injected dependencies.
@@ -91,32 +127,85 @@ class LeanAgent:
             system_prompt: Base system prompt for LLM interactions
                           (defaults to LEAN_KERNEL_PROMPT if not provided)
             model_alias: Model alias for LLM calls (default: "main")
-            tool_result_store: Optional store for large tool results (enables handle-based storage)
+            tool_result_store: Optional store for large tool results (enables handle-based
+                      storage and registers the fetch_tool_result tool for paging through them)
             context_policy: Optional policy for context pack budgeting
                           (defaults to conservative policy if not provided)
             max_input_tokens: Maximum input tokens allowed (default: 100k)
             compression_trigger: Token count to trigger compression (default: 80k)
             max_steps: Maximum execution steps allowed (default: 30 for simple agents,
                       should be higher for RAG/document agents ~50-100)
+            parallel_tool_calls: Run parallel-safe tool calls of one LLM turn
+                      concurrently (default: False, all calls run sequentially)
+            max_parallel_tools: Concurrency limit for parallel tool dispatch (default: 4)
+            token_estimator: Optional tokenizer-backed estimator for budget checks
+                      (default: chars/4 heuristic)
+            enable_checkpoints: Persist a checkpoint after every completed tool turn
+                      (default: False). Resume is implicit: execute()/execute_stream()
+                      with the same session and mission continue from the checkpoint
+            eager_tool_dispatch: In execute_stream(), start parallel-safe (read-only)
+                      tools as soon as their tool_call_end arrives (default: False)
+            prompt_cache_layout: Keep the system prompt byte-stable across a mission
+                      and send plan status and context pack as a trailing message,
+                      so providers can reuse the cached prompt prefix (default: False)
+            tool_selection_top_k: Send only the k tools most relevant to the mission
+                      and current plan step (plus planner) instead of all tool
+                      schemas (default: None, all tools are sent)
+            tool_cache: Optional session-scoped cache memoizing results of tools
+                      flagged as cacheable; calls of mutating tools invalidate the
+                      entries of their cache_resource
+            tool_coalescer: Optional coalescer sharing one execution between identical
+                      calls of cacheable tools that are in flight at the same time;
+                      the tool's user_context (RAG security filter) is part of the
+                      key (default: None, no coalescing)
+            background_compaction: Summarize old history in a background task once
+                      the soft threshold is crossed instead of blocking the loop;
+                      deterministic compression remains the hard-limit fallback
+                      (default: False)
+            compaction_model_alias: Model alias for background summaries (default: "fast")
+            summarize_history: Without background compaction, summarize old history
+                      with a blocking LLM call once the soft threshold is crossed
+                      (default: True; False leaves trimming to the hard-budget preflight)
         """
         self.state_manager = state_manager
         self.llm_provider = llm_provider
         self._base_system_prompt = system_prompt or LEAN_KERNEL_PROMPT
         self.model_alias = model_alias
         self.tool_result_store = tool_result_store
+        self._tool_cache = tool_cache
+        self._tool_coalescer = tool_coalescer
         self.logger = structlog.get_logger().bind(component="lean_agent")
 
         # Execution limits configuration
         self.max_steps = max_steps or self.DEFAULT_MAX_STEPS
 
+        # Concurrent tool dispatch configuration
+        self.parallel_tool_calls = parallel_tool_calls
+        self.max_parallel_tools = max(1, max_parallel_tools or self.DEFAULT_MAX_PARALLEL_TOOLS)
+
+        # Step-level checkpointing (write-behind via state manager)
+        self.enable_checkpoints = enable_checkpoints
+
+        # Eager tool dispatch while streaming
+        self.eager_tool_dispatch = eager_tool_dispatch
+
+        # History compaction (background summaries with the compaction model)
+        self.background_compaction = background_compaction
+        self.compaction_model_alias = compaction_model_alias
+        self.summarize_history = summarize_history
+
+        # Prompt layout (stable prefix for provider-side prompt caching)
+        self.prompt_cache_layout = prompt_cache_layout
+
         # Context pack configuration (Story 9.2)
         self.context_policy = context_policy or ContextPolicy.conservative_default()
-        self.context_builder = ContextBuilder(self.context_policy)
+        self.context_builder = ContextBuilder(self.context_policy, incremental=True)
 
         # Token budget configuration (Story 9.3)
         self.token_budgeter = TokenBudgeter(
             max_input_tokens=max_input_tokens or self.DEFAULT_MAX_INPUT_TOKENS,
             compression_trigger=compression_trigger or self.DEFAULT_COMPRESSION_TRIGGER,
+            estimator=token_estimator,
         )
 
         # Build tools dict, ensure PlannerTool exists
@@ -133,9 +222,31 @@ class LeanAgent:
             self._planner = PlannerTool()
             self.tools[self._planner.name] = self._planner
 
+        # Paging through stored results (handles replace large tool outputs)
+        self._result_fetcher: FetchToolResultTool | None = None
+        if tool_result_store is not None:
+            self._result_fetcher = FetchToolResultTool(tool_result_store)
+            self.tools.setdefault(self._result_fetcher.name, self._result_fetcher)
+
         # Pre-convert tools to OpenAI format
         self._openai_tools = tools_to_openai_format(self.tools)
 
+        # Per-step tool subset selection (only worth it beyond top_k + always sent tools)
+        self.tool_selection_top_k = tool_selection_top_k
+        self._tool_selector: ToolSelector | None = None
+        always_include = [self._planner.name]
+        if self._result_fetcher is not None:
+            always_include.append(self._result_fetcher.name)
+        if (
+            tool_selection_top_k
+            and len(self._openai_tools) > tool_selection_top_k + len(always_include)
+        ):
+            self._tool_selector = ToolSelector(
+                self._openai_tools,
+                estimator=self.token_budgeter.estimator,
+                always_include=always_include,
+            )
+
     @property
     def system_prompt(self) -> str:
         """Return base system prompt (backward compatibility)."""
@@ -162,7 +273,31 @@ class LeanAgent:
         Returns:
             Complete system prompt with plan context and context pack.
         """
-        prompt = self._base_system_prompt
+        dynamic_context = self._build_dynamic_context(
+            mission=mission, state=state, messages=messages
+        )
+        if dynamic_context:
+            return f"{self._base_system_prompt}\n\n{dynamic_context}"
+        return self._base_system_prompt
+
+    def _build_dynamic_context(
+        self,
+        mission: str | None = None,
+        state: dict[str, Any] | None = None,
+        messages: list[dict[str, Any]] | None = None,
+    ) -> str:
+        """
+        Build the per-turn dynamic context: plan status and context pack.
+
+        Args:
+            mission: Optional mission description for context pack
+            state: Optional session state for context pack
+            messages: Optional message history for context pack
+
+        Returns:
+            Plan status and context pack sections (empty string if neither exists)
+        """
+        sections: list[str] = []
 
         # Inject current plan status if PlannerTool exists and has a plan
         if self._planner:
@@ -172,12 +307,12 @@ class LeanAgent:
             # Only inject if there's an actual plan (not "No active plan.")
             if plan_output and plan_output != "No active plan.":
                 plan_section = (
-                    "\n\n## CURRENT PLAN STATUS\n"
+                    "## CURRENT PLAN STATUS\n"
                     "The following plan is currently active. "
                     "Use it to guide your next steps.\n\n"
                     f"{plan_output}"
                 )
-                prompt += plan_section
+                sections.append(plan_section)
                 self.logger.debug("plan_injected", plan_steps=plan_output.count("\n") + 1)
 
         # Build and inject context pack (Story 9.2)
@@ -185,14 +320,112 @@ class LeanAgent:
             mission=mission, state=state, messages=messages
         )
         if context_pack:
-            prompt += f"\n\n{context_pack}"
+            sections.append(context_pack)
             self.logger.debug(
                 "context_pack_injected",
                 pack_length=len(context_pack),
                 policy_max=self.context_policy.max_total_chars,
             )
 
-        return prompt
+        return "\n\n".join(sections)
+
+    def _refresh_system_prompt(
+        self,
+        mission: str,
+        state: dict[str, Any],
+        messages: list[dict[str, Any]],
+    ) -> str | None:
+        """
+        Refresh messages[0] for the next LLM call.
+
+        In the default layout the plan status and context pack are embedded
+        into the system prompt. With prompt_cache_layout the system prompt
+        stays the base prompt and the dynamic context is returned, to be sent
+        as a trailing message (see _with_dynamic_context), so the prompt
+        prefix is identical on every turn.
+
+        Args:
+            mission: Mission description
+            state: Session state
+            messages: Message history (messages[0] is replaced in place)
+
+        Returns:
+            Dynamic context for the trailing message, or None
+        """
+        if not self.prompt_cache_layout:
+            current_system_prompt = self._build_system_prompt(
+                mission=mission, state=state, messages=messages
+            )
+            messages[0] = {"role": "system", "content": current_system_prompt}
+            return None
+
+        messages[0] = {"role": "system", "content": self._base_system_prompt}
+        return self._build_dynamic_context(mission=mission, state=state, messages=messages) or None
+
+    @staticmethod
+    def _with_dynamic_context(
+        messages: list[dict[str, Any]], dynamic_context: str | None
+    ) -> list[dict[str, Any]]:
+        """
+        Build the messages sent to the LLM, with the dynamic context appended.
+
+        The trailing message is not added to the history - the next turn
+        gets a fresh one.
+        """
+        if not dynamic_context:
+            return messages
+        return [*messages, {"role": "system", "content": dynamic_context}]
+
+    @staticmethod
+    def _add_prompt_usage(totals: dict[str, int], usage: dict[str, Any] | None) -> None:
+        """Accumulate prompt, cached prompt and completion tokens of one LLM call."""
+        if not usage:
+            return
+        for key in totals:
+            value = usage.get(key)
+            if isinstance(value, int):
+                totals[key] += value
+
+    def _tool_cache_stats_since(self, start: dict[str, int] | None) -> dict[str, int] | None:
+        """Return tool cache statistics accumulated since the given snapshot."""
+        if self._tool_cache is None or start is None:
+            return None
+        return {key: value - start.get(key, 0) for key, value in self._tool_cache.stats.items()}
+
+    def _select_tools(self, selection: ToolSelection | None, mission: str) -> list[dict[str, Any]]:
+        """
+        Select the tool schemas for the next LLM call.
+
+        Ranks tools against the mission and the first open plan step.
+
+        Args:
+            selection: Per-mission selection state (None = send all tools)
+            mission: Mission description
+
+        Returns:
+            Tool schemas in OpenAI format
+        """
+        if selection is None:
+            return self._openai_tools
+
+        query = mission
+        if self._planner:
+            tasks = self._planner.get_state().get("tasks", [])
+            current = next((t for t in tasks if t.get("status") != "DONE"), None)
+            if current:
+                query = f"{mission}\n{current.get('description', '')}"
+
+        return selection.select(query)
+
+    def _record_tool_calls(
+        self, selection: ToolSelection | None, tool_calls: list[dict[str, Any]]
+    ) -> None:
+        """Record called tools; fall back to the full tool set for unsent tools."""
+        if selection is None:
+            return
+        missing = selection.record_calls(tc["function"]["name"] for tc in tool_calls)
+        if missing:
+            self.logger.warning("tool_selection_fallback", tools=missing)
 
     async def execute(self, mission: str, session_id: str) -> ExecutionResult:
         """
@@ -221,13 +454,38 @@ class LeanAgent:
         if self._planner and state.get("planner_state"):
             self._planner.set_state(state["planner_state"])
 
-        # 2. Build initial messages
-        messages = self._build_initial_messages(mission, state)
+        # 2. Build initial messages (or resume from the last checkpoint)
+        checkpoint = self._get_resumable_checkpoint(mission, state)
+        if checkpoint:
+            messages = [{"role": "system", "content": self._base_system_prompt}]
+            messages.extend(checkpoint["messages"])
+            execution_history = list(checkpoint.get("execution_history", []))
+        else:
+            messages = self._build_initial_messages(mission, state)
+        checkpoints = (
+            CheckpointWriter(self.state_manager, session_id) if self.enable_checkpoints else None
+        )
 
         # 3. Native tool calling loop
-        step = 0  # Counts meaningful progress steps (tool calls or final answer)
+        step = checkpoint["step"] if checkpoint else 0  # Meaningful progress steps
         loop_iterations = 0  # Counts all loop iterations (for debugging)
         final_message = ""
+        prompt_usage = {"prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+        cache_stats_start = self._tool_cache.stats if self._tool_cache else None
+        compactor = (
+            HistoryCompactor(
+                self.llm_provider,
+                self._build_safe_summary_input,
+                model_alias=self.compaction_model_alias,
+            )
+            if self.background_compaction
+            else None
+        )
+        tool_selection = (
+            ToolSelection(self._tool_selector, self.tool_selection_top_k)
+            if self._tool_selector and self.tool_selection_top_k
+            else None
+        )
 
         while step < self.max_steps:
             loop_iterations += 1
@@ -239,26 +497,26 @@ class LeanAgent:
                 max_steps=self.max_steps,
             )
 
-            # Dynamic context injection: rebuild system prompt with current plan and context pack
-            current_system_prompt = self._build_system_prompt(
-                mission=mission, state=state, messages=messages
-            )
-            messages[0] = {"role": "system", "content": current_system_prompt}
+            # Dynamic context injection: current plan and context pack
+            dynamic_context = self._refresh_system_prompt(mission, state, messages)
 
-            # Compress messages if exceeding threshold (async LLM-based)
-            #messages = await self._compress_messages(messages)
+            # Compress messages if exceeding threshold (background or blocking LLM summary)
+            messages = await self._compact_history(messages, dynamic_context, compactor)
 
             # Preflight budget check (Story 9.3)
-            #messages = await self._preflight_budget_check(messages)
+            messages = await self._preflight_budget_check(
+                messages, context_pack=dynamic_context
+            )
 
             # Call LLM with tools
             result = await self.llm_provider.complete(
-                messages=messages,
+                messages=self._with_dynamic_context(messages, dynamic_context),
                 model=self.model_alias,
-                tools=self._openai_tools,
+                tools=self._select_tools(tool_selection, mission),
                 tool_choice="auto",
                 temperature=0.2,
             )
+            self._add_prompt_usage(prompt_usage, result.get("usage"))
 
             if not result.get("success"):
                 self.logger.error(
@@ -290,54 +548,49 @@ class LeanAgent:
                     count=len(tool_calls),
                     tools=[tc["function"]["name"] for tc in tool_calls],
                 )
+                self._record_tool_calls(tool_selection, tool_calls)
 
                 # Add assistant message with tool calls to history
                 messages.append(assistant_tool_calls_to_message(tool_calls))
 
-                # Execute each tool and add results
-                for tool_call in tool_calls:
-                    tool_name = tool_call["function"]["name"]
-                    tool_call_id = tool_call["id"]
-
-                    # Parse arguments
-                    try:
-                        tool_args = json.loads(tool_call["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        tool_args = {}
-                        self.logger.warning(
-                            "tool_args_parse_failed",
-                            tool=tool_name,
-                            raw_args=tool_call["function"]["arguments"],
+                # Execute tools batch by batch; results keep the original call order
+                for batch in self._batch_tool_calls(tool_calls):
+                    for tool_call, tool_args, tool_result in await self._execute_tool_batch(
+                        batch
+                    ):
+                        tool_name = tool_call["function"]["name"]
+                        tool_call_id = tool_call["id"]
+
+                        # Record in execution history
+                        execution_history.append(
+                            {
+                                "type": "tool_call",
+                                "step": step,
+                                "tool": tool_name,
+                                "args": tool_args,
+                                "result": tool_result,
+                            }
                         )
 
-                    # Execute tool
-                    tool_result = await self._execute_tool(tool_name, tool_args)
-
-                    # Record in execution history
-                    execution_history.append(
-                        {
-                            "type": "tool_call",
-                            "step": step,
-                            "tool": tool_name,
-                            "args": tool_args,
-                            "result": tool_result,
-                        }
-                    )
-
-                    # Add tool result to messages (handle-based if store available and result is large)
-                    tool_message = await self._create_tool_message(
-                        tool_call_id, tool_name, tool_result, session_id, step
-                    )
-                    messages.append(tool_message)
-
-                    # Handle tool errors - LLM can see them and react
-                    if not tool_result.get("success"):
-                        self.logger.warning(
-                            "tool_failed",
-                            step=step,
-                            tool=tool_name,
-                            error=tool_result.get("error"),
+                        # Add tool result to messages (handle-based if store available and result is large)
+                        tool_message = await self._create_tool_message(
+                            tool_call_id, tool_name, tool_result, session_id, step
                         )
+                        messages.append(tool_message)
+
+                        # Handle tool errors - LLM can see them and react
+                        if not tool_result.get("success"):
+                            self.logger.warning(
+                                "tool_failed",
+                                step=step,
+                                tool=tool_name,
+                                error=tool_result.get("error"),
+                            )
+
+                # Tool turn complete - checkpoint it (non-blocking)
+                self._schedule_checkpoint(
+                    checkpoints, state, mission, step, messages, execution_history
+                )
 
             else:
                 # No tool calls - LLM returned content (final answer)
@@ -384,7 +637,11 @@ class LeanAgent:
         else:
             status = "completed"
 
-        # 5. Persist state
+        # 5. Persist state (after pending checkpoints, so the final state wins)
+        if compactor:
+            await compactor.cancel()
+        if checkpoints:
+            await checkpoints.flush()
         await self._save_state(session_id, state)
 
         self.logger.info(
@@ -394,13 +651,20 @@ class LeanAgent:
             progress_steps=step,
             total_iterations=loop_iterations,
             overhead_iterations=loop_iterations - step,
+            prompt_tokens=prompt_usage["prompt_tokens"],
+            cached_tokens=prompt_usage["cached_tokens"],
+            tool_cache=self._tool_cache_stats_since(cache_stats_start),
         )
+        if tool_selection:
+            self.logger.info("tool_selection_summary", session_id=session_id, **tool_selection.stats)
 
         return ExecutionResult(
             session_id=session_id,
             status=status,
             final_message=final_message,
             execution_history=execution_history,
+            tool_cache_stats=self._tool_cache_stats_since(cache_stats_start),
+            token_usage=dict(prompt_usage),
         )
 
     async def execute_stream(
@@ -480,227 +744,287 @@ class LeanAgent:
 
         # 1. Load or initialize state
         state = await self.state_manager.load_state(session_id) or {}
+        execution_history: list[dict[str, Any]] = []
 
         # Restore PlannerTool state if available
         if self._planner and state.get("planner_state"):
             self._planner.set_state(state["planner_state"])
 
-        # 2. Build initial messages
-        messages = self._build_initial_messages(mission, state)
+        # 2. Build initial messages (or resume from the last checkpoint)
+        checkpoint = self._get_resumable_checkpoint(mission, state)
+        if checkpoint:
+            messages = [{"role": "system", "content": self._base_system_prompt}]
+            messages.extend(checkpoint["messages"])
+            execution_history = list(checkpoint.get("execution_history", []))
+        else:
+            messages = self._build_initial_messages(mission, state)
+        checkpoints = (
+            CheckpointWriter(self.state_manager, session_id) if self.enable_checkpoints else None
+        )
 
         # 3. Streaming execution loop
-        step = 0  # Counts meaningful progress steps (tool calls or final answer)
+        step = checkpoint["step"] if checkpoint else 0  # Meaningful progress steps
         loop_iterations = 0  # Counts all loop iterations (for debugging)
         final_message = ""
-
-        while step < self.max_steps:
-            loop_iterations += 1
-            self.logger.debug(
-                "stream_loop_iteration",
-                session_id=session_id,
-                iteration=loop_iterations,
-                progress_steps=step,
-                max_steps=self.max_steps,
+        prompt_usage = {"prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+        cache_stats_start = self._tool_cache.stats if self._tool_cache else None
+        compactor = (
+            HistoryCompactor(
+                self.llm_provider,
+                self._build_safe_summary_input,
+                model_alias=self.compaction_model_alias,
             )
+            if self.background_compaction
+            else None
+        )
+        tool_selection = (
+            ToolSelection(self._tool_selector, self.tool_selection_top_k)
+            if self._tool_selector and self.tool_selection_top_k
+            else None
+        )
 
-            # Emit step_start event (with current progress step count)
-            yield StreamEvent(
-                event_type="step_start",
-                data={"step": step, "max_steps": self.max_steps, "iteration": loop_iterations},
-            )
+        # Tools started eagerly in the current turn (cancelled if the consumer goes away)
+        eager_tasks: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        try:
+            while step < self.max_steps:
+                loop_iterations += 1
+                self.logger.debug(
+                    "stream_loop_iteration",
+                    session_id=session_id,
+                    iteration=loop_iterations,
+                    progress_steps=step,
+                    max_steps=self.max_steps,
+                )
 
-            # Dynamic context injection: rebuild system prompt with current plan and context pack
-            current_system_prompt = self._build_system_prompt(
-                mission=mission, state=state, messages=messages
-            )
-            messages[0] = {"role": "system", "content": current_system_prompt}
+                # Emit step_start event (with current progress step count)
+                yield StreamEvent(
+                    event_type="step_start",
+                    data={"step": step, "max_steps": self.max_steps, "iteration": loop_iterations},
+                )
 
-            # Compress messages if exceeding threshold (async LLM-based)
-            messages = await self._compress_messages(messages)
+                # Dynamic context injection: current plan and context pack
+                dynamic_context = self._refresh_system_prompt(mission, state, messages)
 
-            # Preflight budget check (Story 9.3)
-            messages = await self._preflight_budget_check(messages)
+                # Compress messages if exceeding threshold (background or blocking LLM summary)
+                messages = await self._compact_history(messages, dynamic_context, compactor)
 
-            # Stream LLM response
-            tool_calls_accumulated: list[dict[str, Any]] = {}
-            content_accumulated = ""
+                # Preflight budget check (Story 9.3)
+                messages = await self._preflight_budget_check(
+                    messages, context_pack=dynamic_context
+                )
 
-            try:
-                async for chunk in self.llm_provider.complete_stream(
-                    messages=messages,
-                    model=self.model_alias,
-                    tools=self._openai_tools,
-                    tool_choice="auto",
-                    temperature=0.2,
-                ):
-                    chunk_type = chunk.get("type")
-
-                    if chunk_type == "token":
-                        # Yield token for real-time display
-                        token_content = chunk.get("content", "")
-                        if token_content:
-                            yield StreamEvent(
-                                event_type="llm_token",
-                                data={"content": token_content},
-                            )
-                            content_accumulated += token_content
-
-                    elif chunk_type == "tool_call_start":
-                        # Emit tool_call event when tool invocation begins
-                        tc_id = chunk.get("id", "")
-                        tc_name = chunk.get("name", "")
-                        tc_index = chunk.get("index", 0)
-
-                        tool_calls_accumulated[tc_index] = {
-                            "id": tc_id,
-                            "name": tc_name,
-                            "arguments": "",
-                        }
+                # Stream LLM response
+                tool_calls_accumulated: dict[int, dict[str, Any]] = {}
+                content_accumulated = ""
+                eager_tasks = {}
+                eager_semaphore = asyncio.Semaphore(self.max_parallel_tools)
+                stream_failed = False
 
-                        yield StreamEvent(
-                            event_type="tool_call",
-                            data={
-                                "tool": tc_name,
+                try:
+                    async for chunk in self.llm_provider.complete_stream(
+                        messages=self._with_dynamic_context(messages, dynamic_context),
+                        model=self.model_alias,
+                        tools=self._select_tools(tool_selection, mission),
+                        tool_choice="auto",
+                        temperature=0.2,
+                    ):
+                        chunk_type = chunk.get("type")
+
+                        if chunk_type == "token":
+                            # Yield token for real-time display
+                            token_content = chunk.get("content", "")
+                            if token_content:
+                                yield StreamEvent(
+                                    event_type="llm_token",
+                                    data={"content": token_content},
+                                )
+                                content_accumulated += token_content
+
+                        elif chunk_type == "tool_call_start":
+                            # Emit tool_call event when tool invocation begins
+                            tc_id = chunk.get("id", "")
+                            tc_name = chunk.get("name", "")
+                            tc_index = chunk.get("index", 0)
+
+                            tool_calls_accumulated[tc_index] = {
                                 "id": tc_id,
-                                "status": "starting",
-                            },
-                        )
+                                "name": tc_name,
+                                "arguments": "",
+                            }
 
-                    elif chunk_type == "tool_call_delta":
-                        # Accumulate argument chunks
-                        tc_index = chunk.get("index", 0)
-                        if tc_index in tool_calls_accumulated:
-                            tool_calls_accumulated[tc_index]["arguments"] += chunk.get(
-                                "arguments_delta", ""
+                            yield StreamEvent(
+                                event_type="tool_call",
+                                data={
+                                    "tool": tc_name,
+                                    "id": tc_id,
+                                    "status": "starting",
+                                },
                             )
 
-                    elif chunk_type == "tool_call_end":
-                        # Update accumulated tool call with final data
-                        tc_index = chunk.get("index", 0)
-                        if tc_index in tool_calls_accumulated:
-                            tool_calls_accumulated[tc_index]["arguments"] = chunk.get(
-                                "arguments", tool_calls_accumulated[tc_index]["arguments"]
+                        elif chunk_type == "tool_call_delta":
+                            # Accumulate argument chunks
+                            tc_index = chunk.get("index", 0)
+                            if tc_index in tool_calls_accumulated:
+                                tool_calls_accumulated[tc_index]["arguments"] += chunk.get(
+                                    "arguments_delta", ""
+                                )
+
+                        elif chunk_type == "tool_call_end":
+                            # Update accumulated tool call with final data
+                            tc_index = chunk.get("index", 0)
+                            if tc_index in tool_calls_accumulated:
+                                tool_calls_accumulated[tc_index]["arguments"] = chunk.get(
+                                    "arguments", tool_calls_accumulated[tc_index]["arguments"]
+                                )
+                                if self.eager_tool_dispatch:
+                                    self._dispatch_eager_tool(
+                                        tc_index, tool_calls_accumulated, eager_tasks, eager_semaphore
+                                    )
+
+                        elif chunk_type == "done":
+                            self._add_prompt_usage(prompt_usage, chunk.get("usage"))
+
+                        elif chunk_type == "error":
+                            stream_failed = True
+                            yield StreamEvent(
+                                event_type="error",
+                                data={"message": chunk.get("message", "Unknown error"), "step": step},
                             )
 
-                    elif chunk_type == "error":
-                        yield StreamEvent(
-                            event_type="error",
-                            data={"message": chunk.get("message", "Unknown error"), "step": step},
-                        )
+                except Exception as e:
+                    await self._cancel_tool_tasks(eager_tasks)
+                    self.logger.error("stream_error", error=str(e), step=step)
+                    yield StreamEvent(
+                        event_type="error",
+                        data={"message": str(e), "step": step},
+                    )
+                    continue
 
-            except Exception as e:
-                self.logger.error("stream_error", error=str(e), step=step)
-                yield StreamEvent(
-                    event_type="error",
-                    data={"message": str(e), "step": step},
-                )
-                continue
+                # Failed stream in eager mode: drop the partial turn and its in-flight tools
+                if stream_failed and self.eager_tool_dispatch:
+                    await self._cancel_tool_tasks(eager_tasks)
+                    continue
 
-            # Process tool calls
-            if tool_calls_accumulated:
-                # Tool calls received - this counts as a progress step
-                step += 1
+                # Process tool calls
+                if tool_calls_accumulated:
+                    # Tool calls received - this counts as a progress step
+                    step += 1
 
-                # Convert accumulated dict to list format for message
-                tool_calls_list = [
-                    {
-                        "id": tc_data["id"],
-                        "type": "function",
-                        "function": {
-                            "name": tc_data["name"],
-                            "arguments": tc_data["arguments"],
-                        },
-                    }
-                    for tc_data in tool_calls_accumulated.values()
-                ]
+                    # Convert accumulated dict to list format for message
+                    tool_calls_list = [
+                        {
+                            "id": tc_data["id"],
+                            "type": "function",
+                            "function": {
+                                "name": tc_data["name"],
+                                "arguments": tc_data["arguments"],
+                            },
+                        }
+                        for tc_data in tool_calls_accumulated.values()
+                    ]
 
-                self.logger.info(
-                    "stream_tool_calls_received",
-                    step=step,
-                    iteration=loop_iterations,
-                    count=len(tool_calls_list),
-                    tools=[tc["function"]["name"] for tc in tool_calls_list],
-                )
+                    self.logger.info(
+                        "stream_tool_calls_received",
+                        step=step,
+                        iteration=loop_iterations,
+                        count=len(tool_calls_list),
+                        tools=[tc["function"]["name"] for tc in tool_calls_list],
+                    )
+                    self._record_tool_calls(tool_selection, tool_calls_list)
 
-                # Add assistant message with tool calls to history
-                messages.append(assistant_tool_calls_to_message(tool_calls_list))
-
-                for tool_call in tool_calls_list:
-                    tool_name = tool_call["function"]["name"]
-                    tool_call_id = tool_call["id"]
-
-                    # Parse arguments
-                    try:
-                        tool_args = json.loads(tool_call["function"]["arguments"])
-                    except json.JSONDecodeError:
-                        tool_args = {}
-                        self.logger.warning(
-                            "stream_tool_args_parse_failed",
-                            tool=tool_name,
-                            raw_args=tool_call["function"]["arguments"],
-                        )
+                    # Add assistant message with tool calls to history
+                    messages.append(assistant_tool_calls_to_message(tool_calls_list))
 
-                    # Execute tool
-                    tool_result = await self._execute_tool(tool_name, tool_args)
+                    for batch in self._batch_tool_calls(tool_calls_list):
+                        for tool_call, tool_args, tool_result in await self._execute_tool_batch(
+                            batch, prestarted=eager_tasks
+                        ):
+                            tool_name = tool_call["function"]["name"]
+                            tool_call_id = tool_call["id"]
 
-                    # Emit tool_result event
-                    yield StreamEvent(
-                        event_type="tool_result",
-                        data={
-                            "tool": tool_name,
-                            "id": tool_call_id,
-                            "success": tool_result.get("success", False),
-                            "output": self._truncate_output(
-                                tool_result.get("output", str(tool_result.get("error", "")))
-                            ),
-                        },
-                    )
+                            # Emit tool_result event
+                            yield StreamEvent(
+                                event_type="tool_result",
+                                data={
+                                    "tool": tool_name,
+                                    "id": tool_call_id,
+                                    "success": tool_result.get("success", False),
+                                    "output": self._truncate_output(
+                                        tool_result.get("output", str(tool_result.get("error", "")))
+                                    ),
+                                },
+                            )
 
-                    # Check if PlannerTool updated the plan
-                    if tool_name in ("planner", "manage_plan") and tool_result.get("success"):
-                        yield StreamEvent(
-                            event_type="plan_updated",
-                            data={"action": tool_args.get("action", "unknown")},
-                        )
+                            # Record in execution history
+                            execution_history.append(
+                                {
+                                    "type": "tool_call",
+                                    "step": step,
+                                    "tool": tool_name,
+                                    "args": tool_args,
+                                    "result": tool_result,
+                                }
+                            )
+
+                            # Check if PlannerTool updated the plan
+                            if tool_name in ("planner", "manage_plan") and tool_result.get("success"):
+                                yield StreamEvent(
+                                    event_type="plan_updated",
+                                    data={"action": tool_args.get("action", "unknown")},
+                                )
+
+                            # Add tool result to messages (handle-based if store available and result is large)
+                            tool_message = await self._create_tool_message(
+                                tool_call_id, tool_name, tool_result, session_id, step
+                            )
+                            messages.append(tool_message)
 
-                    # Add tool result to messages (handle-based if store available and result is large)
-                    tool_message = await self._create_tool_message(
-                        tool_call_id, tool_name, tool_result, session_id, step
+                    # Tool turn complete - checkpoint it (non-blocking)
+                    self._schedule_checkpoint(
+                        checkpoints, state, mission, step, messages, execution_history
                     )
-                    messages.append(tool_message)
 
-            elif content_accumulated:
-                # No tool calls - this is the final answer
-                # Final answer - this counts as a progress step
-                step += 1
-                final_message = content_accumulated
-                self.logger.info(
-                    "stream_final_answer",
-                    step=step,
-                    iteration=loop_iterations,
-                    total_iterations=loop_iterations,
-                )
+                elif content_accumulated:
+                    # No tool calls - this is the final answer
+                    # Final answer - this counts as a progress step
+                    step += 1
+                    final_message = content_accumulated
+                    self.logger.info(
+                        "stream_final_answer",
+                        step=step,
+                        iteration=loop_iterations,
+                        total_iterations=loop_iterations,
+                    )
+                    execution_history.append(
+                        {"type": "final_answer", "step": step, "content": final_message}
+                    )
 
-                yield StreamEvent(
-                    event_type="final_answer",
-                    data={"content": final_message},
-                )
-                break
+                    yield StreamEvent(
+                        event_type="final_answer",
+                        data={"content": final_message},
+                    )
+                    break
 
-            else:
-                # Empty response - add prompt for LLM to continue
-                # NOTE: This does NOT count as a progress step
-                self.logger.warning(
-                    "stream_empty_response",
-                    step=step,
-                    iteration=loop_iterations,
-                )
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": "[System: Empty response. Please provide an answer or use a tool.]",
-                    }
-                )
+                else:
+                    # Empty response - add prompt for LLM to continue
+                    # NOTE: This does NOT count as a progress step
+                    self.logger.warning(
+                        "stream_empty_response",
+                        step=step,
+                        iteration=loop_iterations,
+                    )
+                    messages.append(
+                        {
+                            "role": "user",
+                            "content": "[System: Empty response. Please provide an answer or use a tool.]",
+                        }
+                    )
+        finally:
+            # Also runs on GeneratorExit (client disconnect): side-effecting tools must
+            # not keep running for a session that is gone
+            await self._cancel_tool_tasks(eager_tasks)
+            if compactor:
+                await compactor.cancel()
 
         # Handle max steps exceeded
         if step >= self.max_steps and not final_message:
@@ -710,7 +1034,9 @@ class LeanAgent:
                 data={"message": final_message, "step": step},
             )
 
-        # Save state
+        # Save state (after pending checkpoints, so the final state wins)
+        if checkpoints:
+            await checkpoints.flush()
         await self._save_state(session_id, state)
 
         # Log execution summary
@@ -720,9 +1046,12 @@ class LeanAgent:
             progress_steps=step,
             total_iterations=loop_iterations,
             overhead_iterations=loop_iterations - step,
+            prompt_tokens=prompt_usage["prompt_tokens"],
+            cached_tokens=prompt_usage["cached_tokens"],
+            tool_cache=self._tool_cache_stats_since(cache_stats_start),
         )
-
-        self.logger.info("execute_stream_complete", session_id=session_id, steps=step)
+        if tool_selection:
+            self.logger.info("tool_selection_summary", session_id=session_id, **tool_selection.stats)
 
     def _truncate_output(self, output: str, max_length: int = 200) -> str:
         """
@@ -739,18 +1068,79 @@ class LeanAgent:
             return output
         return output[:max_length] + "..."
 
-    async def _compress_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def _compact_history(
+        self,
+        messages: list[dict[str, Any]],
+        context_pack: str | None,
+        compactor: HistoryCompactor | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Keep the message history within budget before the next LLM call.
+
+        Without a compactor this is the blocking _compress_messages() unless
+        summarize_history is disabled (then a no-op, the preflight budget
+        check still enforces the hard limit). With background compaction,
+        finished summaries are spliced in and a new
+        one is started once the soft threshold (compression trigger or
+        SUMMARY_THRESHOLD messages) is crossed - the loop only waits when
+        the hard budget is exceeded, and falls back to deterministic
+        compression if that is not enough.
+
+        Args:
+            messages: Current message history
+            context_pack: Dynamic context sent alongside the messages
+            compactor: Background compactor of this mission (None = blocking mode)
+
+        Returns:
+            Message history to use for the next call
+        """
+        if compactor is None:
+            if not self.summarize_history:
+                return messages
+            return await self._compress_messages(messages, context_pack=context_pack)
+
+        messages = compactor.apply(messages)
+
+        if self.token_budgeter.is_over_budget(
+            messages=messages, tools=self._openai_tools, context_pack=context_pack
+        ):
+            messages = await compactor.wait(messages)
+            if self.token_budgeter.is_over_budget(
+                messages=messages, tools=self._openai_tools, context_pack=context_pack
+            ):
+                messages = self._deterministic_compression(messages)
+
+        soft_limit_crossed = len(messages) > self.SUMMARY_THRESHOLD or (
+            self.token_budgeter.should_compress(
+                messages=messages, tools=self._openai_tools, context_pack=context_pack
+            )
+        )
+        if soft_limit_crossed:
+            compactor.start(messages)
+
+        return messages
+
+    async def _compress_messages(
+        self, messages: list[dict[str, Any]], context_pack: str | None = None
+    ) -> list[dict[str, Any]]:
         """
         Compress message history using safe LLM-based summarization.
 
         Strategy (Story 9.3 - Safe Compression):
         1. Trigger based on token budget (primary) or message count (fallback)
         2. Build safe summary input from sanitized message previews (NO raw dumps)
-        3. Use LLM to summarize old messages (skip system prompt)
-        4. Replace old messages with summary + keep recent messages
-        5. Fallback: Simple truncation if LLM summarization fails
+        3. Use LLM to summarize exactly the dropped span (everything between
+           system prompt + mission and the recent messages)
+        4. Replace the span with the summary; cut points stay on assistant/tool
+           group boundaries
+        5. Fallback: Deterministic truncation if LLM summarization fails
 
         This prevents token overflow while preserving context.
+
+        Args:
+            messages: Message list to compress
+            context_pack: Dynamic context sent alongside the messages (counted
+                towards the budget in prompt_cache_layout mode)
         """
         message_count = len(messages)
 
@@ -758,6 +1148,7 @@ class LeanAgent:
         should_compress_budget = self.token_budgeter.should_compress(
             messages=messages,
             tools=self._openai_tools,
+            context_pack=context_pack,
         )
 
         # Message count trigger (fallback for backward compatibility)
@@ -775,17 +1166,17 @@ class LeanAgent:
             count_trigger=should_compress_count,
         )
 
-        # Extract old messages to summarize (skip system prompt)
-        # CRITICAL: Limit to prevent explosion even in compression
-        max_messages_to_summarize = min(self.SUMMARY_THRESHOLD - 1, 15)  # Cap at 15
-        old_messages = messages[1 : 1 + max_messages_to_summarize]
+        # Summarize exactly the messages that are dropped (mission is kept)
+        head, old_messages, recent_messages = split_history(messages)
+        if not old_messages:
+            return messages
 
         # Build safe summary input (NO raw JSON dumps)
         summary_input = self._build_safe_summary_input(old_messages)
 
         # EMERGENCY GUARD: Check if summary input itself is too large
         # If summary input > 50k chars (~12.5k tokens), use deterministic fallback
-        if len(summary_input) > 50000:
+        if len(summary_input) > MAX_SUMMARY_INPUT_CHARS:
             self.logger.error(
                 "compression_input_too_large",
                 input_length=len(summary_input),
@@ -794,16 +1185,7 @@ class LeanAgent:
             return self._deterministic_compression(messages)
 
         # Build summary prompt
-        summary_prompt = f"""Summarize this conversation history concisely:
-
-{summary_input}
-
-Provide a 2-3 paragraph summary of:
-- Key decisions made
-- Important tool results and findings
-- Context needed for understanding recent messages
-
-Keep it factual and concise."""
+        summary_prompt = build_summary_prompt(summary_input)
 
         # CRITICAL: Budget-check the compression prompt itself
         compression_messages = [{"role": "user", "content": summary_prompt}]
@@ -848,12 +1230,12 @@ Keep it factual and concise."""
 
             # Build compressed message list
             compressed = [
-                messages[0],  # System prompt
+                *head,  # System prompt and mission
                 {
                     "role": "system",
-                    "content": f"[Previous Context Summary]\n{summary}",
+                    "content": f"{SUMMARY_PREFIX}\n{summary}",
                 },
-                *messages[self.SUMMARY_THRESHOLD :],  # Recent messages
+                *recent_messages,
             ]
 
             self.logger.info(
@@ -879,9 +1261,10 @@ Keep it factual and concise."""
         - Context length exceeded errors
 
         Strategy:
-        - Keep system prompt
-        - Keep last 10 messages (hard cap)
-        - Add a simple text summary of what was dropped
+        - Keep system prompt and mission
+        - Keep the last 10 messages, extended back to the start of their
+          assistant/tool group
+        - Add a simple text note of what was dropped
 
         This NEVER calls LLM and NEVER explodes.
         """
@@ -890,26 +1273,20 @@ Keep it factual and concise."""
             original_count=len(messages),
         )
 
-        # Keep system prompt
-        system_prompt = messages[0] if messages else {"role": "system", "content": ""}
-
-        # Keep last 10 messages (excluding system prompt)
-        recent_messages = messages[-10:] if len(messages) > 10 else messages[1:]
-
-        # Create simple summary of dropped content
-        dropped_count = len(messages) - len(recent_messages) - 1  # -1 for system
+        head, dropped, recent_messages = split_history(messages)
+        dropped_count = len(dropped)
         if dropped_count > 0:
             summary_text = (
                 f"[{dropped_count} earlier messages compressed for token budget. "
                 f"Continuing from recent context.]"
             )
             compressed = [
-                system_prompt,
+                *head,
                 {"role": "system", "content": summary_text},
                 *recent_messages,
             ]
         else:
-            compressed = [system_prompt, *recent_messages]
+            compressed = list(messages)
 
         self.logger.info(
             "deterministic_compression_complete",
@@ -1035,6 +1412,170 @@ Keep it factual and concise."""
 
         return messages
 
+    def _parse_tool_args(self, tool_call: dict[str, Any]) -> dict[str, Any]:
+        """Parse JSON arguments of a tool call (empty dict if malformed)."""
+        try:
+            args: dict[str, Any] = json.loads(tool_call["function"]["arguments"])
+            return args
+        except json.JSONDecodeError:
+            self.logger.warning(
+                "tool_args_parse_failed",
+                tool=tool_call["function"]["name"],
+                raw_args=tool_call["function"]["arguments"],
+            )
+            return {}
+
+    def _is_parallel_safe(self, tool_name: str) -> bool:
+        """Check whether a tool declares itself safe for concurrent execution."""
+        tool = self.tools.get(tool_name)
+        # Only an explicit True opts in - unknown tools and mocks stay serialized
+        return tool is not None and getattr(tool, "supports_parallelism", False) is True
+
+    def _batch_tool_calls(
+        self, tool_calls: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Group the tool calls of one LLM turn into dispatch batches.
+
+        Consecutive parallel-safe calls share a batch. Every other call gets
+        a batch of its own and acts as a barrier, so write tools still see
+        the effects of earlier calls and never overlap with reads. Without
+        parallel_tool_calls every call is its own batch (sequential).
+
+        Args:
+            tool_calls: Tool calls in the order returned by the LLM
+
+        Returns:
+            List of batches; flattening them yields the original order.
+        """
+        if not self.parallel_tool_calls:
+            return [[tool_call] for tool_call in tool_calls]
+
+        batches: list[list[dict[str, Any]]] = []
+        current: list[dict[str, Any]] = []
+
+        for tool_call in tool_calls:
+            if self._is_parallel_safe(tool_call["function"]["name"]):
+                current.append(tool_call)
+                continue
+            if current:
+                batches.append(current)
+                current = []
+            batches.append([tool_call])
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _dispatch_eager_tool(
+        self,
+        index: int,
+        tool_calls_accumulated: dict[int, dict[str, Any]],
+        eager_tasks: dict[str, asyncio.Task[dict[str, Any]]],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """
+        Start a completed tool call while the LLM stream is still running.
+
+        Only parallel-safe (read-only) tools are started, and only while every
+        earlier call of the turn was started eagerly as well - a write tool
+        acts as a barrier, so nothing after it runs ahead of it.
+
+        Args:
+            index: Stream index of the completed tool call
+            tool_calls_accumulated: Tool calls of the current turn by index
+            eager_tasks: Started tasks by tool call id (updated in place)
+            semaphore: Concurrency limit shared by the turn's eager tools
+        """
+        tc_data = tool_calls_accumulated[index]
+        tool_call_id = tc_data["id"]
+        if not tool_call_id or tool_call_id in eager_tasks:
+            return
+        if not self._is_parallel_safe(tc_data["name"]):
+            return
+
+        earlier = [tc for idx, tc in tool_calls_accumulated.items() if idx < index]
+        if any(tc["id"] not in eager_tasks for tc in earlier):
+            return
+
+        try:
+            tool_args = json.loads(tc_data["arguments"] or "{}")
+        except json.JSONDecodeError:
+            return  # Regular dispatch reports the parse failure
+
+        async def run() -> dict[str, Any]:
+            async with semaphore:
+                return await self._execute_tool(tc_data["name"], tool_args)
+
+        eager_tasks[tool_call_id] = asyncio.create_task(run())
+        self.logger.info("eager_tool_dispatch", tool=tc_data["name"], index=index)
+
+    async def _cancel_tool_tasks(self, tasks: dict[str, asyncio.Task[dict[str, Any]]]) -> None:
+        """Cancel in-flight eagerly dispatched tool tasks and wait for them."""
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.logger.warning("eager_tools_cancelled", count=len(pending))
+        tasks.clear()
+
+    async def _execute_tool_batch(
+        self,
+        batch: list[dict[str, Any]],
+        prestarted: dict[str, asyncio.Task[dict[str, Any]]] | None = None,
+    ) -> list[tuple[dict[str, Any], dict[str, Any], dict[str, Any]]]:
+        """
+        Execute one dispatch batch of tool calls.
+
+        Batches with more than one call run concurrently via asyncio.gather,
+        bounded by max_parallel_tools. Results are returned in batch order
+        regardless of completion order.
+
+        Args:
+            batch: Tool calls from _batch_tool_calls()
+            prestarted: Already running tasks by tool call id (eager dispatch);
+                their results are awaited instead of executing the tool again
+
+        Returns:
+            List of (tool_call, parsed_args, result) tuples in batch order.
+        """
+        prestarted = prestarted or {}
+        parsed = [(tool_call, self._parse_tool_args(tool_call)) for tool_call in batch]
+
+        if len(parsed) == 1:
+            tool_call, tool_args = parsed[0]
+            task = prestarted.get(tool_call["id"])
+            if task is not None:
+                return [(tool_call, tool_args, await task)]
+            result = await self._execute_tool(tool_call["function"]["name"], tool_args)
+            return [(tool_call, tool_args, result)]
+
+        semaphore = asyncio.Semaphore(self.max_parallel_tools)
+
+        async def run(tool_call: dict[str, Any], tool_args: dict[str, Any]) -> dict[str, Any]:
+            task = prestarted.get(tool_call["id"])
+            if task is not None:
+                return await task
+            async with semaphore:
+                return await self._execute_tool(tool_call["function"]["name"], tool_args)
+
+        self.logger.info(
+            "parallel_tool_dispatch",
+            count=len(parsed),
+            max_parallel=self.max_parallel_tools,
+            tools=[tool_call["function"]["name"] for tool_call, _ in parsed],
+        )
+
+        # _execute_tool never raises, so gather cannot lose sibling results
+        results = await asyncio.gather(*(run(tc, args) for tc, args in parsed))
+
+        return [
+            (tool_call, tool_args, result)
+            for (tool_call, tool_args), result in zip(parsed, results, strict=True)
+        ]
+
     async def _execute_tool(
         self,
         tool_name: str,
@@ -1045,14 +1586,45 @@ Keep it factual and concise."""
         if not tool:
             return {"success": False, "error": f"Tool not found: {tool_name}"}
 
+        # Session-scoped memoization (MagicMock attributes are truthy, so check `is True`)
+        cacheable = getattr(tool, "cacheable", False) is True
+        tool_cache = self._tool_cache if cacheable else None
+        resource = getattr(tool, "cache_resource", None)
+        resource = resource if isinstance(resource, str) else None
+        if tool_cache is not None:
+            cached = tool_cache.get(tool_name, tool_args)
+            if cached is not None:
+                self.logger.info("tool_cache_hit", tool=tool_name)
+                return cached
+
         try:
             self.logger.info("tool_execute", tool=tool_name, args_keys=list(tool_args.keys()))
-            result = await tool.execute(**tool_args)
+            if self._tool_coalescer is not None and cacheable:
+                user_context = getattr(tool, "user_context", None)
+                result, shared = await self._tool_coalescer.run(
+                    tool_name,
+                    tool_args,
+                    user_context if isinstance(user_context, dict) else None,
+                    lambda: tool.execute(**tool_args),
+                )
+                if shared:
+                    self.logger.info("tool_call_coalesced", tool=tool_name)
+                    result = dict(result)
+            else:
+                result = await tool.execute(**tool_args)
             self.logger.info("tool_complete", tool=tool_name, success=result.get("success"))
+            if tool_cache is not None and result.get("success"):
+                tool_cache.put(tool_name, tool_args, result, resource=resource)
             return result
         except Exception as e:
             self.logger.error("tool_exception", tool=tool_name, error=str(e))
             return {"success": False, "error": str(e)}
+        finally:
+            # Side effects (even of failed calls) may have changed what cached reads returned
+            if self._tool_cache is not None and getattr(tool, "mutates", False) is True:
+                invalidated = self._tool_cache.invalidate_resource(resource)
+                if invalidated:
+                    self.logger.info("tool_cache_invalidated", tool=tool_name, entries=invalidated)
 
     async def _create_tool_message(
         self,
@@ -1084,7 +1656,13 @@ Keep it factual and concise."""
         result_size = len(result_json)
 
         # Use handle-based storage if store available and result is large
-        if self.tool_result_store and result_size > self.TOOL_RESULT_STORE_THRESHOLD:
+        # (pages of stored results are never stored again)
+        is_page = self._result_fetcher is not None and tool_name == self._result_fetcher.name
+        if (
+            self.tool_result_store
+            and result_size > self.TOOL_RESULT_STORE_THRESHOLD
+            and not is_page
+        ):
             # Store result and get handle
             handle = await self.tool_result_store.put(
                 tool_name=tool_name,
@@ -1114,7 +1692,9 @@ Keep it factual and concise."""
             # Use standard message with truncation
             return tool_result_to_message(tool_call_id, tool_name, tool_result)
 
-    async def _preflight_budget_check(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    async def _preflight_budget_check(
+        self, messages: list[dict[str, Any]], context_pack: str | None = None
+    ) -> list[dict[str, Any]]:
         """
         Preflight budget check before LLM call.
 
@@ -1123,6 +1703,7 @@ Keep it factual and concise."""
 
         Args:
             messages: Message list to check
+            context_pack: Dynamic context sent alongside the messages
 
         Returns:
             Sanitized/truncated message list if needed, otherwise original
@@ -1131,6 +1712,7 @@ Keep it factual and concise."""
         if not self.token_budgeter.is_over_budget(
             messages=messages,
             tools=self._openai_tools,
+            context_pack=context_pack,
         ):
             return messages
 
@@ -1148,6 +1730,7 @@ Keep it factual and concise."""
         if self.token_budgeter.is_over_budget(
             messages=sanitized,
             tools=self._openai_tools,
+            context_pack=context_pack,
         ):
             self.logger.error(
                 "emergency_truncation",
@@ -1155,8 +1738,9 @@ Keep it factual and concise."""
                 action="keep_recent_only",
             )
 
-            # Keep system prompt + last 10 messages (aggressive truncation)
-            emergency_truncated = [sanitized[0]] + sanitized[-10:]
+            # Keep system prompt, mission and recent tool-call groups (aggressive truncation)
+            head, _, recent_messages = split_history(sanitized)
+            emergency_truncated = [*head, *recent_messages]
 
             self.logger.warning(
                 "emergency_truncation_complete",
@@ -1168,11 +1752,77 @@ Keep it factual and concise."""
         return sanitized
 
     async def _save_state(self, session_id: str, state: dict[str, Any]) -> None:
-        """Save state including PlannerTool state."""
+        """Save state including PlannerTool state (mission finished, drop checkpoint)."""
         if self._planner:
             state["planner_state"] = self._planner.get_state()
+        state.pop(CHECKPOINT_KEY, None)
         await self.state_manager.save_state(session_id, state)
 
+    def _get_resumable_checkpoint(
+        self, mission: str, state: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """
+        Return the stored checkpoint if the mission can be resumed from it.
+
+        A checkpoint only exists while a mission is unfinished (it is removed
+        by _save_state). It is used if it belongs to the same mission.
+
+        Args:
+            mission: Mission being executed
+            state: Loaded session state
+
+        Returns:
+            Checkpoint dictionary, or None to start fresh
+        """
+        checkpoint: dict[str, Any] | None = state.get(CHECKPOINT_KEY)
+        if not checkpoint:
+            return None
+
+        if checkpoint.get("mission") != mission:
+            self.logger.info("checkpoint_ignored", reason="different_mission")
+            return None
+
+        self.logger.info(
+            "mission_resumed",
+            step=checkpoint.get("step", 0),
+            messages=len(checkpoint.get("messages", [])),
+            checkpoint_created_at=checkpoint.get("created_at"),
+        )
+        return checkpoint
+
+    def _schedule_checkpoint(
+        self,
+        checkpoints: CheckpointWriter | None,
+        state: dict[str, Any],
+        mission: str,
+        step: int,
+        messages: list[dict[str, Any]],
+        execution_history: list[dict[str, Any]],
+    ) -> None:
+        """Snapshot the loop after a completed tool turn and hand it to the writer."""
+        if checkpoints is None:
+            return
+
+        snapshot = dict(state)
+        if self._planner:
+            snapshot["planner_state"] = copy.deepcopy(self._planner.get_state())
+        snapshot[CHECKPOINT_KEY] = build_checkpoint(mission, step, messages, execution_history)
+        checkpoints.schedule(snapshot)
+
+    def reset_session(self) -> None:
+        """
+        Drop per-session state so the agent can serve another mission.
+
+        Called by the agent pool before a warm agent is reused: clears the
+        plan, the incremental context pack and the session-scoped tool cache.
+        Tools, LLM provider and MCP connections are kept.
+        """
+        if self._planner:
+            self._planner.set_state(None)
+        self.context_builder.reset()
+        if self._tool_cache:
+            self._tool_cache.clear()
+
     async def close(self) -> None:
         """
         Clean up resources (MCP connections, etc).
@@ -75,6 +75,10 @@ class ExecutionResult:
         execution_history: List of execution events (thoughts, actions, observations)
         todolist_id: ID of the TodoList that was executed (if any)
         pending_question: Question awaiting user response (if status is paused)
+        tool_cache_stats: Tool result cache hits/misses/invalidations of this
+            execution (if memoization is enabled)
+        token_usage: Prompt, cached prompt and completion tokens summed over
+            all LLM calls of this execution (if reported by the agent)
     """
 
     session_id: str
@@ -83,4 +87,6 @@ class ExecutionResult:
     execution_history: list[dict[str, Any]] = field(default_factory=list)
     todolist_id: str | None = None
     pending_question: dict[str, Any] | None = None
+    tool_cache_stats: dict[str, int] | None = None
+    token_usage: dict[str, int] | None = None
 
@@ -339,6 +339,7 @@ Respond with JSON: {{"decision": "FOLLOW_UP" or "NEW_MISSION", "confidence": 0.0
                 model="fast",  # Use faster/cheaper model for classification
                 response_format={"type": "json_object"},
                 temperature=0.1,
+                cache=True,  # Same query + context classifies the same way
             )
 
             if result.get("success"):
@@ -5,7 +5,10 @@ This module provides utilities for estimating token usage and enforcing
 budget constraints to prevent "input tokens exceed limit" errors.
 
 Key features:
-- Heuristic token estimation (chars/4 + overhead)
+- Pluggable token estimation: heuristic (chars/4) by default, real
+  tokenizer via TokenEstimatorProtocol (plus structural overhead)
+- Running token ledger: per-message counts and tool schema cost are cached,
+  so repeated budget checks on a growing history stay cheap
 - Budget-based compression triggers
 - Safe message sanitization (hard caps on content)
 - Handle-aware: understands tool result handles vs raw outputs
@@ -16,17 +19,56 @@ from typing import Any
 
 import structlog
 
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
+
+
+class HeuristicTokenEstimator:
+    """
+    Fast heuristic token estimator (~4 characters per token).
+
+    Used as default and as fallback when no tokenizer is available for
+    the configured model.
+    """
+
+    def __init__(self, chars_per_token: int = 4):
+        """
+        Initialize heuristic estimator.
+
+        Args:
+            chars_per_token: Average characters per token (default: 4)
+        """
+        self.chars_per_token = chars_per_token
+
+    @property
+    def name(self) -> str:
+        """Return estimator identifier."""
+        return "heuristic"
+
+    def count_tokens(self, text: str) -> int:
+        """Estimate tokens as len(text) / chars_per_token."""
+        return len(text) // self.chars_per_token
+
 
 class TokenBudgeter:
     """
     Budget manager for LLM prompt token estimation and enforcement.
 
-    Uses a simple heuristic for token estimation:
-    - Base: len(text) / 4 (approximates ~4 chars per token)
+    Token estimation:
+    - Base: text tokens from the estimator (default: len(text) / 4)
     - Overhead: JSON structure, message roles, tool schemas
     - Context pack: Estimated separately with caps
 
-    This is intentionally conservative to prevent overflow.
+    The default heuristic is intentionally conservative to prevent overflow.
+    Pass a tokenizer-backed estimator for accurate counts.
+
+    Token Ledger:
+        Per-message token counts are cached by message identity and reused
+        as long as the message's content and tool_calls are unchanged, so
+        appended, replaced (e.g. the rebuilt system prompt) and compressed
+        histories only pay for messages that are actually new. The tool
+        schema cost is computed once per tools list. Cache entries for
+        messages that are no longer part of any recently estimated list
+        are pruned automatically.
     """
 
     # Default budget limits (conservative for GPT-4 class models)
@@ -48,6 +90,7 @@ class TokenBudgeter:
         self,
         max_input_tokens: int | None = None,
         compression_trigger: int | None = None,
+        estimator: TokenEstimatorProtocol | None = None,
     ):
         """
         Initialize TokenBudgeter with budget limits.
@@ -55,11 +98,21 @@ class TokenBudgeter:
         Args:
             max_input_tokens: Maximum input tokens allowed (default: 100k)
             compression_trigger: Token count to trigger compression (default: 80k)
+            estimator: Token estimator for text (default: chars/4 heuristic)
         """
         self.max_input_tokens = max_input_tokens or self.DEFAULT_MAX_INPUT_TOKENS
         self.compression_trigger = compression_trigger or self.DEFAULT_COMPRESSION_TRIGGER
+        self.estimator = estimator or HeuristicTokenEstimator(self.CHARS_PER_TOKEN)
         self.logger = structlog.get_logger().bind(component="token_budgeter")
 
+        # Token ledger: id(message) -> (message, content, tool_calls, tokens, generation)
+        self._message_tokens: dict[int, tuple[dict[str, Any], Any, Any, int, int]] = {}
+        self._ledger_generation = 0
+        self._ledger_hits = 0
+        self._ledger_misses = 0
+        # Tool schema cost: (tools list, tokens) - schemas are static per agent
+        self._tools_tokens: tuple[list[dict[str, Any]], int] | None = None
+
     def estimate_tokens(
         self,
         messages: list[dict[str, Any]],
@@ -82,41 +135,16 @@ class TokenBudgeter:
         # System prompt overhead
         total_tokens += self.SYSTEM_PROMPT_OVERHEAD_TOKENS
 
-        # Messages
-        for msg in messages:
-            # Message overhead (role, structure)
-            total_tokens += self.MESSAGE_OVERHEAD_TOKENS
+        # Messages (cached per message via the ledger)
+        total_tokens += self._ledger_message_tokens(messages)
 
-            # Content
-            content = msg.get("content")
-            if content:
-                if isinstance(content, str):
-                    total_tokens += len(content) // self.CHARS_PER_TOKEN
-                elif isinstance(content, list):
-                    # Multi-part content (images, etc.)
-                    for part in content:
-                        if isinstance(part, dict) and "text" in part:
-                            total_tokens += len(part["text"]) // self.CHARS_PER_TOKEN
-
-            # Tool calls (if present)
-            tool_calls = msg.get("tool_calls")
-            if tool_calls:
-                for tc in tool_calls:
-                    # Tool name + arguments
-                    tc_json = json.dumps(tc, ensure_ascii=False, default=str)
-                    total_tokens += len(tc_json) // self.CHARS_PER_TOKEN
-
-        # Tool schemas
+        # Tool schemas (cached per tools list)
         if tools:
-            for tool in tools:
-                total_tokens += self.TOOL_SCHEMA_OVERHEAD_TOKENS
-                # Tool schema JSON
-                tool_json = json.dumps(tool, ensure_ascii=False, default=str)
-                total_tokens += len(tool_json) // self.CHARS_PER_TOKEN
+            total_tokens += self._tool_schema_tokens(tools)
 
         # Context pack
         if context_pack:
-            total_tokens += len(context_pack) // self.CHARS_PER_TOKEN
+            total_tokens += self.estimator.count_tokens(context_pack)
 
         self.logger.debug(
             "tokens_estimated",
@@ -124,10 +152,129 @@ class TokenBudgeter:
             tools_count=len(tools) if tools else 0,
             context_pack_length=len(context_pack) if context_pack else 0,
             estimated_tokens=total_tokens,
+            estimator=self.estimator.name,
         )
 
         return total_tokens
 
+    def _count_message_tokens(self, msg: dict[str, Any]) -> int:
+        """
+        Estimate tokens for a single message (uncached).
+
+        Args:
+            msg: Message dictionary
+
+        Returns:
+            Estimated token count including message overhead
+        """
+        # Message overhead (role, structure)
+        tokens = self.MESSAGE_OVERHEAD_TOKENS
+
+        # Content
+        content = msg.get("content")
+        if content:
+            if isinstance(content, str):
+                tokens += self.estimator.count_tokens(content)
+            elif isinstance(content, list):
+                # Multi-part content (images, etc.)
+                for part in content:
+                    if isinstance(part, dict) and "text" in part:
+                        tokens += self.estimator.count_tokens(part["text"])
+
+        # Tool calls (if present)
+        tool_calls = msg.get("tool_calls")
+        if tool_calls:
+            for tc in tool_calls:
+                # Tool name + arguments
+                tc_json = json.dumps(tc, ensure_ascii=False, default=str)
+                tokens += self.estimator.count_tokens(tc_json)
+
+        return tokens
+
+    def _ledger_message_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """
+        Sum message tokens using the ledger cache.
+
+        A cached count is reused while the same message object still holds
+        the same content and tool_calls objects. Entries not seen during the
+        last two estimations are pruned to keep the ledger bounded.
+
+        Args:
+            messages: List of message dictionaries
+
+        Returns:
+            Total estimated message tokens
+        """
+        self._ledger_generation += 1
+        generation = self._ledger_generation
+        ledger = self._message_tokens
+        total = 0
+
+        for msg in messages:
+            content = msg.get("content")
+            tool_calls = msg.get("tool_calls")
+            entry = ledger.get(id(msg))
+
+            if (
+                entry is not None
+                and entry[0] is msg
+                and entry[1] is content
+                and entry[2] is tool_calls
+            ):
+                tokens = entry[3]
+                self._ledger_hits += 1
+            else:
+                tokens = self._count_message_tokens(msg)
+                self._ledger_misses += 1
+
+            ledger[id(msg)] = (msg, content, tool_calls, tokens, generation)
+            total += tokens
+
+        # Prune entries of messages dropped from the history (replaced or compressed)
+        if len(ledger) > len(messages):
+            stale = [key for key, entry in ledger.items() if entry[4] < generation - 1]
+            for key in stale:
+                del ledger[key]
+
+        return total
+
+    def _tool_schema_tokens(self, tools: list[dict[str, Any]]) -> int:
+        """
+        Estimate tokens for tool schemas, cached per tools list.
+
+        Args:
+            tools: List of tool schemas (e.g. the agent's OpenAI tool list)
+
+        Returns:
+            Estimated token count for all tool schemas
+        """
+        if self._tools_tokens is not None and self._tools_tokens[0] is tools:
+            return self._tools_tokens[1]
+
+        tokens = 0
+        for tool in tools:
+            tokens += self.TOOL_SCHEMA_OVERHEAD_TOKENS
+            # Tool schema JSON
+            tool_json = json.dumps(tool, ensure_ascii=False, default=str)
+            tokens += self.estimator.count_tokens(tool_json)
+
+        self._tools_tokens = (tools, tokens)
+        return tokens
+
+    @property
+    def ledger_stats(self) -> dict[str, int]:
+        """
+        Get token ledger statistics.
+
+        Returns:
+            Dictionary with cached message count, hits and misses
+        """
+        return {
+            "cached_messages": len(self._message_tokens),
+            "hits": self._ledger_hits,
+            "misses": self._ledger_misses,
+        }
+
     def is_over_budget(
         self,
         messages: list[dict[str, Any]],
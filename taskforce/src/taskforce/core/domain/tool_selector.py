@@ -0,0 +1,239 @@
+"""
+Tool Selection
+
+Ranks the registered tools against the mission and the current plan step
+with a local lexical (BM25) index, so only the most relevant tool schemas
+are sent to the LLM. Agents with MCP servers expose 30+ tools, and every
+schema costs prompt tokens and time to first token on every call.
+
+Key Concepts:
+- ToolSelector: BM25 index over tool names, descriptions and parameters
+  (built once per agent)
+- ToolSelection: Per-mission selection state - top-k tools plus always
+  included tools (planner) and tools already used in the mission, with a
+  fallback to the full tool set when the model calls a tool that was not sent
+- Token savings are tracked per mission (estimated schema tokens)
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
+
+_TERM_PATTERN = re.compile(r"[^\W_]+")
+_CAMEL_CASE_PATTERN = re.compile(r"([a-z])([A-Z])")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lower-case terms.
+
+    snake_case and camelCase identifiers are split into their parts.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms
+    """
+    text = _CAMEL_CASE_PATTERN.sub(r"\1 \2", text)
+    return _TERM_PATTERN.findall(text.lower())
+
+
+def _schema_text(schema: dict[str, Any]) -> str:
+    """Collect the searchable text of an OpenAI-format tool schema."""
+    function = schema.get("function", {})
+    name = function.get("name", "")
+    parts = [name, name, function.get("description", "")]  # Name weighted twice
+
+    def collect(properties: dict[str, Any]) -> None:
+        for prop_name, prop in properties.items():
+            parts.append(prop_name)
+            if isinstance(prop, dict):
+                parts.append(str(prop.get("description", "")))
+                collect(prop.get("properties", {}) or {})
+                items = prop.get("items")
+                if isinstance(items, dict):
+                    collect(items.get("properties", {}) or {})
+
+    collect(function.get("parameters", {}).get("properties", {}) or {})
+    return " ".join(parts)
+
+
+class ToolSelector:
+    """
+    BM25 index over OpenAI-format tool schemas.
+
+    The index is built once; ranking a query is a single pass over the
+    query terms' postings.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(
+        self,
+        tools: list[dict[str, Any]],
+        estimator: TokenEstimatorProtocol,
+        always_include: Iterable[str] = ("planner",),
+    ):
+        """
+        Build the index.
+
+        Args:
+            tools: Tool schemas in OpenAI format (order is preserved in selections)
+            estimator: Token estimator used to measure schema sizes
+            always_include: Tool names sent on every call regardless of rank
+        """
+        self.tools = tools
+        self.names = [schema["function"]["name"] for schema in tools]
+        self.always_include = [name for name in always_include if name in self.names]
+
+        self._schema_tokens = {
+            name: estimator.count_tokens(json.dumps(schema))
+            for name, schema in zip(self.names, tools, strict=True)
+        }
+        self.full_set_tokens = sum(self._schema_tokens.values())
+
+        documents = [Counter(tokenize(_schema_text(schema))) for schema in tools]
+        self._doc_lengths = [sum(doc.values()) for doc in documents]
+        self._avg_doc_length = sum(self._doc_lengths) / max(1, len(documents))
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        for doc_index, doc in enumerate(documents):
+            for term, frequency in doc.items():
+                self._postings.setdefault(term, []).append((doc_index, frequency))
+
+    def rank(self, query: str) -> list[tuple[str, float]]:
+        """
+        Rank tools by BM25 score against a query.
+
+        Args:
+            query: Free text (mission, current plan step)
+
+        Returns:
+            (tool name, score) pairs with score > 0, best first
+        """
+        scores: dict[int, float] = {}
+        doc_count = len(self.tools)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_index, frequency in postings:
+                norm = 1 - self.B + self.B * self._doc_lengths[doc_index] / self._avg_doc_length
+                scores[doc_index] = scores.get(doc_index, 0.0) + idf * (
+                    frequency * (self.K1 + 1) / (frequency + self.K1 * norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.names[doc_index], score) for doc_index, score in ranked]
+
+    def schemas_for(self, names: set[str]) -> list[dict[str, Any]]:
+        """Return the schemas of the given tools in registration order."""
+        return [schema for name, schema in zip(self.names, self.tools, strict=True) if name in names]
+
+    def tokens_for(self, names: set[str]) -> int:
+        """Return the estimated schema tokens of the given tools."""
+        return sum(self._schema_tokens[name] for name in names if name in self._schema_tokens)
+
+
+class ToolSelection:
+    """
+    Per-mission tool selection.
+
+    Selects the top-k tools for a query plus always included tools and tools
+    already called in this mission (so follow-up calls keep working).
+    Selections are cached per query, so the tools payload only changes when
+    the plan step changes. Once the model calls a tool that was not sent, the
+    full tool set is used for the rest of the mission.
+    """
+
+    def __init__(self, selector: ToolSelector, top_k: int):
+        """
+        Initialize selection state.
+
+        Args:
+            selector: Tool index of the agent
+            top_k: Number of ranked tools to send (besides always included ones)
+        """
+        self.selector = selector
+        self.top_k = top_k
+        self.full_set = False
+        self._used: set[str] = set()
+        self._sent: set[str] = set()
+        self._cache: dict[tuple[str, frozenset[str]], set[str]] = {}
+        self._calls = 0
+        self._tokens_sent = 0
+        self._fallbacks = 0
+
+    def select(self, query: str) -> list[dict[str, Any]]:
+        """
+        Select the tool schemas for the next LLM call.
+
+        Args:
+            query: Mission and current plan step
+
+        Returns:
+            Tool schemas in OpenAI format (registration order)
+        """
+        if self.full_set:
+            names = set(self.selector.names)
+        else:
+            key = (query, frozenset(self._used))
+            cached = self._cache.get(key)
+            if cached is None:
+                ranked = [name for name, _ in self.selector.rank(query)][: self.top_k]
+                if ranked:
+                    cached = {*self.selector.always_include, *self._used, *ranked}
+                else:
+                    # Nothing matches lexically - do not guess
+                    cached = set(self.selector.names)
+                self._cache[key] = cached
+            names = cached
+
+        self._sent = names
+        self._calls += 1
+        self._tokens_sent += self.selector.tokens_for(names)
+        return self.selector.schemas_for(names)
+
+    def record_calls(self, tool_names: Iterable[str]) -> list[str]:
+        """
+        Record the tools the model called with the last selection.
+
+        Args:
+            tool_names: Names of the called tools
+
+        Returns:
+            Known tools that were called although they were not sent
+            (triggers the full-set fallback)
+        """
+        tool_names = [name for name in tool_names if name in self.selector.names]
+        self._used.update(tool_names)
+        missing = [name for name in tool_names if name not in self._sent]
+        if missing and not self.full_set:
+            self.full_set = True
+            self._fallbacks += 1
+        return missing
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """
+        Get selection statistics for the mission.
+
+        Returns:
+            Dictionary with LLM calls, estimated schema tokens sent, tokens a
+            full tool set would have cost, tokens saved and fallbacks
+        """
+        tokens_full = self._calls * self.selector.full_set_tokens
+        return {
+            "llm_calls": self._calls,
+            "tool_tokens_sent": self._tokens_sent,
+            "tool_tokens_full": tokens_full,
+            "tool_tokens_saved": tokens_full - self._tokens_sent,
+            "full_set_fallbacks": self._fallbacks,
+        }
@@ -0,0 +1,120 @@
+"""
+Tool Cache Protocols
+
+This module defines the protocol interfaces for memoizing tool results and
+coalescing identical tool calls. Agents depend on these protocols only; the
+implementations live in the infrastructure layer and are injected by the
+factory.
+
+Key Concepts:
+- Tool result cache: session-scoped memoization of cacheable tool results,
+  invalidated per cache_resource when a mutating tool runs
+- Tool call coalescer: identical calls of cacheable tools that are in flight
+  at the same time share one execution
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+
+class ToolCacheProtocol(Protocol):
+    """
+    Protocol defining the contract for tool result caches.
+
+    Results are keyed by tool name and normalized input. Implementations
+    decide on expiry and bounds; agents only rely on get/put returning
+    results stored for identical calls until they are invalidated.
+    """
+
+    def get(self, tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Retrieve a cached result.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input parameters for the tool
+
+        Returns:
+            Cached result dict or None on a cache miss
+        """
+        ...
+
+    def put(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        result: dict[str, Any],
+        ttl: int | None = None,
+        resource: str | None = None,
+    ) -> None:
+        """
+        Store a tool result.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input parameters for the tool
+            result: Tool execution result to cache
+            ttl: Optional TTL override in seconds
+            resource: Resource the result was read from (see invalidate_resource)
+        """
+        ...
+
+    def invalidate_resource(self, resource: str | None) -> int:
+        """
+        Remove all results read from a resource.
+
+        Args:
+            resource: Resource modified by a mutating tool (None = unknown,
+                drops all entries)
+
+        Returns:
+            Number of removed entries
+        """
+        ...
+
+    def clear(self) -> None:
+        """Clear all cached entries and reset statistics."""
+        ...
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Cache statistics (hits, misses, invalidations, ...).
+
+        Returns:
+            Dictionary of counters
+        """
+        ...
+
+
+class ToolCallCoalescerProtocol(Protocol):
+    """
+    Protocol defining the contract for coalescing identical tool calls.
+
+    The first caller starts the work, later callers with the same tool,
+    input and security context attach to it and receive the same result.
+    """
+
+    async def run(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        security_context: dict[str, Any] | None,
+        fn: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Run a tool call once for all identical concurrent callers.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input parameters for the tool
+            security_context: Caller context the result depends on (e.g. the
+                user_context of RAG tools); calls with different contexts are
+                never shared
+            fn: Coroutine factory executing the tool
+
+        Returns:
+            Tuple of (result, shared); shared is True for callers that
+            attached to another caller's execution
+        """
+        ...
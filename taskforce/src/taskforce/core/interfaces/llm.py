@@ -83,6 +83,8 @@ class LLMProviderProtocol(Protocol):
                         - {"type": "function", "function": {"name": "tool_name"}}: Force specific tool
             **kwargs: Additional parameters (temperature, max_tokens, etc.).
                      Override default parameters for the model.
+                     cache=True/False opts a call into or out of the provider's
+                     response cache, if it has one.
 
         Returns:
             Dictionary with:
@@ -240,7 +242,8 @@ class LLMProviderProtocol(Protocol):
             - Errors are yielded as events, NOT raised as exceptions
             - No automatic retry logic for streaming (retry at consumer level)
             - Tool calls arrive progressively: start → delta(s) → end
-            - done event always includes usage dict (may be empty if not available)
+            - done event always includes usage dict (may be empty if not available);
+              providers may add usage["stream_metrics"] with streaming timings
 
         Example:
             >>> async for event in llm_provider.complete_stream(
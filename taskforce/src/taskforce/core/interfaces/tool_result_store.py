@@ -116,7 +116,7 @@ class ToolResultStoreProtocol(Protocol):
     Design Goals:
     - Stop message history from exploding with large tool outputs
     - Maintain debuggability (full results available on demand)
-    - Support future enhancements (selectors, compression, TTL)
+    - Support partial retrieval (selectors) and future enhancements (TTL)
     - Simple MVP implementation path (file-based or in-memory)
 
     Thread Safety:
@@ -161,12 +161,19 @@ class ToolResultStoreProtocol(Protocol):
 
         Args:
             handle: Handle returned from put()
-            selector: Optional selector for partial retrieval (future feature)
-                     Examples: "output", "output[:1000]", "result.data"
+            selector: Optional selector for partial retrieval, reading only
+                     the selected part of the stored result
+                     Examples: "chars=0:4000", "lines=100:200", "chunk=2/5",
+                     "output", "data.items[0]", "output|lines=0:50"
             max_chars: Optional limit on returned data size
 
         Returns:
-            Full tool result dictionary, or None if not found
+            Full tool result dictionary, or None if not found. With a
+            selector: {"success", "selector", "output", ...} plus
+            "has_more"/"next_selector" for ranges
+
+        Raises:
+            ValueError: If the selector is malformed or selects a missing field
 
         Example:
             >>> result = await store.fetch(handle)
@@ -176,6 +183,40 @@ class ToolResultStoreProtocol(Protocol):
         """
         ...
 
+    async def get_handle(self, handle_id: str) -> ToolResultHandle | None:
+        """
+        Look up the handle of a stored result by ID.
+
+        Lets tools resolve handle IDs the LLM saw in previews.
+
+        Args:
+            handle_id: Handle ID
+
+        Returns:
+            Stored handle, or None if unknown
+
+        Example:
+            >>> handle = await store.get_handle("abc-123")
+            >>> page = await store.fetch(handle, selector="lines=0:100")
+        """
+        ...
+
+    async def list_handles(self, session_id: str | None = None) -> list[ToolResultHandle]:
+        """
+        List the handles of stored results.
+
+        Args:
+            session_id: Only handles of this session (default: all)
+
+        Returns:
+            Stored handles, oldest first
+
+        Example:
+            >>> handles = await store.list_handles("session_1")
+            >>> print(sum(h.size_bytes for h in handles))
+        """
+        ...
+
     async def delete(self, handle: ToolResultHandle) -> bool:
         """
         Delete a stored tool result.
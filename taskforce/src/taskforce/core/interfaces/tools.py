@@ -207,6 +207,105 @@ class ToolProtocol(Protocol):
         """
         ...
 
+    @property
+    def supports_parallelism(self) -> bool:
+        """
+        Whether this tool may run concurrently with other tool calls.
+
+        When the LLM requests several tool calls in a single turn, agents with
+        parallel tool dispatch enabled run consecutive parallel-safe calls
+        together. Tools that are not parallel-safe act as a barrier and are
+        always executed on their own, in the order requested by the LLM.
+
+        Set to True for side-effect free tools:
+        - File reads
+        - Web and document searches
+        - Document retrieval
+
+        Keep False for tools that:
+        - Modify external state (file writes, git, shell commands)
+        - Depend on the outcome of earlier calls in the same turn
+        - Interact with the user
+
+        Returns:
+            True if safe for concurrent execution, False otherwise (default: False)
+
+        Example:
+            >>> semantic_search_tool.supports_parallelism
+            True
+            >>> file_write_tool.supports_parallelism
+            False
+        """
+        ...
+
+    @property
+    def cacheable(self) -> bool:
+        """
+        Whether results of this tool may be memoized within a session.
+
+        Agents with a tool result cache return the stored result when a
+        cacheable tool is called again with identical arguments. Cached
+        results stay valid until a tool that mutates the same cache_resource
+        runs (see mutates).
+
+        Set to True for read-only tools whose result only depends on their
+        arguments (file reads, searches, document retrieval). Keep False for
+        tools with side effects or non-deterministic output (LLM generation,
+        shell commands, user interaction).
+
+        Returns:
+            True if results may be memoized, False otherwise (default: False)
+
+        Example:
+            >>> wiki_get_page_tool.cacheable
+            True
+            >>> file_write_tool.cacheable
+            False
+        """
+        ...
+
+    @property
+    def cache_resource(self) -> str | None:
+        """
+        Resource that this tool reads from or writes to, for cache invalidation.
+
+        Cached results of cacheable tools are tagged with their resource
+        (e.g. "filesystem", "web", "documents"). When a mutating tool runs,
+        all cached results of its resource are dropped.
+
+        Returns:
+            Resource key, or None if the tool touches no shared resource
+            (a mutating tool with None invalidates the whole cache)
+
+        Example:
+            >>> file_read_tool.cache_resource
+            'filesystem'
+            >>> shell_tool.cache_resource
+            'filesystem'
+        """
+        ...
+
+    @property
+    def mutates(self) -> bool:
+        """
+        Whether calls may change the state of cache_resource.
+
+        Set to True for tools with side effects on a resource that cacheable
+        tools read (file writes, shell and python execution, git). Keep False
+        for read-only tools and for tools that only change agent-internal
+        state (planner, user interaction).
+
+        Returns:
+            True if calls invalidate cached results, False otherwise (default: False)
+
+        Example:
+            >>> python_tool.mutates
+            True
+            >>> ask_user_tool.mutates
+            False
+        """
+        ...
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         """
         Generate human-readable preview of operation for approval prompt.
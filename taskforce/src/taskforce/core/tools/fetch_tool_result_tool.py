@@ -0,0 +1,177 @@
+"""
+Fetch Tool Result Tool
+
+Lets the LLM page through tool results that were stored behind a handle
+(large outputs are replaced by a handle + preview in message history).
+Each call reads only the requested slice from the tool result store.
+"""
+
+from typing import Any
+
+from taskforce.core.interfaces.tool_result_store import ToolResultStoreProtocol
+from taskforce.core.interfaces.tools import ApprovalRiskLevel, ToolProtocol
+
+
+class FetchToolResultTool(ToolProtocol):
+    """
+    Tool for partial retrieval of stored tool results.
+
+    Registered by LeanAgent when a tool result store is configured. Results
+    carry next_selector, so the LLM can continue paging with one argument.
+    """
+
+    DEFAULT_MAX_CHARS = 4000
+    MAX_CHARS_LIMIT = 20000
+
+    def __init__(self, store: ToolResultStoreProtocol):
+        """
+        Initialize FetchToolResultTool.
+
+        Args:
+            store: Tool result store holding the results
+        """
+        self._store = store
+
+    @property
+    def name(self) -> str:
+        """Unique identifier for the tool."""
+        return "fetch_tool_result"
+
+    @property
+    def description(self) -> str:
+        """Human-readable description of tool's purpose."""
+        return (
+            "Read part of a large tool result that was stored behind a handle "
+            "(tool messages containing 'handle' and 'preview_text').\n\n"
+            "SELECTORS:\n"
+            "- chars=0:4000 / bytes=0:4096 - Character or byte range\n"
+            "- lines=100:200 - Line range (0-based, end exclusive)\n"
+            "- chunk=2/5 - Part 2 of 5 equal parts\n"
+            "- output, data.items[0].title, results[2:5] - Field selection\n"
+            "- output|lines=0:50 - Range within a field\n\n"
+            "Ranges on the whole result are cheapest. Responses include "
+            "has_more and next_selector; pass next_selector to continue."
+        )
+
+    @property
+    def parameters_schema(self) -> dict[str, Any]:
+        """OpenAI function calling compatible parameter schema."""
+        return {
+            "type": "object",
+            "properties": {
+                "handle_id": {
+                    "type": "string",
+                    "description": "The 'id' of the handle from the tool message.",
+                },
+                "selector": {
+                    "type": "string",
+                    "description": (
+                        "What to read (default: first page, 'chars=0:'). "
+                        "E.g. 'lines=0:100', 'chunk=1/4', 'output|chars=4000:8000'."
+                    ),
+                },
+                "max_chars": {
+                    "type": "integer",
+                    "description": (
+                        f"Maximum characters returned (default: {self.DEFAULT_MAX_CHARS}, "
+                        f"max: {self.MAX_CHARS_LIMIT})."
+                    ),
+                },
+            },
+            "required": ["handle_id"],
+        }
+
+    @property
+    def requires_approval(self) -> bool:
+        """Reading stored results does not require approval."""
+        return False
+
+    @property
+    def approval_risk_level(self) -> ApprovalRiskLevel:
+        """Read-only access to results of earlier tool calls."""
+        return ApprovalRiskLevel.LOW
+
+    @property
+    def supports_parallelism(self) -> bool:
+        """Read-only, safe to run concurrently."""
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        """Pages are cheap to read; not worth memoizing."""
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        """Reads the session's tool result store only."""
+        return None
+
+    @property
+    def mutates(self) -> bool:
+        """Read-only - never invalidates cached results."""
+        return False
+
+    def get_approval_preview(self, **kwargs: Any) -> str:
+        """Generate preview for approval prompt."""
+        return (
+            f"Tool: {self.name}\nHandle: {kwargs.get('handle_id', '?')}\n"
+            f"Selector: {kwargs.get('selector') or 'chars=0:'}"
+        )
+
+    async def execute(
+        self,
+        handle_id: str,
+        selector: str | None = None,
+        max_chars: int | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Read a slice of a stored tool result.
+
+        Args:
+            handle_id: ID of the stored result's handle
+            selector: Selector (default: first page of the result)
+            max_chars: Maximum characters returned
+
+        Returns:
+            Selection dict with output, has_more and next_selector, or
+            error dict
+        """
+        handle = await self._store.get_handle(handle_id)
+        if handle is None:
+            return {"success": False, "error": f"Unknown tool result handle: {handle_id}"}
+
+        limit = min(max_chars or self.DEFAULT_MAX_CHARS, self.MAX_CHARS_LIMIT)
+        try:
+            selection = await self._store.fetch(
+                handle, selector=selector or "chars=0:", max_chars=max(1, limit)
+            )
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        if selection is None:
+            return {
+                "success": False,
+                "error": f"Tool result {handle_id} is no longer available",
+            }
+        return {"handle_id": handle_id, "tool": handle.tool, **selection}
+
+    def validate_params(self, **kwargs: Any) -> tuple[bool, str | None]:
+        """
+        Validate parameters before execution.
+
+        Args:
+            **kwargs: Parameters to validate
+
+        Returns:
+            Tuple of (is_valid: bool, error_message: Optional[str])
+        """
+        if not isinstance(kwargs.get("handle_id"), str) or not kwargs["handle_id"]:
+            return False, "Missing required parameter: handle_id"
+        selector = kwargs.get("selector")
+        if selector is not None and not isinstance(selector, str):
+            return False, "Parameter 'selector' must be a string"
+        max_chars = kwargs.get("max_chars")
+        if max_chars is not None and (not isinstance(max_chars, int) or max_chars < 1):
+            return False, "Parameter 'max_chars' must be a positive integer"
+        return True, None
@@ -124,6 +124,26 @@ class PlannerTool(ToolProtocol):
         """Planner tool has low risk (internal state only)."""
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        """Planner mutates plan state, so calls are always serialized."""
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        """Planner results reflect mutable plan state, never memoized."""
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        """Plan state is not read by any cacheable tool."""
+        return None
+
+    @property
+    def mutates(self) -> bool:
+        """Plan updates never invalidate cached tool results."""
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         """Generate preview for approval prompt."""
         action = kwargs.get("action", "unknown")
@@ -1,10 +1,23 @@
 """
 Infrastructure Cache Module
 
-Provides caching mechanisms for tool results to eliminate redundant API calls.
+Provides caching mechanisms for tool results to eliminate redundant API calls,
+and single-flight coalescing of identical in-flight requests.
 """
 
+from taskforce.infrastructure.cache.single_flight import (
+    SingleFlight,
+    ToolCallCoalescer,
+    compute_tool_key,
+    get_single_flight,
+)
 from taskforce.infrastructure.cache.tool_cache import CacheEntry, ToolResultCache
 
-__all__ = ["CacheEntry", "ToolResultCache"]
-
+__all__ = [
+    "CacheEntry",
+    "SingleFlight",
+    "ToolCallCoalescer",
+    "ToolResultCache",
+    "compute_tool_key",
+    "get_single_flight",
+]
@@ -0,0 +1,354 @@
+"""
+Selectors for partial retrieval of stored tool results.
+
+A selector picks a slice of a stored result, so an agent can page through
+a multi-MB result without the store loading it for every look:
+
+    chars=0:4000            Characters of the stored document (0-based, end exclusive)
+    bytes=1024:2048         Bytes of the stored document (UTF-8)
+    lines=100:200           Lines of the stored document
+    chunk=3/10              Chunk 3 of 10 equal parts (1-based)
+    output                  Field selection (JSON-path style)
+    data.items[0].title     Nested keys and list indexes
+    $.results[2:5]          List slice ("$." prefix is optional)
+    output|lines=100:200    Range within a selected field
+
+Range selectors on the stored document are read from a seekable file
+(memory-mapped by the file store): only the requested part is read and
+decoded. Field selection has to parse the document; ranges after a field
+apply to the field's text (strings as is, other values as indented JSON).
+
+Selections are returned in tool result shape:
+    {"success": True, "selector": "lines=0:50", "output": "...",
+     "range": {"unit": "lines", "start": 0, "end": 50, "total": None},
+     "has_more": True, "next_selector": "lines=50:100"}
+"""
+
+import codecs
+import io
+import json
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+# Read size for scanning files
+_BLOCK_SIZE = 64 * 1024
+
+_RANGE_PATTERN = re.compile(r"^(bytes|chars|lines)=(\d*):(\d*)$")
+_CHUNK_PATTERN = re.compile(r"^chunk=(\d+)/(\d+)$")
+_PATH_TOKEN = re.compile(
+    r'\["((?:[^"\\]|\\.)*)"\]'  # ["key with.dots"]
+    r"|\[(-?\d*):(-?\d*)\]"  # [start:end]
+    r"|\[(-?\d+)\]"  # [index]
+    r"|\.?([^.\[\]]+)"  # key
+)
+
+
+@dataclass(frozen=True)
+class ResultSelector:
+    """
+    Parsed selector.
+
+    Attributes:
+        path: Field path tokens (str keys, int indexes, slice objects)
+        unit: Range unit ("bytes", "chars", "lines", "chunk") or None
+        start: Range start (chunk: 1-based chunk number)
+        end: Range end, exclusive (None = open; chunk: number of chunks)
+        field_path: Field path as given
+    """
+
+    path: tuple[Any, ...] = ()
+    unit: str | None = None
+    start: int = 0
+    end: int | None = None
+    field_path: str = ""
+
+    def __str__(self) -> str:
+        return self._format(self.start, self.end)
+
+    def _format(self, start: int, end: int | None) -> str:
+        if self.unit is None:
+            return self.field_path
+        if self.unit == "chunk":
+            range_text = f"chunk={start}/{end}"
+        else:
+            range_text = f"{self.unit}={start}:{'' if end is None else end}"
+        return f"{self.field_path}|{range_text}" if self.field_path else range_text
+
+
+def parse_selector(selector: str) -> ResultSelector:
+    """
+    Parse a selector string.
+
+    Args:
+        selector: Selector (see module docstring)
+
+    Returns:
+        ResultSelector
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    text = selector.strip()
+    field_path, _, range_text = text.rpartition("|")
+    if not _RANGE_PATTERN.match(range_text) and not _CHUNK_PATTERN.match(range_text):
+        field_path, range_text = text, ""
+    field_path = field_path.strip()
+    if not field_path and not range_text:
+        raise ValueError("Empty selector")
+
+    path = _parse_path(field_path) if field_path else ()
+
+    if not range_text:
+        return ResultSelector(path=path, field_path=field_path)
+
+    chunk = _CHUNK_PATTERN.match(range_text)
+    if chunk:
+        index, count = int(chunk.group(1)), int(chunk.group(2))
+        if not 1 <= index <= count:
+            raise ValueError(f"Invalid chunk '{range_text}': expected chunk=i/n with 1 <= i <= n")
+        return ResultSelector(path, "chunk", index, count, field_path)
+
+    range_match = _RANGE_PATTERN.match(range_text)
+    if range_match is None:
+        raise ValueError(f"Invalid range '{range_text}'")
+    unit, start, end = range_match.groups()
+    start_value = int(start) if start else 0
+    end_value = int(end) if end else None
+    if end_value is not None and end_value < start_value:
+        raise ValueError(f"Invalid range '{range_text}': end before start")
+    return ResultSelector(path, unit, start_value, end_value, field_path)
+
+
+def _parse_path(field_path: str) -> tuple[Any, ...]:
+    text = field_path[1:] if field_path.startswith("$") else field_path
+    tokens: list[Any] = []
+    position = 0
+    while position < len(text):
+        match = _PATH_TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid field path '{field_path}' at position {position}")
+        quoted, slice_start, slice_end, index, key = match.groups()
+        if quoted is not None:
+            tokens.append(json.loads(f'"{quoted}"'))
+        elif index is not None:
+            tokens.append(int(index))
+        elif key is not None:
+            tokens.append(key)
+        else:
+            tokens.append(
+                slice(
+                    int(slice_start) if slice_start else None, int(slice_end) if slice_end else None
+                )
+            )
+        position = match.end()
+    if not tokens:
+        raise ValueError(f"Invalid field path '{field_path}'")
+    return tuple(tokens)
+
+
+def resolve_path(document: Any, selector: ResultSelector) -> Any:
+    """
+    Select a field of a parsed document.
+
+    Args:
+        document: Parsed result
+        selector: Selector with a field path
+
+    Returns:
+        Selected value
+
+    Raises:
+        ValueError: If the path does not exist in the document
+    """
+    value = document
+    for depth, token in enumerate(selector.path):
+        try:
+            if isinstance(token, str):
+                if not isinstance(value, dict):
+                    raise KeyError(token)
+                value = value[token]
+            elif isinstance(value, (list, str)):
+                value = value[token]
+            else:
+                raise TypeError(token)
+        except (KeyError, IndexError, TypeError):
+            available = (
+                f" (keys: {', '.join(map(str, list(value)[:20]))})"
+                if isinstance(value, dict)
+                else ""
+            )
+            raise ValueError(
+                f"Field path '{selector.field_path}' not found at element {depth + 1}{available}"
+            ) from None
+    return value
+
+
+def select_from_file(
+    f: BinaryIO,
+    selector: ResultSelector,
+    size_bytes: int,
+    size_chars: int,
+    max_chars: int | None = None,
+) -> dict[str, Any]:
+    """
+    Apply a selector to a stored result document.
+
+    Args:
+        f: Seekable binary file positioned at the start of the document
+        selector: Parsed selector
+        size_bytes: Document size in bytes (from the handle)
+        size_chars: Document size in characters (from the handle)
+        max_chars: Optional limit on returned text; ranges are shortened
+                   and the remainder is reachable via next_selector
+
+    Returns:
+        Selection in tool result shape (see module docstring)
+
+    Raises:
+        ValueError: If a field path does not exist
+    """
+    if not selector.path:
+        return _select_range(f, selector, size_bytes, size_chars, max_chars)
+
+    value = resolve_path(json.load(f), selector)
+    text = (
+        value
+        if isinstance(value, str)
+        else json.dumps(value, ensure_ascii=False, indent=2, default=str)
+    )
+    if selector.unit is None:
+        if not max_chars or len(text) <= max_chars:
+            return {"success": True, "selector": str(selector), "output": value}
+        # Too large: first page of the field's text
+        selector = ResultSelector(selector.path, "chars", 0, None, selector.field_path)
+
+    data = text.encode("utf-8")
+    return _select_range(io.BytesIO(data), selector, len(data), len(text), max_chars)
+
+
+def _select_range(
+    f: BinaryIO,
+    selector: ResultSelector,
+    size_bytes: int,
+    size_chars: int,
+    max_chars: int | None,
+) -> dict[str, Any]:
+    unit, start, end = selector.unit, selector.start, selector.end
+    chunk_count: int | None = None
+    if unit == "chunk":
+        if end is None:
+            raise ValueError(f"Invalid selector '{selector}': chunk count missing")
+        # Chunk i of n: i-th of n equal character ranges
+        chunk_count = end
+        chunk_chars = math.ceil(size_chars / chunk_count) if size_chars else 0
+        start, end = (start - 1) * chunk_chars, min(size_chars, start * chunk_chars)
+        unit = "chars"
+    requested_end = end
+
+    if unit == "lines":
+        text, end, at_end = _read_lines(f, start, end, max_chars)
+        total = None
+    else:
+        total = size_bytes if unit == "bytes" else size_chars
+        end = total if end is None else min(end, total)
+        start = min(start, end)
+        if max_chars:
+            end = min(end, start + max_chars)
+        if unit == "bytes" or size_bytes == size_chars:  # ASCII: characters are bytes
+            f.seek(start)
+            text = f.read(end - start).decode("utf-8", errors="ignore")
+        else:
+            text = _read_chars(f, start, end)
+        at_end = end >= total
+
+    selection: dict[str, Any] = {"success": True, "selector": str(selector), "output": text}
+    if chunk_count is not None:
+        # Chunks keep their unit, so paging continues chunk by chunk
+        selection["range"] = {
+            "unit": "chunk",
+            "start": selector.start,
+            "end": chunk_count,
+            "total": chunk_count,
+        }
+        selection["truncated"] = requested_end is not None and end < requested_end
+        has_more = selector.start < chunk_count
+        next_range: tuple[int, int | None] = (selector.start + 1, chunk_count)
+    else:
+        selection["range"] = {"unit": unit, "start": start, "end": end, "total": total}
+        has_more = not at_end
+        width = selector.end - selector.start if selector.end is not None else None
+        next_range = (end, end + width if width is not None else None)
+
+    selection["has_more"] = has_more
+    selection["next_selector"] = selector._format(*next_range) if has_more else None
+    return selection
+
+
+def _read_chars(f: BinaryIO, start: int, end: int) -> str:
+    """Decode blocks until the character range is covered (multi-byte documents)."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    position = 0
+    parts: list[str] = []
+    while position < end:
+        block = f.read(_BLOCK_SIZE)
+        text = decoder.decode(block, final=not block)
+        if text:
+            block_end = position + len(text)
+            if block_end > start:
+                parts.append(text[max(0, start - position) : end - position])
+            position = block_end
+        if not block:
+            break
+    return "".join(parts)
+
+
+def _read_lines(
+    f: BinaryIO, start: int, end: int | None, max_chars: int | None
+) -> tuple[str, int, bool]:
+    """
+    Read lines [start, end) in blocks, without decoding the lines before start.
+
+    Stops before a line that would exceed max_chars; a first line longer
+    than max_chars is cut.
+
+    Returns:
+        Tuple of (text, line after the last returned line, document exhausted)
+    """
+    line_number = 0
+    collected = bytearray()
+    line_start = 0  # Offset in collected where the current line begins
+    partial = False  # Bytes of the current line seen
+
+    def _text() -> str:
+        return collected.decode("utf-8", errors="ignore")
+
+    while True:
+        block = f.read(_BLOCK_SIZE)
+        if not block:
+            return _text(), max(start, line_number + partial), True
+
+        position = 0
+        while position < len(block):
+            newline = block.find(b"\n", position)
+            segment_end = len(block) if newline < 0 else newline + 1
+            if line_number >= start:
+                collected += block[position:segment_end]
+                if max_chars and len(collected) > max_chars:
+                    if line_number > start:
+                        del collected[line_start:]  # Next page starts with this line
+                        return _text(), line_number, False
+                    del collected[max_chars:]
+                    return _text(), line_number + 1, False
+            position = segment_end
+
+            if newline < 0:
+                partial = True
+                continue
+            line_number += 1
+            partial = False
+            line_start = len(collected)
+            if end is not None and line_number >= end:
+                at_end = position >= len(block) and not f.read(1)
+                return _text(), line_number, at_end
@@ -0,0 +1,211 @@
+"""
+Single-flight Request Coalescing
+
+Identical requests that are in flight at the same time share one call:
+the first caller starts the work, later callers with the same key attach
+to its task and receive the same result. Nothing is kept once the call
+completes - this complements the result caches, it does not replace them.
+
+One SingleFlight group exists per kind of work ("llm", "tools") in the
+process, so concurrent sessions and agents coalesce with each other.
+
+Usage:
+    flight = get_single_flight("tools")
+    key = compute_tool_key("semantic_search", {"query": "q"}, user_context)
+    result, shared = await flight.do(key, lambda: tool.execute(query="q"))
+
+    # Agents use the ToolCallCoalescerProtocol adapter
+    coalescer = ToolCallCoalescer()
+    result, shared = await coalescer.run(
+        "semantic_search", {"query": "q"}, user_context, lambda: tool.execute(query="q")
+    )
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def compute_tool_key(
+    tool_name: str,
+    tool_input: dict[str, Any],
+    security_context: dict[str, Any] | None = None,
+) -> str:
+    """
+    Generate the coalescing key of a tool call.
+
+    Tools whose results depend on the caller (RAG tools filtering by
+    user_context) must pass that context, so calls of different users
+    never share a result.
+
+    Args:
+        tool_name: Name of the tool
+        tool_input: Input parameters for the tool
+        security_context: Caller context the result depends on
+
+    Returns:
+        Key in format "tool_name:hash"
+    """
+    normalized = json.dumps(
+        {"input": tool_input, "context": security_context or None},
+        sort_keys=True,
+        default=str,
+    )
+    return f"{tool_name}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one task.
+
+    The work runs in its own task, so a caller that is cancelled does not
+    cancel the call for the others; the task is only cancelled once every
+    waiting caller is gone. Calls from a different event loop never attach
+    to each other.
+
+    Attributes:
+        name: Group name (for logging and stats)
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize SingleFlight group.
+
+        Args:
+            name: Group name
+        """
+        self.name = name
+        self._calls: dict[str, tuple[asyncio.Future[Any], list[int]]] = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Request key
+            fn: Coroutine factory doing the work (only called by the first caller)
+
+        Returns:
+            Tuple of (result, shared); shared is True for callers that attached
+            to another caller's call. Exceptions of fn propagate to all callers.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._calls.get(key)
+        if entry is not None and (entry[0].done() or entry[0].get_loop() is not loop):
+            entry = None
+
+        shared = entry is not None
+        if entry is None:
+            task: asyncio.Future[T] = asyncio.ensure_future(fn())
+            entry = (task, [0])
+            self._calls[key] = entry
+            task.add_done_callback(functools.partial(self._forget, key))
+            self._stats["calls"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        task, waiters = entry
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task), shared
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Return number of calls currently in flight.
+
+        Returns:
+            Number of distinct keys being worked on
+        """
+        return len(self._calls)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Return coalescing statistics.
+
+        Returns:
+            Dictionary with 'calls' (work started) and 'coalesced' (callers
+            that attached to a call in flight) counts
+        """
+        return self._stats.copy()
+
+    def _forget(self, key: str, task: asyncio.Future[Any]) -> None:
+        if not task.cancelled():
+            task.exception()  # Retrieved by the waiters; silences the unretrieved warning
+        entry = self._calls.get(key)
+        if entry is not None and entry[0] is task:
+            del self._calls[key]
+
+
+_groups: dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get the process-wide SingleFlight group for a kind of work.
+
+    Args:
+        name: Group name (e.g. "llm", "tools")
+
+    Returns:
+        Shared SingleFlight group
+    """
+    group = _groups.get(name)
+    if group is None:
+        group = SingleFlight(name)
+        _groups[name] = group
+    return group
+
+
+class ToolCallCoalescer:
+    """
+    Coalesces identical tool calls (ToolCallCoalescerProtocol).
+
+    Keys calls with compute_tool_key() and runs them through a SingleFlight
+    group - by default the process-wide "tools" group, so concurrent
+    sessions and agents share executions.
+    """
+
+    def __init__(self, flight: SingleFlight | None = None):
+        """
+        Initialize ToolCallCoalescer.
+
+        Args:
+            flight: SingleFlight group (default: get_single_flight("tools"))
+        """
+        self._flight = flight or get_single_flight("tools")
+
+    async def run(
+        self,
+        tool_name: str,
+        tool_input: dict[str, Any],
+        security_context: dict[str, Any] | None,
+        fn: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Run a tool call once for all identical concurrent callers.
+
+        Args:
+            tool_name: Name of the tool
+            tool_input: Input parameters for the tool
+            security_context: Caller context the result depends on
+            fn: Coroutine factory executing the tool
+
+        Returns:
+            Tuple of (result, shared)
+        """
+        key = compute_tool_key(tool_name, tool_input, security_context)
+        return await self._flight.do(key, fn)
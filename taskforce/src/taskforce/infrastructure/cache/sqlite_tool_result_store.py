@@ -0,0 +1,578 @@
+"""
+SQLite Tool Result Store Implementation
+
+Implements ToolResultStoreProtocol on an embedded SQLite database, for
+stores too large to scan: FileToolResultStore finds the results of a
+session or the store statistics by listing and parsing every handle file,
+here they are indexed queries.
+
+Design:
+- One row per result with indexed session_id, tool and created_at columns
+- Payloads up to inline_threshold bytes stored inline in the row, larger
+  ones in side files (keeps the database small and pages hot)
+- WAL journal, so readers never block the writer
+- All database access runs in worker threads, serialized by a lock
+
+Directory Structure:
+    tool_results/
+        tool_results.sqlite3    # Rows (+ -wal/-shm while open)
+        side_files/
+            ab/abc-123.json     # Side file of a large payload
+
+Migration from the directory layout of FileToolResultStore (plain and
+content-addressed):
+    store = SQLiteToolResultStore("./tool_results/tool_results.sqlite3")
+    report = await store.migrate_from_file_store("./tool_results")
+
+or: taskforce tools migrate-results ./tool_results
+"""
+
+import asyncio
+import io
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from taskforce.core.interfaces.tool_result_store import ToolResultHandle
+from taskforce.infrastructure.cache.result_selector import (
+    ResultSelector,
+    parse_selector,
+    select_from_file,
+)
+from taskforce.infrastructure.cache.tool_result_store import (
+    FileToolResultStore,
+    truncate_result,
+)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tool_results ("
+    "id TEXT PRIMARY KEY, tool TEXT NOT NULL, session_id TEXT, "
+    "created_at TEXT NOT NULL, size_bytes INTEGER NOT NULL, "
+    "size_chars INTEGER NOT NULL, schema_version TEXT NOT NULL, "
+    "metadata TEXT NOT NULL, payload TEXT, side_file TEXT)",
+    "CREATE INDEX IF NOT EXISTS idx_tool_results_session ON tool_results (session_id)",
+    "CREATE INDEX IF NOT EXISTS idx_tool_results_tool ON tool_results (tool)",
+    "CREATE INDEX IF NOT EXISTS idx_tool_results_created ON tool_results (created_at)",
+)
+
+_HANDLE_COLUMNS = (
+    "id, tool, created_at, size_bytes, size_chars, schema_version, metadata"
+)
+
+_INSERT = (
+    "INSERT OR IGNORE INTO tool_results "
+    "(id, tool, session_id, created_at, size_bytes, size_chars, schema_version, "
+    "metadata, payload, side_file) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _handle_from_row(row: tuple) -> ToolResultHandle:
+    """Build a handle from a row of _HANDLE_COLUMNS."""
+    return ToolResultHandle(
+        id=row[0],
+        tool=row[1],
+        created_at=row[2],
+        size_bytes=row[3],
+        size_chars=row[4],
+        schema_version=row[5],
+        metadata=json.loads(row[6]),
+    )
+
+
+class SQLiteToolResultStore:
+    """
+    SQLite-based implementation of ToolResultStoreProtocol.
+
+    Stores tool results as rows of one table; large payloads live in side
+    files next to the database. cleanup_session() and get_stats() are
+    index lookups and aggregates instead of directory scans.
+
+    Thread Safety:
+        One connection per store, used from worker threads under a lock.
+        Several processes may share the database file (WAL mode).
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "./tool_results/tool_results.sqlite3",
+        inline_threshold: int = 64 * 1024,
+    ):
+        """
+        Initialize SQLite tool result store.
+
+        Args:
+            db_path: SQLite database file
+                     (default: ./tool_results/tool_results.sqlite3).
+            inline_threshold: Largest payload in bytes stored inside the
+                     database; larger payloads go to side files.
+        """
+        self.db_path = Path(db_path)
+        self.side_files_dir = self.db_path.parent / "side_files"
+        self.inline_threshold = inline_threshold
+        self.logger = structlog.get_logger().bind(
+            component="sqlite_tool_result_store"
+        )
+
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema (worker thread, lock held)."""
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                db.execute(statement)
+            db.commit()
+            self._db = db
+        return self._db
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _side_file_path(self, side_file: str) -> Path:
+        """Get file path of a side file name stored in a row."""
+        return self.side_files_dir / side_file
+
+    def _row(self, handle: ToolResultHandle, payload: str) -> tuple:
+        """
+        Build the row of a result, writing its side file if needed (worker thread).
+
+        Args:
+            handle: Handle of the result
+            payload: Serialized result
+
+        Returns:
+            Row values in _INSERT order
+        """
+        side_file = None
+        inline_payload: str | None = payload
+        if handle.size_bytes > self.inline_threshold:
+            side_file = f"{handle.id[:2]}/{handle.id}.json"
+            path = self._side_file_path(side_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(payload, encoding="utf-8")
+            inline_payload = None
+
+        return (
+            handle.id,
+            handle.tool,
+            (handle.metadata or {}).get("session_id"),
+            handle.created_at,
+            handle.size_bytes,
+            handle.size_chars,
+            handle.schema_version,
+            json.dumps(handle.metadata or {}, default=str),
+            inline_payload,
+            side_file,
+        )
+
+    def _insert(self, rows: list[tuple]) -> int:
+        """Insert rows, ignoring known IDs (worker thread). Returns rows added."""
+        with self._db_lock:
+            db = self._connect()
+            inserted = db.executemany(_INSERT, rows).rowcount
+            db.commit()
+        return inserted
+
+    def _unlink_side_files(self, side_files: list[str]) -> None:
+        for side_file in side_files:
+            self._side_file_path(side_file).unlink(missing_ok=True)
+
+    async def put(
+        self,
+        tool_name: str,
+        result: dict[str, Any],
+        session_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> ToolResultHandle:
+        """
+        Store a tool result and return a handle.
+
+        Args:
+            tool_name: Name of the tool that produced this result
+            result: Full tool result dictionary
+            session_id: Optional session ID for scoping/cleanup
+            metadata: Optional metadata (e.g., step number, success flag)
+
+        Returns:
+            ToolResultHandle with unique ID and size information
+        """
+        payload = json.dumps(result, ensure_ascii=False, default=str)
+
+        full_metadata = dict(metadata or {})
+        if session_id:
+            full_metadata["session_id"] = session_id
+        full_metadata["success"] = result.get("success", False)
+
+        handle = ToolResultHandle(
+            id=str(uuid.uuid4()),
+            tool=tool_name,
+            created_at=datetime.utcnow().isoformat() + "Z",
+            size_bytes=len(payload.encode("utf-8")),
+            size_chars=len(payload),
+            schema_version="1.0",
+            metadata=full_metadata,
+        )
+
+        def _put() -> None:
+            self._insert([self._row(handle, payload)])
+
+        await asyncio.to_thread(_put)
+
+        self.logger.info(
+            "tool_result_stored",
+            handle_id=handle.id,
+            tool=tool_name,
+            size_bytes=handle.size_bytes,
+            size_chars=handle.size_chars,
+            session_id=session_id,
+            inline=handle.size_bytes <= self.inline_threshold,
+        )
+
+        return handle
+
+    async def fetch(
+        self,
+        handle: ToolResultHandle,
+        selector: str | None = None,
+        max_chars: int | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve a stored tool result by handle.
+
+        Args:
+            handle: Handle returned from put()
+            selector: Optional selector for partial retrieval
+                     (see taskforce.infrastructure.cache.result_selector);
+                     side files are read with seeks, only the selection is
+                     decoded
+            max_chars: Optional limit on returned data size
+
+        Returns:
+            Full tool result dictionary (with a selector: the selection),
+            or None if not found
+
+        Raises:
+            ValueError: If the selector is malformed or selects a missing field
+        """
+        parsed = parse_selector(selector) if selector else None
+
+        def _row() -> tuple[str | None, str | None] | None:
+            with self._db_lock:
+                row: tuple[str | None, str | None] | None = (
+                    self._connect()
+                    .execute(
+                        "SELECT payload, side_file FROM tool_results WHERE id = ?",
+                        (handle.id,),
+                    )
+                    .fetchone()
+                )
+            return row
+
+        def _fetch() -> str | None:
+            row = _row()
+            if row is None:
+                return None
+            payload, side_file = row
+            if side_file is not None:
+                return self._side_file_path(side_file).read_text(encoding="utf-8")
+            return payload
+
+        def _select(parsed: ResultSelector) -> dict[str, Any] | None:
+            row = _row()
+            if row is None:
+                return None
+            payload, side_file = row
+            if side_file is not None:
+                with open(self._side_file_path(side_file), "rb") as f:
+                    return select_from_file(
+                        f, parsed, handle.size_bytes, handle.size_chars, max_chars
+                    )
+            if payload is None:
+                return None
+            data = payload.encode("utf-8")
+            return select_from_file(
+                io.BytesIO(data), parsed, len(data), len(payload), max_chars
+            )
+
+        if parsed is not None:
+            try:
+                selection = await asyncio.to_thread(_select, parsed)
+            except (OSError, sqlite3.Error) as e:
+                self.logger.error(
+                    "tool_result_fetch_failed", handle_id=handle.id, error=str(e)
+                )
+                return None
+            if selection is None:
+                self.logger.warning("tool_result_not_found", handle_id=handle.id)
+            return selection
+
+        try:
+            content = await asyncio.to_thread(_fetch)
+            if content is None:
+                self.logger.warning("tool_result_not_found", handle_id=handle.id)
+                return None
+
+            result: dict[str, Any] = json.loads(content)
+
+            # Apply max_chars limit if specified
+            if max_chars and len(content) > max_chars:
+                result = truncate_result(result, max_chars)
+
+            self.logger.debug("tool_result_fetched", handle_id=handle.id)
+            return result
+
+        except (OSError, sqlite3.Error, ValueError) as e:
+            self.logger.error(
+                "tool_result_fetch_failed",
+                handle_id=handle.id,
+                error=str(e),
+            )
+            return None
+
+    async def get_handle(self, handle_id: str) -> ToolResultHandle | None:
+        """
+        Look up the handle of a stored result by ID.
+
+        Args:
+            handle_id: Handle ID (as shown to the LLM in previews)
+
+        Returns:
+            Stored handle, or None if unknown
+        """
+
+        def _get() -> tuple | None:
+            with self._db_lock:
+                row: tuple | None = (
+                    self._connect()
+                    .execute(
+                        f"SELECT {_HANDLE_COLUMNS} FROM tool_results WHERE id = ?",
+                        (handle_id,),
+                    )
+                    .fetchone()
+                )
+            return row
+
+        row = await asyncio.to_thread(_get)
+        return _handle_from_row(row) if row is not None else None
+
+    async def list_handles(
+        self, session_id: str | None = None
+    ) -> list[ToolResultHandle]:
+        """
+        List the handles of stored results.
+
+        Args:
+            session_id: Only handles of this session (default: all)
+
+        Returns:
+            Stored handles, oldest first
+        """
+
+        def _list() -> list[tuple]:
+            query = f"SELECT {_HANDLE_COLUMNS} FROM tool_results"
+            params: tuple = ()
+            if session_id is not None:
+                query += " WHERE session_id = ?"
+                params = (session_id,)
+            with self._db_lock:
+                return (
+                    self._connect()
+                    .execute(f"{query} ORDER BY created_at", params)
+                    .fetchall()
+                )
+
+        return [_handle_from_row(row) for row in await asyncio.to_thread(_list)]
+
+    async def delete(self, handle: ToolResultHandle) -> bool:
+        """
+        Delete a stored tool result.
+
+        Args:
+            handle: Handle of result to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+
+        def _delete() -> bool:
+            with self._db_lock:
+                db = self._connect()
+                row = db.execute(
+                    "SELECT side_file FROM tool_results WHERE id = ?", (handle.id,)
+                ).fetchone()
+                if row is None:
+                    return False
+                db.execute("DELETE FROM tool_results WHERE id = ?", (handle.id,))
+                db.commit()
+            if row[0] is not None:
+                self._unlink_side_files([row[0]])
+            return True
+
+        deleted = await asyncio.to_thread(_delete)
+
+        if deleted:
+            self.logger.info("tool_result_deleted", handle_id=handle.id)
+        else:
+            self.logger.warning("tool_result_not_found_for_delete", handle_id=handle.id)
+        return deleted
+
+    async def cleanup_session(self, session_id: str) -> int:
+        """
+        Delete all tool results for a session.
+
+        Args:
+            session_id: Session ID to clean up
+
+        Returns:
+            Number of results deleted
+        """
+
+        def _cleanup() -> int:
+            with self._db_lock:
+                db = self._connect()
+                side_files = [
+                    row[0]
+                    for row in db.execute(
+                        "SELECT side_file FROM tool_results "
+                        "WHERE session_id = ? AND side_file IS NOT NULL",
+                        (session_id,),
+                    )
+                ]
+                count = db.execute(
+                    "DELETE FROM tool_results WHERE session_id = ?", (session_id,)
+                ).rowcount
+                db.commit()
+            self._unlink_side_files(side_files)
+            return count
+
+        count = await asyncio.to_thread(_cleanup)
+
+        self.logger.info(
+            "session_cleanup_complete", session_id=session_id, count=count
+        )
+        return count
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get storage statistics.
+
+        Returns:
+            Dictionary with total_results, total_bytes (serialized size of
+            the stored results), total_mb, oldest_result, newest_result,
+            side_file_results, results_by_tool, db_bytes and db_path
+        """
+
+        def _stats() -> tuple[tuple, list[tuple]]:
+            with self._db_lock:
+                db = self._connect()
+                totals = db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), MIN(created_at), "
+                    "MAX(created_at), COUNT(side_file) FROM tool_results"
+                ).fetchone()
+                by_tool = db.execute(
+                    "SELECT tool, COUNT(*) FROM tool_results GROUP BY tool"
+                ).fetchall()
+            return totals, by_tool
+
+        (total_results, total_bytes, oldest, newest, side_files), by_tool = (
+            await asyncio.to_thread(_stats)
+        )
+
+        return {
+            "total_results": total_results,
+            "total_bytes": total_bytes,
+            "total_mb": round(total_bytes / 1024 / 1024, 2),
+            "oldest_result": oldest,
+            "newest_result": newest,
+            "side_file_results": side_files,
+            "results_by_tool": dict(by_tool),
+            "db_bytes": self.db_path.stat().st_size,
+            "db_path": str(self.db_path),
+        }
+
+    async def migrate_from_file_store(
+        self,
+        store_dir: str | Path,
+        batch_size: int = 500,
+    ) -> dict[str, int]:
+        """
+        Import the results of a FileToolResultStore directory.
+
+        Handles keep their IDs, so handles already referenced in message
+        histories stay valid. Results already in the database are skipped,
+        so an interrupted migration can be rerun. The source directory is
+        not modified.
+
+        Args:
+            store_dir: store_dir of the FileToolResultStore
+            batch_size: Rows per transaction
+
+        Returns:
+            Dictionary with migrated, skipped and failed counts
+        """
+        report = await asyncio.to_thread(
+            self._migrate, FileToolResultStore(store_dir), max(1, batch_size)
+        )
+        self.logger.info(
+            "tool_result_store_migrated", store_dir=str(store_dir), **report
+        )
+        return report
+
+    def _migrate(self, source: FileToolResultStore, batch_size: int) -> dict[str, int]:
+        report = {"migrated": 0, "skipped": 0, "failed": 0}
+        if not source.handles_dir.is_dir():
+            return report
+
+        batch: list[tuple] = []
+
+        def _flush() -> None:
+            inserted = self._insert(batch)
+            report["migrated"] += inserted
+            report["skipped"] += len(batch) - inserted
+            batch.clear()
+
+        with os.scandir(source.handles_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    with open(entry.path, encoding="utf-8") as f:
+                        handle = ToolResultHandle.from_dict(json.load(f))
+                    content_hash = (handle.metadata or {}).get("content_hash")
+                    if content_hash:
+                        payload = source._read_blob(content_hash)
+                    else:
+                        payload = source._result_path(handle.id).read_text(
+                            encoding="utf-8"
+                        )
+                    batch.append(self._row(handle, payload))
+                except (OSError, ValueError, KeyError) as e:
+                    report["failed"] += 1
+                    self.logger.warning(
+                        "tool_result_migration_failed",
+                        handle_path=entry.path,
+                        error=str(e),
+                    )
+                    continue
+
+                if len(batch) >= batch_size:
+                    _flush()
+
+        if batch:
+            _flush()
+        return report
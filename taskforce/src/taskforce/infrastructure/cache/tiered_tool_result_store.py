@@ -0,0 +1,452 @@
+"""
+Tiered Tool Result Store Implementation
+
+Puts a hot memory tier in front of a disk store (FileToolResultStore or
+SQLiteToolResultStore) and bounds what the disk tier keeps:
+
+- Hot tier: byte-bounded LRU of results fetched during the mission. Full
+  fetches and field selections ("output|lines=0:100") are served from
+  memory; document ranges ("chars=0:4000") are already partial reads and
+  go to the disk tier directly.
+- Quotas: per-session and global byte limits on the disk tier. When a put
+  exceeds a quota, the least recently used results (other than the new
+  one) are deleted.
+- TTL: a background asyncio task deletes results older than ttl_seconds.
+  It is started with the first put (or start_gc()) and stopped by close().
+
+The index of disk results is loaded from the cold tier once (list_handles),
+so quotas and TTL also cover results of earlier processes.
+
+Usage:
+    store = TieredToolResultStore(
+        FileToolResultStore("./tool_results"),
+        memory_max_bytes=32 * 1024 * 1024,
+        session_quota_bytes=256 * 1024 * 1024,
+        ttl_seconds=24 * 3600,
+    )
+    ...
+    await store.close()
+"""
+
+import asyncio
+import io
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from taskforce.core.interfaces.tool_result_store import (
+    ToolResultHandle,
+    ToolResultStoreProtocol,
+)
+from taskforce.infrastructure.cache.result_selector import (
+    parse_selector,
+    select_from_file,
+)
+from taskforce.infrastructure.cache.tool_result_store import truncate_result
+
+
+@dataclass
+class _IndexEntry:
+    """Disk tier result tracked for quotas and TTL."""
+
+    handle: ToolResultHandle
+    session_id: str | None
+    created: float  # Epoch seconds
+
+
+def _created_timestamp(handle: ToolResultHandle) -> float:
+    """Parse the created_at of a handle ("...Z" ISO format) to epoch seconds."""
+    try:
+        created = datetime.fromisoformat(handle.created_at.removesuffix("Z"))
+    except ValueError:
+        return time.time()
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=UTC)
+    return created.timestamp()
+
+
+class TieredToolResultStore:
+    """
+    Two-tier (memory LRU, disk) implementation of ToolResultStoreProtocol.
+
+    Thread Safety:
+        Single event loop. Index changes and evictions run under an
+        asyncio lock; the cold tier handles its own concurrency.
+    """
+
+    def __init__(
+        self,
+        cold: ToolResultStoreProtocol,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        session_quota_bytes: int | None = None,
+        global_quota_bytes: int | None = None,
+        ttl_seconds: float | None = None,
+        gc_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize tiered store.
+
+        Args:
+            cold: Disk tier holding all results
+            memory_max_bytes: Size of the hot tier (0 disables it); results
+                     larger than this are never kept in memory
+            session_quota_bytes: Disk bytes per session (None = unlimited)
+            global_quota_bytes: Disk bytes in total (None = unlimited)
+            ttl_seconds: Result lifetime (None or 0 = no expiry)
+            gc_interval_seconds: Interval of the background expiry task
+            clock: Wall clock in epoch seconds (injectable for tests)
+        """
+        self.cold = cold
+        self.memory_max_bytes = memory_max_bytes
+        self.session_quota_bytes = session_quota_bytes
+        self.global_quota_bytes = global_quota_bytes
+        self.ttl_seconds = ttl_seconds or None
+        self.gc_interval_seconds = gc_interval_seconds
+        self._clock = clock
+        self.logger = structlog.get_logger().bind(component="tiered_tool_result_store")
+
+        # Hot tier: handle ID -> serialized result
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._memory_bytes = 0
+
+        # Disk tier index, least recently used first
+        self._index: OrderedDict[str, _IndexEntry] = OrderedDict()
+        self._session_bytes: dict[str | None, int] = {}
+        self._disk_bytes = 0
+        self._index_loaded = False
+        self._lock = asyncio.Lock()
+
+        self._gc_task: asyncio.Task | None = None
+        self._stats = {
+            "memory_hits": 0,
+            "memory_misses": 0,
+            "range_reads": 0,
+            "memory_evictions": 0,
+            "bytes_evicted_memory": 0,
+            "quota_evictions": 0,
+            "ttl_evictions": 0,
+            "bytes_evicted": 0,
+        }
+
+    # --- Hot tier -----------------------------------------------------------
+
+    def _remember(self, handle_id: str, payload: str) -> None:
+        """Insert into the hot tier, evicting least recently used results."""
+        size = len(payload.encode("utf-8"))
+        if size > self.memory_max_bytes:
+            return
+        self._forget(handle_id)
+        self._memory[handle_id] = payload
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            evicted_bytes = len(evicted.encode("utf-8"))
+            self._memory_bytes -= evicted_bytes
+            self._stats["memory_evictions"] += 1
+            self._stats["bytes_evicted_memory"] += evicted_bytes
+
+    def _forget(self, handle_id: str) -> None:
+        """Drop a result from the hot tier."""
+        payload = self._memory.pop(handle_id, None)
+        if payload is not None:
+            self._memory_bytes -= len(payload.encode("utf-8"))
+
+    # --- Disk tier index ----------------------------------------------------
+
+    async def _ensure_index(self) -> None:
+        """Load the index of the cold tier once (lock held)."""
+        if self._index_loaded:
+            return
+        for handle in await self.cold.list_handles():
+            self._track(handle)
+        self._index_loaded = True
+
+    def _track(self, handle: ToolResultHandle) -> None:
+        session_id = (handle.metadata or {}).get("session_id")
+        self._index[handle.id] = _IndexEntry(handle, session_id, _created_timestamp(handle))
+        self._session_bytes[session_id] = self._session_bytes.get(session_id, 0) + handle.size_bytes
+        self._disk_bytes += handle.size_bytes
+
+    def _untrack(self, handle_id: str) -> _IndexEntry | None:
+        self._forget(handle_id)
+        entry = self._index.pop(handle_id, None)
+        if entry is None:
+            return None
+        self._disk_bytes -= entry.handle.size_bytes
+        remaining = self._session_bytes.get(entry.session_id, 0) - entry.handle.size_bytes
+        if remaining > 0:
+            self._session_bytes[entry.session_id] = remaining
+        else:
+            self._session_bytes.pop(entry.session_id, None)
+        return entry
+
+    async def _evict(self, handle_id: str, reason: str) -> None:
+        """Delete a result from both tiers (lock held)."""
+        entry = self._untrack(handle_id)
+        if entry is None:
+            return
+        await self.cold.delete(entry.handle)
+        self._stats[f"{reason}_evictions"] += 1
+        self._stats["bytes_evicted"] += entry.handle.size_bytes
+        self.logger.info(
+            "tool_result_evicted",
+            handle_id=handle_id,
+            reason=reason,
+            size_bytes=entry.handle.size_bytes,
+            session_id=entry.session_id,
+        )
+
+    async def _enforce_quotas(self, keep: str | None = None) -> None:
+        """Evict least recently used results until quotas hold (lock held)."""
+        if self.session_quota_bytes is not None:
+            for session_id in list(self._session_bytes):
+                while self._session_bytes.get(session_id, 0) > self.session_quota_bytes:
+                    victim = next(
+                        (
+                            handle_id
+                            for handle_id, entry in self._index.items()
+                            if entry.session_id == session_id and handle_id != keep
+                        ),
+                        None,
+                    )
+                    if victim is None:
+                        break
+                    await self._evict(victim, "quota")
+
+        if self.global_quota_bytes is not None:
+            while self._disk_bytes > self.global_quota_bytes:
+                victim = next((handle_id for handle_id in self._index if handle_id != keep), None)
+                if victim is None:
+                    break
+                await self._evict(victim, "quota")
+
+    def _expired(self, entry: _IndexEntry) -> bool:
+        return self.ttl_seconds is not None and entry.created + self.ttl_seconds <= self._clock()
+
+    # --- Protocol -----------------------------------------------------------
+
+    async def put(
+        self,
+        tool_name: str,
+        result: dict[str, Any],
+        session_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> ToolResultHandle:
+        """
+        Store a tool result in the disk tier and enforce quotas.
+
+        Args:
+            tool_name: Name of the tool that produced this result
+            result: Full tool result dictionary
+            session_id: Optional session ID for scoping/cleanup
+            metadata: Optional metadata (e.g., step number, success flag)
+
+        Returns:
+            ToolResultHandle with unique ID and size information
+        """
+        self.start_gc()
+        handle = await self.cold.put(tool_name, result, session_id, metadata)
+        async with self._lock:
+            await self._ensure_index()
+            if handle.id not in self._index:
+                self._track(handle)
+            await self._enforce_quotas(keep=handle.id)
+        return handle
+
+    async def fetch(
+        self,
+        handle: ToolResultHandle,
+        selector: str | None = None,
+        max_chars: int | None = None,
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve a stored tool result, from memory when possible.
+
+        Args:
+            handle: Handle returned from put()
+            selector: Optional selector for partial retrieval
+            max_chars: Optional limit on returned data size
+
+        Returns:
+            Full tool result dictionary (with a selector: the selection),
+            or None if not found or expired
+
+        Raises:
+            ValueError: If the selector is malformed or selects a missing field
+        """
+        parsed = parse_selector(selector) if selector else None
+
+        entry = self._index.get(handle.id)
+        if entry is not None:
+            if self._expired(entry):
+                async with self._lock:
+                    await self._evict(handle.id, "ttl")
+                return None
+            self._index.move_to_end(handle.id)
+
+        if parsed is not None and not parsed.path:
+            # Document ranges are partial reads of the disk tier already
+            self._stats["range_reads"] += 1
+            return await self.cold.fetch(handle, selector=selector, max_chars=max_chars)
+
+        payload = self._memory.get(handle.id)
+        if payload is not None:
+            self._memory.move_to_end(handle.id)
+            self._stats["memory_hits"] += 1
+        else:
+            self._stats["memory_misses"] += 1
+            result = await self.cold.fetch(handle)
+            if result is None:
+                return None
+            payload = json.dumps(result, ensure_ascii=False, default=str)
+            self._remember(handle.id, payload)
+
+        if parsed is not None:
+            data = payload.encode("utf-8")
+            return select_from_file(io.BytesIO(data), parsed, len(data), len(payload), max_chars)
+
+        result = json.loads(payload)
+        if max_chars and len(payload) > max_chars:
+            result = truncate_result(result, max_chars)
+        return result
+
+    async def get_handle(self, handle_id: str) -> ToolResultHandle | None:
+        """
+        Look up the handle of a stored result by ID.
+
+        Args:
+            handle_id: Handle ID
+
+        Returns:
+            Stored handle, or None if unknown or expired
+        """
+        entry = self._index.get(handle_id)
+        if entry is not None and self._expired(entry):
+            return None
+        return await self.cold.get_handle(handle_id)
+
+    async def list_handles(self, session_id: str | None = None) -> list[ToolResultHandle]:
+        """
+        List the handles of stored results.
+
+        Args:
+            session_id: Only handles of this session (default: all)
+
+        Returns:
+            Stored handles, oldest first
+        """
+        return await self.cold.list_handles(session_id)
+
+    async def delete(self, handle: ToolResultHandle) -> bool:
+        """
+        Delete a stored tool result from both tiers.
+
+        Args:
+            handle: Handle of result to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        async with self._lock:
+            self._untrack(handle.id)
+            return await self.cold.delete(handle)
+
+    async def cleanup_session(self, session_id: str) -> int:
+        """
+        Delete all tool results for a session from both tiers.
+
+        Args:
+            session_id: Session ID to clean up
+
+        Returns:
+            Number of results deleted
+        """
+        async with self._lock:
+            for handle_id in [
+                handle_id
+                for handle_id, entry in self._index.items()
+                if entry.session_id == session_id
+            ]:
+                self._untrack(handle_id)
+            return await self.cold.cleanup_session(session_id)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get storage statistics of both tiers.
+
+        Returns:
+            Disk tier statistics plus memory tier size and hit rate, bytes
+            evicted from memory and disk, evictions by quota and TTL, and
+            the configured limits
+        """
+        async with self._lock:
+            await self._ensure_index()
+        stats = await self.cold.get_stats()
+
+        lookups = self._stats["memory_hits"] + self._stats["memory_misses"]
+        return {
+            **stats,
+            **self._stats,
+            "memory_hit_rate": round(self._stats["memory_hits"] / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "memory_max_bytes": self.memory_max_bytes,
+            "tracked_results": len(self._index),
+            "tracked_bytes": self._disk_bytes,
+            "session_quota_bytes": self.session_quota_bytes,
+            "global_quota_bytes": self.global_quota_bytes,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    # --- Garbage collection -------------------------------------------------
+
+    async def collect_garbage(self) -> int:
+        """
+        Delete expired results and enforce quotas once.
+
+        Returns:
+            Number of results deleted
+        """
+        async with self._lock:
+            await self._ensure_index()
+            before = self._stats["ttl_evictions"] + self._stats["quota_evictions"]
+            if self.ttl_seconds is not None:
+                for handle_id in [
+                    handle_id for handle_id, entry in self._index.items() if self._expired(entry)
+                ]:
+                    await self._evict(handle_id, "ttl")
+            await self._enforce_quotas()
+            return self._stats["ttl_evictions"] + self._stats["quota_evictions"] - before
+
+    def start_gc(self) -> None:
+        """Start the background expiry task (no-op without TTL or if running)."""
+        if self.ttl_seconds is None or (self._gc_task is not None and not self._gc_task.done()):
+            return
+        self._gc_task = asyncio.get_running_loop().create_task(self._gc_loop())
+
+    async def _gc_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.gc_interval_seconds)
+            try:
+                deleted = await self.collect_garbage()
+                if deleted:
+                    self.logger.info("tool_result_gc_complete", deleted=deleted)
+            except Exception as e:
+                self.logger.warning("tool_result_gc_failed", error=str(e))
+
+    async def close(self) -> None:
+        """Stop the background expiry task."""
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
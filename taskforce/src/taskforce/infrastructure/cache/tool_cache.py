@@ -3,6 +3,10 @@ Tool Result Cache
 
 Session-scoped caching for tool execution results to prevent redundant API calls.
 The cache stores results keyed by tool name + normalized input parameters.
+It is a bounded LRU: entries are sized approximately on insert, and the least
+recently used ones are evicted once max_bytes or max_entries is exceeded.
+Expiry uses a monotonic clock and expired entries are dropped proactively on
+every cache operation, not only when their own key is looked up.
 
 Usage:
     cache = ToolResultCache(default_ttl=3600)
@@ -18,12 +22,47 @@ Usage:
 """
 
 import hashlib
+import heapq
 import json
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
 
+def approximate_size(obj: Any) -> int:
+    """
+    Approximate the memory footprint of a JSON-like object in bytes.
+
+    Sums sys.getsizeof over the object and everything reachable through
+    dicts, lists, tuples and sets. Shared objects are counted once.
+
+    Args:
+        obj: Object to size
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
 @dataclass
 class CacheEntry:
     """Single cached tool result with TTL support."""
@@ -33,6 +72,10 @@ class CacheEntry:
     result: dict[str, Any]
     created_at: datetime = field(default_factory=datetime.utcnow)
     ttl_seconds: int = 3600  # Default 1 hour
+    tool_input: dict[str, Any] = field(default_factory=dict)
+    expires_at: float | None = None  # Monotonic deadline, None = no expiry
+    size_bytes: int = 0
+    resource: str | None = None  # Invalidated when a tool mutates this resource
 
 
 class ToolResultCache:
@@ -41,12 +84,14 @@ class ToolResultCache:
 
     Prevents redundant tool calls by storing results keyed by
     tool name + normalized input parameters. Cache entries expire
-    after a configurable TTL.
+    after a configurable TTL; the cache is bounded by total approximate
+    size and entry count with least-recently-used eviction.
 
     Attributes:
-        _cache: Internal dictionary storing CacheEntry objects
+        _cache: LRU-ordered dictionary storing CacheEntry objects
+        _expiry_heap: (expires_at, key) pairs for proactive expiry
         _default_ttl: Default time-to-live in seconds for cache entries
-        _stats: Hit/miss statistics for monitoring
+        _stats: Hit/miss/eviction statistics for monitoring
 
     Example:
         >>> cache = ToolResultCache(default_ttl=3600)
@@ -56,17 +101,47 @@ class ToolResultCache:
         'Hello'
     """
 
-    def __init__(self, default_ttl: int = 3600):
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_MAX_ENTRIES = 10_000
+
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize ToolResultCache.
 
         Args:
             default_ttl: Default time-to-live in seconds for cache entries.
                         Set to 0 for session-lifetime caching (no expiry).
+            max_bytes: Upper bound for the approximate size of all entries
+                       (None = unbounded). Larger single results are not cached.
+            max_entries: Upper bound for the number of entries (None = unbounded)
+            clock: Monotonic time source (injectable for tests)
         """
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
         self._default_ttl = default_ttl
-        self._stats = {"hits": 0, "misses": 0}
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._clock = clock
+        self._bytes = 0
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict[str, int]:
+        return {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "bytes_evicted": 0,
+            "rejected": 0,
+        }
 
     def _compute_key(self, tool_name: str, tool_input: dict) -> str:
         """
@@ -98,6 +173,7 @@ class ToolResultCache:
         Returns:
             Cached result dict or None if cache miss or expired
         """
+        self.purge_expired()
         key = self._compute_key(tool_name, tool_input)
         entry = self._cache.get(key)
 
@@ -105,14 +181,7 @@ class ToolResultCache:
             self._stats["misses"] += 1
             return None
 
-        # Check TTL (0 means no expiry - session lifetime)
-        if entry.ttl_seconds > 0:
-            age = (datetime.utcnow() - entry.created_at).total_seconds()
-            if age > entry.ttl_seconds:
-                del self._cache[key]
-                self._stats["misses"] += 1
-                return None
-
+        self._cache.move_to_end(key)
         self._stats["hits"] += 1
         return entry.result
 
@@ -122,6 +191,7 @@ class ToolResultCache:
         tool_input: dict,
         result: dict[str, Any],
         ttl: int | None = None,
+        resource: str | None = None,
     ) -> None:
         """
         Store tool result in cache.
@@ -131,19 +201,96 @@ class ToolResultCache:
             tool_input: Input parameters for the tool
             result: Tool execution result to cache
             ttl: Optional TTL override in seconds. If None, uses default_ttl.
+            resource: Resource the result was read from (see invalidate_resource)
         """
+        now = self._clock()
+        self.purge_expired(now)
         key = self._compute_key(tool_name, tool_input)
+        self._remove(key)
+
+        size_bytes = approximate_size(result) + approximate_size(tool_input)
+        if self._max_bytes is not None and size_bytes > self._max_bytes:
+            self._stats["rejected"] += 1
+            return
+
+        ttl_seconds = ttl if ttl is not None else self._default_ttl
+        expires_at = now + ttl_seconds if ttl_seconds > 0 else None
         self._cache[key] = CacheEntry(
             tool_name=tool_name,
             input_hash=key.split(":")[1],
             result=result,
-            ttl_seconds=ttl if ttl is not None else self._default_ttl,
+            ttl_seconds=ttl_seconds,
+            tool_input=tool_input,
+            expires_at=expires_at,
+            size_bytes=size_bytes,
+            resource=resource,
         )
+        self._bytes += size_bytes
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+            self._compact_expiry_heap()
+
+        while self._cache and (
+            (self._max_bytes is not None and self._bytes > self._max_bytes)
+            or (self._max_entries is not None and len(self._cache) > self._max_entries)
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= evicted.size_bytes
+            self._stats["evictions"] += 1
+            self._stats["bytes_evicted"] += evicted.size_bytes
+
+    def purge_expired(self, now: float | None = None) -> int:
+        """
+        Remove all expired entries.
+
+        Called on every get/put; the expiry heap makes this O(log n) per
+        expired entry and O(1) when nothing has expired.
+
+        Args:
+            now: Current monotonic time (default: read the clock)
+
+        Returns:
+            Number of removed entries
+        """
+        if now is None:
+            now = self._clock()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip heap items of entries that were replaced or removed since
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+        self._stats["expirations"] += removed
+        return removed
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop stale heap items once they outnumber the live entries."""
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 64:
+            return
+        self._expiry_heap = [
+            (entry.expires_at, key)
+            for key, entry in self._cache.items()
+            if entry.expires_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _remove(self, key: str) -> bool:
+        """Remove an entry and release its bytes."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size_bytes
+        return True
 
     def clear(self) -> None:
         """Clear all cached entries and reset statistics."""
         self._cache.clear()
-        self._stats = {"hits": 0, "misses": 0}
+        self._expiry_heap.clear()
+        self._bytes = 0
+        self._stats = self._empty_stats()
 
     def invalidate(self, tool_name: str, tool_input: dict) -> bool:
         """
@@ -156,11 +303,32 @@ class ToolResultCache:
         Returns:
             True if entry was found and removed, False otherwise
         """
-        key = self._compute_key(tool_name, tool_input)
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        return self._remove(self._compute_key(tool_name, tool_input))
+
+    def invalidate_resource(self, resource: str | None) -> int:
+        """
+        Remove all entries read from a resource.
+
+        Used after calls of mutating tools: file_write, shell, python and
+        git invalidate every cached file_read ("filesystem"), whatever
+        arguments they were called with.
+
+        Args:
+            resource: Resource modified by the call (None = unknown, drops
+                all entries)
+
+        Returns:
+            Number of removed entries
+        """
+        stale = [
+            key
+            for key, entry in self._cache.items()
+            if resource is None or entry.resource == resource
+        ]
+        for key in stale:
+            self._remove(key)
+        self._stats["invalidations"] += len(stale)
+        return len(stale)
 
     @property
     def stats(self) -> dict[str, int]:
@@ -168,7 +336,9 @@ class ToolResultCache:
         Return cache hit/miss statistics.
 
         Returns:
-            Dictionary with 'hits' and 'misses' counts
+            Dictionary with 'hits', 'misses', 'invalidations', 'evictions'
+            (LRU, for max_bytes/max_entries), 'expirations', 'bytes_evicted'
+            and 'rejected' (results larger than max_bytes) counts
         """
         return self._stats.copy()
 
@@ -180,5 +350,17 @@ class ToolResultCache:
         Returns:
             Number of cached entries
         """
+        self.purge_expired()
         return len(self._cache)
 
+    @property
+    def size_bytes(self) -> int:
+        """
+        Return approximate total size of cached entries.
+
+        Returns:
+            Approximate size in bytes
+        """
+        self.purge_expired()
+        return self._bytes
+
@@ -19,11 +19,34 @@ Directory Structure:
         handles/
             abc-123.json        # Handle metadata
             def-456.json
+
+Content-addressed mode (content_addressed=True):
+    Payloads are keyed by the SHA-256 of their canonical JSON and stored
+    once, gzip-compressed while writing. Handles are compact references
+    (metadata["content_hash"]); each blob keeps a reference count and is
+    removed with its last handle. A document fetched again and again
+    across sessions costs one blob plus one small handle per fetch.
+
+    store_dir/
+        blobs/
+            3f/3fa9...e1.json.gz    # Compressed canonical payload
+            3f/3fa9...e1.refs       # Number of handles referencing it
+        handles/
+            abc-123.json
+
+    get_stats() reports logical vs. stored bytes and the bytes written by
+    this instance, so both modes can be compared.
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
+import mmap
+import os
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -32,6 +55,48 @@ import aiofiles
 import structlog
 
 from taskforce.core.interfaces.tool_result_store import ToolResultHandle
+from taskforce.infrastructure.cache.result_selector import (
+    ResultSelector,
+    parse_selector,
+    select_from_file,
+)
+
+# Chunk size for streaming (de)compression of blobs
+_CHUNK_SIZE = 64 * 1024
+
+
+def truncate_result(result: dict[str, Any], max_chars: int) -> dict[str, Any]:
+    """
+    Truncate large fields in result to meet max_chars limit.
+
+    Shared by the tool result store implementations.
+
+    Args:
+        result: Original result dictionary
+        max_chars: Maximum total characters
+
+    Returns:
+        Truncated result dictionary
+    """
+    truncated = result.copy()
+    large_fields = [
+        "output",
+        "result",
+        "content",
+        "stdout",
+        "stderr",
+        "data",
+    ]
+
+    for field in large_fields:
+        if field in truncated and isinstance(truncated[field], str):
+            field_limit = max_chars // len(large_fields)
+            if len(truncated[field]) > field_limit:
+                truncated[field] = (
+                    truncated[field][:field_limit] + "... [TRUNCATED]"
+                )
+
+    return truncated
 
 
 class FileToolResultStore:
@@ -43,21 +108,34 @@ class FileToolResultStore:
     deployments.
 
     Thread Safety:
-        Uses asyncio locks per handle ID to prevent concurrent write
-        conflicts. Read operations are lock-free (write-once).
+        Uses asyncio locks per handle ID (per content hash for blob
+        reference counts) to prevent concurrent write conflicts. Read
+        operations are lock-free (write-once). Reference counts are not
+        safe across processes sharing one store_dir.
     """
 
-    def __init__(self, store_dir: str | Path = "./tool_results"):
+    def __init__(
+        self,
+        store_dir: str | Path = "./tool_results",
+        content_addressed: bool = False,
+        compression_level: int = 6,
+    ):
         """
         Initialize file-based tool result store.
 
         Args:
             store_dir: Directory for storing results
                       (default: ./tool_results).
+            content_addressed: Store payloads once per content hash,
+                      compressed, with reference-counted handles.
+            compression_level: gzip level for content-addressed blobs (1-9).
         """
         self.store_dir = Path(store_dir)
         self.results_dir = self.store_dir / "results"
         self.handles_dir = self.store_dir / "handles"
+        self.blobs_dir = self.store_dir / "blobs"
+        self.content_addressed = content_addressed
+        self.compression_level = compression_level
         self.logger = structlog.get_logger().bind(
             component="tool_result_store"
         )
@@ -66,10 +144,20 @@ class FileToolResultStore:
         self._locks: dict[str, asyncio.Lock] = {}
         self._locks_lock = asyncio.Lock()
 
+        # Write volume of this instance (for comparing storage modes)
+        self._write_stats = {
+            "puts": 0,
+            "dedup_hits": 0,
+            "bytes_written": 0,
+            "logical_bytes_put": 0,
+        }
+
     async def _ensure_dirs(self) -> None:
         """Create store directories if they don't exist."""
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self.handles_dir.mkdir(parents=True, exist_ok=True)
+        if self.content_addressed:
+            self.blobs_dir.mkdir(parents=True, exist_ok=True)
 
     async def _get_lock(self, handle_id: str) -> asyncio.Lock:
         """Get or create lock for a handle ID."""
@@ -86,6 +174,76 @@ class FileToolResultStore:
         """Get file path for a handle."""
         return self.handles_dir / f"{handle_id}.json"
 
+    def _blob_path(self, content_hash: str) -> Path:
+        """Get file path for a content-addressed blob."""
+        return self.blobs_dir / content_hash[:2] / f"{content_hash}.json.gz"
+
+    def _refs_path(self, content_hash: str) -> Path:
+        """Get file path for the reference count of a blob."""
+        return self.blobs_dir / content_hash[:2] / f"{content_hash}.refs"
+
+    def _write_blob(self, content_hash: str, data: bytes) -> int:
+        """
+        Compress data into the blob of content_hash (worker thread).
+
+        Writes to a temporary file first, so readers never see a partial
+        blob.
+
+        Returns:
+            Compressed size in bytes
+        """
+        blob_path = self._blob_path(content_hash)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = blob_path.with_name(f"{blob_path.name}.{uuid.uuid4().hex}.tmp")
+        view = memoryview(data)
+        with gzip.open(tmp_path, "wb", compresslevel=self.compression_level) as f:
+            for start in range(0, len(view), _CHUNK_SIZE):
+                f.write(view[start : start + _CHUNK_SIZE])
+        os.replace(tmp_path, blob_path)
+        return blob_path.stat().st_size
+
+    def _read_blob(self, content_hash: str) -> str:
+        """Decompress the blob of content_hash (worker thread)."""
+        chunks = []
+        with gzip.open(self._blob_path(content_hash), "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                chunks.append(chunk)
+        return b"".join(chunks).decode("utf-8")
+
+    def _write_refs(self, content_hash: str, refs: int) -> None:
+        """Atomically write the reference count of a blob (worker thread)."""
+        refs_path = self._refs_path(content_hash)
+        tmp_path = refs_path.with_name(f"{refs_path.name}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(str(refs))
+        os.replace(tmp_path, refs_path)
+
+    def _change_refs(self, content_hash: str, delta: int) -> int | None:
+        """
+        Adjust the reference count of a blob (worker thread, hash lock held).
+
+        The blob and its count are removed when no reference is left. A blob
+        without a readable count (e.g. a put interrupted between writing the
+        blob and its count) has an unknown number of handles and is kept.
+
+        Returns:
+            New reference count, or None if the count is unknown
+        """
+        refs_path = self._refs_path(content_hash)
+        try:
+            refs = int(refs_path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.logger.warning(
+                "blob_refs_unknown", content_hash=content_hash[:12], delta=delta
+            )
+            return None
+        refs = max(0, refs + delta)
+        if refs:
+            self._write_refs(content_hash, refs)
+        else:
+            self._blob_path(content_hash).unlink(missing_ok=True)
+            refs_path.unlink(missing_ok=True)
+        return refs
+
     async def put(
         self,
         tool_name: str,
@@ -103,6 +261,9 @@ class FileToolResultStore:
         4. Create and write handle metadata
         5. Return handle
 
+        In content-addressed mode step 3 writes the compressed blob only if
+        no blob with the same content hash exists, and adds a reference.
+
         Args:
             tool_name: Name of the tool that produced this result
             result: Full tool result dictionary
@@ -114,6 +275,11 @@ class FileToolResultStore:
         """
         await self._ensure_dirs()
 
+        if self.content_addressed:
+            return await self._put_content_addressed(
+                tool_name, result, session_id, metadata
+            )
+
         # Generate unique ID
         handle_id = str(uuid.uuid4())
         lock = await self._get_lock(handle_id)
@@ -127,7 +293,7 @@ class FileToolResultStore:
             size_chars = len(result_json)
 
             # Build metadata
-            full_metadata = metadata or {}
+            full_metadata = dict(metadata or {})
             if session_id:
                 full_metadata["session_id"] = session_id
             # noqa: E501
@@ -155,6 +321,8 @@ class FileToolResultStore:
             async with aiofiles.open(handle_path, "w", encoding="utf-8") as f:
                 await f.write(handle_json)
 
+            self._record_put(size_bytes, size_bytes + len(handle_json.encode("utf-8")))
+
             self.logger.info(
                 "tool_result_stored",
                 handle_id=handle_id,
@@ -166,6 +334,85 @@ class FileToolResultStore:
 
             return handle
 
+    async def _put_content_addressed(
+        self,
+        tool_name: str,
+        result: dict[str, Any],
+        session_id: str | None,
+        metadata: dict[str, Any] | None,
+    ) -> ToolResultHandle:
+        """Store a result as a reference to its (possibly shared) blob."""
+        canonical = json.dumps(
+            result,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        data = canonical.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        bytes_written = 0
+        async with await self._get_lock(content_hash):
+            deduplicated = self._blob_path(content_hash).exists()
+            if deduplicated:
+                await asyncio.to_thread(self._change_refs, content_hash, 1)
+            else:
+                bytes_written = await asyncio.to_thread(
+                    self._write_blob, content_hash, data
+                )
+                await asyncio.to_thread(self._write_refs, content_hash, 1)
+
+        full_metadata = dict(metadata or {})
+        if session_id:
+            full_metadata["session_id"] = session_id
+        full_metadata["success"] = result.get("success", False)
+        full_metadata["content_hash"] = content_hash
+
+        handle = ToolResultHandle(
+            id=str(uuid.uuid4()),
+            tool=tool_name,
+            created_at=datetime.utcnow().isoformat() + "Z",
+            size_bytes=len(data),
+            size_chars=len(canonical),
+            schema_version="1.0",
+            metadata=full_metadata,
+        )
+
+        # Compact handle: a reference, not a document
+        handle_json = json.dumps(handle.to_dict(), separators=(",", ":"))
+        async with aiofiles.open(
+            self._handle_path(handle.id), "w", encoding="utf-8"
+        ) as f:
+            await f.write(handle_json)
+
+        bytes_written += len(handle_json.encode("utf-8"))
+        self._record_put(len(data), bytes_written, deduplicated)
+
+        self.logger.info(
+            "tool_result_stored",
+            handle_id=handle.id,
+            tool=tool_name,
+            size_bytes=handle.size_bytes,
+            size_chars=handle.size_chars,
+            session_id=session_id,
+            content_hash=content_hash[:12],
+            deduplicated=deduplicated,
+            bytes_written=bytes_written,
+        )
+
+        return handle
+
+    def _record_put(
+        self, logical_bytes: int, bytes_written: int, deduplicated: bool = False
+    ) -> None:
+        """Account the write volume of a put."""
+        self._write_stats["puts"] += 1
+        self._write_stats["logical_bytes_put"] += logical_bytes
+        self._write_stats["bytes_written"] += bytes_written
+        if deduplicated:
+            self._write_stats["dedup_hits"] += 1
+
     async def fetch(
         self,
         handle: ToolResultHandle,
@@ -177,29 +424,50 @@ class FileToolResultStore:
 
         Implementation:
         1. Check if result file exists
-        2. Read and parse JSON
-        3. Apply selector if provided (future feature)
+        2. With a selector: read only the selected part (memory-mapped
+           result file, seekable stream of a compressed blob)
+        3. Otherwise read and parse JSON
         4. Apply max_chars limit if provided
         5. Return result
 
         Args:
             handle: Handle returned from put()
             selector: Optional selector for partial retrieval
-                     (not yet implemented)
+                     (see taskforce.infrastructure.cache.result_selector)
             max_chars: Optional limit on returned data size
 
         Returns:
-            Full tool result dictionary, or None if not found
+            Full tool result dictionary (with a selector: the selection),
+            or None if not found
+
+        Raises:
+            ValueError: If the selector is malformed or selects a missing field
         """
-        result_path = self._result_path(handle.id)
+        parsed = parse_selector(selector) if selector else None
+
+        content_hash = (handle.metadata or {}).get("content_hash")
+        if content_hash:
+            # Handles of deleted results must not reach a shared blob
+            if not self._handle_path(handle.id).exists() or not self._blob_path(
+                content_hash
+            ).exists():
+                self.logger.warning("tool_result_not_found", handle_id=handle.id)
+                return None
+        else:
+            result_path = self._result_path(handle.id)
+            if not result_path.exists():
+                self.logger.warning("tool_result_not_found", handle_id=handle.id)
+                return None
 
-        if not result_path.exists():
-            self.logger.warning("tool_result_not_found", handle_id=handle.id)
-            return None
+        if parsed is not None:
+            return await self._fetch_selection(handle, content_hash, parsed, max_chars)
 
         try:
-            async with aiofiles.open(result_path, "r", encoding="utf-8") as f:
-                content = await f.read()
+            if content_hash:
+                content = await asyncio.to_thread(self._read_blob, content_hash)
+            else:
+                async with aiofiles.open(result_path, "r", encoding="utf-8") as f:
+                    content = await f.read()
 
             result = json.loads(content)
 
@@ -219,40 +487,115 @@ class FileToolResultStore:
             )
             return None
 
-    def _truncate_result(
+    async def _fetch_selection(
         self,
-        result: dict[str, Any],
-        max_chars: int,
-    ) -> dict[str, Any]:
+        handle: ToolResultHandle,
+        content_hash: str | None,
+        selector: ResultSelector,
+        max_chars: int | None,
+    ) -> dict[str, Any] | None:
+        """Read the part of a stored result picked by selector."""
+
+        def _select() -> dict[str, Any]:
+            with self._open_document(handle.id, content_hash) as f:
+                return select_from_file(
+                    f, selector, handle.size_bytes, handle.size_chars, max_chars
+                )
+
+        try:
+            selection = await asyncio.to_thread(_select)
+        except (OSError, EOFError) as e:
+            self.logger.error(
+                "tool_result_fetch_failed",
+                handle_id=handle.id,
+                selector=str(selector),
+                error=str(e),
+            )
+            return None
+
+        self.logger.debug(
+            "tool_result_fetched", handle_id=handle.id, selector=str(selector)
+        )
+        return selection
+
+    @contextmanager
+    def _open_document(
+        self, handle_id: str, content_hash: str | None
+    ) -> Iterator[Any]:
+        """Open a stored result for seeking (worker thread)."""
+        if content_hash:
+            with gzip.open(self._blob_path(content_hash), "rb") as f:
+                yield f
+            return
+        with open(self._result_path(handle_id), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    async def get_handle(self, handle_id: str) -> ToolResultHandle | None:
+        """
+        Look up the handle of a stored result by ID.
+
+        Args:
+            handle_id: Handle ID (as shown to the LLM in previews)
+
+        Returns:
+            Stored handle, or None if unknown or not a valid handle ID
+        """
+        try:
+            if str(uuid.UUID(handle_id)) != handle_id:
+                return None
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        handle_path = self._handle_path(handle_id)
+        try:
+            async with aiofiles.open(handle_path, encoding="utf-8") as f:
+                return ToolResultHandle.from_dict(json.loads(await f.read()))
+        except FileNotFoundError:
+            return None
+
+    async def list_handles(
+        self, session_id: str | None = None
+    ) -> list[ToolResultHandle]:
         """
-        Truncate large fields in result to meet max_chars limit.
+        List the handles of stored results (scans the handle directory).
 
         Args:
-            result: Original result dictionary
-            max_chars: Maximum total characters
+            session_id: Only handles of this session (default: all)
 
         Returns:
-            Truncated result dictionary
+            Stored handles, oldest first
         """
-        truncated = result.copy()
-        large_fields = [
-            "output",
-            "result",
-            "content",
-            "stdout",
-            "stderr",
-            "data",
-        ]
-
-        for field in large_fields:
-            if field in truncated and isinstance(truncated[field], str):
-                field_limit = max_chars // len(large_fields)
-                if len(truncated[field]) > field_limit:
-                    truncated[field] = (
-                        truncated[field][:field_limit] + "... [TRUNCATED]"
-                    )
-
-        return truncated
+
+        def _list() -> list[ToolResultHandle]:
+            handles: list[ToolResultHandle] = []
+            if not self.handles_dir.is_dir():
+                return handles
+            with os.scandir(self.handles_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        with open(entry.path, encoding="utf-8") as f:
+                            handle = ToolResultHandle.from_dict(json.load(f))
+                    except (OSError, ValueError, KeyError):
+                        continue
+                    if session_id is None or (handle.metadata or {}).get(
+                        "session_id"
+                    ) == session_id:
+                        handles.append(handle)
+            handles.sort(key=lambda handle: handle.created_at)
+            return handles
+
+        return await asyncio.to_thread(_list)
+
+    def _truncate_result(
+        self,
+        result: dict[str, Any],
+        max_chars: int,
+    ) -> dict[str, Any]:
+        """Truncate large fields in result to meet max_chars limit."""
+        return truncate_result(result, max_chars)
 
     async def delete(self, handle: ToolResultHandle) -> bool:
         """
@@ -260,7 +603,7 @@ class FileToolResultStore:
 
         Implementation:
         1. Acquire lock for handle ID
-        2. Delete result file
+        2. Delete result file (content-addressed: drop a blob reference)
         3. Delete handle file
         4. Return success status
 
@@ -283,8 +626,12 @@ class FileToolResultStore:
                 deleted = True
 
             if handle_path.exists():
+                content_hash = await self._stored_content_hash(handle_path)
                 handle_path.unlink()
                 deleted = True
+                if content_hash:
+                    async with await self._get_lock(content_hash):
+                        await asyncio.to_thread(self._change_refs, content_hash, -1)
 
             if deleted:
                 self.logger.info("tool_result_deleted", handle_id=handle.id)
@@ -296,6 +643,15 @@ class FileToolResultStore:
 
             return deleted
 
+    async def _stored_content_hash(self, handle_path: Path) -> str | None:
+        """Read the blob reference of a stored handle (None for plain results)."""
+        try:
+            async with aiofiles.open(handle_path, "r", encoding="utf-8") as f:
+                handle_data = json.loads(await f.read())
+        except (OSError, ValueError):
+            return None
+        return (handle_data.get("metadata") or {}).get("content_hash")
+
     async def cleanup_session(self, session_id: str) -> int:
         """
         Delete all tool results for a session.
@@ -348,26 +704,31 @@ class FileToolResultStore:
         Get storage statistics.
 
         Implementation:
-        1. Scan all result files
+        1. Scan all result files and blobs
         2. Calculate total size and count
-        3. Find oldest/newest timestamps
+        3. Find oldest/newest timestamps and logical (uncompressed) size
         4. Return stats dictionary
 
         Returns:
-            Dictionary with storage statistics
+            Dictionary with storage statistics. total_bytes is the payload
+            footprint on disk; logical_bytes the size of the stored results
+            as serialized; bytes_written, dedup_hits and puts count the
+            writes of this store instance.
         """
         await self._ensure_dirs()
 
         result_files = list(self.results_dir.glob("*.json"))
+        blob_files = list(self.blobs_dir.glob("*/*.json.gz"))
         handle_files = list(self.handles_dir.glob("*.json"))
 
         total_bytes = sum(
-            f.stat().st_size for f in result_files if f.exists()
+            f.stat().st_size for f in result_files + blob_files if f.exists()
         )
         total_results = len(result_files)
 
         # Find oldest and newest
         timestamps = []
+        logical_bytes = 0
         for handle_path in handle_files:
             try:
                 async with aiofiles.open(
@@ -375,6 +736,9 @@ class FileToolResultStore:
                 ) as f:
                     handle_data = json.loads(await f.read())
                     timestamps.append(handle_data.get("created_at", ""))
+                    logical_bytes += handle_data.get("size_bytes", 0)
+                    if (handle_data.get("metadata") or {}).get("content_hash"):
+                        total_results += 1  # Stored as blob reference
             except Exception:
                 pass
 
@@ -384,6 +748,10 @@ class FileToolResultStore:
             "total_results": total_results,
             "total_bytes": total_bytes,
             "total_mb": round(total_bytes / 1024 / 1024, 2),
+            "logical_bytes": logical_bytes,
+            "unique_blobs": len(blob_files),
+            "content_addressed": self.content_addressed,
+            **self._write_stats,
             "oldest_result": timestamps[0] if timestamps else None,
             "newest_result": timestamps[-1] if timestamps else None,
             "store_dir": str(self.store_dir),
@@ -0,0 +1,551 @@
+"""
+Latency-aware load balancing over model deployments.
+
+A model alias can map to a weighted pool of Azure deployments
+(deployment_mapping) or OpenAI models (models) instead of a single name:
+
+    deployment_mapping:
+      main:
+        - {deployment: "gpt-4.1-eastus", weight: 2}
+        - {deployment: "gpt-4.1-westeu", weight: 1}
+
+Pool members must serve the same model family - parameters are mapped for
+the first member. Each request picks a deployment by "power of two
+choices": two members are sampled by weight and the one with the lower
+score (EWMA latency, penalised by the EWMA error rate) wins. Members
+without observations are preferred, so new members are warmed up.
+
+Every deployment has a circuit breaker: it opens after consecutive
+deployment failures (rate limits, timeouts, connection and 5xx errors)
+and lets a single probe through once the cooldown has passed. While every
+deployment of an alias is open, requests go to its configured fallback.
+
+Slow requests are hedged: once a request has run longer than the p95
+latency of its deployment, a duplicate is sent to another member of the
+pool and the first success wins.
+
+Health of all deployments is shared process-wide and exposed by the API
+(GET /health/llm).
+
+Configuration (llm_config.yaml):
+    load_balancing:
+      ewma_alpha: 0.3              # Weight of the newest observation
+      error_penalty: 4.0           # Score multiplier per unit of error rate
+      hedging: true                # Duplicate requests slower than the percentile
+      hedge_percentile: 95
+      hedge_min_samples: 20        # Latency samples before a deployment is hedged
+      hedge_min_delay_ms: 250
+      failure_threshold: 5         # Consecutive failures that open the circuit
+      cooldown_seconds: 30         # Open circuit duration before a probe
+      fallbacks:
+        main: fast                 # Alias used while all 'main' circuits are open
+"""
+
+import hashlib
+import json
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import structlog
+
+from taskforce.infrastructure.llm.rate_limiter import is_rate_limit_error
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Exception name fragments of failures caused by the deployment, not the request
+_DEPLOYMENT_ERROR_MARKERS = (
+    "Timeout",
+    "APIConnection",
+    "ServiceUnavailable",
+    "InternalServer",
+)
+
+
+@dataclass
+class LoadBalancingConfig:
+    """
+    Configuration for deployment pools.
+
+    Attributes:
+        ewma_alpha: Weight of the newest latency/error observation
+        error_penalty: Score multiplier per unit of EWMA error rate
+        hedging: Whether slow requests are duplicated to another member
+        hedge_percentile: Latency percentile after which a request is hedged
+        hedge_min_samples: Latency samples required before hedging
+        hedge_min_delay_ms: Lower bound of the hedge delay
+        failure_threshold: Consecutive failures that open a circuit
+        cooldown_seconds: Time an open circuit waits before a probe
+        latency_window: Latency samples kept per deployment
+        fallbacks: Alias to use while all deployments of an alias are open
+    """
+
+    ewma_alpha: float = 0.3
+    error_penalty: float = 4.0
+    hedging: bool = True
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    hedge_min_delay_ms: int = 250
+    failure_threshold: int = 5
+    cooldown_seconds: float = 30.0
+    latency_window: int = 100
+    fallbacks: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any] | None) -> "LoadBalancingConfig":
+        """
+        Create config from the load_balancing section of llm_config.yaml.
+
+        Args:
+            config: Load balancing configuration dictionary
+
+        Returns:
+            LoadBalancingConfig with defaults for missing keys
+        """
+        config = config or {}
+        defaults = cls()
+        return cls(
+            ewma_alpha=min(1.0, max(0.01, float(config.get("ewma_alpha", defaults.ewma_alpha)))),
+            error_penalty=max(0.0, float(config.get("error_penalty", defaults.error_penalty))),
+            hedging=bool(config.get("hedging", defaults.hedging)),
+            hedge_percentile=min(
+                100.0, max(1.0, float(config.get("hedge_percentile", defaults.hedge_percentile)))
+            ),
+            hedge_min_samples=max(
+                1, int(config.get("hedge_min_samples", defaults.hedge_min_samples))
+            ),
+            hedge_min_delay_ms=max(
+                0, int(config.get("hedge_min_delay_ms", defaults.hedge_min_delay_ms))
+            ),
+            failure_threshold=max(
+                1, int(config.get("failure_threshold", defaults.failure_threshold))
+            ),
+            cooldown_seconds=max(
+                0.0, float(config.get("cooldown_seconds", defaults.cooldown_seconds))
+            ),
+            latency_window=max(1, int(config.get("latency_window", defaults.latency_window))),
+            fallbacks=dict(config.get("fallbacks") or {}),
+        )
+
+
+def parse_pool(value: Any) -> list[tuple[str, float]]:
+    """
+    Parse the mapping of an alias into weighted pool members.
+
+    Accepts a single name, a list of names, or a list of dicts with
+    'deployment' (or 'model') and an optional 'weight'.
+
+    Args:
+        value: Value of the alias in models or deployment_mapping
+
+    Returns:
+        List of (name, weight) tuples
+
+    Raises:
+        ValueError: If the pool is empty, a member has no name or a
+            weight is not positive
+    """
+    entries = value if isinstance(value, list) else [value]
+    members: list[tuple[str, float]] = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            name = entry.get("deployment") or entry.get("model")
+            weight = float(entry.get("weight", 1.0))
+        else:
+            name, weight = entry, 1.0
+        if not name:
+            raise ValueError(f"Pool member without deployment or model name: {entry!r}")
+        if weight <= 0:
+            raise ValueError(f"Pool member '{name}' must have a positive weight")
+        members.append((str(name), weight))
+    if not members:
+        raise ValueError("Model pool must contain at least one deployment")
+    return members
+
+
+def is_deployment_error(error: Exception) -> bool:
+    """
+    Check whether an error counts against the health of the deployment.
+
+    Request errors (bad request, authentication, content filter) say
+    nothing about the deployment and never open its circuit.
+
+    Args:
+        error: Exception raised by the completion call
+
+    Returns:
+        True for rate limits, timeouts, connection and server errors
+    """
+    if is_rate_limit_error(error):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int) and status_code >= 500:
+        return True
+    error_type = type(error).__name__
+    return any(marker in error_type for marker in _DEPLOYMENT_ERROR_MARKERS)
+
+
+class DeploymentHealth:
+    """
+    Latency, error rate and circuit breaker state of one deployment.
+
+    Shared by every pool the deployment is a member of.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        config: LoadBalancingConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize deployment health.
+
+        Args:
+            model: Resolved model or deployment name (e.g. "azure/gpt-4.1-eastus")
+            config: Load balancing configuration
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.model = model
+        self.config = config
+        self._clock = clock
+        self.latency_ewma_ms: float | None = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self._probe_in_flight = False
+        self._latencies: deque[float] = deque(maxlen=config.latency_window)
+        self.logger = structlog.get_logger().bind(component="llm_load_balancer")
+
+    @property
+    def state(self) -> str:
+        """
+        Return the circuit state.
+
+        Returns:
+            "closed", "open" or "half_open" (cooldown passed, probe allowed)
+        """
+        if self.opened_at is None:
+            return CLOSED
+        if self._clock() - self.opened_at >= self.config.cooldown_seconds:
+            return HALF_OPEN
+        return OPEN
+
+    @property
+    def available(self) -> bool:
+        """
+        Check whether a request may be sent to the deployment.
+
+        Returns:
+            True if the circuit is closed, or half-open without a probe in flight
+        """
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and not self._probe_in_flight)
+
+    def score(self) -> float:
+        """
+        Return the routing score (lower is better).
+
+        Returns:
+            EWMA latency penalised by the EWMA error rate; 0 without observations
+        """
+        if self.latency_ewma_ms is None:
+            return 0.0
+        return self.latency_ewma_ms * (1.0 + self.config.error_penalty * self.error_rate)
+
+    def begin(self) -> None:
+        """Mark a request as sent (claims the probe of a half-open circuit)."""
+        if self.state == HALF_OPEN:
+            self._probe_in_flight = True
+
+    def abandon(self) -> None:
+        """Release the probe of a request that ended without a health verdict."""
+        self._probe_in_flight = False
+
+    def record_success(self, latency_ms: float | None = None) -> None:
+        """
+        Record a successful request and close the circuit.
+
+        Args:
+            latency_ms: Request latency (None if not comparable, e.g. streams)
+        """
+        if self.opened_at is not None:
+            self.logger.info("llm_circuit_closed", deployment=self.model)
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+        self.error_rate = self._ewma(self.error_rate, 0.0)
+        if latency_ms is not None:
+            self.record_latency(latency_ms)
+
+    def record_failure(self) -> None:
+        """Record a deployment failure; opens the circuit at the threshold."""
+        was_probe = self.state == HALF_OPEN
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        self.error_rate = self._ewma(self.error_rate, 1.0)
+        if was_probe or (
+            self.opened_at is None and self.consecutive_failures >= self.config.failure_threshold
+        ):
+            self.opened_at = self._clock()
+            self.logger.warning(
+                "llm_circuit_opened",
+                deployment=self.model,
+                consecutive_failures=self.consecutive_failures,
+                cooldown_seconds=self.config.cooldown_seconds,
+            )
+
+    def record_latency(self, latency_ms: float) -> None:
+        """
+        Record a latency observation without changing the circuit.
+
+        Args:
+            latency_ms: Observed latency (a lower bound for hedged-out requests)
+        """
+        self._latencies.append(latency_ms)
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = float(latency_ms)
+        else:
+            self.latency_ewma_ms = self._ewma(self.latency_ewma_ms, latency_ms)
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """
+        Return a percentile of the recent latencies.
+
+        Args:
+            percentile: Percentile (1-100)
+
+        Returns:
+            Latency in ms, or None before hedge_min_samples observations
+        """
+        if len(self._latencies) < self.config.hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        index = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the health of the deployment.
+
+        Returns:
+            Dictionary with state, latency, error rate and request counts
+        """
+        p95 = self.latency_percentile(95)
+        return {
+            "model": self.model,
+            "state": self.state,
+            "latency_ewma_ms": (
+                round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None
+            ),
+            "latency_p95_ms": round(p95, 1) if p95 is not None else None,
+            "error_rate": round(self.error_rate, 4),
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+    def _ewma(self, current: float, observation: float) -> float:
+        alpha = self.config.ewma_alpha
+        return alpha * observation + (1 - alpha) * current
+
+
+class DeploymentPool:
+    """
+    Weighted pool of deployments serving one model alias.
+
+    Attributes:
+        alias: Model alias
+        members: List of (DeploymentHealth, weight) tuples
+        config: Load balancing configuration
+    """
+
+    def __init__(
+        self,
+        alias: str,
+        members: list[tuple[DeploymentHealth, float]],
+        config: LoadBalancingConfig,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            alias: Model alias
+            members: Deployments with their weights
+            config: Load balancing configuration
+        """
+        if not members:
+            raise ValueError(f"Deployment pool '{alias}' has no deployments")
+        self.alias = alias
+        self.members = members
+        self.config = config
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def targets(self) -> list[tuple[str, float]]:
+        """Return the (model, weight) tuples of the pool."""
+        return [(health.model, weight) for health, weight in self.members]
+
+    @property
+    def available(self) -> bool:
+        """Check whether any deployment accepts requests."""
+        return any(health.available for health, _ in self.members)
+
+    @property
+    def fallback(self) -> str | None:
+        """Return the alias used while no deployment accepts requests."""
+        return self.config.fallbacks.get(self.alias)
+
+    def pick(self) -> DeploymentHealth:
+        """
+        Pick the deployment for the next request.
+
+        Returns:
+            Picked deployment. With every circuit open, the deployment that
+            opened first.
+        """
+        healthy = [(h, w) for h, w in self.members if h.available]
+        if not healthy:
+            return min(self.members, key=lambda member: member[0].opened_at or 0.0)[0]
+        return self._choose(healthy)
+
+    def pick_alternate(self, exclude: set[str]) -> DeploymentHealth | None:
+        """
+        Pick a deployment to hedge a request to.
+
+        Args:
+            exclude: Models not to pick (the deployment being hedged)
+
+        Returns:
+            Picked deployment, or None if no other deployment accepts
+            requests (hedges never go to open circuits)
+        """
+        healthy = [(h, w) for h, w in self.members if h.model not in exclude and h.available]
+        if not healthy:
+            return None
+        return self._choose(healthy)
+
+    @staticmethod
+    def _choose(healthy: list[tuple[DeploymentHealth, float]]) -> DeploymentHealth:
+        """Choose among available deployments by weight and health score."""
+        if len(healthy) == 1:
+            return healthy[0][0]
+
+        # Power of two choices: sample two members by weight, keep the better one
+        first = random.choices(healthy, weights=[w for _, w in healthy])[0]
+        rest = [member for member in healthy if member is not first]
+        second = random.choices(rest, weights=[w for _, w in rest])[0]
+        return min(first, second, key=lambda member: member[0].score() / member[1])[0]
+
+    def hedge_delay(self, deployment: DeploymentHealth) -> float | None:
+        """
+        Return how long to wait before hedging a request.
+
+        Args:
+            deployment: Deployment the request was sent to
+
+        Returns:
+            Delay in seconds, or None if the request is not hedged (hedging
+            disabled, single-member pool, too few latency samples)
+        """
+        if not self.config.hedging or len(self.members) < 2:
+            return None
+        percentile = deployment.latency_percentile(self.config.hedge_percentile)
+        if percentile is None:
+            return None
+        return max(percentile, self.config.hedge_min_delay_ms) / 1000
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the health of the pool.
+
+        Returns:
+            Dictionary with alias, fallback, hedge counts and per-deployment health
+        """
+        return {
+            "alias": self.alias,
+            "fallback": self.fallback,
+            "available": self.available,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "deployments": [
+                {**health.snapshot(), "weight": weight} for health, weight in self.members
+            ],
+        }
+
+
+_deployments: dict[str, DeploymentHealth] = {}
+# Keyed by (fingerprint of members and configuration, alias)
+_pools: dict[tuple[str, str], DeploymentPool] = {}
+
+
+def _pool_key(
+    alias: str, targets: list[tuple[str, float]], config: LoadBalancingConfig
+) -> tuple[str, str]:
+    """Key pools by alias and by what they are built from (profile configs differ)."""
+    fingerprint = json.dumps([targets, asdict(config)], sort_keys=True)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()[:16], alias
+
+
+def get_deployment_pool(
+    alias: str,
+    targets: list[tuple[str, float]],
+    config: LoadBalancingConfig,
+) -> DeploymentPool:
+    """
+    Get the process-wide pool of an alias.
+
+    Services using the same members and configuration for an alias share
+    one pool; services with a different configuration (e.g. another
+    profile) get their own. The health of each deployment is shared by
+    all pools.
+
+    Args:
+        alias: Model alias
+        targets: Resolved (model, weight) members
+        config: Load balancing configuration
+
+    Returns:
+        Shared DeploymentPool
+    """
+    key = _pool_key(alias, targets, config)
+    pool = _pools.get(key)
+    if pool is None:
+        members = []
+        for model, weight in targets:
+            health = _deployments.get(model)
+            if health is None:
+                health = DeploymentHealth(model, config)
+                _deployments[model] = health
+            members.append((health, weight))
+        pool = DeploymentPool(alias, members, config)
+        _pools[key] = pool
+    return pool
+
+
+def get_pool_health() -> list[dict[str, Any]]:
+    """
+    Return the health of every pool used in this process.
+
+    Returns:
+        List of pool snapshots (pools appear after their first request)
+    """
+    return [pool.snapshot() for pool in _pools.values()]
+
+
+def reset_deployment_pools() -> None:
+    """Drop all pools and deployment health (tests, config reload)."""
+    _pools.clear()
+    _deployments.clear()
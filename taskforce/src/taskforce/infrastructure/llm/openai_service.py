@@ -10,16 +10,24 @@ Supports multiple LLM providers:
 
 Key features:
 - Model alias resolution with deployment mapping for Azure
+- Weighted deployment pools per alias with EWMA latency routing, hedged
+  requests, circuit breakers and fallback aliases
 - Automatic parameter mapping between GPT-4 and GPT-5 parameter sets
-- Configurable retry logic with exponential backoff
+- Configurable retry logic with jittered exponential backoff and Retry-After
+- Per-deployment client-side rate limits (requests/tokens per minute,
+  max in flight) with queue-wait reporting
+- Opt-in response cache for deterministic calls (memory LRU + SQLite)
+- Single-flight coalescing of identical deterministic calls in flight
 - Structured logging with provider-specific context
 - Azure-specific error parsing and troubleshooting guidance
-- Streaming support for real-time token delivery
+- Streaming support for real-time token delivery, with time to first
+  token, inter-token gaps and throughput per stream
 
 For Azure OpenAI setup instructions, see docs/azure-openai-setup.md
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -41,7 +49,6 @@ os.environ["HTTPX_LOG_LEVEL"] = "warning"
 for _ln in ["LiteLLM", "litellm", "httpcore", "httpx", "aiohttp", "openai"]:
     logging.getLogger(_ln).setLevel(logging.ERROR)
 
-import aiofiles  # noqa: E402
 import litellm  # noqa: E402
 import structlog  # noqa: E402
 import yaml  # noqa: E402
@@ -50,7 +57,43 @@ import yaml  # noqa: E402
 litellm.set_verbose = False
 litellm.suppress_debug_info = True
 
+from taskforce.core.domain.token_budgeter import TokenBudgeter  # noqa: E402
 from taskforce.core.interfaces.llm import LLMProviderProtocol  # noqa: E402
+from taskforce.infrastructure.cache.single_flight import get_single_flight  # noqa: E402
+from taskforce.infrastructure.llm.load_balancer import (  # noqa: E402
+    DeploymentHealth,
+    DeploymentPool,
+    LoadBalancingConfig,
+    get_deployment_pool,
+    is_deployment_error,
+    parse_pool,
+)
+from taskforce.infrastructure.llm.rate_limiter import (  # noqa: E402
+    RateGovernor,
+    RateLimitConfig,
+    backoff_delay,
+    get_rate_governor,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from taskforce.infrastructure.llm.response_cache import (  # noqa: E402
+    LLMResponseCache,
+    ResponseCacheConfig,
+    compute_cache_key,
+    get_response_cache,
+)
+from taskforce.infrastructure.llm.stream_metrics import (  # noqa: E402
+    StreamTimer,
+    record_stream_metrics,
+)
+from taskforce.infrastructure.llm.token_estimator import create_token_estimator  # noqa: E402
+from taskforce.infrastructure.llm.trace_writer import (  # noqa: E402
+    TraceWriterConfig,
+    get_trace_writer,
+)
+
+# Usage reported for results the caller did not pay for (cache hits, coalesced calls)
+_ZERO_USAGE = {"total_tokens": 0, "prompt_tokens": 0, "completion_tokens": 0, "cached_tokens": 0}
 
 
 @dataclass
@@ -61,6 +104,8 @@ class RetryPolicy:
     backoff_multiplier: float = 2.0
     timeout: int = 30
     retry_on_errors: list[str] = field(default_factory=list)
+    max_backoff: float = 60.0
+    jitter: bool = True
 
 
 class OpenAIService(LLMProviderProtocol):
@@ -72,18 +117,25 @@ class OpenAIService(LLMProviderProtocol):
     Implements LLMProviderProtocol for dependency injection.
     """
 
-    def __init__(self, config_path: str = "configs/llm_config.yaml"):
+    def __init__(
+        self,
+        config_path: str = "configs/llm_config.yaml",
+        profile: str | None = None,
+    ):
         """
         Initialize OpenAIService with configuration.
 
         Args:
             config_path: Path to YAML configuration file
+            profile: Configuration profile using this service (groups the
+                streaming metrics)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             ValueError: If config is invalid
         """
         self.logger = structlog.get_logger()
+        self.profile = profile
         self._load_config(config_path)
         self._initialize_provider()
 
@@ -131,8 +183,28 @@ class OpenAIService(LLMProviderProtocol):
             backoff_multiplier=retry_config.get("backoff_multiplier", 2.0),
             timeout=retry_config.get("timeout", 30),
             retry_on_errors=retry_config.get("retry_on_errors", []),
+            max_backoff=retry_config.get("max_backoff", 60.0),
+            jitter=retry_config.get("jitter", True),
+        )
+
+        # Client-side rate limits per model alias
+        self.rate_limit_config = config.get("rate_limits", {}) or {}
+        self._config_path = config_path
+        self._prompt_budgeters: dict[str, TokenBudgeter] = {}
+
+        # Response cache for deterministic calls (opt-in)
+        cache_config = ResponseCacheConfig.from_dict(config.get("response_cache"))
+        self.response_cache: LLMResponseCache | None = (
+            get_response_cache(cache_config) if cache_config.enabled else None
         )
 
+        # Deployment pools: routing, hedging, circuit breakers and fallbacks
+        self.load_balancing = LoadBalancingConfig.from_dict(config.get("load_balancing"))
+
+        # Identical deterministic calls in flight share one request (opt-in)
+        self.coalesce_requests = bool(config.get("coalesce_requests", False))
+        self._flights = get_single_flight("llm")
+
         # Logging preferences
         self.logging_config = config.get("logging", {})
 
@@ -331,6 +403,45 @@ class OpenAIService(LLMProviderProtocol):
             configured_deployments=configured_deployments,
         )
 
+    def _resolve_targets(self, model_alias: str | None) -> list[tuple[str, float]]:
+        """
+        Resolve model alias to its weighted pool of models or Azure deployments.
+
+        An alias maps to a single name or to a list of pool members (see
+        load_balancer.parse_pool); a single name is a pool of one.
+
+        Args:
+            model_alias: Model alias or None (uses default)
+
+        Returns:
+            List of (model or "azure/<deployment>", weight) tuples
+
+        Raises:
+            ValueError: If Azure enabled and alias has no deployment mapping,
+                or the pool definition is invalid
+        """
+        if model_alias is None:
+            model_alias = self.default_model
+
+        azure_config = self.provider_config.get("azure", {})
+        if azure_config.get("enabled", False):
+            deployment_mapping = azure_config.get("deployment_mapping", {})
+            if model_alias not in deployment_mapping:
+                # No deployment mapping for this alias
+                # Check if fallback to OpenAI model name is allowed
+                # (For now, we'll be strict and raise an error)
+                raise ValueError(
+                    f"Azure provider is enabled but no deployment mapping found for model alias '{model_alias}'. "
+                    f"Please add '{model_alias}' to deployment_mapping in azure provider configuration, "
+                    f"or set azure.enabled to false to use OpenAI models."
+                )
+            return [
+                (f"azure/{deployment_name}", weight)
+                for deployment_name, weight in parse_pool(deployment_mapping[model_alias])
+            ]
+
+        return parse_pool(self.models.get(model_alias, model_alias))
+
     def _resolve_model(self, model_alias: str | None) -> str:
         """
         Resolve model alias to actual model name or Azure deployment name.
@@ -342,6 +453,9 @@ class OpenAIService(LLMProviderProtocol):
         
         When Azure provider is disabled:
         - Uses traditional OpenAI model name resolution
+
+        For a pooled alias the first member is returned (it selects the
+        parameter mapping); the load balancer spreads requests over the pool.
         
         Args:
             model_alias: Model alias or None (uses default)
@@ -355,51 +469,67 @@ class OpenAIService(LLMProviderProtocol):
         if model_alias is None:
             model_alias = self.default_model
 
-        # Check if Azure is enabled
-        azure_config = self.provider_config.get("azure", {})
-        azure_enabled = azure_config.get("enabled", False)
-
-        if azure_enabled:
-            # Azure provider: resolve through deployment_mapping
-            deployment_mapping = azure_config.get("deployment_mapping", {})
-
-            # First, resolve alias to OpenAI model name
-            openai_model = self.models.get(model_alias, model_alias)
-
-            # Check if deployment mapping exists for this alias
-            if model_alias in deployment_mapping:
-                deployment_name = deployment_mapping[model_alias]
+        targets = self._resolve_targets(model_alias)
+        resolved_model = targets[0][0]
 
-                self.logger.info(
-                    "model_resolved",
-                    provider="azure",
-                    model_alias=model_alias,
-                    deployment_name=deployment_name,
-                    openai_model=openai_model,
-                )
-
-                return f"azure/{deployment_name}"
-            else:
-                # No deployment mapping for this alias
-                # Check if fallback to OpenAI model name is allowed
-                # (For now, we'll be strict and raise an error)
-                raise ValueError(
-                    f"Azure provider is enabled but no deployment mapping found for model alias '{model_alias}'. "
-                    f"Please add '{model_alias}' to deployment_mapping in azure provider configuration, "
-                    f"or set azure.enabled to false to use OpenAI models."
-                )
+        if self.provider_config.get("azure", {}).get("enabled", False):
+            self.logger.info(
+                "model_resolved",
+                provider="azure",
+                model_alias=model_alias,
+                deployment_name=resolved_model.replace("azure/", "", 1),
+                openai_model=self.models.get(model_alias, model_alias),
+                pool_size=len(targets),
+            )
         else:
-            # OpenAI provider: traditional resolution
-            resolved_model = self.models.get(model_alias, model_alias)
-
             self.logger.info(
                 "model_resolved",
                 provider="openai",
                 model_alias=model_alias,
                 resolved_model=resolved_model,
+                pool_size=len(targets),
             )
 
-            return resolved_model
+        return resolved_model
+
+    def _get_deployment_pool(self, model_alias: str | None) -> DeploymentPool:
+        """
+        Get the shared deployment pool of an alias.
+
+        Args:
+            model_alias: Model alias or None (uses default)
+
+        Returns:
+            DeploymentPool of the alias
+        """
+        alias = model_alias or self.default_model
+        return get_deployment_pool(alias, self._resolve_targets(alias), self.load_balancing)
+
+    def _route_alias(self, model_alias: str | None) -> str:
+        """
+        Follow configured fallbacks while every deployment of an alias is open.
+
+        Args:
+            model_alias: Model alias or None (uses default)
+
+        Returns:
+            Alias to send the request to
+        """
+        alias = model_alias or self.default_model
+        visited = {alias}
+        while True:
+            pool = self._get_deployment_pool(alias)
+            fallback = pool.fallback
+            if pool.available or not fallback or fallback in visited:
+                return alias
+            self.logger.warning(
+                "llm_alias_fallback",
+                model_alias=alias,
+                fallback=fallback,
+                reason="all deployment circuits open",
+            )
+            visited.add(fallback)
+            alias = fallback
 
     def _parse_azure_error(self, error: Exception) -> dict[str, Any]:
         """
@@ -733,6 +863,8 @@ class OpenAIService(LLMProviderProtocol):
         latency_ms: int,
         success: bool,
         error: str | None = None,
+        tool_calls: list[dict[str, Any]] | None = None,
+        stream_metrics: dict[str, Any] | None = None,
     ) -> None:
         """
         Trace LLM interaction to configured destinations.
@@ -745,6 +877,8 @@ class OpenAIService(LLMProviderProtocol):
             latency_ms: Request latency in milliseconds
             success: Whether the request was successful
             error: Error message if failed
+            tool_calls: Tool calls requested by the model (OpenAI format)
+            stream_metrics: Streaming timings and mapped parameters (streams only)
         """
         if not self.tracing_config.get("enabled", False):
             return
@@ -756,11 +890,14 @@ class OpenAIService(LLMProviderProtocol):
             "model": model,
             "messages": messages,
             "response": response_content,
+            "tool_calls": tool_calls,
             "usage": token_stats,
             "latency_ms": latency_ms,
             "success": success,
             "error": error,
         }
+        if stream_metrics is not None:
+            trace_data["stream_metrics"] = stream_metrics
 
         tasks = []
         if mode in ["file", "both"]:
@@ -773,18 +910,11 @@ class OpenAIService(LLMProviderProtocol):
             await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _trace_to_file(self, trace_data: dict[str, Any]) -> None:
-        """Write trace data to JSONL file."""
+        """Queue trace data for the shared batched JSONL writer."""
         try:
             file_config = self.tracing_config.get("file_config", {})
-            file_path = file_config.get("path", "traces/llm_traces.jsonl")
-
-            # Ensure directory exists
-            path = Path(file_path)
-            if not path.parent.exists():
-                path.parent.mkdir(parents=True, exist_ok=True)
-
-            async with aiofiles.open(path, mode="a", encoding="utf-8") as f:
-                await f.write(json.dumps(trace_data) + "\n")
+            writer = get_trace_writer(TraceWriterConfig.from_file_config(file_config))
+            await writer.write(trace_data)
 
         except Exception as e:
             self.logger.error("trace_file_write_failed", error=str(e))
@@ -812,6 +942,99 @@ class OpenAIService(LLMProviderProtocol):
         except Exception as e:
             self.logger.error("trace_phoenix_failed", error=str(e))
 
+    @staticmethod
+    def _extract_token_stats(usage: Any) -> dict[str, Any]:
+        """
+        Normalize LiteLLM usage into token statistics.
+
+        Adds ``cached_tokens`` - prompt tokens served from the provider's
+        prompt cache (OpenAI/Azure ``prompt_tokens_details.cached_tokens``,
+        Anthropic ``cache_read_input_tokens``).
+
+        Args:
+            usage: Usage object or dict from the LiteLLM response
+
+        Returns:
+            Dict with total_tokens, prompt_tokens, completion_tokens and cached_tokens
+        """
+        if not usage:
+            return {}
+
+        def _usage_field(source: Any, name: str) -> Any:
+            if isinstance(source, dict):
+                return source.get(name)
+            return getattr(source, name, None)
+
+        if isinstance(usage, dict):
+            token_stats = dict(usage)
+        else:
+            token_stats = {
+                "total_tokens": getattr(usage, "total_tokens", 0),
+                "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+                "completion_tokens": getattr(usage, "completion_tokens", 0),
+            }
+
+        details = _usage_field(usage, "prompt_tokens_details")
+        cached_tokens = _usage_field(details, "cached_tokens") if details else None
+        if not isinstance(cached_tokens, int):
+            cached_tokens = _usage_field(usage, "cache_read_input_tokens")
+        token_stats["cached_tokens"] = cached_tokens if isinstance(cached_tokens, int) else 0
+        token_stats.pop("prompt_tokens_details", None)
+        return token_stats
+
+    def _get_rate_governor(self, model_alias: str | None, actual_model: str) -> RateGovernor:
+        """
+        Get the shared admission governor for a resolved model.
+
+        Limits come from rate_limits.default, overridden per alias by
+        rate_limits.models. Disabled rate limits yield an unlimited
+        governor, which still honours Retry-After pauses.
+
+        Args:
+            model_alias: Model alias or None (uses default)
+            actual_model: Resolved model or Azure deployment name
+
+        Returns:
+            RateGovernor shared by all calls to actual_model
+        """
+        limits: dict[str, Any] = {}
+        if self.rate_limit_config.get("enabled", True):
+            alias = model_alias or self.default_model
+            limits = {
+                **(self.rate_limit_config.get("default") or {}),
+                **((self.rate_limit_config.get("models") or {}).get(alias) or {}),
+            }
+        return get_rate_governor(actual_model, RateLimitConfig.from_dict(limits))
+
+    def _estimate_prompt_tokens(
+        self,
+        model_alias: str | None,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+    ) -> int:
+        """
+        Estimate prompt tokens for tokens-per-minute admission.
+
+        Uses one TokenBudgeter per alias so unchanged messages and tool
+        schemas are served from its ledger across calls.
+
+        Args:
+            model_alias: Model alias or None (uses default)
+            messages: Request messages
+            tools: Request tool schemas
+
+        Returns:
+            Estimated prompt tokens
+        """
+        alias = model_alias or self.default_model
+        budgeter = self._prompt_budgeters.get(alias)
+        if budgeter is None:
+            budgeter = TokenBudgeter(
+                estimator=create_token_estimator(self._config_path, alias)
+            )
+            self._prompt_budgeters[alias] = budgeter
+        return budgeter.estimate_tokens(messages, tools=tools)
+
     async def complete(
         self,
         messages: list[dict[str, Any]],
@@ -828,14 +1051,25 @@ class OpenAIService(LLMProviderProtocol):
             model: Model alias or None (uses default)
             tools: Optional list of tool definitions in OpenAI function calling format
             tool_choice: Optional tool choice strategy ("auto", "none", "required", or specific tool)
-            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+            **kwargs: Additional parameters (temperature, max_tokens, etc.).
+                cache=True caches a non-deterministic call, cache=False bypasses
+                the response cache (default: cache when temperature == 0)
 
         Returns:
             Dict with:
             - success: bool
             - content: str | None (if no tool calls)
             - tool_calls: list[dict] | None (if model invoked tools)
-            - usage: Dict with token counts
+            - usage: Dict with token counts (cached_tokens = prompt tokens
+              served from the provider's prompt cache)
+            - model: Model or deployment that answered (pooled aliases)
+            - latency_ms: Model latency of the successful attempt
+            - queue_wait_ms: Time spent waiting for client-side admission
+              (rate limits, max in flight) over all attempts
+            - cache_hit: True if served from the response cache (usage is zero)
+            - hedged: True if a duplicate request was sent to another deployment
+            - coalesced: True if the result was shared by an identical
+              deterministic call already in flight (usage is zero)
             - error: str (if failed)
 
         Example:
@@ -848,7 +1082,10 @@ class OpenAIService(LLMProviderProtocol):
             ...     temperature=0.7
             ... )
         """
-        # Resolve model and parameters
+        cache_flag = kwargs.pop("cache", None)
+
+        # Resolve model and parameters (fallback alias while its deployments are down)
+        model = self._route_alias(model)
         actual_model = self._resolve_model(model)
         base_params = self._get_model_parameters(actual_model)
 
@@ -888,11 +1125,117 @@ class OpenAIService(LLMProviderProtocol):
                 # Default to "auto" when tools are provided
                 litellm_kwargs["tool_choice"] = "auto"
 
+        # Deterministic calls are answered from the response cache and
+        # coalesced with identical calls already in flight
+        request_key = None
+        deterministic = cache_flag or (
+            cache_flag is None and merged_params.get("temperature") == 0
+        )
+        if deterministic and (self.response_cache is not None or self.coalesce_requests):
+            request_key = compute_cache_key(
+                actual_model,
+                messages,
+                tools=litellm_kwargs.get("tools"),
+                tool_choice=litellm_kwargs.get("tool_choice"),
+                params=final_params,
+            )
+
+        if self.response_cache is not None:
+            if request_key is None:
+                self.response_cache.record_bypass()
+            else:
+                cached = await self.response_cache.get(request_key)
+                if cached is not None:
+                    self.logger.info(
+                        "llm_completion_cache_hit",
+                        provider=provider,
+                        model=actual_model,
+                        deployment=display_name if is_azure else None,
+                    )
+                    return {
+                        **cached,
+                        "usage": dict(_ZERO_USAGE),
+                        "latency_ms": 0,
+                        "queue_wait_ms": 0,
+                        "cache_hit": True,
+                    }
+
+        send = functools.partial(
+            self._send_completion,
+            messages=messages,
+            model=model,
+            tools=tools,
+            actual_model=actual_model,
+            litellm_kwargs=litellm_kwargs,
+            provider=provider,
+            display_name=display_name,
+            is_azure=is_azure,
+            cache_key=request_key if self.response_cache is not None else None,
+        )
+        if request_key is None or not self.coalesce_requests:
+            return await send()
+
+        result, shared = await self._flights.do(request_key, send)
+        if not shared:
+            return result
+
+        # The first caller accounts for the tokens
+        self.logger.info(
+            "llm_completion_coalesced",
+            provider=provider,
+            model=actual_model,
+            deployment=display_name if is_azure else None,
+        )
+        return {**result, "usage": dict(_ZERO_USAGE), "coalesced": True}
+
+    async def _send_completion(
+        self,
+        *,
+        messages: list[dict[str, Any]],
+        model: str | None,
+        tools: list[dict[str, Any]] | None,
+        actual_model: str,
+        litellm_kwargs: dict[str, Any],
+        provider: str,
+        display_name: str,
+        is_azure: bool,
+        cache_key: str | None,
+    ) -> dict[str, Any]:
+        """
+        Send a completion through admission control with retries.
+
+        Every attempt is routed to a deployment of the alias' pool, so a
+        retry moves away from a failing deployment.
+
+        Args:
+            messages: Request messages
+            model: Model alias (selects the pool and rate limits)
+            tools: Tool schemas (for the prompt token estimate)
+            actual_model: Resolved model or deployment name
+            litellm_kwargs: Prepared LiteLLM call arguments
+            provider: Provider name for logging
+            display_name: Model or deployment name for logging
+            is_azure: Whether the Azure provider is enabled
+            cache_key: Response cache key to store a success under, if any
+
+        Returns:
+            Same as complete()
+        """
+        pool = self._get_deployment_pool(model)
+        governor = self._get_rate_governor(model, actual_model)
+        estimated_tokens = (
+            self._estimate_prompt_tokens(model, messages, tools) if governor.counts_tokens else 0
+        )
+        queue_waits: list[int] = []
+
         # Retry logic
         for attempt in range(self.retry_policy.max_attempts):
+            start_time = time.time()
+            deployment = pool.pick()
+            actual_model = deployment.model
+            if is_azure:
+                display_name = actual_model.replace("azure/", "", 1)
             try:
-                start_time = time.time()
-
                 self.logger.info(
                     "llm_completion_started",
                     provider=provider,
@@ -903,8 +1246,15 @@ class OpenAIService(LLMProviderProtocol):
                     tools_count=len(tools) if tools else 0,
                 )
 
-                # Call LiteLLM
-                response = await litellm.acompletion(**litellm_kwargs)
+                # Call LiteLLM once admitted (latency excludes the queue wait)
+                response, winner, latency_ms = await self._call_pool(
+                    pool, deployment, pool.alias, litellm_kwargs, estimated_tokens, queue_waits
+                )
+                hedged = winner is not deployment
+                actual_model = winner.model
+                if is_azure:
+                    display_name = actual_model.replace("azure/", "", 1)
+                queue_wait_ms = sum(queue_waits)
 
                 # Extract content, tool_calls and usage
                 message = response.choices[0].message
@@ -933,19 +1283,8 @@ class OpenAIService(LLMProviderProtocol):
                     elif hasattr(message, "refusal") and message.refusal:
                         content = f"[Model refused: {message.refusal}]"
 
-                usage = getattr(response, "usage", {})
-
                 # Handle both dict and object forms
-                if isinstance(usage, dict):
-                    token_stats = usage
-                else:
-                    token_stats = {
-                        "total_tokens": getattr(usage, "total_tokens", 0),
-                        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
-                        "completion_tokens": getattr(usage, "completion_tokens", 0),
-                    }
-
-                latency_ms = int((time.time() - start_time) * 1000)
+                token_stats = self._extract_token_stats(getattr(response, "usage", {}))
 
                 # Warn if we have completion tokens but empty content (and no tool calls)
                 completion_tokens = token_stats.get("completion_tokens", 0)
@@ -965,21 +1304,36 @@ class OpenAIService(LLMProviderProtocol):
                         model=actual_model,
                         deployment=display_name if is_azure else None,
                         tokens=token_stats.get("total_tokens", 0),
+                        prompt_tokens=token_stats.get("prompt_tokens", 0),
+                        cached_tokens=token_stats.get("cached_tokens", 0),
                         latency_ms=latency_ms,
+                        queue_wait_ms=queue_wait_ms,
+                        hedged=hedged,
                         tool_calls_count=len(tool_calls) if tool_calls else 0,
                     )
 
                 # Trace interaction
-                asyncio.create_task(
-                    self._trace_interaction(
-                        messages=messages,
-                        response_content=content,
+                await self._trace_interaction(
+                    messages=messages,
+                    response_content=content,
+                    model=actual_model,
+                    token_stats=token_stats,
+                    latency_ms=latency_ms,
+                    success=True,
+                    tool_calls=tool_calls,
+                )
+
+                if cache_key is not None and self.response_cache is not None:
+                    await self.response_cache.put(
+                        cache_key,
+                        {
+                            "success": True,
+                            "content": content,
+                            "tool_calls": tool_calls,
+                            "model": actual_model,
+                        },
                         model=actual_model,
-                        token_stats=token_stats,
-                        latency_ms=latency_ms,
-                        success=True,
                     )
-                )
 
                 return {
                     "success": True,
@@ -988,6 +1342,9 @@ class OpenAIService(LLMProviderProtocol):
                     "usage": token_stats,
                     "model": actual_model,
                     "latency_ms": latency_ms,
+                    "queue_wait_ms": queue_wait_ms,
+                    "cache_hit": False,
+                    "hedged": hedged,
                 }
 
             except Exception as e:
@@ -999,6 +1356,10 @@ class OpenAIService(LLMProviderProtocol):
                 if is_azure:
                     parsed_error = self._parse_azure_error(e)
 
+                # Rate limits were already recorded for the deployment
+                retry_after = retry_after_seconds(e) if is_rate_limit_error(e) else None
+                queue_wait_ms = sum(queue_waits)
+
                 # Check if should retry (check both error type and message)
                 should_retry = attempt < self.retry_policy.max_attempts - 1 and any(
                     err_type in error_type or err_type in error_msg
@@ -1006,7 +1367,13 @@ class OpenAIService(LLMProviderProtocol):
                 )
 
                 if should_retry:
-                    backoff_time = self.retry_policy.backoff_multiplier**attempt
+                    backoff_time = backoff_delay(
+                        attempt,
+                        self.retry_policy.backoff_multiplier,
+                        self.retry_policy.max_backoff,
+                        retry_after=retry_after,
+                        jitter=self.retry_policy.jitter,
+                    )
 
                     log_context = {
                         "provider": provider,
@@ -1014,7 +1381,8 @@ class OpenAIService(LLMProviderProtocol):
                         "deployment": display_name if is_azure else None,
                         "error_type": error_type,
                         "attempt": attempt + 1,
-                        "backoff_seconds": backoff_time,
+                        "backoff_seconds": round(backoff_time, 3),
+                        "retry_after": retry_after,
                     }
 
                     # Add Azure-specific context if available
@@ -1031,6 +1399,7 @@ class OpenAIService(LLMProviderProtocol):
                         "error_type": error_type,
                         "error": error_msg[:200],
                         "attempts": attempt + 1,
+                        "queue_wait_ms": queue_wait_ms,
                     }
 
                     # Add Azure-specific context for troubleshooting
@@ -1047,16 +1416,14 @@ class OpenAIService(LLMProviderProtocol):
                     self.logger.error("llm_completion_failed", **log_context)
 
                     # Trace failure
-                    asyncio.create_task(
-                        self._trace_interaction(
-                            messages=messages,
-                            response_content=None,
-                            model=actual_model,
-                            token_stats={},
-                            latency_ms=int((time.time() - start_time) * 1000),
-                            success=False,
-                            error=error_msg,
-                        )
+                    await self._trace_interaction(
+                        messages=messages,
+                        response_content=None,
+                        model=actual_model,
+                        token_stats={},
+                        latency_ms=int((time.time() - start_time) * 1000),
+                        success=False,
+                        error=error_msg,
                     )
 
                     error_result = {
@@ -1064,6 +1431,7 @@ class OpenAIService(LLMProviderProtocol):
                         "error": error_msg,
                         "error_type": error_type,
                         "model": actual_model,
+                        "queue_wait_ms": queue_wait_ms,
                     }
 
                     # Include parsed error details for Azure
@@ -1077,8 +1445,140 @@ class OpenAIService(LLMProviderProtocol):
             "success": False,
             "error": "Max retries exceeded",
             "model": actual_model,
+            "queue_wait_ms": sum(queue_waits),
         }
 
+    async def _call_pool(
+        self,
+        pool: DeploymentPool,
+        deployment: DeploymentHealth,
+        model_alias: str,
+        litellm_kwargs: dict[str, Any],
+        estimated_tokens: int,
+        queue_waits: list[int],
+    ) -> tuple[Any, DeploymentHealth, int]:
+        """
+        Call a deployment, hedging to another pool member when it is slow.
+
+        Once the call has run longer than the deployment's latency
+        percentile, a duplicate goes to another available deployment; the
+        first success wins and the other call is cancelled.
+
+        Args:
+            pool: Pool of the alias
+            deployment: Deployment picked for the call
+            model_alias: Model alias (selects the rate limits)
+            litellm_kwargs: Prepared LiteLLM call arguments
+            estimated_tokens: Prompt token estimate for admission
+            queue_waits: Admission waits of the primary call are appended here
+
+        Returns:
+            Tuple of (response, deployment that answered, latency_ms)
+
+        Raises:
+            Exception: Error of the primary call if no call succeeded
+        """
+        hedge_after = pool.hedge_delay(deployment)
+        if hedge_after is None:
+            return await self._call_deployment(
+                deployment, model_alias, litellm_kwargs, estimated_tokens, queue_waits
+            )
+
+        started = time.time()
+        primary = asyncio.ensure_future(
+            self._call_deployment(
+                deployment, model_alias, litellm_kwargs, estimated_tokens, queue_waits
+            )
+        )
+        calls = {primary}
+        try:
+            done, _ = await asyncio.wait(calls, timeout=hedge_after)
+            alternate = None if done else pool.pick_alternate(exclude={deployment.model})
+            if alternate is not None:
+                pool.hedges += 1
+                self.logger.info(
+                    "llm_request_hedged",
+                    model_alias=model_alias,
+                    deployment=deployment.model,
+                    hedge_deployment=alternate.model,
+                    hedge_after_ms=int(hedge_after * 1000),
+                )
+                calls.add(
+                    asyncio.ensure_future(
+                        self._call_deployment(
+                            alternate, model_alias, litellm_kwargs, estimated_tokens
+                        )
+                    )
+                )
+
+            pending = set(calls)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for call in done:
+                    if call.exception() is None:
+                        result = call.result()
+                        if call is not primary:
+                            # The primary was slower than this: keep it in its latency
+                            pool.hedge_wins += 1
+                            deployment.record_latency((time.time() - started) * 1000)
+                        return result
+
+            return primary.result()  # Every call failed: raise the primary's error
+        finally:
+            for call in calls:
+                if not call.done():
+                    call.cancel()
+
+    async def _call_deployment(
+        self,
+        deployment: DeploymentHealth,
+        model_alias: str,
+        litellm_kwargs: dict[str, Any],
+        estimated_tokens: int,
+        queue_waits: list[int] | None = None,
+    ) -> tuple[Any, DeploymentHealth, int]:
+        """
+        Send one LiteLLM call to a deployment and record its health.
+
+        Args:
+            deployment: Deployment to call
+            model_alias: Model alias (selects the rate limits)
+            litellm_kwargs: Prepared LiteLLM call arguments
+            estimated_tokens: Prompt token estimate for admission
+            queue_waits: Admission wait is appended here, if given
+
+        Returns:
+            Tuple of (response, deployment, latency_ms)
+        """
+        governor = self._get_rate_governor(model_alias, deployment.model)
+        async with governor.slot(estimated_tokens) as admission:
+            if queue_waits is not None:
+                queue_waits.append(admission.wait_ms)
+            deployment.begin()
+            start_time = time.time()
+            try:
+                response = await litellm.acompletion(
+                    **{**litellm_kwargs, "model": deployment.model}
+                )
+            except asyncio.CancelledError:
+                deployment.abandon()
+                raise
+            except Exception as e:
+                # Rate limits throttle every caller of the deployment
+                if is_rate_limit_error(e):
+                    governor.record_rate_limited(retry_after_seconds(e))
+                if is_deployment_error(e):
+                    deployment.record_failure()
+                else:
+                    deployment.abandon()
+                raise
+
+        latency_ms = int((time.time() - start_time) * 1000)
+        usage = self._extract_token_stats(getattr(response, "usage", {}))
+        governor.record_success(admission, usage.get("total_tokens"))
+        deployment.record_success(latency_ms)
+        return response, deployment, latency_ms
+
     async def generate(
         self,
         prompt: str,
@@ -1126,6 +1626,34 @@ Task: {prompt}
 
         return result
 
+    @staticmethod
+    def _is_complete_json(arguments: str) -> bool:
+        """Check whether streamed tool call arguments form a complete JSON value."""
+        if not arguments:
+            return False
+        try:
+            json.loads(arguments)
+        except json.JSONDecodeError:
+            return False
+        return True
+
+    def _stream_tool_call_end(self, idx: int, tc_data: dict[str, Any]) -> dict[str, Any]:
+        """Build the tool_call_end stream event for a completed tool call."""
+        self.logger.debug(
+            "llm_stream_tool_call_end",
+            tool_id=tc_data["id"],
+            tool_name=tc_data["name"],
+            arguments_length=len(tc_data["arguments"]),
+            index=idx,
+        )
+        return {
+            "type": "tool_call_end",
+            "id": tc_data["id"],
+            "name": tc_data["name"],
+            "arguments": tc_data["arguments"],
+            "index": idx,
+        }
+
     async def complete_stream(
         self,
         messages: list[dict[str, Any]],
@@ -1153,20 +1681,31 @@ Task: {prompt}
             - {"type": "tool_call_start", "id": "...", "name": "...", "index": N}
             - {"type": "tool_call_delta", "id": "...", "arguments_delta": "...", "index": N}
             - {"type": "tool_call_end", "id": "...", "name": "...", "arguments": "...", "index": N}
-            - {"type": "done", "usage": {...}} - Stream complete
+            - {"type": "done", "usage": {...}, "queue_wait_ms": N} - Stream complete;
+              usage["stream_metrics"] holds time to first token, time to first
+              tool call, inter-token gaps and tokens per second (see stream_metrics)
             - {"type": "error", "message": "..."} - Error occurred
+
+            tool_call_end for a call is emitted as soon as a later call has
+            started and its arguments are complete JSON (the last call ends at
+            finish), so consumers can start tools before the stream is done.
         """
-        # Resolve model and parameters
+        # Resolve model and pick a deployment (streams are not hedged)
         try:
-            actual_model = self._resolve_model(model)
+            model = self._route_alias(model)
+            pool_model = self._resolve_model(model)
+            deployment = self._get_deployment_pool(model).pick()
         except ValueError as e:
             self.logger.error("stream_model_resolution_failed", error=str(e))
             yield {"type": "error", "message": str(e)}
             return
 
-        base_params = self._get_model_parameters(actual_model)
+        actual_model = deployment.model
+
+        kwargs.pop("cache", None)  # Streams are never served from the response cache
+        base_params = self._get_model_parameters(pool_model)
         merged_params = {**base_params, **kwargs}
-        final_params = self._map_parameters_for_model(actual_model, merged_params)
+        final_params = self._map_parameters_for_model(pool_model, merged_params)
 
         # Determine provider for logging
         azure_config = self.provider_config.get("azure", {})
@@ -1206,12 +1745,22 @@ Task: {prompt}
             tools_count=len(tools) if tools else 0,
         )
 
+        # The admission slot is held until the stream is finished
+        governor = self._get_rate_governor(model, actual_model)
+        estimated_tokens = (
+            self._estimate_prompt_tokens(model, messages, tools) if governor.counts_tokens else 0
+        )
+        admission = await governor.acquire(estimated_tokens)
+        deployment.begin()
+        timer = StreamTimer()  # Starts after admission: excludes the queue wait
+
         try:
             # Call LiteLLM with streaming
             response = await litellm.acompletion(**litellm_kwargs)
 
             # Track tool calls across chunks
             current_tool_calls: dict[int, dict[str, Any]] = {}
+            ended_tool_calls: set[int] = set()
             content_accumulated = ""  # Accumulate content for tracing
             start_time = time.time()
 
@@ -1223,8 +1772,12 @@ Task: {prompt}
                 delta = chunk.choices[0].delta
                 finish_reason = chunk.choices[0].finish_reason
 
+                has_content = bool(getattr(delta, "content", None))
+                if has_content or getattr(delta, "tool_calls", None):
+                    timer.mark_output()
+
                 # Handle content tokens
-                if hasattr(delta, "content") and delta.content:
+                if has_content:
                     content_accumulated += delta.content  # Accumulate for tracing
                     self.logger.debug(
                         "llm_stream_token",
@@ -1252,6 +1805,7 @@ Task: {prompt}
 
                             # Only emit start if we have meaningful data
                             if tool_id or tool_name:
+                                timer.mark_tool_call_start()
                                 self.logger.debug(
                                     "llm_stream_tool_call_start",
                                     tool_id=tool_id,
@@ -1290,24 +1844,25 @@ Task: {prompt}
                                     "index": idx,
                                 }
 
+                    # A call is done once a later call has started and its
+                    # arguments form complete JSON - end it before finish
+                    latest_idx = max(current_tool_calls)
+                    for prev_idx, prev_data in current_tool_calls.items():
+                        if (
+                            prev_idx < latest_idx
+                            and prev_idx not in ended_tool_calls
+                            and self._is_complete_json(prev_data["arguments"])
+                        ):
+                            ended_tool_calls.add(prev_idx)
+                            yield self._stream_tool_call_end(prev_idx, prev_data)
+
                 # Check for finish
                 if finish_reason:
-                    # Emit tool_call_end for all accumulated tool calls
+                    # Emit tool_call_end for all tool calls not yet completed
                     for idx, tc_data in current_tool_calls.items():
-                        self.logger.debug(
-                            "llm_stream_tool_call_end",
-                            tool_id=tc_data["id"],
-                            tool_name=tc_data["name"],
-                            arguments_length=len(tc_data["arguments"]),
-                            index=idx,
-                        )
-                        yield {
-                            "type": "tool_call_end",
-                            "id": tc_data["id"],
-                            "name": tc_data["name"],
-                            "arguments": tc_data["arguments"],
-                            "index": idx,
-                        }
+                        if idx not in ended_tool_calls:
+                            ended_tool_calls.add(idx)
+                            yield self._stream_tool_call_end(idx, tc_data)
 
             # Final done event
             latency_ms = int((time.time() - start_time) * 1000)
@@ -1316,39 +1871,61 @@ Task: {prompt}
             # Note: Streaming responses may not always have usage data
             usage: dict[str, Any] = {}
             if hasattr(response, "usage") and response.usage:
-                raw_usage = response.usage
-                if isinstance(raw_usage, dict):
-                    usage = raw_usage
-                else:
-                    usage = {
-                        "total_tokens": getattr(raw_usage, "total_tokens", 0),
-                        "prompt_tokens": getattr(raw_usage, "prompt_tokens", 0),
-                        "completion_tokens": getattr(raw_usage, "completion_tokens", 0),
-                    }
+                usage = self._extract_token_stats(response.usage)
+            governor.record_success(admission, usage.get("total_tokens"))
+            deployment.record_success()  # Stream duration depends on output length
+
+            stream_metrics = timer.finish(usage.get("completion_tokens"))
+            record_stream_metrics(self.profile, model, actual_model, stream_metrics)
 
             self.logger.info(
                 "llm_stream_completed",
                 provider=provider,
                 model=actual_model,
+                model_alias=model,
+                profile=self.profile,
                 deployment=display_name if is_azure else None,
                 latency_ms=latency_ms,
+                queue_wait_ms=admission.wait_ms,
                 tool_calls_count=len(current_tool_calls),
                 usage=usage,
+                params=final_params,
+                **stream_metrics,
             )
 
             # Trace interaction (same as non-streaming complete)
-            asyncio.create_task(
-                self._trace_interaction(
-                    messages=messages,
-                    response_content=content_accumulated or None,
-                    model=actual_model,
-                    token_stats=usage,
-                    latency_ms=latency_ms,
-                    success=True,
-                )
+            await self._trace_interaction(
+                messages=messages,
+                response_content=content_accumulated or None,
+                model=actual_model,
+                token_stats=usage,
+                latency_ms=latency_ms,
+                success=True,
+                tool_calls=[
+                    {
+                        "id": tc_data["id"],
+                        "type": "function",
+                        "function": {
+                            "name": tc_data["name"],
+                            "arguments": tc_data["arguments"],
+                        },
+                    }
+                    for tc_data in current_tool_calls.values()
+                ]
+                or None,
+                stream_metrics={
+                    **stream_metrics,
+                    "model_alias": model,
+                    "profile": self.profile,
+                    "params": final_params,
+                },
             )
 
-            yield {"type": "done", "usage": usage}
+            yield {
+                "type": "done",
+                "usage": {**usage, "stream_metrics": stream_metrics},
+                "queue_wait_ms": admission.wait_ms,
+            }
 
         except Exception as e:
             error_msg = str(e)
@@ -1370,20 +1947,27 @@ Task: {prompt}
             if parsed_error and "hint" in parsed_error:
                 log_context["troubleshooting_hint"] = parsed_error["hint"]
 
+            if is_rate_limit_error(e):
+                governor.record_rate_limited(retry_after_seconds(e))
+            if is_deployment_error(e):
+                deployment.record_failure()
+
             self.logger.error("llm_stream_failed", **log_context)
 
             # Trace failed interaction
-            asyncio.create_task(
-                self._trace_interaction(
-                    messages=messages,
-                    response_content=None,
-                    model=actual_model,
-                    token_stats={},
-                    latency_ms=0,
-                    success=False,
-                    error=error_msg,
-                )
+            await self._trace_interaction(
+                messages=messages,
+                response_content=None,
+                model=actual_model,
+                token_stats={},
+                latency_ms=0,
+                success=False,
+                error=error_msg,
             )
 
             yield {"type": "error", "message": error_msg}
 
+        finally:
+            governor.release()
+            deployment.abandon()
+
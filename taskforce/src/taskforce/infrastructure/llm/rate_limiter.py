@@ -0,0 +1,453 @@
+"""
+Client-side admission control for LLM deployments.
+
+OpenAIService admits every call through a RateGovernor for the deployment
+it targets. One governor exists per deployment (shared by all service
+instances of the process), so concurrent missions queue in the client
+instead of hammering the deployment until it answers with 429s.
+
+Key features:
+- Token buckets for requests per minute and tokens per minute (estimated
+  prompt tokens are reserved up front, reconciled with the actual usage)
+- Max-in-flight limit per deployment
+- Retry-After from a rate-limited response pauses the whole deployment
+- Adaptive rate: each rate limit halves the admitted rate, each success
+  raises it again (AIMD)
+- Jittered exponential backoff for retries (backoff_delay)
+- Queue wait per admission, so throttling is visible apart from model latency
+
+Configuration (llm_config.yaml):
+    rate_limits:
+      enabled: true
+      default:                      # Applies to every model alias
+        requests_per_minute: 0      # 0 = unlimited
+        tokens_per_minute: 0
+        max_in_flight: 0
+      models:                       # Per-alias overrides
+        main:
+          requests_per_minute: 300
+          tokens_per_minute: 150000
+          max_in_flight: 8
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import structlog
+
+# Lower bound of the adaptive rate scale after repeated rate limits
+MIN_RATE_SCALE = 0.1
+# Additive recovery of the rate scale per successful call
+RATE_SCALE_RECOVERY = 0.05
+
+
+@dataclass
+class RateLimitConfig:
+    """
+    Admission limits for one deployment.
+
+    Attributes:
+        requests_per_minute: Request budget per minute (0 = unlimited)
+        tokens_per_minute: Token budget per minute (0 = unlimited)
+        max_in_flight: Maximum concurrent requests (0 = unlimited)
+    """
+
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_in_flight: int = 0
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any] | None) -> "RateLimitConfig":
+        """
+        Create config from a rate_limits entry of llm_config.yaml.
+
+        Args:
+            config: Limits dictionary (missing keys are unlimited)
+
+        Returns:
+            RateLimitConfig with non-negative limits
+        """
+        config = config or {}
+        return cls(
+            requests_per_minute=max(0, int(config.get("requests_per_minute", 0) or 0)),
+            tokens_per_minute=max(0, int(config.get("tokens_per_minute", 0) or 0)),
+            max_in_flight=max(0, int(config.get("max_in_flight", 0) or 0)),
+        )
+
+
+@dataclass
+class Admission:
+    """
+    Result of admitting one request.
+
+    Attributes:
+        wait_ms: Time spent queued for admission in milliseconds
+        estimated_tokens: Tokens reserved from the token bucket
+    """
+
+    wait_ms: int
+    estimated_tokens: int
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a per-minute rate.
+
+    Callers reserve capacity up front and the bucket may go negative; the
+    returned wait is the time until the reservation is covered. Waiters are
+    therefore served in arrival order without a lock (and without binding
+    to an event loop).
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Capacity and refill per minute
+            clock: Monotonic clock in seconds
+        """
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    def reserve(self, amount: float, rate_scale: float = 1.0) -> float:
+        """
+        Reserve capacity.
+
+        Args:
+            amount: Units to reserve (capped at the bucket capacity)
+            rate_scale: Factor applied to the refill rate (adaptive throttling)
+
+        Returns:
+            Seconds to wait until the reservation is covered
+        """
+        rate = self._rate * rate_scale
+        self._refill(rate)
+        self._level -= min(amount, self.capacity)
+        if self._level >= 0:
+            return 0.0
+        return -self._level / rate
+
+    def adjust(self, amount: float) -> None:
+        """
+        Return (positive) or charge (negative) capacity after the fact.
+
+        Args:
+            amount: Units to add to the bucket
+        """
+        self._level = min(self.capacity, self._level + amount)
+
+    def _refill(self, rate: float) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * rate)
+        self._updated = now
+
+
+class RateGovernor:
+    """
+    Admission control for one deployment.
+
+    The in-flight semaphore is created lazily per event loop (the CLI may
+    run several asyncio.run() calls in one process).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: RateLimitConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize governor.
+
+        Args:
+            name: Deployment identifier (for logging)
+            config: Admission limits
+            clock: Monotonic clock in seconds
+        """
+        self.name = name
+        self.config = config
+        self._clock = clock
+        self._requests = (
+            TokenBucket(config.requests_per_minute, clock) if config.requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(config.tokens_per_minute, clock) if config.tokens_per_minute else None
+        )
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._paused_until = 0.0
+        self._rate_scale = 1.0
+        self._in_flight = 0
+        self._stats = {"admitted": 0, "throttled": 0, "rate_limited": 0, "wait_ms": 0}
+        self.logger = structlog.get_logger().bind(component="rate_governor")
+
+    @property
+    def counts_tokens(self) -> bool:
+        """Whether admission needs a prompt token estimate."""
+        return self._tokens is not None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """
+        Get governor statistics.
+
+        Returns:
+            Dictionary with admitted, throttled and rate-limited counts, total
+            queue wait, current in-flight requests and adaptive rate scale
+        """
+        return {**self._stats, "in_flight": self._in_flight, "rate_scale": self._rate_scale}
+
+    async def acquire(self, estimated_tokens: int = 0) -> Admission:
+        """
+        Wait until a request may be sent.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens of the request
+
+        Returns:
+            Admission with the queue wait; call release() when the request is done
+        """
+        started = self._clock()
+        semaphore = self._ensure_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        self._in_flight += 1
+
+        try:
+            # A Retry-After pause may be extended while waiting
+            while (pause := self._paused_until - self._clock()) > 0:
+                await asyncio.sleep(pause)
+
+            wait = 0.0
+            if self._requests is not None:
+                wait = self._requests.reserve(1, self._rate_scale)
+            if self._tokens is not None and estimated_tokens > 0:
+                wait = max(wait, self._tokens.reserve(estimated_tokens, self._rate_scale))
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+
+        wait_ms = int((self._clock() - started) * 1000)
+        self._stats["admitted"] += 1
+        self._stats["wait_ms"] += wait_ms
+        if wait_ms > 0:
+            self._stats["throttled"] += 1
+            self.logger.debug(
+                "llm_request_throttled",
+                deployment=self.name,
+                wait_ms=wait_ms,
+                in_flight=self._in_flight,
+                rate_scale=self._rate_scale,
+            )
+        return Admission(wait_ms=wait_ms, estimated_tokens=estimated_tokens)
+
+    def release(self) -> None:
+        """Release the in-flight slot taken by acquire()."""
+        self._in_flight = max(0, self._in_flight - 1)
+        if self._semaphore is not None and self._is_current_loop():
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[Admission]:
+        """
+        Hold an admission for the duration of a request.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens of the request
+
+        Yields:
+            Admission with the queue wait
+        """
+        admission = await self.acquire(estimated_tokens)
+        try:
+            yield admission
+        finally:
+            self.release()
+
+    def record_success(self, admission: Admission, total_tokens: int | None = None) -> None:
+        """
+        Feed back a successful request.
+
+        Reconciles the token reservation with the actual usage and raises
+        the adaptive rate scale.
+
+        Args:
+            admission: Admission of the request
+            total_tokens: Actual total tokens reported by the provider
+        """
+        if self._tokens is not None and total_tokens:
+            self._tokens.adjust(admission.estimated_tokens - total_tokens)
+        self._rate_scale = min(1.0, self._rate_scale + RATE_SCALE_RECOVERY)
+
+    def record_rate_limited(self, retry_after: float | None = None) -> None:
+        """
+        Feed back a rate-limited request.
+
+        Halves the adaptive rate scale and pauses admission for Retry-After.
+
+        Args:
+            retry_after: Seconds requested by the provider, if any
+        """
+        self._stats["rate_limited"] += 1
+        self._rate_scale = max(MIN_RATE_SCALE, self._rate_scale / 2)
+        if retry_after:
+            self._paused_until = max(self._paused_until, self._clock() + retry_after)
+        self.logger.warning(
+            "llm_deployment_rate_limited",
+            deployment=self.name,
+            retry_after=retry_after,
+            rate_scale=self._rate_scale,
+        )
+
+    def _ensure_semaphore(self) -> asyncio.Semaphore | None:
+        """Get the in-flight semaphore of the running loop."""
+        if not self.config.max_in_flight:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            # Slots held in a previous loop are gone with that loop
+            self._loop = loop
+            self._in_flight = 0
+            self._semaphore = asyncio.Semaphore(self.config.max_in_flight)
+        return self._semaphore
+
+    def _is_current_loop(self) -> bool:
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an error is a provider rate limit (HTTP 429).
+
+    Args:
+        error: Exception raised by LiteLLM
+
+    Returns:
+        True for rate limit errors
+    """
+    if getattr(error, "status_code", None) == 429:
+        return True
+    text = f"{type(error).__name__} {error}"
+    return "RateLimit" in text or "429" in text or "Too Many Requests" in text
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """
+    Extract the Retry-After delay from a provider error.
+
+    Reads retry-after-ms and retry-after (seconds or HTTP date) from the
+    response headers attached to OpenAI/LiteLLM exceptions.
+
+    Args:
+        error: Exception raised by LiteLLM
+
+    Returns:
+        Delay in seconds, or None if the provider sent none
+    """
+    headers = getattr(error, "headers", None)
+    if not headers:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        lowered = {str(key).lower(): value for key, value in dict(headers).items()}
+    except (TypeError, ValueError):
+        return None
+
+    value = lowered.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = lowered.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    multiplier: float,
+    max_backoff: float,
+    retry_after: float | None = None,
+    jitter: bool = True,
+) -> float:
+    """
+    Compute the delay before a retry.
+
+    Exponential backoff with equal jitter (half fixed, half random) so
+    concurrent callers that failed together do not retry together. A
+    Retry-After from the provider is a lower bound, with up to 10% jitter.
+
+    Args:
+        attempt: Zero-based attempt that failed
+        multiplier: Backoff base (delay ceiling = multiplier ** attempt)
+        max_backoff: Maximum delay in seconds
+        retry_after: Delay requested by the provider, if any
+        jitter: Randomize the delay
+
+    Returns:
+        Delay in seconds
+    """
+    ceiling = min(max_backoff, multiplier**attempt)
+    delay = ceiling / 2 + random.uniform(0, ceiling / 2) if jitter else ceiling
+    if retry_after is not None:
+        floor = retry_after * (1 + random.uniform(0, 0.1)) if jitter else retry_after
+        delay = max(delay, floor)
+    return delay
+
+
+_governors: dict[str, RateGovernor] = {}
+
+
+def get_rate_governor(name: str, config: RateLimitConfig) -> RateGovernor:
+    """
+    Get the process-wide governor for a deployment.
+
+    All OpenAIService instances calling the same deployment share one
+    governor, so limits hold across concurrent agents.
+
+    Args:
+        name: Deployment identifier (resolved model name)
+        config: Limits (used when the governor is created)
+
+    Returns:
+        Shared RateGovernor for the deployment
+    """
+    governor = _governors.get(name)
+    if governor is None:
+        governor = RateGovernor(name, config)
+        _governors[name] = governor
+    return governor
+
+
+def reset_rate_governors() -> None:
+    """Drop all governors (tests, config reload)."""
+    _governors.clear()
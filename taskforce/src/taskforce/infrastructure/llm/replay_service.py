@@ -0,0 +1,464 @@
+"""
+Replay LLM Provider for offline benchmarking.
+
+Plays back recorded LLM responses through LLMProviderProtocol so the agent
+loop (LeanAgent, Agent, AgentExecutor) can be load-tested and profiled
+without network access. Fixtures are built from the JSONL traces written by
+OpenAIService (tracing.mode: file) or constructed directly in code.
+
+Key features:
+- Request matching by conversation fingerprint (system messages excluded, as
+  they carry dynamic context), falling back to recording order
+- Deterministic by default (no delay); optional latency models:
+  "recorded" replays the traced latency, "synthetic" models time to first
+  token plus a token rate
+- Streaming with token, tool_call_start/delta/end and done events
+
+Configuration (profile YAML):
+    llm:
+      provider: replay
+      replay:
+        trace_path: traces/llm_traces.jsonl
+        loop: true                      # Restart when fixtures are exhausted
+        latency:
+          mode: synthetic               # none | recorded | synthetic
+          time_to_first_token_ms: 300
+          tokens_per_second: 50
+          speedup: 1.0
+          jitter: 0.1
+          seed: 42
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+import yaml
+
+from taskforce.core.domain.token_budgeter import HeuristicTokenEstimator
+from taskforce.core.interfaces.llm import LLMProviderProtocol
+from taskforce.infrastructure.llm.trace_format import iter_traces
+
+LATENCY_MODES = ("none", "recorded", "synthetic")
+TOOL_ARGUMENT_CHUNK_CHARS = 16
+
+
+def conversation_fingerprint(messages: list[dict[str, Any]]) -> str:
+    """
+    Compute a stable fingerprint of a request's conversation.
+
+    System messages are excluded because they contain dynamic context (plan
+    status, context pack, timestamps) that differs between runs.
+
+    Args:
+        messages: Request messages
+
+    Returns:
+        SHA256 hex digest
+    """
+    relevant = [
+        {
+            "role": message.get("role"),
+            "content": message.get("content"),
+            "tool_call_id": message.get("tool_call_id"),
+            "tool_calls": [
+                (tc.get("function", {}).get("name"), tc.get("function", {}).get("arguments"))
+                for tc in message.get("tool_calls") or []
+            ],
+        }
+        for message in messages
+        if message.get("role") != "system"
+    ]
+    return hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass
+class ReplayRecord:
+    """One recorded LLM response."""
+
+    content: str | None = None
+    tool_calls: list[dict[str, Any]] | None = None
+    usage: dict[str, Any] = field(default_factory=dict)
+    latency_ms: int = 0
+    model: str = "replay"
+    fingerprint: str | None = None
+
+    @classmethod
+    def from_trace(cls, trace: dict[str, Any]) -> "ReplayRecord":
+        """
+        Build a record from one OpenAIService JSONL trace entry.
+
+        Args:
+            trace: Parsed trace line
+
+        Returns:
+            ReplayRecord keyed by the traced request messages
+        """
+        messages = trace.get("messages")
+        return cls(
+            content=trace.get("response"),
+            tool_calls=trace.get("tool_calls") or None,
+            usage=trace.get("usage") or {},
+            latency_ms=int(trace.get("latency_ms") or 0),
+            model=trace.get("model") or "replay",
+            fingerprint=conversation_fingerprint(messages) if messages else None,
+        )
+
+
+@dataclass
+class LatencyModel:
+    """
+    Synthetic latency applied to replayed responses.
+
+    Attributes:
+        mode: "none" (no delay), "recorded" (traced latency) or "synthetic"
+            (time to first token + completion tokens / tokens_per_second)
+        time_to_first_token_ms: Synthetic TTFT; caps TTFT in recorded mode
+        tokens_per_second: Synthetic generation rate
+        speedup: Divides all delays (e.g. 10 = ten times faster than recorded)
+        jitter: Relative random variation (0.1 = +/-10%)
+        seed: Random seed for reproducible jitter
+    """
+
+    mode: str = "none"
+    time_to_first_token_ms: float = 300.0
+    tokens_per_second: float = 50.0
+    speedup: float = 1.0
+    jitter: float = 0.0
+    seed: int | None = None
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.mode not in LATENCY_MODES:
+            raise ValueError(
+                f"Unknown latency mode: {self.mode} (expected one of {LATENCY_MODES})"
+            )
+        if self.tokens_per_second <= 0 or self.speedup <= 0:
+            raise ValueError("tokens_per_second and speedup must be positive")
+        self._random = random.Random(self.seed)
+
+    def timings(self, record: ReplayRecord, completion_tokens: int) -> tuple[float, float]:
+        """
+        Compute delays for a replayed response.
+
+        Args:
+            record: Replayed record
+            completion_tokens: Completion tokens of the response
+
+        Returns:
+            Tuple of (time to first token, total generation time after it) in seconds
+        """
+        if self.mode == "none":
+            return 0.0, 0.0
+
+        if self.mode == "recorded":
+            total = record.latency_ms / 1000
+            ttft = min(total, self.time_to_first_token_ms / 1000)
+            generation = total - ttft
+        else:
+            ttft = self.time_to_first_token_ms / 1000
+            generation = completion_tokens / self.tokens_per_second
+
+        factor = 1.0
+        if self.jitter:
+            factor += self._random.uniform(-self.jitter, self.jitter)
+        scale = max(factor, 0.0) / self.speedup
+        return ttft * scale, generation * scale
+
+
+class ReplayLLMProvider(LLMProviderProtocol):
+    """
+    LLMProviderProtocol implementation that plays back recorded responses.
+
+    Requests are answered with the first unused record whose fingerprint
+    matches the request conversation, otherwise with the next unused record
+    in recording order. When all records are used, replay restarts if
+    ``loop`` is set, else an error result is returned.
+    """
+
+    def __init__(
+        self,
+        records: list[ReplayRecord],
+        latency: LatencyModel | None = None,
+        loop: bool = False,
+    ):
+        """
+        Initialize replay provider.
+
+        Args:
+            records: Recorded responses in recording order
+            latency: Latency model (default: no delay)
+            loop: Restart from the first record when all records are used
+        """
+        self.records = list(records)
+        self.latency = latency or LatencyModel()
+        self.loop = loop
+        self._used: set[int] = set()
+        self._cursor = 0
+        self._estimator = HeuristicTokenEstimator()
+        self._stats = {
+            "calls": 0,
+            "fingerprint_matches": 0,
+            "sequential_matches": 0,
+            "exhausted": 0,
+            "simulated_latency_ms": 0,
+        }
+        self.logger = structlog.get_logger().bind(component="replay_llm")
+
+    @classmethod
+    def from_trace_file(
+        cls,
+        path: str | Path,
+        include_failures: bool = False,
+        **kwargs: Any,
+    ) -> "ReplayLLMProvider":
+        """
+        Build a replay provider from an OpenAIService JSONL trace file.
+
+        Full and delta-encoded traces are supported; rotated backups of the
+        file are read first.
+
+        Args:
+            path: Trace file path (tracing.file_config.path)
+            include_failures: Also replay failed calls (as empty responses)
+            **kwargs: Passed to the constructor (latency, loop)
+
+        Returns:
+            ReplayLLMProvider with one record per traced call
+        """
+        records = [
+            ReplayRecord.from_trace(trace)
+            for trace in iter_traces(path)
+            if trace.get("success", True) or include_failures
+        ]
+        return cls(records, **kwargs)
+
+    @classmethod
+    def from_config(cls, replay_config: dict[str, Any]) -> "ReplayLLMProvider":
+        """
+        Build a replay provider from the ``llm.replay`` profile section.
+
+        Args:
+            replay_config: Dict with trace_path, loop and latency settings
+
+        Returns:
+            Configured ReplayLLMProvider
+        """
+        trace_path = replay_config.get("trace_path")
+        if not trace_path:
+            raise ValueError("llm.replay.trace_path is required for the replay provider")
+        return cls.from_trace_file(
+            trace_path,
+            include_failures=replay_config.get("include_failures", False),
+            latency=LatencyModel(**replay_config.get("latency", {})),
+            loop=replay_config.get("loop", False),
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get replay statistics.
+
+        Returns:
+            Dictionary with calls, match counts, exhausted count and the
+            total simulated latency
+        """
+        return dict(self._stats)
+
+    def _next_record(self, messages: list[dict[str, Any]]) -> ReplayRecord | None:
+        """Pick the record answering a request (fingerprint match, then order)."""
+        self._stats["calls"] += 1
+        if len(self._used) == len(self.records) and self.loop:
+            self._used.clear()
+            self._cursor = 0
+
+        fingerprint = conversation_fingerprint(messages)
+        for index, record in enumerate(self.records):
+            if index not in self._used and record.fingerprint == fingerprint:
+                self._used.add(index)
+                self._stats["fingerprint_matches"] += 1
+                return record
+
+        while self._cursor < len(self.records):
+            index = self._cursor
+            self._cursor += 1
+            if index not in self._used:
+                self._used.add(index)
+                self._stats["sequential_matches"] += 1
+                return self.records[index]
+
+        self._stats["exhausted"] += 1
+        self.logger.warning("replay_exhausted", records=len(self.records))
+        return None
+
+    def _usage(self, record: ReplayRecord, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        """Recorded usage, or a heuristic estimate when the trace has none."""
+        if record.usage:
+            return dict(record.usage)
+        completion = self._estimator.count_tokens(record.content or "") + sum(
+            self._estimator.count_tokens(tc["function"]["arguments"])
+            for tc in record.tool_calls or []
+        )
+        prompt = self._estimator.count_tokens(json.dumps(messages, default=str))
+        return {
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "total_tokens": prompt + completion,
+        }
+
+    def _exhausted_error(self) -> dict[str, Any]:
+        return {
+            "success": False,
+            "error": f"Replay fixtures exhausted after {len(self.records)} records",
+            "error_type": "ReplayExhaustedError",
+        }
+
+    async def complete(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Replay the recorded response for a chat completion.
+
+        Args:
+            messages: Request messages (used for fingerprint matching)
+            model: Ignored (the recorded model is reported)
+            tools: Ignored
+            tool_choice: Ignored
+            **kwargs: Ignored
+
+        Returns:
+            Same shape as OpenAIService.complete()
+        """
+        start_time = time.perf_counter()
+        record = self._next_record(messages)
+        if record is None:
+            return self._exhausted_error()
+
+        usage = self._usage(record, messages)
+        ttft, generation = self.latency.timings(record, usage.get("completion_tokens", 0))
+        if ttft + generation > 0:
+            await asyncio.sleep(ttft + generation)
+
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        self._stats["simulated_latency_ms"] += latency_ms
+        return {
+            "success": True,
+            "content": record.content,
+            "tool_calls": [dict(tc) for tc in record.tool_calls] if record.tool_calls else None,
+            "usage": usage,
+            "model": record.model,
+            "latency_ms": latency_ms,
+            "queue_wait_ms": 0,
+        }
+
+    async def generate(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Replay the recorded response for a single prompt.
+
+        Args:
+            prompt: The prompt text
+            context: Optional structured context (formatted like OpenAIService)
+            model: Ignored
+            **kwargs: Ignored
+
+        Returns:
+            Same as complete() plus "generated_text"
+        """
+        if context:
+            context_str = yaml.dump(context, default_flow_style=False)
+            prompt = f"""Context:
+{context_str}
+
+Task: {prompt}
+"""
+        result = await self.complete([{"role": "user", "content": prompt}], model=model)
+        if result.get("success"):
+            result["generated_text"] = result["content"]
+        return result
+
+    async def complete_stream(
+        self,
+        messages: list[dict[str, Any]],
+        model: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: str | dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Replay the recorded response as a stream of events.
+
+        Content is split into word chunks; tool call arguments are streamed
+        in small deltas. The latency model's time to first token is applied
+        before the first event and the generation time is spread evenly
+        across the chunks.
+
+        Yields:
+            Same events as OpenAIService.complete_stream()
+        """
+        start_time = time.perf_counter()
+        record = self._next_record(messages)
+        if record is None:
+            yield {"type": "error", "message": self._exhausted_error()["error"]}
+            return
+
+        usage = self._usage(record, messages)
+        ttft, generation = self.latency.timings(record, usage.get("completion_tokens", 0))
+
+        events: list[dict[str, Any]] = [
+            {"type": "token", "content": chunk}
+            for chunk in re.findall(r"\s*\S+\s*", record.content or "")
+        ]
+        for idx, tc in enumerate(record.tool_calls or []):
+            name = tc["function"]["name"]
+            arguments = tc["function"]["arguments"]
+            events.append({"type": "tool_call_start", "id": tc["id"], "name": name, "index": idx})
+            for offset in range(0, len(arguments), TOOL_ARGUMENT_CHUNK_CHARS):
+                events.append(
+                    {
+                        "type": "tool_call_delta",
+                        "id": tc["id"],
+                        "arguments_delta": arguments[offset : offset + TOOL_ARGUMENT_CHUNK_CHARS],
+                        "index": idx,
+                    }
+                )
+            events.append(
+                {
+                    "type": "tool_call_end",
+                    "id": tc["id"],
+                    "name": name,
+                    "arguments": arguments,
+                    "index": idx,
+                }
+            )
+
+        if ttft > 0:
+            await asyncio.sleep(ttft)
+        interval = generation / len(events) if events else 0.0
+        for event in events:
+            yield event
+            if interval > 0:
+                await asyncio.sleep(interval)
+
+        self._stats["simulated_latency_ms"] += int((time.perf_counter() - start_time) * 1000)
+        yield {"type": "done", "usage": usage, "queue_wait_ms": 0}
@@ -0,0 +1,316 @@
+"""
+Response cache for deterministic LLM completions.
+
+OpenAIService.complete() looks up eligible calls here before sending them.
+A call is eligible when the cache is enabled and the call is deterministic
+(temperature == 0) or explicitly flagged with cache=True; cache=False
+bypasses the cache for a single call. Only successful responses are stored.
+
+Keys are a SHA-256 hash of the canonical JSON of the resolved model, the
+normalized messages, tools, tool_choice and the mapped model parameters.
+
+Tiers:
+- Memory: LRU of serialized responses (a hit never shares objects with
+  earlier callers)
+- Disk (optional): SQLite table shared by processes using the same file,
+  accessed from worker threads
+
+Configuration (llm_config.yaml):
+    response_cache:
+      enabled: false
+      max_entries: 1024             # Memory LRU size
+      ttl_seconds: 86400            # 0 = no expiry
+      disk_path: null               # e.g. .taskforce/llm_cache.sqlite3
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+# Message fields that affect the completion (everything else is bookkeeping)
+_MESSAGE_FIELDS = ("role", "content", "name", "tool_calls", "tool_call_id")
+
+
+@dataclass
+class ResponseCacheConfig:
+    """
+    Configuration for the LLM response cache.
+
+    Attributes:
+        enabled: Whether eligible calls are cached
+        max_entries: Maximum entries in the memory LRU
+        ttl_seconds: Entry lifetime in seconds (0 = no expiry)
+        disk_path: SQLite file for the persistent tier (None = memory only)
+    """
+
+    enabled: bool = False
+    max_entries: int = 1024
+    ttl_seconds: int = 86400
+    disk_path: str | None = None
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any] | None) -> "ResponseCacheConfig":
+        """
+        Create config from the response_cache section of llm_config.yaml.
+
+        Args:
+            config: Cache configuration dictionary
+
+        Returns:
+            ResponseCacheConfig with defaults for missing keys
+        """
+        config = config or {}
+        defaults = cls()
+        return cls(
+            enabled=bool(config.get("enabled", defaults.enabled)),
+            max_entries=max(1, int(config.get("max_entries", defaults.max_entries))),
+            ttl_seconds=max(0, int(config.get("ttl_seconds", defaults.ttl_seconds))),
+            disk_path=config.get("disk_path") or None,
+        )
+
+
+def compute_cache_key(
+    model: str,
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None = None,
+    tool_choice: str | dict[str, Any] | None = None,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """
+    Compute the cache key of a completion request.
+
+    Messages are reduced to the fields sent to the model, so extra
+    bookkeeping keys and key order do not change the key.
+
+    Args:
+        model: Resolved model or deployment name
+        messages: Request messages
+        tools: Tool schemas
+        tool_choice: Tool choice strategy
+        params: Mapped model parameters
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    normalized = [
+        {name: msg[name] for name in _MESSAGE_FIELDS if msg.get(name) is not None}
+        for msg in messages
+    ]
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": normalized,
+            "tools": tools or None,
+            "tool_choice": tool_choice,
+            "params": params or {},
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier (memory LRU, optional SQLite) cache of completion results.
+    """
+
+    def __init__(self, config: ResponseCacheConfig):
+        """
+        Initialize cache.
+
+        Args:
+            config: Cache configuration
+        """
+        self.config = config
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bypassed": 0,
+        }
+        self.logger = structlog.get_logger().bind(component="llm_response_cache")
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counts per tier, stores, evictions,
+            bypassed calls and memory size
+        """
+        return {**self._stats, "size": len(self._memory)}
+
+    def record_bypass(self) -> None:
+        """Count a call that was not eligible for caching."""
+        self._stats["bypassed"] += 1
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key from compute_cache_key()
+
+        Returns:
+            Fresh copy of the cached result, or None on a miss
+        """
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            payload, expires_at = entry
+            if not expires_at or expires_at > now:
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                result: dict[str, Any] = json.loads(payload)
+                return result
+            del self._memory[key]
+
+        if self.config.disk_path:
+            row = await asyncio.to_thread(self._disk_get, key, now)
+            if row is not None:
+                payload, expires_at = row
+                self._remember(key, payload, expires_at)
+                self._stats["hits"] += 1
+                self._stats["disk_hits"] += 1
+                result = json.loads(payload)
+                return result
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, key: str, result: dict[str, Any], model: str | None = None) -> None:
+        """
+        Store a successful result.
+
+        Args:
+            key: Key from compute_cache_key()
+            result: Completion result (JSON-serializable)
+            model: Resolved model name (stored alongside on disk)
+        """
+        payload = json.dumps(result, default=str)
+        expires_at = time.time() + self.config.ttl_seconds if self.config.ttl_seconds else 0.0
+        self._remember(key, payload, expires_at)
+        self._stats["stores"] += 1
+
+        if self.config.disk_path:
+            try:
+                await asyncio.to_thread(self._disk_put, key, payload, model, expires_at)
+            except sqlite3.Error as e:
+                self.logger.warning("llm_response_cache_write_failed", error=str(e))
+
+    def clear(self) -> None:
+        """Clear the memory tier and reset statistics (the disk tier is kept)."""
+        self._memory.clear()
+        self._stats = dict.fromkeys(self._stats, 0)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, payload: str, expires_at: float) -> None:
+        """Insert into the memory LRU, evicting the least recently used entry."""
+        self._memory[key] = (payload, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite tier and drop expired rows (worker thread, lock held)."""
+        if self._db is None:
+            if not self.config.disk_path:
+                raise RuntimeError("Response cache has no disk tier (disk_path not set)")
+            path = Path(self.config.disk_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, model TEXT, "
+                "created_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+            db.execute(
+                "DELETE FROM llm_responses WHERE expires_at > 0 AND expires_at <= ?",
+                (time.time(),),
+            )
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _disk_get(self, key: str, now: float) -> tuple[str, float] | None:
+        with self._db_lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT response, expires_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None or (row[1] and row[1] <= now):
+            return None
+        return row[0], row[1]
+
+    def _disk_put(self, key: str, payload: str, model: str | None, expires_at: float) -> None:
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, response, model, created_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, model, time.time(), expires_at),
+            )
+            db.commit()
+
+
+_caches: dict[str, LLMResponseCache] = {}
+
+
+def get_response_cache(config: ResponseCacheConfig) -> LLMResponseCache:
+    """
+    Get the process-wide response cache for a configuration.
+
+    Services with the same disk path (or all memory-only services) share
+    one cache, so concurrent agents reuse each other's results.
+
+    Args:
+        config: Cache configuration (used when the cache is created)
+
+    Returns:
+        Shared LLMResponseCache
+    """
+    key = str(Path(config.disk_path).resolve()) if config.disk_path else ":memory:"
+    cache = _caches.get(key)
+    if cache is None:
+        cache = LLMResponseCache(config)
+        _caches[key] = cache
+    return cache
+
+
+def reset_response_caches() -> None:
+    """Close and drop all response caches (tests, config reload)."""
+    caches = list(_caches.values())
+    _caches.clear()
+    for cache in caches:
+        cache.close()
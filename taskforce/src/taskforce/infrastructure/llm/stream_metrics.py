@@ -0,0 +1,215 @@
+"""
+Streaming performance metrics for LLM completions.
+
+OpenAIService.complete_stream() times every stream with a StreamTimer:
+- ttft_ms: Request sent -> first output (content token or tool call)
+- first_tool_call_ms: Request sent -> first tool_call_start
+- inter_token_*_ms: Gaps between consecutive output chunks (mean, p95, max)
+- tokens_per_second: Completion tokens over the generation window (first
+  output -> end); output chunks are counted when usage is not streamed
+- stream_ms: Request sent -> stream finished
+
+The numbers are added to the done event usage ("stream_metrics"), the
+llm_stream_completed log and the trace record, and aggregated per
+profile, model alias and deployment for comparing deployments and model
+parameters (GET /health/llm).
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# Streams kept per aggregate for the percentiles
+_WINDOW = 256
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    """Return the nearest-rank percentile of values (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percentile / 100 * len(ordered)) - 1)]
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+class StreamTimer:
+    """
+    Measures the timing of one streaming call.
+
+    Start it right before the request is sent (after admission), so the
+    numbers exclude client-side queueing.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize timer and start the clock.
+
+        Args:
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        self._clock = clock
+        self._start = clock()
+        self._first_output: float | None = None
+        self._first_tool_call: float | None = None
+        self._last_output: float | None = None
+        self._gaps: list[float] = []
+        self.output_chunks = 0
+
+    def mark_output(self) -> None:
+        """Record a chunk carrying output (content or tool call arguments)."""
+        now = self._clock()
+        if self._last_output is None:
+            self._first_output = now
+        else:
+            self._gaps.append(now - self._last_output)
+        self._last_output = now
+        self.output_chunks += 1
+
+    def mark_tool_call_start(self) -> None:
+        """Record the start of a tool call (only the first one is kept)."""
+        if self._first_tool_call is None:
+            self._first_tool_call = self._clock()
+
+    def finish(self, completion_tokens: int | None = None) -> dict[str, Any]:
+        """
+        Stop the clock and compute the metrics.
+
+        Args:
+            completion_tokens: Completion tokens from the usage, if streamed
+
+        Returns:
+            Dictionary with ttft_ms, first_tool_call_ms, inter_token_mean_ms,
+            inter_token_p95_ms, inter_token_max_ms, tokens_per_second,
+            output_chunks and stream_ms (None where not measurable)
+        """
+        end = self._clock()
+        gaps_ms = [gap * 1000 for gap in self._gaps]
+
+        tokens = completion_tokens or self.output_chunks
+        tokens_per_second = None
+        if self._first_output is not None and end > self._first_output and tokens:
+            tokens_per_second = round(tokens / (end - self._first_output), 1)
+
+        return {
+            "ttft_ms": self._elapsed_ms(self._first_output),
+            "first_tool_call_ms": self._elapsed_ms(self._first_tool_call),
+            "inter_token_mean_ms": _round(sum(gaps_ms) / len(gaps_ms)) if gaps_ms else None,
+            "inter_token_p95_ms": _round(_percentile(gaps_ms, 95)),
+            "inter_token_max_ms": _round(max(gaps_ms)) if gaps_ms else None,
+            "tokens_per_second": tokens_per_second,
+            "output_chunks": self.output_chunks,
+            "stream_ms": self._elapsed_ms(end),
+        }
+
+    def _elapsed_ms(self, mark: float | None) -> float | None:
+        return _round((mark - self._start) * 1000) if mark is not None else None
+
+
+class StreamStats:
+    """
+    Rolling aggregate of stream metrics for one profile, alias and deployment.
+    """
+
+    def __init__(self, profile: str | None, model_alias: str, model: str):
+        """
+        Initialize aggregate.
+
+        Args:
+            profile: Configuration profile (None if unknown)
+            model_alias: Model alias
+            model: Resolved model or deployment name
+        """
+        self.profile = profile
+        self.model_alias = model_alias
+        self.model = model
+        self.streams = 0
+        self._samples: dict[str, deque[float]] = {
+            name: deque(maxlen=_WINDOW)
+            for name in ("ttft_ms", "first_tool_call_ms", "inter_token_mean_ms", "tokens_per_second")
+        }
+
+    def record(self, metrics: dict[str, Any]) -> None:
+        """
+        Add the metrics of a finished stream.
+
+        Args:
+            metrics: Result of StreamTimer.finish()
+        """
+        self.streams += 1
+        for name, samples in self._samples.items():
+            value = metrics.get(name)
+            if value is not None:
+                samples.append(value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the aggregate.
+
+        Returns:
+            Dictionary with stream count and p50/p95 of time to first
+            token, p50 of time to first tool call, mean inter-token gap and
+            p50 tokens per second over the recent streams
+        """
+        ttft = list(self._samples["ttft_ms"])
+        gaps = list(self._samples["inter_token_mean_ms"])
+        return {
+            "profile": self.profile,
+            "model_alias": self.model_alias,
+            "model": self.model,
+            "streams": self.streams,
+            "ttft_p50_ms": _round(_percentile(ttft, 50)),
+            "ttft_p95_ms": _round(_percentile(ttft, 95)),
+            "first_tool_call_p50_ms": _round(
+                _percentile(list(self._samples["first_tool_call_ms"]), 50)
+            ),
+            "inter_token_mean_ms": _round(sum(gaps) / len(gaps)) if gaps else None,
+            "tokens_per_second_p50": _round(
+                _percentile(list(self._samples["tokens_per_second"]), 50)
+            ),
+        }
+
+
+_stats: dict[tuple[str | None, str, str], StreamStats] = {}
+
+
+def record_stream_metrics(
+    profile: str | None,
+    model_alias: str,
+    model: str,
+    metrics: dict[str, Any],
+) -> None:
+    """
+    Add stream metrics to the process-wide aggregate of their key.
+
+    Args:
+        profile: Configuration profile (None if unknown)
+        model_alias: Model alias
+        model: Resolved model or deployment name
+        metrics: Result of StreamTimer.finish()
+    """
+    key = (profile, model_alias, model)
+    stats = _stats.get(key)
+    if stats is None:
+        stats = StreamStats(profile, model_alias, model)
+        _stats[key] = stats
+    stats.record(metrics)
+
+
+def get_stream_stats() -> list[dict[str, Any]]:
+    """
+    Return all stream aggregates.
+
+    Returns:
+        List of StreamStats snapshots
+    """
+    return [stats.snapshot() for stats in _stats.values()]
+
+
+def reset_stream_stats() -> None:
+    """Drop all stream aggregates (tests)."""
+    _stats.clear()
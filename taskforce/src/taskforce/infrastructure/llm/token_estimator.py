@@ -0,0 +1,348 @@
+"""
+Tokenizer-backed Token Estimation
+
+Provides a TokenEstimatorProtocol implementation backed by a real BPE
+tokenizer (tiktoken) for the model family behind a model alias. Encodings
+are loaded strictly from local files - tokenizer downloads are never
+attempted. When no encoding is available locally, the chars/4 heuristic
+is used as fallback.
+
+Configuration (llm_config.yaml):
+    tokenizer:
+      enabled: true
+      cache_dir: null          # Extra directory with *.tiktoken files
+      cache_size: 4096         # LRU entries (keyed by content hash)
+      default_encoding: o200k_base
+      encodings:               # Optional overrides (alias or model -> encoding)
+        legacy: cl100k_base
+"""
+
+import base64
+import hashlib
+import importlib.util
+import os
+import tempfile
+import threading
+import types
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+import yaml
+
+from taskforce.core.domain.token_budgeter import HeuristicTokenEstimator
+from taskforce.core.interfaces.token_estimator import TokenEstimatorProtocol
+from taskforce.infrastructure.llm.load_balancer import parse_pool
+
+logger = structlog.get_logger().bind(component="token_estimator")
+
+DEFAULT_ENCODING = "o200k_base"
+DEFAULT_CACHE_SIZE = 4096
+
+# Loaded encodings by name (None = not available locally)
+_ENCODINGS: dict[str, Any] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+
+def _bundled_tokenizer_dir() -> Path | None:
+    """Locate the tokenizer files bundled with LiteLLM without importing it."""
+    spec = importlib.util.find_spec("litellm")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    package_dir = Path(next(iter(spec.submodule_search_locations)))
+    bundled = package_dir / "litellm_core_utils" / "tokenizers"
+    return bundled if bundled.is_dir() else None
+
+
+def _tiktoken_cache_dir() -> Path:
+    """Directory tiktoken caches downloaded files in (same lookup as tiktoken)."""
+    cache_dir = os.environ.get("TIKTOKEN_CACHE_DIR") or os.environ.get("DATA_GYM_CACHE_DIR")
+    return Path(cache_dir or Path(tempfile.gettempdir()) / "data-gym-cache")
+
+
+def _find_bpe_file(url: str, cache_dir: str | None) -> Path | None:
+    """
+    Find the BPE file of a tiktoken download URL in the local search directories.
+
+    Directories may contain files named like the download (e.g.
+    ``o200k_base.tiktoken``) or tiktoken cache entries (named by the SHA-1 of
+    the URL).
+    """
+    file_names = (url.rsplit("/", 1)[-1], hashlib.sha1(url.encode()).hexdigest())
+    for directory in (cache_dir, _tiktoken_cache_dir(), _bundled_tokenizer_dir()):
+        if not directory:
+            continue
+        for file_name in file_names:
+            candidate = Path(directory) / file_name
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def _read_bpe_ranks(path: Path, expected_hash: str | None) -> dict[bytes, int]:
+    """
+    Parse a .tiktoken BPE file (base64 token and rank per line).
+
+    Read directly instead of via tiktoken.load.load_tiktoken_bpe(), which
+    copies local files into the tiktoken cache directory.
+    """
+    contents = path.read_bytes()
+    if expected_hash and hashlib.sha256(contents).hexdigest() != expected_hash:
+        raise ValueError(f"Hash mismatch for tokenizer file {path}")
+    ranks: dict[bytes, int] = {}
+    for line in contents.splitlines():
+        if line:
+            token, rank = line.split()
+            ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+def _local_encoding_constructor(
+    encoding_name: str, cache_dir: str | None
+) -> Callable[[], dict[str, Any]] | None:
+    """
+    Get tiktoken's constructor for an encoding, reading BPE files locally.
+
+    Patterns, special tokens and file hashes come from
+    tiktoken_ext.openai_public. The constructor is rebound to local loaders
+    (a copy, the module itself is not patched), so the download path of
+    tiktoken.load is never reached.
+
+    Returns:
+        Constructor returning Encoding kwargs, or None for unknown encodings
+    """
+    try:
+        from tiktoken_ext import openai_public
+    except ImportError:
+        return None
+    constructor = openai_public.ENCODING_CONSTRUCTORS.get(encoding_name)
+    if constructor is None:
+        return None
+
+    def load_bpe(url: str, expected_hash: str | None = None) -> dict[bytes, int]:
+        path = _find_bpe_file(url, cache_dir)
+        if path is None:
+            raise FileNotFoundError("no local tokenizer file")
+        return _read_bpe_ranks(path, expected_hash)
+
+    def load_data_gym(*args: Any, **kwargs: Any) -> dict[bytes, int]:
+        raise FileNotFoundError("no local tokenizer file")
+
+    local_globals = {
+        **constructor.__globals__,
+        "load_tiktoken_bpe": load_bpe,
+        "data_gym_to_mergeable_bpe_ranks": load_data_gym,
+    }
+    # Constructors building on others (o200k_harmony) must call local copies too
+    for function in openai_public.ENCODING_CONSTRUCTORS.values():
+        local_globals[function.__name__] = types.FunctionType(
+            function.__code__, local_globals, function.__name__
+        )
+    local_constructor: Callable[[], dict[str, Any]] = local_globals[constructor.__name__]
+    return local_constructor
+
+
+def load_local_encoding(encoding_name: str, cache_dir: str | None = None) -> Any | None:
+    """
+    Load a tiktoken encoding from local files only.
+
+    Uses the encoding definitions of tiktoken_ext.openai_public but looks up
+    the BPE file in ``cache_dir``, the tiktoken cache (TIKTOKEN_CACHE_DIR) and
+    the tokenizers bundled with LiteLLM. Nothing is downloaded and no tiktoken
+    module state is touched, so concurrent tiktoken users are unaffected.
+
+    Args:
+        encoding_name: tiktoken encoding name (e.g. "o200k_base")
+        cache_dir: Optional directory with local tokenizer files
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken or the encoding file is unavailable
+    """
+    with _ENCODINGS_LOCK:
+        if encoding_name in _ENCODINGS:
+            return _ENCODINGS[encoding_name]
+
+        try:
+            import tiktoken
+        except ImportError:
+            logger.warning("tiktoken_not_installed", encoding=encoding_name)
+            _ENCODINGS[encoding_name] = None
+            return None
+
+        encoding = None
+        constructor = _local_encoding_constructor(encoding_name, cache_dir)
+        if constructor is None:
+            logger.warning(
+                "tokenizer_unavailable",
+                encoding=encoding_name,
+                error="unknown encoding",
+                fallback="heuristic",
+            )
+        else:
+            try:
+                encoding = tiktoken.Encoding(**constructor())
+            except Exception as e:
+                logger.warning(
+                    "tokenizer_unavailable",
+                    encoding=encoding_name,
+                    error=str(e),
+                    fallback="heuristic",
+                )
+
+        _ENCODINGS[encoding_name] = encoding
+        return encoding
+
+
+def encoding_name_for_model(
+    model: str,
+    overrides: dict[str, str] | None = None,
+    default: str = DEFAULT_ENCODING,
+) -> str:
+    """
+    Resolve the tiktoken encoding for a model name.
+
+    Args:
+        model: Model name (provider prefixes like "azure/" are ignored)
+        overrides: Optional explicit model -> encoding mapping
+        default: Encoding used for unknown models
+
+    Returns:
+        Encoding name
+    """
+    overrides = overrides or {}
+    if model in overrides:
+        return overrides[model]
+
+    base_model = model.split("/", 1)[-1]
+    if base_model in overrides:
+        return overrides[base_model]
+
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_name_for_model(base_model)
+    except (ImportError, KeyError):
+        return default
+
+
+class TiktokenEstimator:
+    """
+    Token estimator backed by a local tiktoken encoding.
+
+    Counts are memoized in an LRU cache keyed by a hash of the text, so
+    repeated content (system prompt, tool schemas, re-sent history) is
+    only tokenized once.
+    """
+
+    def __init__(self, encoding: Any, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize estimator.
+
+        Args:
+            encoding: tiktoken Encoding instance
+            cache_size: Maximum number of cached counts
+        """
+        self._encoding = encoding
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._cache_size = cache_size
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def name(self) -> str:
+        """Return estimator identifier."""
+        return f"tiktoken:{self._encoding.name}"
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Count tokens using the BPE tokenizer.
+
+        Special token markers in the text are counted as plain text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Exact token count for the encoding
+        """
+        if not text:
+            return 0
+
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        count = len(self._encoding.encode_ordinary(text))
+        self._cache[key] = count
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return count
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache size, hits and misses
+        """
+        return {
+            "encoding": self._encoding.name,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+def create_token_estimator(
+    config_path: str = "configs/llm_config.yaml",
+    model_alias: str = "main",
+) -> TokenEstimatorProtocol:
+    """
+    Create the token estimator for a model alias from the LLM config.
+
+    Resolves alias -> model via the ``models`` section and model -> encoding
+    via ``tokenizer.encodings`` or tiktoken's model table. Falls back to the
+    heuristic estimator if the tokenizer is disabled or not available locally.
+
+    Args:
+        config_path: Path to llm_config.yaml
+        model_alias: Model alias used by the agent (e.g. "main")
+
+    Returns:
+        TiktokenEstimator, or HeuristicTokenEstimator as fallback
+    """
+    config: dict[str, Any] = {}
+    config_file = Path(config_path)
+    if config_file.exists():
+        with open(config_file, encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+    tokenizer_config = config.get("tokenizer", {}) or {}
+    if not tokenizer_config.get("enabled", True):
+        return HeuristicTokenEstimator()
+
+    overrides = tokenizer_config.get("encodings", {}) or {}
+    default_encoding = tokenizer_config.get("default_encoding", DEFAULT_ENCODING)
+
+    if model_alias in overrides:
+        encoding_name = overrides[model_alias]
+    else:
+        model = parse_pool(config.get("models", {}).get(model_alias, model_alias))[0][0]
+        encoding_name = encoding_name_for_model(model, overrides, default_encoding)
+
+    encoding = load_local_encoding(encoding_name, tokenizer_config.get("cache_dir"))
+    if encoding is None:
+        return HeuristicTokenEstimator()
+
+    logger.debug("token_estimator_created", model_alias=model_alias, encoding=encoding_name)
+    return TiktokenEstimator(
+        encoding, cache_size=tokenizer_config.get("cache_size", DEFAULT_CACHE_SIZE)
+    )
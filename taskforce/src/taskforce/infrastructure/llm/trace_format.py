@@ -0,0 +1,250 @@
+"""
+Delta-encoded LLM trace format.
+
+A full trace record repeats the whole conversation on every call, so a
+mission with n steps writes O(n²) message data. The delta format stores per
+record only what changed since the previous call of the same conversation:
+
+    {
+        "format": "delta",
+        "conversation": "3f9c2a61d0b4",
+        "messages_delta": [
+            {"role": "system", "content": {"$blob": "<hash>"}},
+            {"$copy": [1, 12]},
+            {"role": "tool", "tool_call_id": "call_7", "content": "..."}
+        ],
+        "blobs": {"<hash>": "<large content written once>"},
+        ... model, response, tool_calls, usage, latency_ms, success, error
+    }
+
+- {"$copy": [start, count]} copies count messages starting at index start
+  of the previous record of the conversation
+- Message contents of at least blob_min_chars characters are stored once in
+  "blobs" and referenced by content hash afterwards (e.g. a system prompt
+  that changes by a plan line is still rewritten, but the large tool outputs
+  it is rebuilt with are not)
+
+Conversations are recognized by content: a call belongs to the conversation
+whose previous record shares the longest prefix of non-system messages with
+it (then the most non-system messages, e.g. after history compression).
+Matching only affects compression, never correctness - copies are
+content-identical.
+
+iter_traces() rebuilds full records (with "messages") from delta and legacy
+full records alike, across rotated trace files.
+"""
+
+import hashlib
+import json
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+TRACE_FORMATS = ("full", "delta")
+
+HASH_CHARS = 32
+
+
+def _content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:HASH_CHARS]
+
+
+def _message_hash(message: dict[str, Any]) -> str:
+    return _content_hash(json.dumps(message, sort_keys=True, default=str))
+
+
+class TraceDeltaEncoder:
+    """
+    Encodes full trace records into delta records.
+
+    State (previous message hashes per conversation, known blob hashes) is
+    bounded by LRU; forgetting state only costs compression. Call reset()
+    when starting a new trace file so references never point into files a
+    reader may no longer have.
+    """
+
+    def __init__(
+        self,
+        blob_min_chars: int = 512,
+        max_conversations: int = 256,
+        max_blobs: int = 100_000,
+    ):
+        """
+        Initialize encoder.
+
+        Args:
+            blob_min_chars: Contents at least this long are stored as blobs
+            max_conversations: Conversations tracked for delta encoding
+            max_blobs: Blob hashes remembered as already written
+        """
+        self.blob_min_chars = blob_min_chars
+        self.max_conversations = max_conversations
+        self.max_blobs = max_blobs
+        # conversation id -> (message hashes, non-system message hashes) of its previous record
+        self._conversations: OrderedDict[str, tuple[list[str], list[str]]] = OrderedDict()
+        self._known_blobs: OrderedDict[str, None] = OrderedDict()
+
+    def reset(self) -> None:
+        """Forget all conversations and written blobs."""
+        self._conversations.clear()
+        self._known_blobs.clear()
+
+    def encode(self, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Encode a full trace record.
+
+        Args:
+            record: Trace record with a "messages" list
+
+        Returns:
+            Delta record (records without a messages list are returned unchanged)
+        """
+        messages = record.get("messages")
+        if not isinstance(messages, list):
+            return record
+
+        hashes = [_message_hash(message) for message in messages]
+        key_hashes = [
+            message_hash
+            for message, message_hash in zip(messages, hashes, strict=True)
+            if message.get("role") != "system"
+        ]
+        conversation, previous = self._match(key_hashes)
+        positions: dict[str, int] = {}
+        for index, message_hash in enumerate(previous):
+            positions.setdefault(message_hash, index)
+
+        items: list[dict[str, Any]] = []
+        blobs: dict[str, str] = {}
+        for message, message_hash in zip(messages, hashes, strict=True):
+            position = positions.get(message_hash)
+            if position is None:
+                items.append(self._encode_message(message, blobs))
+                continue
+            last = items[-1] if items else None
+            if last and "$copy" in last and sum(last["$copy"]) == position:
+                last["$copy"][1] += 1
+            else:
+                items.append({"$copy": [position, 1]})
+
+        self._conversations[conversation] = (hashes, key_hashes)
+        self._conversations.move_to_end(conversation)
+        while len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+
+        encoded = {key: value for key, value in record.items() if key != "messages"}
+        encoded["format"] = "delta"
+        encoded["conversation"] = conversation
+        encoded["messages_delta"] = items
+        if blobs:
+            encoded["blobs"] = blobs
+        return encoded
+
+    def _match(self, key_hashes: list[str]) -> tuple[str, list[str]]:
+        """Find the conversation sharing most non-system messages (or start one)."""
+        candidates = set(key_hashes)
+        best_id, best_score = None, (0, 0)
+        for conversation, (_, previous_keys) in self._conversations.items():
+            prefix = 0
+            for current, previous in zip(key_hashes, previous_keys, strict=False):
+                if current != previous:
+                    break
+                prefix += 1
+            score = (prefix, len(candidates.intersection(previous_keys)))
+            if score[1] and score >= best_score:
+                best_id, best_score = conversation, score
+        if best_id is None:
+            return uuid.uuid4().hex[:12], []
+        return best_id, self._conversations[best_id][0]
+
+    def _encode_message(self, message: dict[str, Any], blobs: dict[str, str]) -> dict[str, Any]:
+        """Replace large string content by a blob reference."""
+        content = message.get("content")
+        if not isinstance(content, str) or len(content) < self.blob_min_chars:
+            return message
+
+        blob_hash = _content_hash(content)
+        if blob_hash in self._known_blobs:
+            self._known_blobs.move_to_end(blob_hash)
+        else:
+            blobs[blob_hash] = content
+            self._known_blobs[blob_hash] = None
+            while len(self._known_blobs) > self.max_blobs:
+                self._known_blobs.popitem(last=False)
+        return {**message, "content": {"$blob": blob_hash}}
+
+
+def trace_files(path: str | Path) -> list[Path]:
+    """
+    List a trace file and its rotated backups, oldest first.
+
+    Args:
+        path: Current trace file path (e.g. traces/llm_traces.jsonl)
+
+    Returns:
+        Existing files in write order: path.N, ..., path.1, path
+    """
+    path = Path(path)
+    backups = []
+    for candidate in path.parent.glob(f"{path.name}.*"):
+        suffix = candidate.name[len(path.name) + 1 :]
+        if suffix.isdigit():
+            backups.append((int(suffix), candidate))
+    files = [candidate for _, candidate in sorted(backups, reverse=True)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+def iter_traces(path: str | Path, include_rotated: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Read trace records with full "messages" rebuilt.
+
+    Handles both delta and full (legacy) records. Message dicts may be shared
+    between records of the same conversation; copy them before mutating.
+    Blob references that cannot be resolved (backup deleted) yield None content.
+
+    Args:
+        path: Trace file path
+        include_rotated: Also read rotated backups (needed to resolve
+            references written before the last rotation)
+
+    Yields:
+        Trace records in write order
+    """
+    files = trace_files(path) if include_rotated else [Path(path)]
+    blobs: dict[str, str] = {}
+    conversations: dict[str, list[dict[str, Any]]] = {}
+
+    for file_path in files:
+        with open(file_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("format") != "delta":
+                    yield record
+                    continue
+
+                blobs.update(record.pop("blobs", {}))
+                previous = conversations.get(record["conversation"], [])
+                messages: list[dict[str, Any]] = []
+                for item in record.pop("messages_delta"):
+                    if "$copy" in item:
+                        start, count = item["$copy"]
+                        messages.extend(previous[start : start + count])
+                    else:
+                        messages.append(_decode_message(item, blobs))
+
+                conversations[record["conversation"]] = messages
+                record["messages"] = list(messages)
+                yield record
+
+
+def _decode_message(message: dict[str, Any], blobs: dict[str, str]) -> dict[str, Any]:
+    content = message.get("content")
+    if isinstance(content, dict) and "$blob" in content:
+        return {**message, "content": blobs.get(content["$blob"])}
+    return message
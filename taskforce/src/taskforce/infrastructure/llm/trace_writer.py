@@ -0,0 +1,357 @@
+"""
+Batched trace writer for LLM interaction traces.
+
+OpenAIService hands every trace record to a TraceWriter instead of opening
+the trace file per call. One writer exists per trace file (shared by all
+service instances of the process); it owns a single open handle and drains
+an asyncio.Queue in batches, triggered by batch size or flush interval.
+
+Key features:
+- Records are serialized on submit (later mutation of the message list by
+  the agent cannot leak into the trace)
+- Delta format (default): only messages new since the previous call of the
+  conversation plus blob references are written (see trace_format). Records
+  are encoded by the drain task right before they are written, so the
+  encoder starts fresh exactly at rotations and after failed writes
+- Bounded queue with an overflow policy: "block" (backpressure on the
+  caller), "drop" (discard new records) or "sample" (keep every n-th record
+  once the queue is half full, discard when full)
+- Size-based rotation: llm_traces.jsonl -> llm_traces.jsonl.1 -> ...
+- flush() / close() for clean shutdown (close_trace_writers() from the
+  FastAPI lifespan or the CLI)
+
+Configuration (llm_config.yaml):
+    tracing:
+      file_config:
+        path: traces/llm_traces.jsonl
+        format: delta                   # delta | full
+        blob_min_chars: 512             # delta: store longer contents once by hash
+        batch_size: 100                 # Records per write
+        flush_interval_seconds: 1.0     # Max delay before a partial batch is written
+        max_queue_size: 10000
+        overflow: block                 # block | drop | sample
+        sample_every: 10                # "sample": keep 1 of n records under pressure
+        max_bytes: 52428800             # Rotate at this size (0 = never)
+        backup_count: 5                 # Rotated files to keep
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+import structlog
+
+from taskforce.infrastructure.llm.trace_format import TRACE_FORMATS, TraceDeltaEncoder
+
+OVERFLOW_POLICIES = ("block", "drop", "sample")
+
+_FLUSH = object()
+_STOP = object()
+
+
+@dataclass
+class TraceWriterConfig:
+    """
+    Configuration for a batched trace writer.
+
+    Attributes:
+        path: Trace file path (JSONL)
+        format: "delta" (conversation-aware, see trace_format) or "full"
+        blob_min_chars: Delta format stores longer contents once by hash
+        batch_size: Maximum records written per batch
+        flush_interval_seconds: Maximum time a partial batch waits for more records
+        max_queue_size: Maximum queued records before the overflow policy applies
+        overflow: "block", "drop" or "sample"
+        sample_every: Keep 1 of n records under pressure ("sample" policy)
+        max_bytes: Rotate the file once it reaches this size (0 = never)
+        backup_count: Number of rotated files to keep
+    """
+
+    path: str = "traces/llm_traces.jsonl"
+    format: str = "delta"
+    blob_min_chars: int = 512
+    batch_size: int = 100
+    flush_interval_seconds: float = 1.0
+    max_queue_size: int = 10000
+    overflow: str = "block"
+    sample_every: int = 10
+    max_bytes: int = 50 * 1024 * 1024
+    backup_count: int = 5
+
+    def __post_init__(self) -> None:
+        if self.format not in TRACE_FORMATS:
+            raise ValueError(
+                f"Invalid trace format '{self.format}', expected one of {TRACE_FORMATS}"
+            )
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid trace overflow policy '{self.overflow}', "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+
+    @classmethod
+    def from_file_config(cls, file_config: dict[str, Any]) -> "TraceWriterConfig":
+        """
+        Create config from the tracing.file_config section of llm_config.yaml.
+
+        Args:
+            file_config: File tracing configuration dictionary
+
+        Returns:
+            TraceWriterConfig with defaults for missing keys
+        """
+        defaults = cls()
+        return cls(
+            path=file_config.get("path", defaults.path),
+            format=file_config.get("format", defaults.format),
+            blob_min_chars=int(file_config.get("blob_min_chars", defaults.blob_min_chars)),
+            batch_size=max(1, int(file_config.get("batch_size", defaults.batch_size))),
+            flush_interval_seconds=float(
+                file_config.get("flush_interval_seconds", defaults.flush_interval_seconds)
+            ),
+            max_queue_size=max(1, int(file_config.get("max_queue_size", defaults.max_queue_size))),
+            overflow=file_config.get("overflow", defaults.overflow),
+            sample_every=max(1, int(file_config.get("sample_every", defaults.sample_every))),
+            max_bytes=int(file_config.get("max_bytes", defaults.max_bytes)),
+            backup_count=int(file_config.get("backup_count", defaults.backup_count)),
+        )
+
+
+class TraceWriter:
+    """
+    Single-handle trace sink draining a queue in batches.
+
+    The drain task is started lazily on the first write() in the running
+    event loop. If a later write() happens in a different loop (e.g. a new
+    asyncio.run() in the CLI), a new queue and drain task are created; the
+    file handle is kept.
+    """
+
+    def __init__(self, config: TraceWriterConfig):
+        """
+        Initialize trace writer.
+
+        Args:
+            config: Writer configuration
+        """
+        self.config = config
+        self.path = Path(config.path)
+        self._file: TextIO | None = None
+        self._size = 0
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._sample_counter = 0
+        self._encoder = (
+            TraceDeltaEncoder(blob_min_chars=config.blob_min_chars)
+            if config.format == "delta"
+            else None
+        )
+        self._stats = {"written": 0, "dropped": 0, "batches": 0, "rotations": 0}
+        self.logger = structlog.get_logger().bind(component="trace_writer")
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with written, dropped, batches, rotations and queued counts
+        """
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return {**self._stats, "queued": queued}
+
+    async def write(self, record: dict[str, Any]) -> bool:
+        """
+        Queue a trace record for writing.
+
+        Args:
+            record: JSON-serializable trace record
+
+        Returns:
+            True if the record was queued, False if it was dropped
+        """
+        queue = self._ensure_started()
+
+        if self.config.overflow == "sample" and queue.qsize() >= queue.maxsize // 2:
+            self._sample_counter += 1
+            if self._sample_counter % self.config.sample_every:
+                self._drop()
+                return False
+        if self.config.overflow != "block" and queue.full():
+            self._drop()
+            return False
+
+        line = json.dumps(record, default=str) + "\n"
+        if self.config.overflow == "block":
+            await queue.put(line)
+        else:
+            queue.put_nowait(line)
+        return True
+
+    async def flush(self) -> None:
+        """Write all queued records and flush the file handle."""
+        if self._queue is None or not self._is_current_loop():
+            return
+        await self._queue.put(_FLUSH)
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Write all queued records, stop the drain task and close the file."""
+        if (
+            self._queue is not None
+            and self._task is not None
+            and not self._task.done()
+            and self._is_current_loop()
+        ):
+            await self._queue.put(_STOP)
+            await self._task
+        self._queue = None
+        self._task = None
+        self._loop = None
+        if self._file is not None:
+            await asyncio.to_thread(self._close_file)
+
+    def _encode(self, line: str) -> str:
+        """Delta-encode a serialized record (worker thread)."""
+        if self._encoder is None:
+            return line
+        return json.dumps(self._encoder.encode(json.loads(line)), default=str) + "\n"
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Start the drain task in the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or (self._task and self._task.done()):
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.config.max_queue_size)
+            self._task = loop.create_task(self._drain(self._queue))
+        return self._queue
+
+    def _is_current_loop(self) -> bool:
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    def _drop(self) -> None:
+        """Count a dropped record, logging the first and every 1000th drop."""
+        self._stats["dropped"] += 1
+        if self._stats["dropped"] % 1000 == 1:
+            self.logger.warning(
+                "trace_records_dropped",
+                dropped=self._stats["dropped"],
+                policy=self.config.overflow,
+                path=str(self.path),
+            )
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Collect batches from the queue and write them until stopped."""
+        loop = asyncio.get_running_loop()
+        stop = False
+        while not stop:
+            item = await queue.get()
+            taken = 1  # queue items to acknowledge (records and markers)
+            batch: list[str] = []
+            if item is _STOP:
+                stop = True
+            elif item is not _FLUSH:
+                batch.append(item)
+                deadline = loop.time() + self.config.flush_interval_seconds
+                while len(batch) < self.config.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                    taken += 1
+                    if item is _FLUSH or item is _STOP:
+                        stop = item is _STOP
+                        break
+                    batch.append(item)
+
+            if batch:
+                try:
+                    await asyncio.to_thread(self._write_lines, batch)
+                    self._stats["written"] += len(batch)
+                    self._stats["batches"] += 1
+                except Exception as e:
+                    if self._encoder is not None:
+                        # Lost records must not be the base of later references
+                        self._encoder.reset()
+                    self.logger.error("trace_file_write_failed", error=str(e), path=str(self.path))
+            for _ in range(taken):
+                queue.task_done()
+
+    def _write_lines(self, lines: list[str]) -> None:
+        """Encode and append lines with the shared handle, rotating by size (worker thread)."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._size = self._file.tell()
+
+        data = "".join(self._encode(line) for line in lines)
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data.encode("utf-8"))
+
+        if self.config.max_bytes and self._size >= self.config.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        """Shift rotated files and start a new trace file (worker thread)."""
+        self._close_file()
+        if self.config.backup_count > 0:
+            for index in range(self.config.backup_count - 1, 0, -1):
+                source = Path(f"{self.path}.{index}")
+                if source.exists():
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            self.path.unlink(missing_ok=True)
+        self._stats["rotations"] += 1
+        if self._encoder is not None:
+            # References never reach back into a rotated file
+            self._encoder.reset()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._size = 0
+
+
+_writers: dict[str, TraceWriter] = {}
+
+
+def get_trace_writer(config: TraceWriterConfig) -> TraceWriter:
+    """
+    Get the process-wide trace writer for a trace file.
+
+    All OpenAIService instances tracing to the same path share one writer
+    (and thus one handle), so concurrent agents never interleave appends.
+
+    Args:
+        config: Writer configuration (used when the writer is created)
+
+    Returns:
+        Shared TraceWriter for config.path
+    """
+    key = str(Path(config.path).resolve())
+    writer = _writers.get(key)
+    if writer is None:
+        writer = TraceWriter(config)
+        _writers[key] = writer
+    return writer
+
+
+async def close_trace_writers() -> None:
+    """Flush and close all trace writers (application shutdown)."""
+    writers = list(_writers.values())
+    _writers.clear()
+    for writer in writers:
+        await writer.close()
@@ -4,11 +4,17 @@ MCP Client for connecting to local and remote MCP servers.
 Provides connection management for Model Context Protocol servers via:
 - stdio: Local servers launched as subprocess
 - SSE: Remote servers via Server-Sent Events
+
+MCPConnection keeps a client context open in a dedicated owner task, so
+connections held by long-lived (pooled) agents can be closed from any task.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from typing import Any
 
+import structlog
+
 try:
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.sse import sse_client
@@ -187,7 +193,115 @@ class MCPClient:
                 "error_type": type(e).__name__,
             }
 
+    async def ping(self) -> None:
+        """
+        Check that the server responds.
+
+        Raises:
+            Exception: If the session is closed or the server does not answer
+        """
+        await self.session.send_ping()
+
     async def close(self):
         """Close the connection to the MCP server."""
         # Context managers handle cleanup automatically
         pass
+
+
+class MCPConnection:
+    """
+    MCP client context owned by a dedicated task.
+
+    anyio requires the cancel scopes of stdio_client/sse_client to be exited
+    in the task that entered them. Agents built in one request task and
+    closed from another (agent pool eviction, shutdown) would fail to close
+    and leak stdio server processes. MCPConnection enters the context in its
+    own task and exits it there once close is requested; __aexit__ may be
+    awaited from any task of the same event loop.
+
+    Example:
+        >>> connection = MCPConnection(MCPClient.create_stdio("python", ["server.py"]))
+        >>> client = await connection.__aenter__()
+        >>> ...
+        >>> await connection.__aexit__(None, None, None)  # from any task
+    """
+
+    def __init__(
+        self,
+        context: AbstractAsyncContextManager[MCPClient],
+        ping_timeout: float = 5.0,
+    ):
+        """
+        Initialize connection.
+
+        Args:
+            context: Client context from MCPClient.create_stdio/create_sse
+            ping_timeout: Seconds is_healthy() waits for a ping response
+        """
+        self._context = context
+        self.ping_timeout = ping_timeout
+        self.client: MCPClient | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._close_requested: asyncio.Event | None = None
+        self.logger = structlog.get_logger().bind(component="mcp_connection")
+
+    async def __aenter__(self) -> MCPClient:
+        """Open the connection in the owner task and return the client."""
+        ready: asyncio.Future[MCPClient] = asyncio.get_running_loop().create_future()
+        self._close_requested = asyncio.Event()
+        self._task = asyncio.create_task(self._own(ready, self._close_requested))
+        try:
+            self.client = await ready
+        except BaseException:
+            self._close_requested.set()
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+        return self.client
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Close the connection (in the owner task) and wait until it is closed."""
+        if self._task is None or self._close_requested is None:
+            return
+        self._close_requested.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the owner task still holds an open connection."""
+        return self.client is not None and self._task is not None and not self._task.done()
+
+    async def is_healthy(self) -> bool:
+        """
+        Check that the connection is open and the server answers a ping.
+
+        Returns:
+            True if healthy, False otherwise (never raises)
+        """
+        client = self.client
+        if client is None or not self.is_open:
+            return False
+        try:
+            await asyncio.wait_for(client.ping(), self.ping_timeout)
+        except Exception as e:
+            self.logger.warning("mcp_ping_failed", error=str(e))
+            return False
+        return True
+
+    async def _own(
+        self, ready: "asyncio.Future[MCPClient]", close_requested: asyncio.Event
+    ) -> None:
+        """Enter the context, wait for close, exit the context (same task)."""
+        try:
+            async with self._context as client:
+                ready.set_result(client)
+                await close_requested.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                # Server died or failed to shut down cleanly; is_healthy() reports it
+                self.logger.warning("mcp_connection_closed_with_error", error=str(e))
@@ -32,6 +32,10 @@ class MCPToolWrapper(ToolProtocol):
         tool_definition: dict[str, Any],
         requires_approval: bool = False,
         risk_level: ApprovalRiskLevel = ApprovalRiskLevel.LOW,
+        supports_parallelism: bool = False,
+        cacheable: bool = False,
+        cache_resource: str | None = None,
+        mutates: bool = False,
     ):
         """
         Initialize MCP tool wrapper.
@@ -42,11 +46,21 @@ class MCPToolWrapper(ToolProtocol):
                 (name, description, input_schema)
             requires_approval: Whether this tool requires user approval
             risk_level: Risk level for approval prompts
+            supports_parallelism: Whether calls may run concurrently with
+                other tool calls (only enable for read-only MCP tools)
+            cacheable: Whether results may be memoized within a session
+                (only enable for read-only MCP tools)
+            cache_resource: Resource key for cache invalidation (e.g. per server)
+            mutates: Whether calls invalidate cached results of cache_resource
         """
         self._client = client
         self._tool_definition = tool_definition
         self._requires_approval = requires_approval
         self._risk_level = risk_level
+        self._supports_parallelism = supports_parallelism
+        self._cacheable = cacheable
+        self._cache_resource = cache_resource
+        self._mutates = mutates
 
         # Extract tool metadata
         self._name = tool_definition.get("name", "unknown_mcp_tool")
@@ -107,6 +121,26 @@ class MCPToolWrapper(ToolProtocol):
         """Return the risk level for approval prompts."""
         return self._risk_level
 
+    @property
+    def supports_parallelism(self) -> bool:
+        """Return whether this tool may run concurrently with other calls."""
+        return self._supports_parallelism
+
+    @property
+    def cacheable(self) -> bool:
+        """Return whether results may be memoized within a session."""
+        return self._cacheable
+
+    @property
+    def cache_resource(self) -> str | None:
+        """Return the resource key used for cache invalidation."""
+        return self._cache_resource
+
+    @property
+    def mutates(self) -> bool:
+        """Return whether calls invalidate cached results of the resource."""
+        return self._mutates
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         """
         Generate approval preview for this MCP tool execution.
@@ -47,6 +47,22 @@ class AskUserTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return None
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         question = kwargs.get("question", "")
         return f"Tool: {self.name}\nOperation: Ask user\nQuestion: {question}"
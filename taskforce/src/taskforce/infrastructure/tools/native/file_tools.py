@@ -52,6 +52,22 @@ class FileReadTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         path = kwargs.get("path", "")
         return f"Tool: {self.name}\nOperation: Read file\nPath: {path}"
@@ -147,6 +163,22 @@ class FileWriteTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.MEDIUM
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         path = kwargs.get("path", "")
         content = kwargs.get("content", "")
@@ -91,6 +91,22 @@ class GitTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.HIGH
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         operation = kwargs.get("operation")
         if operation == "push":
@@ -277,6 +293,23 @@ class GitHubTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.HIGH
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        # Repository changes show up in web_fetch results of GitHub pages
+        return "web"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         action = kwargs.get("action")
         name = kwargs.get("name", "")
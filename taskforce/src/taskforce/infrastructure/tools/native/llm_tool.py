@@ -73,6 +73,22 @@ class LLMTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return None
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         prompt = kwargs.get("prompt", "")
         prompt_preview = prompt[:100] + "..." if len(prompt) > 100 else prompt
@@ -62,6 +62,22 @@ class PythonTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.HIGH
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         code = kwargs.get("code", "")
         code_preview = code[:200] + "..." if len(code) > 200 else code
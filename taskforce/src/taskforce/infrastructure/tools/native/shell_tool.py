@@ -54,6 +54,22 @@ class ShellTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.HIGH
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         command = kwargs.get("command", "")
         cwd = kwargs.get("cwd", "current directory")
@@ -185,6 +201,22 @@ class PowerShellTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.HIGH
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return False
+
+    @property
+    def cacheable(self) -> bool:
+        return False
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "filesystem"
+
+    @property
+    def mutates(self) -> bool:
+        return True
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         command = kwargs.get("command", "")
         cwd = kwargs.get("cwd", "current directory")
@@ -50,6 +50,22 @@ class WebSearchTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "web"
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         query = kwargs.get("query", "")
         num_results = kwargs.get("num_results", 5)
@@ -170,6 +186,22 @@ class WebFetchTool(ToolProtocol):
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "web"
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         url = kwargs.get("url", "")
         return f"Tool: {self.name}\nOperation: Fetch URL content\nURL: {url}"
@@ -98,6 +98,26 @@ class GlobalDocumentAnalysisTool(ToolProtocol):
         """Low risk - read-only operation."""
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        """Read-only - safe to run concurrently."""
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        """Read-only - results may be memoized within a session."""
+        return True
+
+    @property
+    def cache_resource(self) -> str | None:
+        """Results depend on the indexed documents."""
+        return "documents"
+
+    @property
+    def mutates(self) -> bool:
+        """Read-only - never invalidates cached results."""
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         """Generate approval preview (not used for read-only tool)."""
         document_id = kwargs.get("document_id", "")
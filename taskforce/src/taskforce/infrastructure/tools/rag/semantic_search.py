@@ -90,6 +90,22 @@ class SemanticSearchTool:
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return ApprovalRiskLevel.LOW
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return True
+
+    @property
+    def cacheable(self) -> bool:
+        return True
+
+    @property
+    def cache_resource(self) -> str | None:
+        return "documents"
+
+    @property
+    def mutates(self) -> bool:
+        return False
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         query = kwargs.get("query", "")
         return f"Tool: {self.name}\nOperation: Hybrid Search\nQuery: {query}"
@@ -32,6 +32,27 @@ class OutputFilteringTool:
     def approval_risk_level(self) -> ApprovalRiskLevel:
         return self._original.approval_risk_level
 
+    @property
+    def supports_parallelism(self) -> bool:
+        return self._original.supports_parallelism
+
+    @property
+    def cacheable(self) -> bool:
+        return self._original.cacheable
+
+    @property
+    def cache_resource(self) -> str | None:
+        return self._original.cache_resource
+
+    @property
+    def mutates(self) -> bool:
+        return self._original.mutates
+
+    @property
+    def user_context(self) -> Dict[str, Any] | None:
+        # Security context of RAG tools (part of the coalescing key)
+        return getattr(self._original, "user_context", None)
+
     def get_approval_preview(self, **kwargs: Any) -> str:
         return self._original.get_approval_preview(**kwargs)
 
@@ -83,3 +83,12 @@ def test_streaming_execution():
         # Allow pass if stream setup fails due to environment (e.g. no LLM key)
         pass
 
+
+@pytest.mark.integration
+def test_llm_health_endpoint():
+    response = client.get("/health/llm")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] in ["healthy", "degraded", "unavailable"]
+    assert isinstance(data["pools"], list)
+    assert isinstance(data["streaming"], list)
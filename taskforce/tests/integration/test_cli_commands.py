@@ -201,6 +201,30 @@ def test_help_command():
     assert "sessions" in result.output
 
 
+def test_tools_migrate_results_command(tmp_path):
+    """Test migrating a file tool result store to SQLite."""
+    import asyncio
+
+    from taskforce.infrastructure.cache.tool_result_store import FileToolResultStore
+
+    store = FileToolResultStore(tmp_path)
+    asyncio.run(store.put("file_read", {"success": True, "output": "content"}, "s1"))
+
+    result = runner.invoke(app, ["tools", "migrate-results", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Migrated 1 results" in result.output
+    assert (tmp_path / "tool_results.sqlite3").exists()
+
+
+def test_tools_migrate_results_missing_store(tmp_path):
+    """Test migrate-results with a directory that holds no store."""
+    result = runner.invoke(app, ["tools", "migrate-results", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "No tool result store found" in result.output
+
+
 def test_command_group_help():
     """Test command group help displays subcommands."""
     result = runner.invoke(app, ["run", "--help"])
@@ -374,6 +374,50 @@ class TestServerSSEEventFormat:
                     assert "details" in parsed
 
 
+class TestServerBatchStreaming:
+    """Tests for the batch SSE streaming endpoint."""
+
+    @pytest.mark.integration
+    def test_batch_stream_forwards_batch_events(self):
+        """Test that batch events are streamed as SSE data lines."""
+        mock_updates = [
+            make_progress_update("batch_started", "Starting batch", {"total": 2}),
+            make_progress_update("mission_complete", "Mission 2/2", {"index": 1}),
+            make_progress_update("mission_complete", "Mission 1/2", {"index": 0}),
+            make_progress_update("batch_complete", "Batch finished", {"total": 2}),
+        ]
+
+        with patch.object(AgentExecutor, "execute_batch_streaming") as mock_stream:
+            mock_stream.return_value = mock_streaming_generator(mock_updates)
+
+            with client.stream(
+                "POST",
+                "/api/v1/execute/batch/stream",
+                json={"missions": ["a", "b"], "max_concurrency": 2},
+            ) as response:
+                assert response.status_code == 200
+                events = [
+                    json.loads(line[6:])
+                    for line in response.iter_lines()
+                    if line.startswith("data: ")
+                ]
+
+        assert [event["event_type"] for event in events] == [
+            "batch_started",
+            "mission_complete",
+            "mission_complete",
+            "batch_complete",
+        ]
+        assert mock_stream.call_args.kwargs["max_concurrency"] == 2
+
+    @pytest.mark.integration
+    def test_batch_rejects_empty_missions(self):
+        """Test that an empty mission list is rejected by validation."""
+        response = client.post("/api/v1/execute/batch", json={"missions": []})
+
+        assert response.status_code == 422
+
+
 class TestServerSSEBackwardCompatibility:
     """Tests for SSE endpoint backward compatibility."""
 
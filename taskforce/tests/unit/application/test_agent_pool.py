@@ -0,0 +1,266 @@
+"""
+Unit Tests for AgentPool
+
+Tests warm agent reuse, per-key isolation, session reset, size limits,
+idle eviction, health checks and the AgentExecutor integration.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.application.agent_pool import (
+    AgentPool,
+    AgentPoolConfig,
+    check_agent_connections,
+)
+from taskforce.application.executor import AgentExecutor
+from taskforce.application.factory import AgentFactory
+from taskforce.core.domain.models import ExecutionResult
+
+
+def _make_agent() -> MagicMock:
+    agent = MagicMock()
+    agent.close = AsyncMock()
+    agent.reset_session = MagicMock()
+    return agent
+
+
+def _creator():
+    created: list[MagicMock] = []
+
+    async def create():
+        agent = _make_agent()
+        created.append(agent)
+        return agent
+
+    return create, created
+
+
+@pytest.mark.asyncio
+async def test_released_agent_is_reused_and_reset():
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    create, created = _creator()
+    key = AgentPool.key_for("dev")
+
+    first = await pool.acquire(key, create)
+    await pool.release(key, first)
+    second = await pool.acquire(key, create)
+
+    assert second is first
+    assert len(created) == 1
+    first.reset_session.assert_called_once()
+    first.close.assert_not_called()
+    assert pool.stats["hits"] == 1
+    assert pool.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_are_isolated():
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    create, created = _creator()
+    dev = AgentPool.key_for("dev")
+    rag = AgentPool.key_for("dev", user_context={"user_id": "u1"})
+
+    agent = await pool.acquire(dev, create)
+    await pool.release(dev, agent)
+    other = await pool.acquire(rag, create)
+
+    assert other is not agent
+    assert len(created) == 2
+    assert AgentPool.key_for("dev", user_context={"a": 1, "b": 2}) == AgentPool.key_for(
+        "dev", user_context={"b": 2, "a": 1}
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_agent_is_closed_not_pooled():
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    create, _ = _creator()
+    key = AgentPool.key_for("dev")
+
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent, healthy=False)
+
+    agent.close.assert_awaited_once()
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_max_uses_recycles_agent():
+    pool = AgentPool(AgentPoolConfig(enabled=True, max_uses=2))
+    create, created = _creator()
+    key = AgentPool.key_for("dev")
+
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+
+    agent.close.assert_awaited_once()
+    assert pool.idle_count == 0
+    assert len(created) == 1
+
+
+@pytest.mark.asyncio
+async def test_size_limits_close_surplus_agents():
+    pool = AgentPool(AgentPoolConfig(enabled=True, max_size=2, max_idle_per_key=1))
+    create, _ = _creator()
+    keys = [AgentPool.key_for(profile) for profile in ("a", "b", "c")]
+
+    agents = [await pool.acquire(keys[0], create), await pool.acquire(keys[0], create)]
+    for agent in agents:
+        await pool.release(keys[0], agent)
+    assert pool.idle_count == 1
+    agents[1].close.assert_awaited_once()
+
+    for key in keys[1:]:
+        await pool.release(key, await pool.acquire(key, create))
+
+    # Least recently released agent (key "a") was evicted
+    assert pool.idle_count == 2
+    agents[0].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_agents_are_evicted(monkeypatch):
+    pool = AgentPool(AgentPoolConfig(enabled=True, idle_ttl_seconds=10))
+    create, created = _creator()
+    key = AgentPool.key_for("dev")
+    now = time.monotonic()
+
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+
+    monkeypatch.setattr(
+        "taskforce.application.agent_pool.time.monotonic", lambda: now + 60
+    )
+    fresh = await pool.acquire(key, create)
+
+    agent.close.assert_awaited_once()
+    assert fresh is not agent
+    assert pool.stats["evicted_idle"] == 1
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_agent_is_replaced():
+    pool = AgentPool(AgentPoolConfig(enabled=True), health_check=lambda agent: False)
+    create, created = _creator()
+    key = AgentPool.key_for("dev")
+
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+    fresh = await pool.acquire(key, create)
+
+    assert fresh is not agent
+    agent.close.assert_awaited_once()
+    assert pool.stats["unhealthy"] == 1
+
+
+@pytest.mark.asyncio
+async def test_agent_with_dead_mcp_connection_is_replaced():
+    pool = AgentPool(AgentPoolConfig(enabled=True), health_check=check_agent_connections)
+    connection = MagicMock()
+    connection.is_healthy = AsyncMock(return_value=True)
+    created: list[MagicMock] = []
+
+    async def create():
+        agent = _make_agent()
+        agent._mcp_contexts = [connection]
+        created.append(agent)
+        return agent
+
+    key = AgentPool.key_for("dev")
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+    assert await pool.acquire(key, create) is agent
+
+    connection.is_healthy.return_value = False
+    await pool.release(key, agent)
+    fresh = await pool.acquire(key, create)
+
+    assert fresh is not agent
+    assert len(created) == 2
+    agent.close.assert_awaited_once()
+    assert connection.is_healthy.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_without_mcp_connections_is_healthy():
+    agent = MagicMock()
+    agent._mcp_contexts = []
+    assert await check_agent_connections(agent)
+    assert await check_agent_connections(object())
+
+
+@pytest.mark.asyncio
+async def test_close_closes_idle_agents():
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    create, _ = _creator()
+    key = AgentPool.key_for("dev")
+
+    agent = await pool.acquire(key, create)
+    await pool.release(key, agent)
+    await pool.close()
+
+    agent.close.assert_awaited_once()
+    assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_reuses_pooled_agent():
+    mock_factory = MagicMock(spec=AgentFactory)
+    mock_agent = _make_agent()
+    mock_agent.execute = AsyncMock(
+        return_value=ExecutionResult(
+            session_id="s",
+            status="completed",
+            final_message="Success",
+            execution_history=[],
+        )
+    )
+    mock_factory.create_agent = AsyncMock(return_value=mock_agent)
+
+    executor = AgentExecutor(
+        factory=mock_factory, agent_pool=AgentPool(AgentPoolConfig(enabled=True))
+    )
+    await executor.execute_mission("First", profile="dev")
+    await executor.execute_mission("Second", profile="dev")
+
+    mock_factory.create_agent.assert_awaited_once_with(profile="dev")
+    assert mock_agent.execute.await_count == 2
+    mock_agent.close.assert_not_called()
+
+    await executor.close()
+    mock_agent.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_executor_discards_agent_after_failure():
+    mock_factory = MagicMock(spec=AgentFactory)
+    mock_agent = _make_agent()
+    mock_agent.execute = AsyncMock(side_effect=RuntimeError("boom"))
+    mock_factory.create_agent = AsyncMock(return_value=mock_agent)
+
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    executor = AgentExecutor(factory=mock_factory, agent_pool=pool)
+
+    with pytest.raises(RuntimeError):
+        await executor.execute_mission("Test", profile="dev")
+
+    mock_agent.close.assert_awaited_once()
+    assert pool.idle_count == 0
+
+
+def test_executor_pool_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("AGENT_POOL_ENABLED", raising=False)
+    assert AgentExecutor(factory=MagicMock(spec=AgentFactory)).agent_pool is None
+
+    monkeypatch.setenv("AGENT_POOL_ENABLED", "true")
+    monkeypatch.setenv("AGENT_POOL_MAX_SIZE", "3")
+    executor = AgentExecutor(factory=MagicMock(spec=AgentFactory))
+    assert executor.agent_pool is not None
+    assert executor.agent_pool.config.max_size == 3
+    assert executor.agent_pool._health_check is check_agent_connections
@@ -0,0 +1,192 @@
+"""
+Unit Tests for AgentExecutor batch execution
+
+Tests bounded concurrency, agent sharing, failure isolation, streaming
+order and aggregate metrics of execute_batch / execute_batch_streaming.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from taskforce.application.agent_pool import AgentPool, AgentPoolConfig
+from taskforce.application.executor import AgentExecutor, _percentile
+from taskforce.application.factory import AgentFactory
+from taskforce.core.domain.models import ExecutionResult
+from taskforce.infrastructure.tools.mcp.client import MCPClient, MCPConnection
+
+
+def _make_factory(delays: dict[str, float] | None = None, fail: set[str] | None = None):
+    """Factory whose agents sleep per mission and track peak concurrency."""
+    delays = delays or {}
+    fail = fail or set()
+    tracker = {"running": 0, "peak": 0}
+    agents: list[MagicMock] = []
+
+    async def execute(mission: str, session_id: str):
+        tracker["running"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["running"])
+        try:
+            await asyncio.sleep(delays.get(mission, 0.01))
+            if mission in fail:
+                raise RuntimeError(f"{mission} failed")
+            return ExecutionResult(
+                session_id=session_id,
+                status="completed",
+                final_message=f"done {mission}",
+                token_usage={"prompt_tokens": 10, "completion_tokens": 2},
+            )
+        finally:
+            tracker["running"] -= 1
+
+    async def create_agent(**kwargs):
+        agent = MagicMock()
+        agent.execute = AsyncMock(side_effect=execute)
+        agent.close = AsyncMock()
+        agent.reset_session = MagicMock()
+        agents.append(agent)
+        return agent
+
+    factory = MagicMock(spec=AgentFactory)
+    factory.create_agent = AsyncMock(side_effect=create_agent)
+    return factory, agents, tracker
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_bounds_concurrency_and_shares_agents():
+    factory, agents, tracker = _make_factory()
+    executor = AgentExecutor(factory=factory)
+
+    batch = await executor.execute_batch(
+        [f"m{i}" for i in range(10)], profile="dev", max_concurrency=3
+    )
+
+    assert [result.index for result in batch.results] == list(range(10))
+    assert all(result.status == "completed" for result in batch.results)
+    assert tracker["peak"] <= 3
+    assert len(agents) <= 3
+    # Batch-owned pool is closed afterwards
+    for agent in agents:
+        agent.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_reports_failures_without_aborting():
+    factory, _, _ = _make_factory(fail={"bad"})
+    executor = AgentExecutor(factory=factory)
+
+    batch = await executor.execute_batch(["ok", "bad", "ok2"], max_concurrency=2)
+
+    statuses = {result.mission: result.status for result in batch.results}
+    assert statuses == {"ok": "completed", "bad": "failed", "ok2": "completed"}
+    assert batch.results[1].error == "bad failed"
+    assert batch.summary.completed == 2
+    assert batch.summary.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_summary_metrics():
+    factory, _, _ = _make_factory()
+    executor = AgentExecutor(factory=factory)
+    seen = []
+
+    batch = await executor.execute_batch(
+        ["a", "b", "c", "d"], max_concurrency=2, result_callback=seen.append
+    )
+
+    summary = batch.summary
+    assert len(seen) == 4
+    assert summary.total == 4
+    assert summary.token_usage == {"prompt_tokens": 40, "completion_tokens": 8}
+    assert summary.missions_per_second > 0
+    assert 0 < summary.latency_p50_seconds <= summary.latency_p95_seconds
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_streaming_yields_in_completion_order():
+    factory, _, _ = _make_factory(delays={"slow": 0.1, "fast": 0.01})
+    executor = AgentExecutor(factory=factory)
+
+    updates = [
+        update
+        async for update in executor.execute_batch_streaming(
+            ["slow", "fast"], max_concurrency=2
+        )
+    ]
+
+    assert [update.event_type for update in updates] == [
+        "batch_started",
+        "mission_complete",
+        "mission_complete",
+        "batch_complete",
+    ]
+    assert updates[1].details["mission"] == "fast"
+    assert updates[2].details["mission"] == "slow"
+    assert updates[-1].details["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_uses_executor_pool():
+    factory, agents, _ = _make_factory()
+    pool = AgentPool(AgentPoolConfig(enabled=True))
+    executor = AgentExecutor(factory=factory, agent_pool=pool)
+
+    await executor.execute_batch(["a", "b", "c"], max_concurrency=1)
+
+    assert len(agents) == 1
+    assert pool.idle_count == 1
+    agents[0].close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_closes_mcp_connections_of_batch_agents():
+    """Agents built in mission tasks are closed by the batch without cancel-scope errors."""
+    factory, agents, _ = _make_factory()
+    closed: list[str] = []
+    create_agent = factory.create_agent.side_effect
+
+    @asynccontextmanager
+    async def mcp_context():
+        async with anyio.create_task_group():
+            try:
+                yield MCPClient(AsyncMock(), MagicMock(), MagicMock())
+            finally:
+                closed.append("closed")
+
+    async def create_agent_with_mcp(**kwargs):
+        agent = await create_agent(**kwargs)
+        connection = MCPConnection(mcp_context())
+        await connection.__aenter__()
+
+        async def close():
+            await connection.__aexit__(None, None, None)
+
+        agent.close = AsyncMock(side_effect=close)
+        agent.connection = connection
+        return agent
+
+    factory.create_agent = AsyncMock(side_effect=create_agent_with_mcp)
+    executor = AgentExecutor(factory=factory)
+
+    batch = await executor.execute_batch([f"m{i}" for i in range(4)], max_concurrency=2)
+
+    assert batch.summary.completed == 4
+    assert len(closed) == len(agents)
+    assert not any(agent.connection.is_open for agent in agents)
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_rejects_invalid_concurrency():
+    executor = AgentExecutor(factory=MagicMock(spec=AgentFactory))
+
+    with pytest.raises(ValueError):
+        await executor.execute_batch(["a"], max_concurrency=0)
+
+
+def test_percentile_nearest_rank():
+    assert _percentile([], 0.5) == 0.0
+    assert _percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert _percentile([float(i) for i in range(1, 101)], 0.95) == 95.0
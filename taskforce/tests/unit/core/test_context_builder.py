@@ -389,3 +389,97 @@ class TestContextBuilder:
         assert len(result) == 100
         assert result == "A" * 100
 
+
+
+def make_preview_message(call_id: str, tool: str, preview: str) -> dict:
+    """Create a tool message in preview format (Story 9.1)."""
+    return {
+        "role": "tool",
+        "tool_call_id": call_id,
+        "content": json.dumps({
+            "handle": {"id": f"h_{call_id}", "tool": tool, "size_chars": 100},
+            "preview_text": preview,
+            "truncated": False,
+        }),
+    }
+
+
+class TestIncrementalContextBuilder:
+    """Test incremental mode of ContextBuilder."""
+
+    def test_matches_full_build(self):
+        """Incremental output equals full re-scan output as history grows."""
+        policy = ContextPolicy(include_latest_tool_previews_n=3)
+        full = ContextBuilder(policy)
+        incremental = ContextBuilder(policy, incremental=True)
+        state = {"planner_state": {"plan": {"steps": [{"status": "pending"}]}}}
+
+        messages = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        for i in range(8):
+            messages.append(make_preview_message(f"c{i}", "file_read", f"Preview {i}"))
+            messages.append({"role": "tool", "tool_call_id": f"x{i}", "content": "plain"})
+
+            assert incremental.build_context_pack(
+                mission="m", state=state, messages=messages
+            ) == full.build_context_pack(mission="m", state=state, messages=messages)
+
+    def test_each_message_parsed_once(self, monkeypatch):
+        """Previously consumed tool messages are not parsed again."""
+        builder = ContextBuilder(ContextPolicy.conservative_default(), incremental=True)
+        messages = [make_preview_message("c0", "python", "Result: 0")]
+        builder.build_context_pack(messages=messages)
+
+        parsed: list[str] = []
+        original_loads = json.loads
+
+        def counting_loads(content, *args, **kwargs):
+            parsed.append(content)
+            return original_loads(content, *args, **kwargs)
+
+        monkeypatch.setattr(json, "loads", counting_loads)
+
+        messages.append(make_preview_message("c1", "python", "Result: 1"))
+        pack = builder.build_context_pack(messages=messages)
+        builder.build_context_pack(messages=messages)
+
+        assert len(parsed) == 1
+        assert "Result: 0" in pack and "Result: 1" in pack
+
+    def test_returns_cached_pack_when_unchanged(self):
+        """Pack is only re-rendered when its inputs change."""
+        builder = ContextBuilder(ContextPolicy.conservative_default(), incremental=True)
+        messages = [make_preview_message("c0", "python", "Result: 0")]
+
+        pack1 = builder.build_context_pack(mission="m", messages=messages)
+        messages.append({"role": "assistant", "content": "thinking"})
+        pack2 = builder.build_context_pack(mission="m", messages=messages)
+        pack3 = builder.build_context_pack(mission="other", messages=messages)
+
+        assert pack2 is pack1
+        assert "other" in pack3
+
+    def test_previews_ring_is_bounded(self):
+        """Only the latest N previews are retained."""
+        policy = ContextPolicy(include_latest_tool_previews_n=2)
+        builder = ContextBuilder(policy, incremental=True)
+        messages = [make_preview_message(f"c{i}", "python", f"Result: {i}") for i in range(5)]
+
+        pack = builder.build_context_pack(messages=messages)
+
+        assert len(builder._previews) == 2
+        assert "Result: 3" in pack and "Result: 4" in pack
+        assert "Result: 2" not in pack
+
+    def test_rescans_when_history_is_replaced(self):
+        """A new message list (e.g. after compression) triggers a fresh scan."""
+        builder = ContextBuilder(ContextPolicy.conservative_default(), incremental=True)
+        builder.build_context_pack(
+            messages=[make_preview_message("c0", "python", "Old result")]
+        )
+
+        pack = builder.build_context_pack(
+            messages=[make_preview_message("c1", "python", "New result")]
+        )
+
+        assert "New result" in pack
+        assert "Old result" not in pack
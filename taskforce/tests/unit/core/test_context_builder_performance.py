@@ -0,0 +1,85 @@
+"""
+Performance tests for ContextBuilder.
+
+Verifies that incremental context pack building keeps the per-iteration
+work flat as the message history grows, while the full re-scan grows with
+the number of tool messages. Work is measured as the number of messages
+parsed per loop iteration, not wall-clock time.
+"""
+
+import json
+
+from taskforce.core.domain.context_builder import ContextBuilder
+from taskforce.core.domain.context_policy import ContextPolicy
+
+
+def make_tool_message(i: int) -> dict:
+    """Tool message in preview format with a realistic payload size."""
+    return {
+        "role": "tool",
+        "tool_call_id": f"call_{i}",
+        "content": json.dumps({
+            "handle": {"id": f"h{i}", "tool": "semantic_search", "size_chars": 8000},
+            "preview_text": f"Result {i}: " + "lorem ipsum " * 40,
+            "truncated": True,
+        }),
+    }
+
+
+def parses_per_iteration(
+    builder: ContextBuilder, history_size: int, iterations: int = 50
+) -> tuple[float, list[str]]:
+    """
+    Simulate the agent loop: grow history to history_size, then count the
+    messages parsed per loop iteration (append tool result + build pack).
+
+    Returns:
+        Tuple of (average parsed messages per iteration, built packs)
+    """
+    state = {"planner_state": {"plan": {"steps": [{"status": "in_progress"}]}}}
+    messages = [{"role": "system", "content": "system"}, {"role": "user", "content": "mission"}]
+    for i in range(history_size):
+        messages.append({"role": "assistant", "content": None})
+        messages.append(make_tool_message(i))
+        builder.build_context_pack(mission="Mission", state=state, messages=messages)
+
+    parse = builder._parse_tool_preview
+    parsed = 0
+
+    def counting_parse(msg: dict) -> dict | None:
+        nonlocal parsed
+        parsed += 1
+        return parse(msg)
+
+    builder._parse_tool_preview = counting_parse
+    packs = []
+    for i in range(history_size, history_size + iterations):
+        messages.append(make_tool_message(i))
+        packs.append(builder.build_context_pack(mission="Mission", state=state, messages=messages))
+    return parsed / iterations, packs
+
+
+class TestContextBuilderPerformance:
+    """Work per iteration of context pack building."""
+
+    def test_incremental_cost_stays_flat(self):
+        """Per-iteration work at 500 tool messages equals the work at 10."""
+        policy = ContextPolicy.conservative_default()
+
+        small, _ = parses_per_iteration(ContextBuilder(policy, incremental=True), 10)
+        large, _ = parses_per_iteration(ContextBuilder(policy, incremental=True), 500)
+
+        assert small == large == 1
+
+    def test_incremental_does_less_work_than_full_rescan_on_long_history(self):
+        """Incremental building parses only new messages, with identical output."""
+        policy = ContextPolicy(include_latest_tool_previews_n=100, max_items=100)
+
+        full, full_packs = parses_per_iteration(ContextBuilder(policy), 300, iterations=20)
+        incremental, incremental_packs = parses_per_iteration(
+            ContextBuilder(policy, incremental=True), 300, iterations=20
+        )
+
+        assert incremental == 1
+        assert full >= policy.include_latest_tool_previews_n
+        assert incremental_packs == full_packs
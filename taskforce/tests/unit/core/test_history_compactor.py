@@ -0,0 +1,260 @@
+"""
+Unit tests for background history compaction.
+
+Tests the HistoryCompactor (segment selection on tool-call boundaries,
+mission retention, non-blocking splice, identity validation, hard-limit wait) and that
+LeanAgent never waits on summaries below the hard budget.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.history_compactor import SUMMARY_PREFIX, HistoryCompactor
+from taskforce.core.domain.lean_agent import LeanAgent
+
+
+def history(turns: int) -> list[dict]:
+    """System prompt, mission and `turns` tool-call rounds (assistant + tool)."""
+    messages = [
+        {"role": "system", "content": "System"},
+        {"role": "user", "content": "Mission"},
+    ]
+    for i in range(turns):
+        messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"c{i}",
+                        "type": "function",
+                        "function": {"name": "file_read", "arguments": "{}"},
+                    }
+                ],
+            }
+        )
+        messages.append(
+            {"role": "tool", "tool_call_id": f"c{i}", "name": "file_read", "content": "x"}
+        )
+    return messages
+
+
+def slow_llm(delay: float = 0.0, content: str = "Summary") -> AsyncMock:
+    llm = AsyncMock()
+
+    async def complete(**kwargs):
+        await asyncio.sleep(delay)
+        return {"success": True, "content": content}
+
+    llm.complete.side_effect = complete
+    return llm
+
+
+def compactor_for(llm, keep_recent: int = 4) -> HistoryCompactor:
+    return HistoryCompactor(
+        llm, lambda msgs: f"{len(msgs)} messages", model_alias="fast", keep_recent=keep_recent
+    )
+
+
+class TestHistoryCompactor:
+    """Tests for the background compactor."""
+
+    @pytest.mark.asyncio
+    async def test_start_is_non_blocking_and_apply_splices(self):
+        llm = slow_llm(delay=0.01)
+        compactor = compactor_for(llm)
+        messages = history(5)
+
+        assert compactor.start(messages) is True
+        assert compactor.apply(messages) is messages  # Not ready yet
+
+        await asyncio.sleep(0.02)
+        compacted = compactor.apply(messages)
+
+        assert compacted[0] is messages[0]
+        assert compacted[1] is messages[1]  # Mission
+        assert compacted[2]["content"].startswith(SUMMARY_PREFIX)
+        assert compacted[3:] == messages[-4:]
+        assert llm.complete.call_args.kwargs["model"] == "fast"
+        assert compactor.stats["applied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_segment_keeps_tool_results_with_their_call(self):
+        compactor = compactor_for(slow_llm(), keep_recent=3)
+        messages = history(5)  # Recent 3 would start with a tool message
+
+        compactor.start(messages)
+        compacted = await compactor.wait(messages)
+
+        assert compacted[3]["role"] == "assistant"
+        assert compacted[4]["role"] == "tool"
+
+    @pytest.mark.asyncio
+    async def test_splice_keeps_current_system_prompt(self):
+        compactor = compactor_for(slow_llm())
+        messages = history(5)
+        compactor.start(messages)
+
+        # The agent refreshes the system prompt (plan, context pack) every iteration
+        messages[0] = {"role": "system", "content": "System with updated plan"}
+        compacted = await compactor.wait(messages)
+
+        assert compacted[0] is messages[0]
+        assert compacted[1]["content"] == "Mission"
+        assert compacted[2]["content"].startswith(SUMMARY_PREFIX)
+
+    @pytest.mark.asyncio
+    async def test_mission_survives_repeated_compaction(self):
+        compactor = compactor_for(slow_llm())
+        messages = history(5)
+
+        compactor.start(messages)
+        once = await compactor.wait(messages)
+        once.extend(history(3)[2:])
+        compactor.start(once)
+        twice = await compactor.wait(once)
+
+        assert [m["content"] for m in twice[:2]] == ["System", "Mission"]
+        assert twice[2]["content"].startswith(SUMMARY_PREFIX)
+        assert sum(m["content"] == "Mission" for m in twice) == 1
+        assert compactor.stats["applied"] == 2
+
+    @pytest.mark.asyncio
+    async def test_messages_appended_meanwhile_are_kept(self):
+        compactor = compactor_for(slow_llm(delay=0.01))
+        messages = history(5)
+        compactor.start(messages)
+
+        messages.append({"role": "user", "content": "new"})
+        compacted = await compactor.wait(messages)
+
+        assert compacted[-1]["content"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_discards_summary(self):
+        compactor = compactor_for(slow_llm())
+        messages = history(5)
+        compactor.start(messages)
+
+        rewritten = [messages[0], *messages[-3:]]
+        result = await compactor.wait(rewritten)
+
+        assert result is rewritten
+        assert compactor.stats["discarded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_summary_leaves_history_unchanged(self):
+        llm = AsyncMock()
+        llm.complete.return_value = {"success": False, "error": "rate limited"}
+        compactor = compactor_for(llm)
+        messages = history(5)
+        compactor.start(messages)
+
+        assert await compactor.wait(messages) is messages
+        assert compactor.stats["failed"] == 1
+        assert not compactor.pending
+
+    @pytest.mark.asyncio
+    async def test_only_one_compaction_at_a_time(self):
+        compactor = compactor_for(slow_llm(delay=0.01))
+        messages = history(5)
+
+        assert compactor.start(messages) is True
+        assert compactor.start(messages) is False
+        await compactor.cancel()
+        assert not compactor.pending
+
+    def test_short_history_not_compacted(self):
+        compactor = compactor_for(slow_llm())
+
+        assert compactor.start(history(1)) is False
+
+
+class TestLeanAgentBackgroundCompaction:
+    """Tests for background compaction in the LeanAgent loop."""
+
+    def _agent(self, llm, **kwargs) -> LeanAgent:
+        state_manager = AsyncMock()
+        state_manager.load_state.return_value = {}
+        tool = MagicMock()
+        tool.name = "file_read"
+        tool.description = "Read a file"
+        tool.parameters_schema = {"type": "object", "properties": {}}
+        tool.execute = AsyncMock(return_value={"success": True, "output": "x"})
+        return LeanAgent(
+            state_manager=state_manager,
+            llm_provider=llm,
+            tools=[tool],
+            system_prompt="Test",
+            background_compaction=True,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_soft_threshold_does_not_block_reasoning_call(self):
+        summary_started = asyncio.Event()
+        release_summary = asyncio.Event()
+        reasoning_models: list[str] = []
+
+        async def complete(**kwargs):
+            if kwargs["model"] == "fast":
+                summary_started.set()
+                await release_summary.wait()
+                return {"success": True, "content": "Summary"}
+            reasoning_models.append(kwargs["model"])
+            await asyncio.sleep(0)  # Network I/O lets the background summary run
+            if len(reasoning_models) == 1:
+                # Summary is running while this reasoning call goes out
+                assert summary_started.is_set()
+                release_summary.set()
+            if len(reasoning_models) <= 2:
+                call_id = f"r{len(reasoning_models)}"
+                return {
+                    "success": True,
+                    "tool_calls": [
+                        {
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": "file_read", "arguments": json.dumps({})},
+                        }
+                    ],
+                }
+            return {"success": True, "content": "Done", "tool_calls": None}
+
+        llm = AsyncMock()
+        llm.complete.side_effect = complete
+        agent = self._agent(llm)
+        agent.SUMMARY_THRESHOLD = 4
+        agent._build_initial_messages = MagicMock(return_value=history(8))
+
+        result = await agent.execute("Mission", "s1")
+
+        assert result.status == "completed"
+        assert reasoning_models == ["main", "main", "main"]
+        final_messages = [
+            c.kwargs["messages"] for c in llm.complete.call_args_list if c.kwargs["model"] == "main"
+        ][-1]
+        assert final_messages[1]["content"] == "Mission"
+        assert final_messages[2]["content"].startswith(SUMMARY_PREFIX)
+
+    @pytest.mark.asyncio
+    async def test_hard_limit_falls_back_to_deterministic(self):
+        llm = AsyncMock()
+        llm.complete.return_value = {"success": True, "content": "Done", "tool_calls": None}
+        agent = self._agent(llm, max_input_tokens=2000, compression_trigger=1000)
+        big = history(12)
+        for message in big:
+            if message["role"] == "tool":
+                message["content"] = "y" * 400
+        agent._build_initial_messages = MagicMock(return_value=big)
+
+        await agent.execute("Mission", "s1")
+
+        sent = llm.complete.call_args_list[0].kwargs["messages"]
+        assert len(sent) == 13
+        assert sent[1]["content"] == "Mission"
+        assert "compressed for token budget" in sent[2]["content"]
+        assert sent[3]["role"] == "assistant"
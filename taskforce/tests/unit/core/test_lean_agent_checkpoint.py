@@ -0,0 +1,271 @@
+"""
+Unit Tests for LeanAgent Checkpointing and Resume
+
+Tests the write-behind CheckpointWriter and that LeanAgent checkpoints each
+completed tool turn (also when streaming) and resumes interrupted missions
+from the last checkpoint when they are re-run, instead of restarting them.
+"""
+
+import asyncio
+import copy
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.checkpoint import CHECKPOINT_KEY, CheckpointWriter
+from taskforce.core.domain.lean_agent import LeanAgent
+
+
+class InMemoryStateManager:
+    """Minimal StateManagerProtocol implementation recording every save."""
+
+    def __init__(self, delay: float = 0.0):
+        self.states: dict[str, dict] = {}
+        self.saves: list[dict] = []
+        self.delay = delay
+
+    async def save_state(self, session_id: str, state_data: dict) -> bool:
+        await asyncio.sleep(self.delay)
+        snapshot = copy.deepcopy(state_data)
+        self.saves.append(snapshot)
+        self.states[session_id] = snapshot
+        return True
+
+    async def load_state(self, session_id: str) -> dict | None:
+        return copy.deepcopy(self.states.get(session_id, {}))
+
+    async def delete_state(self, session_id: str) -> None:
+        self.states.pop(session_id, None)
+
+    async def list_sessions(self) -> list[str]:
+        return list(self.states)
+
+
+@pytest.fixture
+def mock_tool():
+    """Mock ToolProtocol for a generic tool."""
+    tool = MagicMock()
+    tool.name = "test_tool"
+    tool.description = "A test tool for unit tests"
+    tool.parameters_schema = {
+        "type": "object",
+        "properties": {"param": {"type": "string"}},
+    }
+    tool.execute = AsyncMock(return_value={"success": True, "output": "test result"})
+    return tool
+
+
+def make_tool_call(tool_name: str, args: dict, call_id: str = "call_1"):
+    """Helper to create a tool call response structure."""
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {
+            "name": tool_name,
+            "arguments": json.dumps(args),
+        },
+    }
+
+
+def tool_turn(call_id: str) -> dict:
+    return {
+        "success": True,
+        "content": None,
+        "tool_calls": [make_tool_call("test_tool", {"param": call_id}, call_id)],
+    }
+
+
+class TestCheckpointWriter:
+    """Tests for the write-behind checkpoint writer."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_does_not_block_and_flush_persists(self):
+        state_manager = InMemoryStateManager(delay=0.01)
+        writer = CheckpointWriter(state_manager, "s1")
+
+        writer.schedule({"n": 1})
+        assert state_manager.saves == []
+
+        await writer.flush()
+        assert state_manager.saves == [{"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_snapshots_coalesce_while_write_in_flight(self):
+        state_manager = InMemoryStateManager(delay=0.01)
+        writer = CheckpointWriter(state_manager, "s1")
+
+        writer.schedule({"n": 1})
+        await asyncio.sleep(0)  # first write starts
+        writer.schedule({"n": 2})
+        writer.schedule({"n": 3})
+        await writer.flush()
+
+        assert state_manager.saves == [{"n": 1}, {"n": 3}]
+        assert writer.stats == {"writes": 2, "coalesced": 1}
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_swallowed(self):
+        state_manager = AsyncMock()
+        state_manager.save_state.side_effect = OSError("disk full")
+        writer = CheckpointWriter(state_manager, "s1")
+
+        writer.schedule({"n": 1})
+        await writer.flush()
+
+        assert writer.stats["writes"] == 0
+
+
+class TestLeanAgentCheckpointing:
+    """Tests for checkpointing and resume in LeanAgent."""
+
+    def _agent(self, state_manager, llm_provider, tool, **kwargs) -> LeanAgent:
+        return LeanAgent(
+            state_manager=state_manager,
+            llm_provider=llm_provider,
+            tools=[tool],
+            system_prompt="Test",
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_after_each_tool_turn(self, mock_tool):
+        state_manager = InMemoryStateManager()
+        llm = AsyncMock()
+        llm.complete.side_effect = [
+            tool_turn("call_1"),
+            tool_turn("call_2"),
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+        agent = self._agent(state_manager, llm, mock_tool, enable_checkpoints=True)
+
+        result = await agent.execute("Mission", "s1")
+
+        assert result.status == "completed"
+        checkpoints = [s[CHECKPOINT_KEY] for s in state_manager.saves if CHECKPOINT_KEY in s]
+        # Turns completed before the writer ran are coalesced into the latest one
+        assert checkpoints[-1]["step"] == 2
+        assert checkpoints[-1]["messages"][-1]["tool_call_id"] == "call_2"
+        # Finished mission leaves no checkpoint behind
+        assert CHECKPOINT_KEY not in state_manager.states["s1"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, mock_tool):
+        state_manager = InMemoryStateManager()
+        llm = AsyncMock()
+        llm.complete.side_effect = [
+            tool_turn("call_1"),
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+        agent = self._agent(state_manager, llm, mock_tool)
+
+        await agent.execute("Mission", "s1")
+
+        assert len(state_manager.saves) == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_after_crash_continues_from_last_turn(self, mock_tool):
+        state_manager = InMemoryStateManager()
+        llm = AsyncMock()
+        llm.complete.side_effect = [
+            tool_turn("call_1"),
+            tool_turn("call_2"),
+            RuntimeError("worker killed"),
+        ]
+        agent = self._agent(state_manager, llm, mock_tool, enable_checkpoints=True)
+
+        with pytest.raises(RuntimeError):
+            await agent.execute("Mission", "s1")
+        await asyncio.sleep(0.01)  # let the write-behind task finish
+        assert state_manager.states["s1"][CHECKPOINT_KEY]["step"] == 2
+
+        # Fresh agent (e.g. after redeploy) resumes when the mission is re-run
+        mock_tool.execute.reset_mock()
+        resumed_llm = AsyncMock()
+        resumed_llm.complete.return_value = {
+            "success": True,
+            "content": "Done",
+            "tool_calls": None,
+        }
+        resumed = self._agent(state_manager, resumed_llm, mock_tool, enable_checkpoints=True)
+
+        result = await resumed.execute("Mission", "s1")
+
+        assert result.status == "completed"
+        assert result.final_message == "Done"
+        mock_tool.execute.assert_not_called()
+        assert [h["step"] for h in result.execution_history] == [1, 2, 3]
+
+        sent = resumed_llm.complete.call_args.kwargs["messages"]
+        assert [m.get("tool_call_id") for m in sent if m["role"] == "tool"] == [
+            "call_1",
+            "call_2",
+        ]
+        assert CHECKPOINT_KEY not in state_manager.states["s1"]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_of_other_mission_is_ignored(self, mock_tool):
+        state_manager = InMemoryStateManager()
+        state_manager.states["s1"] = {
+            CHECKPOINT_KEY: {"mission": "Old mission", "step": 5, "messages": []}
+        }
+        llm = AsyncMock()
+        llm.complete.return_value = {"success": True, "content": "Done", "tool_calls": None}
+        agent = self._agent(state_manager, llm, mock_tool, enable_checkpoints=True)
+
+        result = await agent.execute("New mission", "s1")
+
+        assert [h["step"] for h in result.execution_history] == [1]
+        assert CHECKPOINT_KEY not in state_manager.states["s1"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_checkpoint_keeps_execution_history(self, mock_tool):
+        state_manager = InMemoryStateManager()
+        turns = [
+            [
+                {"type": "tool_call_start", "id": f"call_{i}", "name": "test_tool", "index": 0},
+                {
+                    "type": "tool_call_end",
+                    "id": f"call_{i}",
+                    "name": "test_tool",
+                    "arguments": json.dumps({"param": str(i)}),
+                    "index": 0,
+                },
+            ]
+            for i in (1, 2)
+        ]
+
+        async def stream(**kwargs):
+            if not turns:
+                raise RuntimeError("worker killed")
+            for chunk in turns.pop(0):
+                yield chunk
+
+        llm = MagicMock()
+        llm.complete_stream = stream
+        agent = self._agent(state_manager, llm, mock_tool, enable_checkpoints=True)
+
+        async for event in agent.execute_stream("Mission", "s1"):
+            if event.event_type == "error":
+                break
+        await asyncio.sleep(0.01)  # let the write-behind task finish
+
+        checkpoint = state_manager.states["s1"][CHECKPOINT_KEY]
+        assert checkpoint["step"] == 2
+        assert [(h["step"], h["args"]) for h in checkpoint["execution_history"]] == [
+            (1, {"param": "1"}),
+            (2, {"param": "2"}),
+        ]
+
+        # Resuming with execute() continues the streamed mission's history
+        resumed_llm = AsyncMock()
+        resumed_llm.complete.return_value = {"success": True, "content": "Done", "tool_calls": None}
+        resumed = self._agent(state_manager, resumed_llm, mock_tool, enable_checkpoints=True)
+
+        result = await resumed.execute("Mission", "s1")
+
+        assert [h["type"] for h in result.execution_history] == [
+            "tool_call",
+            "tool_call",
+            "final_answer",
+        ]
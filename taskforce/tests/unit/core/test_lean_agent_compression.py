@@ -93,10 +93,13 @@ async def test_compression_with_llm_summary(lean_agent, mock_llm_provider):
     assert "[Previous Context Summary]" in result[1]["content"]
     assert "Summary: User asked 25 questions" in result[1]["content"]
 
-    # Verify recent messages preserved (after threshold)
-    # Should have: system + summary + messages after threshold
-    expected_count = 1 + 1 + (len(messages) - lean_agent.SUMMARY_THRESHOLD)
-    assert len(result) == expected_count
+    # Verify recent messages preserved and everything else summarized
+    # Should have: system + summary + 10 recent messages
+    assert result[2:] == messages[-10:]
+    prompt = call_args[1]["messages"][0]["content"]
+    assert "User message 0" in prompt
+    assert "Response 19" in prompt  # Last dropped message is part of the summary
+    assert "Response 20" not in prompt
 
 
 @pytest.mark.asyncio
@@ -255,3 +258,97 @@ async def test_compression_uses_correct_model(lean_agent, mock_llm_provider):
     assert call_args[1]["model"] == "custom-model"
     assert call_args[1]["temperature"] == 0  # Should use 0 for deterministic
 
+
+
+def tool_turn_history(turns: int, calls_per_turn: int = 2) -> list[dict]:
+    """System prompt, mission and `turns` assistant turns with several tool results each."""
+    messages = [
+        {"role": "system", "content": "System prompt"},
+        {"role": "user", "content": "Mission"},
+    ]
+    for i in range(turns):
+        call_ids = [f"call_{i}_{j}" for j in range(calls_per_turn)]
+        messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": "file_read", "arguments": "{}"},
+                    }
+                    for call_id in call_ids
+                ],
+            }
+        )
+        for call_id in call_ids:
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": call_id,
+                    "name": "file_read",
+                    "content": json.dumps({"success": True, "output": f"out {call_id}"}),
+                }
+            )
+    return messages
+
+
+def assert_tool_messages_have_parents(messages: list[dict]) -> None:
+    """Every tool message must follow the assistant message that requested it."""
+    open_calls: set[str] = set()
+    for message in messages:
+        if message["role"] == "assistant" and message.get("tool_calls"):
+            open_calls = {tc["id"] for tc in message["tool_calls"]}
+        elif message["role"] == "tool":
+            assert message["tool_call_id"] in open_calls, message["tool_call_id"]
+        else:
+            open_calls = set()
+
+
+@pytest.mark.asyncio
+async def test_compression_keeps_tool_groups_and_mission(lean_agent, mock_llm_provider):
+    """Summary, deterministic and emergency truncation never orphan tool messages."""
+    messages = tool_turn_history(8)  # 26 messages, recent 10 start inside a group
+    mock_llm_provider.complete.return_value = {"success": True, "content": "Summary"}
+
+    summarized = await lean_agent._compress_messages(messages)
+    deterministic = lean_agent._deterministic_compression(messages)
+    lean_agent.token_budgeter.max_input_tokens = 100  # Force emergency truncation
+    truncated = await lean_agent._preflight_budget_check(messages)
+
+    for result in (summarized, deterministic, truncated):
+        assert result[1]["content"] == "Mission"
+        assert_tool_messages_have_parents(result)
+        assert len(result) < len(messages)
+
+    # The summary covers exactly the dropped span: turns 0-3, turns 4-7 are kept
+    # (the last 10 messages start inside turn 4)
+    prompt = mock_llm_provider.complete.call_args.kwargs["messages"][0]["content"]
+    assert "out call_3_1" in prompt
+    assert "out call_4_0" not in prompt
+    assert summarized[3:] == messages[14:]
+
+
+@pytest.mark.asyncio
+async def test_llm_summary_is_default_and_can_be_disabled(
+    mock_state_manager, mock_llm_provider
+):
+    """Without a compactor, long histories are summarized unless summarize_history=False."""
+    messages = tool_turn_history(8)
+
+    agent = LeanAgent(
+        state_manager=mock_state_manager,
+        llm_provider=mock_llm_provider,
+        tools=[],
+        summarize_history=False,
+    )
+    assert await agent._compact_history(messages, None, None) is messages
+    assert not mock_llm_provider.complete.called
+
+    mock_llm_provider.complete.return_value = {"success": True, "content": "Summary"}
+    agent = LeanAgent(
+        state_manager=mock_state_manager, llm_provider=mock_llm_provider, tools=[]
+    )
+    compacted = await agent._compact_history(messages, None, None)
+    assert compacted[2]["content"].startswith("[Previous Context Summary]")
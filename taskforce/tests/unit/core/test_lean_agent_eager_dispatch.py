@@ -0,0 +1,187 @@
+"""
+Unit Tests for LeanAgent Eager Tool Dispatch
+
+Tests that execute_stream() starts parallel-safe tools as soon as their
+tool_call_end arrives (while the LLM is still streaming), keeps results in
+call order, treats write tools as barriers and cancels in-flight tools when
+the stream fails or the consumer closes the stream.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+
+
+def make_tool(name: str, parallel: bool, events: list[str]) -> MagicMock:
+    """Create a mock tool that records when it starts and finishes."""
+    tool = MagicMock()
+    tool.name = name
+    tool.description = f"{name} tool"
+    tool.parameters_schema = {"type": "object", "properties": {"path": {"type": "string"}}}
+    tool.supports_parallelism = parallel
+
+    async def execute(**kwargs):
+        events.append(f"{name}:{kwargs.get('path')}:start")
+        await asyncio.sleep(0.01)
+        events.append(f"{name}:{kwargs.get('path')}:end")
+        return {"success": True, "output": f"{name} {kwargs.get('path')}"}
+
+    tool.execute = AsyncMock(side_effect=execute)
+    return tool
+
+
+def tool_call_events(index: int, call_id: str, name: str, args: dict) -> list[dict]:
+    """Stream chunks for one complete tool call."""
+    arguments = json.dumps(args)
+    return [
+        {"type": "tool_call_start", "id": call_id, "name": name, "index": index},
+        {"type": "tool_call_delta", "id": call_id, "arguments_delta": arguments, "index": index},
+        {
+            "type": "tool_call_end",
+            "id": call_id,
+            "name": name,
+            "arguments": arguments,
+            "index": index,
+        },
+    ]
+
+
+def recorded_stream(turns: list[list[dict]], events: list[str]):
+    """Build a complete_stream mock replaying one chunk list per call."""
+    remaining = list(turns)
+
+    async def stream(**kwargs):
+        for chunk in remaining.pop(0):
+            events.append(f"llm:{chunk['type']}")
+            await asyncio.sleep(0)
+            yield chunk
+
+    return stream
+
+
+FINAL_TURN = [{"type": "token", "content": "Done"}, {"type": "done", "usage": {}}]
+
+
+@pytest.fixture
+def mock_state_manager():
+    """Mock StateManagerProtocol."""
+    mock = AsyncMock()
+    mock.load_state.return_value = {"answers": {}}
+    mock.save_state.return_value = True
+    return mock
+
+
+def make_agent(state_manager, tools, turns, events, eager: bool = True) -> LeanAgent:
+    llm = MagicMock()
+    llm.complete_stream = recorded_stream(turns, events)
+    return LeanAgent(
+        state_manager=state_manager,
+        llm_provider=llm,
+        tools=tools,
+        system_prompt="Test",
+        eager_tool_dispatch=eager,
+    )
+
+
+async def collect(agent: LeanAgent) -> list:
+    return [event async for event in agent.execute_stream("Mission", "s1")]
+
+
+class TestEagerToolDispatch:
+    """Tests for eager dispatch of read-only tools during streaming."""
+
+    @pytest.mark.asyncio
+    async def test_read_tool_starts_before_stream_ends(self, mock_state_manager):
+        events: list[str] = []
+        read = make_tool("file_read", True, events)
+        turn = [
+            *tool_call_events(0, "c1", "file_read", {"path": "a"}),
+            *tool_call_events(1, "c2", "file_read", {"path": "b"}),
+            {"type": "done", "usage": {}},
+        ]
+        agent = make_agent(mock_state_manager, [read], [turn, FINAL_TURN], events)
+
+        stream_events = await collect(agent)
+
+        assert events.index("file_read:a:start") < events.index("llm:done")
+        # Both reads overlap instead of running one after the other
+        assert events.index("file_read:b:start") < events.index("file_read:a:end")
+        results = [e.data["id"] for e in stream_events if e.event_type == "tool_result"]
+        assert results == ["c1", "c2"]
+        assert read.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_tool_is_barrier(self, mock_state_manager):
+        events: list[str] = []
+        read = make_tool("file_read", True, events)
+        write = make_tool("file_write", False, events)
+        turn = [
+            *tool_call_events(0, "c1", "file_write", {"path": "a"}),
+            *tool_call_events(1, "c2", "file_read", {"path": "a"}),
+            {"type": "done", "usage": {}},
+        ]
+        agent = make_agent(mock_state_manager, [read, write], [turn, FINAL_TURN], events)
+
+        stream_events = await collect(agent)
+
+        # Neither the write nor the read behind it runs before the stream ends
+        assert events.index("file_write:a:start") > events.index("llm:done")
+        assert events.index("file_read:a:start") > events.index("file_write:a:end")
+        results = [e.data["id"] for e in stream_events if e.event_type == "tool_result"]
+        assert results == ["c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_waits_for_stream_end(self, mock_state_manager):
+        events: list[str] = []
+        read = make_tool("file_read", True, events)
+        turn = [
+            *tool_call_events(0, "c1", "file_read", {"path": "a"}),
+            {"type": "done", "usage": {}},
+        ]
+        agent = make_agent(mock_state_manager, [read], [turn, FINAL_TURN], events, eager=False)
+
+        await collect(agent)
+
+        assert events.index("file_read:a:start") > events.index("llm:done")
+
+    @pytest.mark.asyncio
+    async def test_stream_error_cancels_in_flight_tools(self, mock_state_manager):
+        events: list[str] = []
+        read = make_tool("file_read", True, events)
+        failed_turn = [
+            *tool_call_events(0, "c1", "file_read", {"path": "a"}),
+            {"type": "error", "message": "connection reset"},
+        ]
+        agent = make_agent(mock_state_manager, [read], [failed_turn, FINAL_TURN], events)
+
+        stream_events = await collect(agent)
+
+        assert "file_read:a:start" in events
+        assert "file_read:a:end" not in events
+        assert not [e for e in stream_events if e.event_type == "tool_result"]
+        assert stream_events[-1].event_type == "final_answer"
+
+    @pytest.mark.asyncio
+    async def test_consumer_disconnect_cancels_in_flight_tools(self, mock_state_manager):
+        events: list[str] = []
+        read = make_tool("file_read", True, events)
+        turn = [
+            *tool_call_events(0, "c1", "file_read", {"path": "a"}),
+            {"type": "token", "content": "still streaming"},
+            {"type": "done", "usage": {}},
+        ]
+        agent = make_agent(mock_state_manager, [read], [turn], events)
+
+        stream = agent.execute_stream("Mission", "s1")
+        async for event in stream:
+            if event.event_type == "llm_token":
+                break  # Client disconnects while the eager tool is running
+        await stream.aclose()
+        await asyncio.sleep(0.02)
+
+        assert "file_read:a:start" in events
+        assert "file_read:a:end" not in events
@@ -0,0 +1,306 @@
+"""
+Unit Tests for LeanAgent Parallel Tool Dispatch
+
+Tests that parallel-safe tool calls requested in one LLM turn run
+concurrently (bounded by max_parallel_tools), that non-parallel-safe tools
+act as barriers, and that tool messages keep the original call order.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+
+
+@pytest.fixture
+def mock_state_manager():
+    """Mock StateManagerProtocol."""
+    mock = AsyncMock()
+    mock.load_state.return_value = {"answers": {}}
+    mock.save_state.return_value = True
+    return mock
+
+
+@pytest.fixture
+def mock_llm_provider():
+    """Mock LLMProviderProtocol with native tool calling support."""
+    return AsyncMock()
+
+
+class ConcurrencyProbe:
+    """Tracks how many tool executions overlap and in which order they run."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.events: list[str] = []
+
+    def make_tool(self, name: str, parallel: bool, delay: float = 0.02):
+        tool = MagicMock()
+        tool.name = name
+        tool.description = f"{name} tool"
+        tool.parameters_schema = {
+            "type": "object",
+            "properties": {"param": {"type": "string"}},
+        }
+        tool.supports_parallelism = parallel
+
+        async def execute(**kwargs):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.events.append(f"start:{name}:{kwargs.get('param')}")
+            await asyncio.sleep(delay)
+            self.events.append(f"end:{name}:{kwargs.get('param')}")
+            self.active -= 1
+            return {"success": True, "output": f"{name}:{kwargs.get('param')}"}
+
+        tool.execute = execute
+        return tool
+
+
+def make_tool_call(tool_name: str, args: dict, call_id: str = "call_1"):
+    """Helper to create a tool call response structure."""
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {
+            "name": tool_name,
+            "arguments": json.dumps(args),
+        },
+    }
+
+
+def make_agent(state_manager, llm_provider, tools, **kwargs):
+    return LeanAgent(
+        state_manager=state_manager,
+        llm_provider=llm_provider,
+        tools=tools,
+        system_prompt="Test",
+        **kwargs,
+    )
+
+
+class TestToolCallBatching:
+    """Tests for grouping tool calls into dispatch batches."""
+
+    def test_sequential_by_default(self, mock_state_manager, mock_llm_provider):
+        probe = ConcurrencyProbe()
+        agent = make_agent(
+            mock_state_manager, mock_llm_provider, [probe.make_tool("read", True)]
+        )
+        calls = [make_tool_call("read", {}, f"c{i}") for i in range(3)]
+
+        assert agent._batch_tool_calls(calls) == [[c] for c in calls]
+
+    def test_write_tools_act_as_barrier(self, mock_state_manager, mock_llm_provider):
+        probe = ConcurrencyProbe()
+        agent = make_agent(
+            mock_state_manager,
+            mock_llm_provider,
+            [probe.make_tool("read", True), probe.make_tool("write", False)],
+            parallel_tool_calls=True,
+        )
+        calls = [
+            make_tool_call("read", {}, "c1"),
+            make_tool_call("read", {}, "c2"),
+            make_tool_call("write", {}, "c3"),
+            make_tool_call("read", {}, "c4"),
+        ]
+
+        batches = agent._batch_tool_calls(calls)
+
+        assert [[c["id"] for c in b] for b in batches] == [["c1", "c2"], ["c3"], ["c4"]]
+
+    def test_tools_without_explicit_flag_are_serialized(
+        self, mock_state_manager, mock_llm_provider
+    ):
+        """MagicMock attributes are truthy but must not opt a tool in."""
+        tool = MagicMock()
+        tool.name = "unknown"
+        tool.description = "Tool without parallelism flag"
+        tool.parameters_schema = {"type": "object", "properties": {}}
+        agent = make_agent(
+            mock_state_manager, mock_llm_provider, [tool], parallel_tool_calls=True
+        )
+        calls = [make_tool_call("unknown", {}, "c1"), make_tool_call("unknown", {}, "c2")]
+
+        assert len(agent._batch_tool_calls(calls)) == 2
+
+
+class TestParallelExecution:
+    """Tests for concurrent tool dispatch in execute()."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_calls_overlap_and_keep_order(
+        self, mock_state_manager, mock_llm_provider
+    ):
+        probe = ConcurrencyProbe()
+        agent = make_agent(
+            mock_state_manager,
+            mock_llm_provider,
+            [probe.make_tool("read", True)],
+            parallel_tool_calls=True,
+        )
+        mock_llm_provider.complete.side_effect = [
+            {
+                "success": True,
+                "content": None,
+                "tool_calls": [
+                    make_tool_call("read", {"param": str(i)}, f"call_{i}") for i in range(3)
+                ],
+            },
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+
+        result = await agent.execute(mission="Read", session_id="s1")
+
+        assert result.status == "completed"
+        assert probe.max_active == 3
+
+        # Tool messages sent to the LLM follow the original call order
+        second_call_messages = mock_llm_provider.complete.call_args_list[1].kwargs["messages"]
+        tool_messages = [m for m in second_call_messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1", "call_2"]
+
+        history_args = [
+            h["args"]["param"] for h in result.execution_history if h["type"] == "tool_call"
+        ]
+        assert history_args == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_is_respected(
+        self, mock_state_manager, mock_llm_provider
+    ):
+        probe = ConcurrencyProbe()
+        agent = make_agent(
+            mock_state_manager,
+            mock_llm_provider,
+            [probe.make_tool("read", True)],
+            parallel_tool_calls=True,
+            max_parallel_tools=2,
+        )
+        mock_llm_provider.complete.side_effect = [
+            {
+                "success": True,
+                "content": None,
+                "tool_calls": [
+                    make_tool_call("read", {"param": str(i)}, f"call_{i}") for i in range(5)
+                ],
+            },
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+
+        await agent.execute(mission="Read", session_id="s1")
+
+        assert probe.max_active == 2
+        assert len([e for e in probe.events if e.startswith("end:")]) == 5
+
+    @pytest.mark.asyncio
+    async def test_write_tool_never_overlaps(self, mock_state_manager, mock_llm_provider):
+        probe = ConcurrencyProbe()
+        agent = make_agent(
+            mock_state_manager,
+            mock_llm_provider,
+            [probe.make_tool("read", True), probe.make_tool("write", False)],
+            parallel_tool_calls=True,
+        )
+        mock_llm_provider.complete.side_effect = [
+            {
+                "success": True,
+                "content": None,
+                "tool_calls": [
+                    make_tool_call("read", {"param": "a"}, "call_1"),
+                    make_tool_call("write", {"param": "b"}, "call_2"),
+                    make_tool_call("read", {"param": "c"}, "call_3"),
+                ],
+            },
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+
+        await agent.execute(mission="Read and write", session_id="s1")
+
+        assert probe.events == [
+            "start:read:a",
+            "end:read:a",
+            "start:write:b",
+            "end:write:b",
+            "start:read:c",
+            "end:read:c",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failing_tool_does_not_cancel_siblings(
+        self, mock_state_manager, mock_llm_provider
+    ):
+        probe = ConcurrencyProbe()
+        failing = probe.make_tool("broken", True)
+        failing.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        agent = make_agent(
+            mock_state_manager,
+            mock_llm_provider,
+            [probe.make_tool("read", True), failing],
+            parallel_tool_calls=True,
+        )
+        mock_llm_provider.complete.side_effect = [
+            {
+                "success": True,
+                "content": None,
+                "tool_calls": [
+                    make_tool_call("broken", {}, "call_1"),
+                    make_tool_call("read", {"param": "x"}, "call_2"),
+                ],
+            },
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+
+        result = await agent.execute(mission="Read", session_id="s1")
+
+        results = [h["result"] for h in result.execution_history if h["type"] == "tool_call"]
+        assert results[0]["success"] is False
+        assert results[1] == {"success": True, "output": "read:x"}
+
+
+class TestParallelStreaming:
+    """Tests for concurrent tool dispatch in execute_stream()."""
+
+    @pytest.mark.asyncio
+    async def test_stream_tool_results_keep_call_order(
+        self, mock_state_manager, mock_llm_provider
+    ):
+        probe = ConcurrencyProbe()
+        # Later calls finish first to prove results are re-ordered
+        tools = [probe.make_tool(f"read_{i}", True, delay=0.03 - i * 0.01) for i in range(3)]
+        agent = make_agent(
+            mock_state_manager, mock_llm_provider, tools, parallel_tool_calls=True
+        )
+        call_count = 0
+
+        async def stream(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                for i in range(3):
+                    args_json = json.dumps({"param": str(i)})
+                    yield {"type": "tool_call_start", "id": f"c{i}", "name": f"read_{i}", "index": i}
+                    yield {
+                        "type": "tool_call_end",
+                        "id": f"c{i}",
+                        "name": f"read_{i}",
+                        "arguments": args_json,
+                        "index": i,
+                    }
+                yield {"type": "done", "usage": {"total_tokens": 15}}
+            else:
+                yield {"type": "token", "content": "Done"}
+                yield {"type": "done", "usage": {"total_tokens": 5}}
+
+        mock_llm_provider.complete_stream = stream
+
+        events = [e async for e in agent.execute_stream("Read", "s1")]
+
+        result_ids = [e.data["id"] for e in events if e.event_type == "tool_result"]
+        assert result_ids == ["c0", "c1", "c2"]
+        assert probe.max_active == 3
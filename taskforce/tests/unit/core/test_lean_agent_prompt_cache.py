@@ -0,0 +1,160 @@
+"""
+Unit Tests for the LeanAgent Prompt-Cache Layout
+
+Tests that prompt_cache_layout keeps the system prompt and tool schemas
+byte-stable across a mission, sends plan status and context pack as a
+trailing message that is not stored in the history, and reports cached
+prompt tokens.
+"""
+
+import json
+from itertools import pairwise
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+from taskforce.core.tools.planner_tool import PlannerTool
+
+
+@pytest.fixture
+def mock_state_manager():
+    """Mock StateManagerProtocol."""
+    mock = AsyncMock()
+    mock.load_state.return_value = {"answers": {}}
+    mock.save_state.return_value = True
+    return mock
+
+
+@pytest.fixture
+def mock_tool():
+    """Mock ToolProtocol for a generic tool."""
+    tool = MagicMock()
+    tool.name = "test_tool"
+    tool.description = "A test tool for unit tests"
+    tool.parameters_schema = {"type": "object", "properties": {"param": {"type": "string"}}}
+    tool.execute = AsyncMock(return_value={"success": True, "output": "test result"})
+    return tool
+
+
+def make_tool_call(tool_name: str, args: dict, call_id: str) -> dict:
+    """Helper to create a tool call response structure."""
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": tool_name, "arguments": json.dumps(args)},
+    }
+
+
+def llm_turns() -> list[dict]:
+    """Create a plan, call a tool, then answer."""
+    return [
+        {
+            "success": True,
+            "tool_calls": [
+                make_tool_call("planner", {"action": "create_plan", "tasks": ["Step A"]}, "c1")
+            ],
+            "usage": {"prompt_tokens": 1000, "cached_tokens": 0},
+        },
+        {
+            "success": True,
+            "tool_calls": [make_tool_call("test_tool", {"param": "x"}, "c2")],
+            "usage": {"prompt_tokens": 1100, "cached_tokens": 1024},
+        },
+        {
+            "success": True,
+            "content": "Done",
+            "tool_calls": None,
+            "usage": {"prompt_tokens": 1200, "cached_tokens": 1024},
+        },
+    ]
+
+
+def sent_messages(llm: AsyncMock) -> list[list[dict]]:
+    """Deep copies of the message lists passed to each complete() call."""
+    return [json.loads(json.dumps(call.kwargs["messages"])) for call in llm.complete.call_args_list]
+
+
+class TestPromptCacheLayout:
+    """Tests for the stable-prefix prompt layout."""
+
+    def _agent(self, state_manager, llm, tool, **kwargs) -> LeanAgent:
+        return LeanAgent(
+            state_manager=state_manager,
+            llm_provider=llm,
+            tools=[tool, PlannerTool()],
+            system_prompt="Base prompt",
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_and_tools_are_stable(self, mock_state_manager, mock_tool):
+        llm = AsyncMock()
+        captured: list[list[dict]] = []
+        tools_sent: list[str] = []
+
+        async def complete(**kwargs):
+            captured.append(json.loads(json.dumps(kwargs["messages"])))
+            tools_sent.append(json.dumps(kwargs["tools"]))
+            return turns.pop(0)
+
+        turns = llm_turns()
+        llm.complete.side_effect = complete
+        agent = self._agent(mock_state_manager, llm, mock_tool, prompt_cache_layout=True)
+
+        result = await agent.execute("Mission", "s1")
+
+        assert result.status == "completed"
+        assert {msgs[0]["content"] for msgs in captured} == {"Base prompt"}
+        assert len(set(tools_sent)) == 1
+
+        # Each request extends the previous one (minus its trailing context)
+        for previous, current in pairwise(captured):
+            assert current[: len(previous) - 1] == previous[:-1]
+
+        # Dynamic context comes last and carries the current plan
+        assert captured[1][-1]["role"] == "system"
+        assert "CURRENT PLAN STATUS" in captured[1][-1]["content"]
+        assert "CURRENT PLAN STATUS" not in captured[0][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_dynamic_context_not_stored_in_history(self, mock_state_manager, mock_tool):
+        llm = AsyncMock()
+        llm.complete.side_effect = llm_turns()
+        agent = self._agent(mock_state_manager, llm, mock_tool, prompt_cache_layout=True)
+
+        await agent.execute("Mission", "s1")
+
+        # Earlier turns' dynamic context is not carried over
+        last = sent_messages(llm)[-1]
+        trailing = [m for m in last[1:] if m["role"] == "system"]
+        assert trailing == [last[-1]]
+
+    @pytest.mark.asyncio
+    async def test_default_layout_embeds_plan_in_system_prompt(
+        self, mock_state_manager, mock_tool
+    ):
+        llm = AsyncMock()
+        llm.complete.side_effect = llm_turns()
+        agent = self._agent(mock_state_manager, llm, mock_tool)
+
+        await agent.execute("Mission", "s1")
+
+        calls = sent_messages(llm)
+        assert "CURRENT PLAN STATUS" in calls[1][0]["content"]
+        assert all(m["role"] != "system" for m in calls[1][1:])
+
+    @pytest.mark.asyncio
+    async def test_cached_tokens_logged(self, mock_state_manager, mock_tool):
+        llm = AsyncMock()
+        llm.complete.side_effect = llm_turns()
+        agent = self._agent(mock_state_manager, llm, mock_tool, prompt_cache_layout=True)
+        agent.logger = MagicMock()
+
+        await agent.execute("Mission", "s1")
+
+        complete_logs = [
+            c.kwargs for c in agent.logger.info.call_args_list if c.args[0] == "execute_complete"
+        ]
+        assert complete_logs[0]["prompt_tokens"] == 3300
+        assert complete_logs[0]["cached_tokens"] == 2048
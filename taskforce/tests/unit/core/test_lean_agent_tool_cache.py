@@ -0,0 +1,298 @@
+"""
+Unit Tests for LeanAgent Tool Result Memoization
+
+Tests that repeated identical calls of cacheable tools are served from the
+session-scoped ToolResultCache, that mutating tools invalidate the entries
+of their cache_resource (and nothing else), that hit/miss stats are reported in ExecutionResult, and that
+identical in-flight calls across agents share one execution.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+from taskforce.infrastructure.cache.single_flight import ToolCallCoalescer
+from taskforce.infrastructure.cache.tool_cache import ToolResultCache
+
+
+@pytest.fixture
+def mock_state_manager():
+    """Mock StateManagerProtocol."""
+    mock = AsyncMock()
+    mock.load_state.return_value = {"answers": {}}
+    mock.save_state.return_value = True
+    return mock
+
+
+def make_tool(
+    name: str, cacheable: bool, resource: str | None = None, mutates: bool = False
+) -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    tool.description = f"{name} tool"
+    tool.parameters_schema = {"type": "object", "properties": {"path": {"type": "string"}}}
+    tool.cacheable = cacheable
+    tool.cache_resource = resource
+    tool.mutates = mutates
+    tool.execute = AsyncMock(return_value={"success": True, "output": f"{name} result"})
+    return tool
+
+
+def tool_turn(name: str, args: dict, call_id: str) -> dict:
+    return {
+        "success": True,
+        "tool_calls": [
+            {
+                "id": call_id,
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(args)},
+            }
+        ],
+    }
+
+
+FINAL = {"success": True, "content": "Done", "tool_calls": None}
+
+
+def make_agent(state_manager, tools, turns, tool_cache=None) -> LeanAgent:
+    llm = AsyncMock()
+    llm.complete.side_effect = turns
+    return LeanAgent(
+        state_manager=state_manager,
+        llm_provider=llm,
+        tools=tools,
+        system_prompt="Test",
+        tool_cache=tool_cache,
+    )
+
+
+class TestLeanAgentToolCache:
+    """Tests for session-scoped tool memoization."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_served_from_cache(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True)
+        agent = make_agent(
+            mock_state_manager,
+            [read],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("file_read", {"path": "a.txt"}, "c2"),
+                FINAL,
+            ],
+            tool_cache=ToolResultCache(),
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        read.execute.assert_awaited_once()
+        assert result.tool_cache_stats == {
+            "hits": 1,
+            "misses": 1,
+            "invalidations": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "bytes_evicted": 0,
+            "rejected": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_read_of_same_path(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True, resource="filesystem")
+        write = make_tool("file_write", cacheable=False, resource="filesystem", mutates=True)
+        agent = make_agent(
+            mock_state_manager,
+            [read, write],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("file_write", {"path": "a.txt", "content": "new"}, "c2"),
+                tool_turn("file_read", {"path": "a.txt"}, "c3"),
+                FINAL,
+            ],
+            tool_cache=ToolResultCache(),
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        assert read.execute.await_count == 2
+        write.execute.assert_awaited_once()
+        assert result.tool_cache_stats == {
+            "hits": 0,
+            "misses": 2,
+            "invalidations": 1,
+            "evictions": 0,
+            "expirations": 0,
+            "bytes_evicted": 0,
+            "rejected": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_shell_invalidates_reads_without_shared_arguments(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True, resource="filesystem")
+        search = make_tool("web_search", cacheable=True, resource="web")
+        shell = make_tool("shell", cacheable=False, resource="filesystem", mutates=True)
+        agent = make_agent(
+            mock_state_manager,
+            [read, search, shell],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("web_search", {"query": "news"}, "c2"),
+                tool_turn("shell", {"command": "echo new > a.txt"}, "c3"),
+                tool_turn("file_read", {"path": "a.txt"}, "c4"),
+                tool_turn("web_search", {"query": "news"}, "c5"),
+                FINAL,
+            ],
+            tool_cache=ToolResultCache(),
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        assert read.execute.await_count == 2
+        search.execute.assert_awaited_once()
+        assert result.tool_cache_stats["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_mutating_tools_keep_cached_results(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True, resource="filesystem")
+        planner = make_tool("planner", cacheable=False)
+        agent = make_agent(
+            mock_state_manager,
+            [read, planner],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("planner", {"action": "update", "path": "a.txt"}, "c2"),
+                tool_turn("file_read", {"path": "a.txt"}, "c3"),
+                FINAL,
+            ],
+            tool_cache=ToolResultCache(),
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        read.execute.assert_awaited_once()
+        assert result.tool_cache_stats["invalidations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tools_without_flag_are_not_cached(self, mock_state_manager):
+        tool = MagicMock()  # No explicit cacheable flag (MagicMock attribute is truthy)
+        tool.name = "remote_tool"
+        tool.description = "Remote tool"
+        tool.parameters_schema = {"type": "object", "properties": {}}
+        tool.execute = AsyncMock(return_value={"success": True, "output": "data"})
+        agent = make_agent(
+            mock_state_manager,
+            [tool],
+            [tool_turn("remote_tool", {}, "c1"), tool_turn("remote_tool", {}, "c2"), FINAL],
+            tool_cache=ToolResultCache(),
+        )
+
+        await agent.execute("Mission", "s1")
+
+        assert tool.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_results_not_cached(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True)
+        read.execute.return_value = {"success": False, "error": "timeout"}
+        agent = make_agent(
+            mock_state_manager,
+            [read],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("file_read", {"path": "a.txt"}, "c2"),
+                FINAL,
+            ],
+            tool_cache=ToolResultCache(),
+        )
+
+        await agent.execute("Mission", "s1")
+
+        assert read.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_cache_no_stats(self, mock_state_manager):
+        read = make_tool("file_read", cacheable=True)
+        agent = make_agent(
+            mock_state_manager,
+            [read],
+            [
+                tool_turn("file_read", {"path": "a.txt"}, "c1"),
+                tool_turn("file_read", {"path": "a.txt"}, "c2"),
+                FINAL,
+            ],
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        assert read.execute.await_count == 2
+        assert result.tool_cache_stats is None
+
+
+class TestLeanAgentToolCoalescing:
+    """Tests for single-flight execution of identical in-flight tool calls."""
+
+    @staticmethod
+    def slow_tool(name: str, user_context: dict | None = None) -> MagicMock:
+        tool = make_tool(name, cacheable=True)
+        tool.user_context = user_context
+
+        async def execute(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"success": True, "output": f"{name} result"}
+
+        tool.execute = AsyncMock(side_effect=execute)
+        return tool
+
+    def make_coalescing_agent(self, state_manager, tool) -> LeanAgent:
+        return LeanAgent(
+            state_manager=state_manager,
+            llm_provider=AsyncMock(),
+            tools=[tool],
+            system_prompt="Test",
+            tool_coalescer=ToolCallCoalescer(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_share_one_execution(self, mock_state_manager):
+        search = self.slow_tool("semantic_search", {"user_id": "alice"})
+        agents = [self.make_coalescing_agent(mock_state_manager, search) for _ in range(3)]
+
+        results = await asyncio.gather(
+            *(agent._execute_tool("semantic_search", {"query": "q"}) for agent in agents)
+        )
+
+        search.execute.assert_awaited_once()
+        assert all(result["output"] == "semantic_search result" for result in results)
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_different_security_context_not_shared(self, mock_state_manager):
+        alice = self.slow_tool("semantic_search", {"user_id": "alice"})
+        bob = self.slow_tool("semantic_search", {"user_id": "bob"})
+
+        await asyncio.gather(
+            self.make_coalescing_agent(mock_state_manager, alice)._execute_tool(
+                "semantic_search", {"query": "q"}
+            ),
+            self.make_coalescing_agent(mock_state_manager, bob)._execute_tool(
+                "semantic_search", {"query": "q"}
+            ),
+        )
+
+        alice.execute.assert_awaited_once()
+        bob.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_tools_not_coalesced(self, mock_state_manager):
+        write = make_tool("file_write", cacheable=False)
+        agent = self.make_coalescing_agent(mock_state_manager, write)
+
+        await asyncio.gather(
+            agent._execute_tool("file_write", {"path": "a.txt"}),
+            agent._execute_tool("file_write", {"path": "a.txt"}),
+        )
+
+        assert write.execute.await_count == 2
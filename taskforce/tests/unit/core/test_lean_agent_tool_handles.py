@@ -398,3 +398,84 @@ async def test_streaming_uses_handles(
     stats = await tool_result_store.get_stats()
     assert stats["total_results"] >= 1  # At least one result stored
 
+
+
+@pytest.mark.asyncio
+async def test_agent_registers_fetch_tool_and_pages_through_handle(
+    mock_state_manager,
+    mock_llm_provider,
+    mock_tool,
+    tool_result_store,
+):
+    """Test that the LLM can page through a stored result via fetch_tool_result."""
+    agent = LeanAgent(
+        state_manager=mock_state_manager,
+        llm_provider=mock_llm_provider,
+        tools=[mock_tool],
+        tool_result_store=tool_result_store,
+    )
+    assert "fetch_tool_result" in agent.tools
+
+    handle_ids = []
+
+    async def complete(**kwargs):
+        tool_messages = [m for m in kwargs["messages"] if m.get("role") == "tool"]
+        if not tool_messages:
+            return {
+                "success": True,
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "large_output_tool", "arguments": "{}"},
+                    }
+                ],
+            }
+        if len(tool_messages) == 1:
+            handle_ids.append(json.loads(tool_messages[0]["content"])["handle"]["id"])
+            arguments = json.dumps(
+                {
+                    "handle_id": handle_ids[0],
+                    "selector": "output|chars=0:6000",
+                    "max_chars": 6000,
+                }
+            )
+            return {
+                "success": True,
+                "tool_calls": [
+                    {
+                        "id": "call_2",
+                        "type": "function",
+                        "function": {"name": "fetch_tool_result", "arguments": arguments},
+                    }
+                ],
+            }
+        return {"success": True, "content": "Done"}
+
+    mock_llm_provider.complete.side_effect = complete
+
+    result = await agent.execute(mission="Read it", session_id="session_fetch")
+
+    assert result.status == "completed"
+    last_messages = mock_llm_provider.complete.call_args_list[-1][1]["messages"]
+    page = json.loads([m for m in last_messages if m.get("role") == "tool"][-1]["content"])
+    # Pages are returned inline, never stored behind another handle
+    assert "handle" not in page
+    assert page["output"] == "x" * 6000
+    assert page["next_selector"] == "output|chars=6000:12000"
+
+
+@pytest.mark.asyncio
+async def test_agent_without_store_has_no_fetch_tool(
+    mock_state_manager,
+    mock_llm_provider,
+    mock_tool,
+):
+    """Test that fetch_tool_result is only registered with a store."""
+    agent = LeanAgent(
+        state_manager=mock_state_manager,
+        llm_provider=mock_llm_provider,
+        tools=[mock_tool],
+    )
+
+    assert "fetch_tool_result" not in agent.tools
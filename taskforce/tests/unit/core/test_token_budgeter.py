@@ -385,3 +385,102 @@ class TestTokenBudgeter:
 
         assert stats["should_compress"] is True
 
+
+
+class TestTokenLedger:
+    """Test suite for the running token ledger."""
+
+    def _history(self, n: int) -> list[dict]:
+        messages = [{"role": "system", "content": "System prompt"}]
+        for i in range(n):
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {"name": "file_read", "arguments": '{"path": "a"}'},
+                        }
+                    ],
+                }
+            )
+            messages.append({"role": "tool", "tool_call_id": f"call_{i}", "content": "y" * 400})
+        return messages
+
+    def test_ledger_matches_uncached_estimate(self):
+        """Cached totals equal a fresh estimate after append/replace/compress."""
+        budgeter = TokenBudgeter()
+        tools = [{"type": "function", "function": {"name": "t", "parameters": {}}}]
+        messages = self._history(5)
+        budgeter.estimate_tokens(messages, tools)
+
+        # Append
+        messages.append({"role": "user", "content": "z" * 800})
+        # Replace (system prompt is rebuilt every loop iteration)
+        messages[0] = {"role": "system", "content": "New system prompt " * 20}
+        assert budgeter.estimate_tokens(messages, tools) == TokenBudgeter().estimate_tokens(
+            messages, tools
+        )
+
+        # Compress (new list reusing recent message objects)
+        compressed = [messages[0], {"role": "system", "content": "summary"}, *messages[-4:]]
+        assert budgeter.estimate_tokens(compressed, tools) == TokenBudgeter().estimate_tokens(
+            compressed, tools
+        )
+
+    def test_unchanged_messages_are_not_recounted(self):
+        """Repeated checks on the same history only count new messages."""
+        budgeter = TokenBudgeter()
+        messages = self._history(10)
+
+        budgeter.estimate_tokens(messages)
+        misses = budgeter.ledger_stats["misses"]
+        budgeter.should_compress(messages)
+        budgeter.is_over_budget(messages)
+        assert budgeter.ledger_stats["misses"] == misses
+
+        messages.append({"role": "user", "content": "next"})
+        budgeter.estimate_tokens(messages)
+        assert budgeter.ledger_stats["misses"] == misses + 1
+
+    def test_content_reassignment_invalidates_entry(self):
+        """A message whose content was replaced in place is recounted."""
+        budgeter = TokenBudgeter()
+        message = {"role": "tool", "content": "x" * 40}
+        before = budgeter.estimate_tokens([message])
+
+        message["content"] = "x" * 4000
+
+        assert budgeter.estimate_tokens([message]) == before + 990
+
+    def test_tool_schema_cost_cached_per_list(self, monkeypatch):
+        """Tool schemas are serialized once per tools list."""
+        import taskforce.core.domain.token_budgeter as module
+
+        budgeter = TokenBudgeter()
+        tools = [{"type": "function", "function": {"name": f"t{i}"}} for i in range(3)]
+        first = budgeter.estimate_tokens([], tools)
+
+        calls = []
+        original_dumps = module.json.dumps
+        monkeypatch.setattr(
+            module.json, "dumps", lambda *a, **k: calls.append(a) or original_dumps(*a, **k)
+        )
+
+        assert budgeter.estimate_tokens([], tools) == first
+        assert calls == []
+
+    def test_ledger_prunes_dropped_messages(self):
+        """Messages removed from the history do not accumulate in the ledger."""
+        budgeter = TokenBudgeter()
+        messages = self._history(20)
+        budgeter.estimate_tokens(messages)
+
+        compressed = messages[:1] + messages[-4:]
+        budgeter.estimate_tokens(compressed)
+        budgeter.estimate_tokens(compressed)
+        budgeter.estimate_tokens(compressed)
+
+        assert budgeter.ledger_stats["cached_messages"] == len(compressed)
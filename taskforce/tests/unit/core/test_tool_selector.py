@@ -0,0 +1,207 @@
+"""
+Unit tests for per-step tool subset selection.
+
+Tests the BM25 tool index, per-mission selection (top-k plus planner and
+already used tools, full-set fallback, token savings) and the LeanAgent
+integration.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+from taskforce.core.domain.token_budgeter import HeuristicTokenEstimator
+from taskforce.core.domain.tool_selector import ToolSelection, ToolSelector, tokenize
+
+TOOL_SPECS = {
+    "planner": "Manage the execution plan: create_plan, mark_done, read_plan",
+    "wiki_search": "Search wiki pages by keyword",
+    "wiki_get_page": "Get the content of a wiki page",
+    "wiki_create_page": "Create a new wiki page",
+    "list_tables": "List all database tables",
+    "describe_table": "Describe the columns of a database table",
+    "execute_sql": "Execute a SQL query against the database",
+    "file_read": "Read a file from disk",
+    "file_write": "Write content to a file on disk",
+    "web_search": "Search the web",
+    "git": "Run git operations on a repository",
+    "shell": "Execute shell commands",
+}
+
+
+def schema(name: str, description: str) -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": {
+                "type": "object",
+                "properties": {"query": {"type": "string", "description": "Input"}},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def selector() -> ToolSelector:
+    tools = [schema(name, description) for name, description in TOOL_SPECS.items()]
+    return ToolSelector(tools, estimator=HeuristicTokenEstimator())
+
+
+class TestToolSelector:
+    """Tests for the lexical tool index."""
+
+    def test_tokenize_splits_identifiers(self):
+        assert tokenize("wiki_get_page executeSql Größe") == [
+            "wiki",
+            "get",
+            "page",
+            "execute",
+            "sql",
+            "größe",
+        ]
+
+    def test_rank_prefers_matching_tools(self, selector):
+        ranked = [name for name, _ in selector.rank("Which columns does the orders table have?")]
+
+        assert ranked[0] == "describe_table"
+
+    def test_rank_without_matches(self, selector):
+        assert selector.rank("xyzzy") == []
+
+
+class TestToolSelection:
+    """Tests for per-mission selection state."""
+
+    def _names(self, schemas: list[dict]) -> list[str]:
+        return [s["function"]["name"] for s in schemas]
+
+    def test_top_k_plus_planner_in_registration_order(self, selector):
+        selection = ToolSelection(selector, top_k=2)
+
+        names = self._names(selection.select("search the wiki page"))
+
+        assert names[0] == "planner"
+        assert len(names) == 3
+        assert set(names) <= {"planner", "wiki_search", "wiki_get_page", "wiki_create_page"}
+
+    def test_used_tools_stay_selected(self, selector):
+        selection = ToolSelection(selector, top_k=1)
+        selection.select("read a file")
+        selection.record_calls(["file_read"])
+
+        names = self._names(selection.select("run the sql query"))
+
+        assert "file_read" in names
+        assert "execute_sql" in names
+
+    def test_unsent_tool_triggers_full_set(self, selector):
+        selection = ToolSelection(selector, top_k=1)
+        selection.select("read a file")
+
+        missing = selection.record_calls(["git", "unknown_tool"])
+
+        assert missing == ["git"]
+        assert len(selection.select("read a file")) == len(TOOL_SPECS)
+        assert selection.stats["full_set_fallbacks"] == 1
+
+    def test_no_lexical_match_sends_all_tools(self, selector):
+        selection = ToolSelection(selector, top_k=2)
+
+        assert len(selection.select("xyzzy")) == len(TOOL_SPECS)
+
+    def test_token_savings(self, selector):
+        selection = ToolSelection(selector, top_k=2)
+        selection.select("search the wiki page")
+        selection.select("search the wiki page")
+
+        stats = selection.stats
+        assert stats["llm_calls"] == 2
+        assert stats["tool_tokens_full"] == 2 * selector.full_set_tokens
+        assert stats["tool_tokens_saved"] == stats["tool_tokens_full"] - stats["tool_tokens_sent"]
+        assert stats["tool_tokens_saved"] > stats["tool_tokens_sent"]
+
+
+def make_tool(name: str, description: str) -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    tool.description = description
+    tool.parameters_schema = {"type": "object", "properties": {"query": {"type": "string"}}}
+    tool.execute = AsyncMock(return_value={"success": True, "output": f"{name} result"})
+    return tool
+
+
+def tool_call(name: str, call_id: str) -> dict:
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": json.dumps({"query": "x"})},
+    }
+
+
+class TestLeanAgentToolSelection:
+    """Tests for tool selection in the LeanAgent loop."""
+
+    def _agent(self, llm, top_k: int | None) -> LeanAgent:
+        state_manager = AsyncMock()
+        state_manager.load_state.return_value = {}
+        tools = [make_tool(n, d) for n, d in TOOL_SPECS.items() if n != "planner"]
+        return LeanAgent(
+            state_manager=state_manager,
+            llm_provider=llm,
+            tools=tools,
+            system_prompt="Test",
+            tool_selection_top_k=top_k,
+        )
+
+    def _sent_tools(self, llm) -> list[set[str]]:
+        return [
+            {t["function"]["name"] for t in call.kwargs["tools"]}
+            for call in llm.complete.call_args_list
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sends_subset(self):
+        llm = AsyncMock()
+        llm.complete.side_effect = [
+            {"success": True, "tool_calls": [tool_call("describe_table", "c1")]},
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+        agent = self._agent(llm, top_k=3)
+
+        result = await agent.execute("Describe the orders database table", "s1")
+
+        assert result.status == "completed"
+        first, second = self._sent_tools(llm)
+        assert "planner" in first and "describe_table" in first
+        assert len(first) == 4
+        assert "describe_table" in second
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_full_set(self):
+        llm = AsyncMock()
+        llm.complete.side_effect = [
+            {"success": True, "tool_calls": [tool_call("shell", "c1")]},
+            {"success": True, "content": "Done", "tool_calls": None},
+        ]
+        agent = self._agent(llm, top_k=2)
+
+        await agent.execute("Describe the orders database table", "s1")
+
+        first, second = self._sent_tools(llm)
+        assert "shell" not in first
+        assert len(second) == len(TOOL_SPECS)
+        agent.tools["shell"].execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_all_tools(self):
+        llm = AsyncMock()
+        llm.complete.return_value = {"success": True, "content": "Done", "tool_calls": None}
+        agent = self._agent(llm, top_k=None)
+
+        await agent.execute("Describe the orders database table", "s1")
+
+        assert self._sent_tools(llm) == [set(TOOL_SPECS)]
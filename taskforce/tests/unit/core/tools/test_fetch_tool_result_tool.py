@@ -0,0 +1,104 @@
+"""
+Unit tests for FetchToolResultTool - paging through stored tool results.
+"""
+
+import pytest
+
+from taskforce.core.tools.fetch_tool_result_tool import FetchToolResultTool
+from taskforce.infrastructure.cache.sqlite_tool_result_store import SQLiteToolResultStore
+from taskforce.infrastructure.cache.tool_result_store import FileToolResultStore
+
+LINES = "".join(f"row {i}\n" for i in range(3000))
+
+
+@pytest.fixture(params=["file", "content_addressed", "sqlite"])
+def store(request, tmp_path):
+    """Tool result store of each implementation."""
+    if request.param == "sqlite":
+        store = SQLiteToolResultStore(tmp_path / "results.sqlite3", inline_threshold=1024)
+        yield store
+        store.close()
+    else:
+        yield FileToolResultStore(
+            tmp_path, content_addressed=request.param == "content_addressed"
+        )
+
+
+@pytest.mark.asyncio
+async def test_default_returns_first_page(store):
+    """Without selector the first page of the stored document is returned."""
+    handle = await store.put("file_read", {"success": True, "output": LINES}, "s1")
+    tool = FetchToolResultTool(store)
+
+    result = await tool.execute(handle_id=handle.id, max_chars=100)
+
+    assert result["success"] is True
+    assert result["tool"] == "file_read"
+    assert len(result["output"]) == 100
+    assert result["has_more"] is True
+    assert result["next_selector"] == "chars=100:"
+
+
+@pytest.mark.asyncio
+async def test_pages_through_field_lines(store):
+    """Line pages of a field continue via next_selector."""
+    handle = await store.put("file_read", {"success": True, "output": LINES}, "s1")
+    tool = FetchToolResultTool(store)
+
+    first = await tool.execute(handle_id=handle.id, selector="output|lines=0:2")
+    second = await tool.execute(handle_id=handle.id, selector=first["next_selector"])
+
+    assert first["output"] == "row 0\nrow 1\n"
+    assert second["output"] == "row 2\nrow 3\n"
+
+
+@pytest.mark.asyncio
+async def test_chunk_of_stored_document(store):
+    """chunk=i/n returns equal parts of the stored document."""
+    handle = await store.put("search", {"success": True, "output": "abc" * 100}, "s1")
+    tool = FetchToolResultTool(store)
+
+    parts = [
+        (await tool.execute(handle_id=handle.id, selector=f"chunk={i}/3"))["output"]
+        for i in range(1, 4)
+    ]
+
+    assert len("".join(parts)) == handle.size_chars
+
+
+@pytest.mark.asyncio
+async def test_errors_are_reported(store):
+    """Unknown handles and bad selectors produce error results."""
+    handle = await store.put("search", {"success": True, "output": "x"}, "s1")
+    tool = FetchToolResultTool(store)
+
+    unknown = await tool.execute(handle_id="00000000-0000-0000-0000-000000000000")
+    malformed = await tool.execute(handle_id=handle.id, selector="lines=9:1")
+    missing = await tool.execute(handle_id=handle.id, selector="data.items")
+
+    assert unknown["success"] is False
+    assert "Unknown tool result handle" in unknown["error"]
+    assert malformed["success"] is False
+    assert missing["success"] is False
+    assert "not found" in missing["error"]
+
+
+@pytest.mark.asyncio
+async def test_file_store_rejects_path_like_handle_ids(tmp_path):
+    """Handle IDs from the LLM never reach the filesystem unvalidated."""
+    store = FileToolResultStore(tmp_path / "store")
+    (tmp_path / "secret.json").write_text("{}")
+
+    assert await store.get_handle("../secret") is None
+    assert await store.get_handle("not-a-uuid") is None
+
+
+def test_validate_params():
+    """Parameter validation."""
+    tool = FetchToolResultTool(store=None)
+
+    assert tool.validate_params(handle_id="abc") == (True, None)
+    assert tool.validate_params()[0] is False
+    assert tool.validate_params(handle_id="abc", max_chars=0)[0] is False
+    assert tool.supports_parallelism is True
+    assert tool.requires_approval is False
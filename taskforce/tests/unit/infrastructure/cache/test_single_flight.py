@@ -0,0 +1,177 @@
+"""
+Unit tests for SingleFlight request coalescing.
+
+Tests that concurrent identical calls share one execution, that results
+and errors reach every caller, cancellation handling, tool keys and the
+ToolCallCoalescer adapter.
+"""
+
+import asyncio
+
+import pytest
+
+from taskforce.infrastructure.cache.single_flight import (
+    SingleFlight,
+    ToolCallCoalescer,
+    compute_tool_key,
+    get_single_flight,
+)
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test identical in-flight calls run the work once."""
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"success": True}
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+        assert calls == 1
+        assert [shared for _, shared in results].count(False) == 1
+        assert all(result == {"success": True} for result, _ in results)
+        assert flight.stats == {"calls": 1, "coalesced": 4}
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        """Test completed calls are forgotten (no caching)."""
+        flight = SingleFlight("test")
+
+        async def work():
+            return 1
+
+        await flight.do("key", work)
+        _, shared = await flight.do("key", work)
+
+        assert shared is False
+        assert flight.stats["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Test calls with different keys do not attach to each other."""
+        flight = SingleFlight("test")
+
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("a", lambda: work("a")), flight.do("b", lambda: work("b"))
+        )
+
+        assert results == [("a", False), ("b", False)]
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_callers(self):
+        """Test an exception of the work reaches every attached caller."""
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("backend down")
+
+        results = await asyncio.gather(
+            flight.do("key", work), flight.do("key", work), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test the first caller's cancellation leaves the call running."""
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == ("done", True)
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_work_cancelled_when_last_caller_leaves(self):
+        """Test the work is cancelled once nobody waits for it."""
+        flight = SingleFlight("test")
+        started = asyncio.Event()
+        cancelled = False
+
+        async def work():
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        caller = asyncio.create_task(flight.do("key", work))
+        await started.wait()
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert cancelled is True
+        assert flight.in_flight == 0
+
+
+def test_tool_key_includes_security_context():
+    """Test calls of different users never share a key."""
+    args = {"query": "revenue"}
+
+    alice = compute_tool_key("semantic_search", args, {"user_id": "alice", "org_id": "acme"})
+    bob = compute_tool_key("semantic_search", args, {"user_id": "bob", "org_id": "acme"})
+
+    assert alice != bob
+    assert alice == compute_tool_key(
+        "semantic_search", {"query": "revenue"}, {"org_id": "acme", "user_id": "alice"}
+    )
+    assert compute_tool_key("semantic_search", args) == compute_tool_key(
+        "semantic_search", args, {}
+    )
+
+
+def test_groups_shared_per_name():
+    """Test process-wide groups per kind of work."""
+    assert get_single_flight("llm") is get_single_flight("llm")
+    assert get_single_flight("llm") is not get_single_flight("tools")
+
+
+@pytest.mark.asyncio
+async def test_tool_coalescer_keys_by_security_context():
+    """Test the adapter shares calls per tool, input and security context."""
+    flight = SingleFlight("test")
+    coalescer = ToolCallCoalescer(flight)
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return {"success": True}
+
+    results = await asyncio.gather(
+        coalescer.run("semantic_search", {"query": "q"}, {"user_id": "alice"}, work),
+        coalescer.run("semantic_search", {"query": "q"}, {"user_id": "alice"}, work),
+        coalescer.run("semantic_search", {"query": "q"}, {"user_id": "bob"}, work),
+    )
+
+    assert [shared for _, shared in results] == [False, True, False]
+    assert flight.stats == {"calls": 2, "coalesced": 1}
+    assert ToolCallCoalescer()._flight is get_single_flight("tools")
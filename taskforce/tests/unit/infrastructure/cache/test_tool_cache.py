@@ -4,16 +4,29 @@ Unit tests for ToolResultCache.
 Tests cache behavior including:
 - Cache hits and misses
 - Key normalization (deterministic regardless of dict order)
-- TTL expiration
+- TTL expiration (monotonic clock, proactive expiry)
+- Size- and count-bounded LRU eviction
 - Cache invalidation
 - Statistics tracking
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pytest
 
-from taskforce.infrastructure.cache.tool_cache import CacheEntry, ToolResultCache
+from taskforce.infrastructure.cache.tool_cache import (
+    CacheEntry,
+    ToolResultCache,
+    approximate_size,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
 
 
 class TestToolResultCache:
@@ -102,13 +115,12 @@ class TestToolResultCache:
 
     def test_cache_ttl_expired(self):
         """Test cache entries expire after TTL."""
-        cache = ToolResultCache(default_ttl=1)  # 1 second TTL
+        clock = FakeClock()
+        cache = ToolResultCache(default_ttl=1, clock=clock)  # 1 second TTL
 
         cache.put("tool", {"key": "value"}, {"result": "data"})
-
-        # Manually expire by modifying created_at
         key = cache._compute_key("tool", {"key": "value"})
-        cache._cache[key].created_at = datetime.utcnow() - timedelta(seconds=2)
+        clock.now += 2
 
         result = cache.get("tool", {"key": "value"})
 
@@ -119,13 +131,13 @@ class TestToolResultCache:
 
     def test_cache_ttl_zero_no_expiry(self):
         """Test TTL of 0 means no expiry (session lifetime)."""
-        cache = ToolResultCache(default_ttl=0)
+        clock = FakeClock()
+        cache = ToolResultCache(default_ttl=0, clock=clock)
 
         cache.put("tool", {"key": "value"}, {"result": "data"})
 
-        # Even with old created_at, should not expire
-        key = cache._compute_key("tool", {"key": "value"})
-        cache._cache[key].created_at = datetime.utcnow() - timedelta(days=365)
+        # Even a year later, should not expire
+        clock.now += 365 * 24 * 3600
 
         result = cache.get("tool", {"key": "value"})
 
@@ -143,6 +155,37 @@ class TestToolResultCache:
         key = cache._compute_key("tool", {"key": "value"})
         assert cache._cache[key].ttl_seconds == 1
 
+    def test_expired_entries_are_purged_proactively(self):
+        """Test expired entries are removed without looking up their keys."""
+        clock = FakeClock()
+        cache = ToolResultCache(default_ttl=10, clock=clock)
+        cache.put("tool", {"a": 1}, {"result": "short"}, ttl=1)
+        cache.put("tool", {"a": 2}, {"result": "long"})
+        cache.put("tool", {"a": 3}, {"result": "forever"}, ttl=0)
+
+        clock.now += 5
+        cache.put("tool", {"a": 4}, {"result": "new"})
+
+        assert cache.size == 3
+        assert cache.stats["expirations"] == 1
+
+        clock.now += 11
+        assert cache.purge_expired() == 2
+        assert cache.get("tool", {"a": 3}) == {"result": "forever"}
+        assert cache.stats["expirations"] == 3
+
+    def test_reput_resets_expiry(self):
+        """Test overwriting an entry replaces its deadline."""
+        clock = FakeClock()
+        cache = ToolResultCache(default_ttl=10, clock=clock)
+        cache.put("tool", {"a": 1}, {"result": "old"})
+
+        clock.now += 8
+        cache.put("tool", {"a": 1}, {"result": "new"})
+        clock.now += 8
+
+        assert cache.get("tool", {"a": 1}) == {"result": "new"}
+        assert cache.stats["expirations"] == 0
     def test_cache_clear(self):
         """Test cache clear removes all entries and resets stats."""
         cache = ToolResultCache()
@@ -176,6 +219,32 @@ class TestToolResultCache:
 
         assert removed is False
 
+    def test_cache_invalidate_resource(self):
+        """Test invalidate_resource removes all entries of the resource."""
+        cache = ToolResultCache()
+
+        cache.put("file_read", {"path": "a.txt"}, {"result": "a"}, resource="filesystem")
+        cache.put("file_read", {"path": "b.txt"}, {"result": "b"}, resource="filesystem")
+        cache.put("web_search", {"query": "a.txt"}, {"result": "web"}, resource="web")
+
+        removed = cache.invalidate_resource("filesystem")
+
+        assert removed == 2
+        assert cache.get("file_read", {"path": "a.txt"}) is None
+        assert cache.get("file_read", {"path": "b.txt"}) is None
+        assert cache.get("web_search", {"query": "a.txt"}) is not None
+        assert cache.stats["invalidations"] == 2
+
+    def test_cache_invalidate_unknown_resource_drops_all(self):
+        """Test that None (unknown side effects) removes every entry."""
+        cache = ToolResultCache()
+
+        cache.put("file_read", {"path": "a.txt"}, {"result": "a"}, resource="filesystem")
+        cache.put("semantic_search", {"query": "x"}, {"result": "data"})
+
+        assert cache.invalidate_resource(None) == 2
+        assert cache.size == 0
+
     def test_cache_size(self):
         """Test cache size property returns correct count."""
         cache = ToolResultCache()
@@ -230,6 +299,80 @@ class TestToolResultCache:
         assert cache.size == 2
 
 
+class TestToolResultCacheBounds:
+    """Test suite for size- and count-bounded LRU eviction."""
+
+    def test_max_entries_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ToolResultCache(max_entries=2)
+        cache.put("tool", {"a": 1}, {"result": 1})
+        cache.put("tool", {"a": 2}, {"result": 2})
+        cache.get("tool", {"a": 1})  # a=1 is now more recent than a=2
+
+        cache.put("tool", {"a": 3}, {"result": 3})
+
+        assert cache.get("tool", {"a": 2}) is None
+        assert cache.get("tool", {"a": 1}) == {"result": 1}
+        assert cache.get("tool", {"a": 3}) == {"result": 3}
+        assert cache.stats["evictions"] == 1
+
+    def test_max_bytes_bounds_total_size(self):
+        """Test entries are evicted until the total size fits."""
+        entry_size = approximate_size({"output": "x" * 1000}) + approximate_size({"a": 0})
+        cache = ToolResultCache(max_bytes=entry_size * 3)
+
+        for i in range(5):
+            cache.put("tool", {"a": i}, {"output": str(i) * 1000})
+
+        assert cache.size == 3
+        assert cache.size_bytes <= entry_size * 3
+        assert cache.stats["evictions"] == 2
+        assert cache.stats["bytes_evicted"] >= 2 * 1000
+        assert cache.get("tool", {"a": 0}) is None
+        assert cache.get("tool", {"a": 4}) is not None
+
+    def test_oversized_result_is_not_cached(self):
+        """Test a result larger than max_bytes is rejected, not cached."""
+        cache = ToolResultCache(max_bytes=1000)
+        cache.put("tool", {"a": 1}, {"output": "small"})
+
+        cache.put("tool", {"a": 2}, {"output": "x" * 2000})
+
+        assert cache.get("tool", {"a": 2}) is None
+        assert cache.get("tool", {"a": 1}) is not None
+        assert cache.stats["rejected"] == 1
+        assert cache.stats["evictions"] == 0
+
+    def test_size_bytes_tracks_removals(self):
+        """Test the byte total follows overwrites and invalidations."""
+        cache = ToolResultCache()
+        cache.put("file_read", {"path": "a.txt"}, {"output": "x" * 1000})
+        cache.put("file_read", {"path": "a.txt"}, {"output": "y" * 100})
+        after_overwrite = cache.size_bytes
+
+        cache.invalidate_resource(None)
+
+        assert 100 < after_overwrite < 1000
+        assert cache.size_bytes == 0
+
+    def test_unbounded_cache(self):
+        """Test None disables both bounds."""
+        cache = ToolResultCache(max_bytes=None, max_entries=None)
+
+        for i in range(100):
+            cache.put("tool", {"a": i}, {"output": "x" * 1000})
+
+        assert cache.size == 100
+        assert cache.stats["evictions"] == 0
+
+    def test_approximate_size_counts_nested_content(self):
+        """Test nested strings dominate the size of a result."""
+        small = approximate_size({"data": [{"text": "a"}]})
+        large = approximate_size({"data": [{"text": "a" * 10000}]})
+
+        assert large - small >= 9999
+
+
 class TestCacheEntry:
     """Test suite for CacheEntry dataclass."""
 
@@ -0,0 +1,85 @@
+"""
+Performance tests for ToolResultCache.
+
+Verifies at 10k and 100k entries that get/put never scan the whole cache:
+LRU bookkeeping and proactive expiry keep the per-operation work constant
+(amortized) as the cache grows, including when the bounds force constant
+eviction. Work is measured as full scans of the entry table, not time.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from taskforce.infrastructure.cache.tool_cache import ToolResultCache
+
+
+class ScanCountingDict(OrderedDict):
+    """Entry table that counts full iterations."""
+
+    scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+
+def make_result(i: int) -> dict:
+    """Tool result with a realistic shape and payload size."""
+    return {"success": True, "output": f"Result {i}: " + "lorem ipsum " * 20, "data": [i, i + 1]}
+
+
+def fill_and_read(cache: ToolResultCache, entries: int) -> ScanCountingDict:
+    """
+    Fill the cache with the given number of entries, then read them back.
+
+    Returns:
+        The cache's entry table with the number of full scans
+    """
+    table = ScanCountingDict()
+    cache._cache = table
+    inputs = [{"path": f"/docs/page_{i}.md", "limit": 100} for i in range(entries)]
+
+    for i, tool_input in enumerate(inputs):
+        cache.put("file_read", tool_input, make_result(i))
+    for tool_input in inputs:
+        cache.get("file_read", tool_input)
+
+    return table
+
+
+class TestToolResultCachePerformance:
+    """Work per get/put of the cache."""
+
+    @pytest.mark.parametrize("entries", [10_000, 100_000])
+    def test_get_put_never_scan_cache(self, entries):
+        """Every entry fitting, all with a TTL: no get/put iterates the entries."""
+        cache = ToolResultCache(default_ttl=3600, max_bytes=None, max_entries=None)
+
+        table = fill_and_read(cache, entries)
+
+        assert cache.size == entries
+        assert cache.stats["hits"] == entries
+        assert table.scans == 0
+        assert len(cache._expiry_heap) == entries
+
+    def test_eviction_work_is_amortized_constant(self):
+        """100k puts with a 10k bound: one eviction per put, rare heap compactions."""
+        bounded = ToolResultCache(max_entries=10_000)
+
+        table = fill_and_read(bounded, 100_000)
+
+        assert bounded.size == 10_000
+        assert bounded.stats["evictions"] == 90_000
+        assert bounded.stats["hits"] == 10_000  # The most recently put entries
+        # Stale expiry items are compacted about once per max_entries puts
+        assert 0 < table.scans <= 100_000 // 10_000
+        assert len(bounded._expiry_heap) <= 2 * bounded.size + 64
@@ -15,6 +15,7 @@ import pytest
 import yaml
 
 from taskforce.infrastructure.llm.openai_service import OpenAIService
+from taskforce.infrastructure.llm.stream_metrics import get_stream_stats
 
 
 @pytest.fixture
@@ -317,6 +318,75 @@ class TestCompleteStreamToolCalls:
             end_ids = {e["id"] for e in end_events}
             assert end_ids == {"call_1", "call_2"}
 
+    async def test_complete_stream_ends_tool_call_when_next_starts(self, temp_config_file):
+        """Test that a finished tool call ends before the stream finishes."""
+        service = OpenAIService(config_path=temp_config_file)
+
+        chunks = [
+            create_mock_chunk(tool_calls=[create_mock_tool_call(0, "call_1", "tool_a", None)]),
+            create_mock_chunk(tool_calls=[create_mock_tool_call(0, None, None, '{"a":')]),
+            create_mock_chunk(tool_calls=[create_mock_tool_call(0, None, None, "1}")]),
+            create_mock_chunk(tool_calls=[create_mock_tool_call(1, "call_2", "tool_b", None)]),
+            create_mock_chunk(tool_calls=[create_mock_tool_call(1, None, None, '{"b":2}')]),
+            create_mock_chunk(finish_reason="tool_calls"),
+        ]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_stream_generator(chunks)
+
+            events = []
+            async for event in service.complete_stream(
+                messages=[{"role": "user", "content": "Test"}],
+                model="main",
+                tools=[{"type": "function", "function": {"name": "tool_a"}}],
+            ):
+                events.append(event)
+
+            kinds = [(e["type"], e.get("id")) for e in events if e["type"] != "tool_call_delta"]
+            assert kinds == [
+                ("tool_call_start", "call_1"),
+                ("tool_call_start", "call_2"),
+                ("tool_call_end", "call_1"),
+                ("tool_call_end", "call_2"),
+                ("done", None),
+            ]
+            ends = {e["id"]: e["arguments"] for e in events if e["type"] == "tool_call_end"}
+            assert ends == {"call_1": '{"a":1}', "call_2": '{"b":2}'}
+
+    async def test_complete_stream_interleaved_arguments_not_ended_early(self, temp_config_file):
+        """Test that a tool call with incomplete arguments is not ended early."""
+        service = OpenAIService(config_path=temp_config_file)
+
+        chunks = [
+            create_mock_chunk(
+                tool_calls=[
+                    create_mock_tool_call(0, "call_1", "tool_a", None),
+                    create_mock_tool_call(1, "call_2", "tool_b", None),
+                ]
+            ),
+            create_mock_chunk(
+                tool_calls=[
+                    create_mock_tool_call(0, None, None, '{"a":1}'),
+                    create_mock_tool_call(1, None, None, '{"b":2}'),
+                ]
+            ),
+            create_mock_chunk(finish_reason="tool_calls"),
+        ]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_stream_generator(chunks)
+
+            events = []
+            async for event in service.complete_stream(
+                messages=[{"role": "user", "content": "Test"}],
+                model="main",
+                tools=[{"type": "function", "function": {"name": "tool_a"}}],
+            ):
+                events.append(event)
+
+            ends = {e["id"]: e["arguments"] for e in events if e["type"] == "tool_call_end"}
+            assert ends == {"call_1": '{"a":1}', "call_2": '{"b":2}'}
+
 
 @pytest.mark.asyncio
 class TestCompleteStreamDoneEvent:
@@ -384,7 +454,48 @@ class TestCompleteStreamDoneEvent:
 
             done_event = [e for e in events if e["type"] == "done"][0]
             assert done_event["type"] == "done"
-            assert done_event["usage"] == {}  # Empty dict when not available
+            assert set(done_event["usage"]) == {"stream_metrics"}  # No token counts
+
+    async def test_complete_stream_done_event_reports_stream_metrics(self, temp_config_file):
+        """Test that done event usage carries the streaming timings."""
+        service = OpenAIService(config_path=temp_config_file, profile="dev")
+
+        chunks = [
+            create_mock_chunk(content="Let me search"),
+            create_mock_chunk(
+                tool_calls=[create_mock_tool_call(0, tool_id="call_1", name="search")]
+            ),
+            create_mock_chunk(
+                tool_calls=[create_mock_tool_call(0, arguments='{"q": "x"}')]
+            ),
+            create_mock_chunk(finish_reason="tool_calls"),
+        ]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_stream_generator(chunks)
+
+            events = [
+                event
+                async for event in service.complete_stream(
+                    messages=[{"role": "user", "content": "Test"}],
+                    model="main",
+                )
+            ]
+
+        metrics = events[-1]["usage"]["stream_metrics"]
+        assert metrics["output_chunks"] == 3
+        assert metrics["ttft_ms"] is not None
+        assert metrics["first_tool_call_ms"] >= metrics["ttft_ms"]
+        assert metrics["inter_token_mean_ms"] is not None
+        assert metrics["stream_ms"] >= metrics["ttft_ms"]
+
+        stats = [
+            entry
+            for entry in get_stream_stats()
+            if entry["profile"] == "dev" and entry["model_alias"] == "main"
+        ]
+        assert stats[0]["model"] == "gpt-4.1"
+        assert stats[0]["streams"] >= 1
 
 
 @pytest.mark.asyncio
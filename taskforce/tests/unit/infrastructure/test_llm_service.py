@@ -6,11 +6,14 @@ Tests cover:
 - Model alias resolution
 - Parameter mapping (GPT-4 vs GPT-5)
 - Retry logic with exponential backoff
+- Client-side rate limits and queue-wait reporting
+- Response cache for deterministic calls
 - Azure provider initialization
 - Error handling and parsing
 """
 
 import asyncio
+import itertools
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,7 +21,23 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import yaml
 
+from taskforce.infrastructure.llm.load_balancer import reset_deployment_pools
 from taskforce.infrastructure.llm.openai_service import OpenAIService, RetryPolicy
+from taskforce.infrastructure.llm.rate_limiter import reset_rate_governors
+from taskforce.infrastructure.llm.response_cache import reset_response_caches
+from taskforce.infrastructure.llm.trace_writer import close_trace_writers
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_state():
+    """Governors, response caches and deployment pools are shared across the process."""
+    reset_rate_governors()
+    reset_response_caches()
+    reset_deployment_pools()
+    yield
+    reset_rate_governors()
+    reset_response_caches()
+    reset_deployment_pools()
 
 
 @pytest.fixture
@@ -306,6 +325,48 @@ class TestCompletion:
             assert result["usage"]["total_tokens"] == 100
             assert "latency_ms" in result
 
+    async def test_complete_reports_cached_tokens(self, temp_config_file):
+        """Test that prompt-cache hits from the provider usage are surfaced."""
+        service = OpenAIService(config_path=temp_config_file)
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Test response"))]
+        mock_response.usage = MagicMock(
+            total_tokens=6100,
+            prompt_tokens=6000,
+            completion_tokens=100,
+            prompt_tokens_details=MagicMock(cached_tokens=5120),
+        )
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+
+            result = await service.complete(
+                messages=[{"role": "user", "content": "Hello"}], model="main"
+            )
+
+        assert result["usage"]["cached_tokens"] == 5120
+        assert result["usage"]["prompt_tokens"] == 6000
+
+    async def test_extract_token_stats_dict_usage(self):
+        """Test cached token extraction from dict usage (incl. Anthropic naming)."""
+        openai_usage = {
+            "prompt_tokens": 10,
+            "completion_tokens": 2,
+            "total_tokens": 12,
+            "prompt_tokens_details": {"cached_tokens": 8},
+        }
+        anthropic_usage = {"prompt_tokens": 10, "cache_read_input_tokens": 4}
+
+        assert OpenAIService._extract_token_stats(openai_usage) == {
+            "prompt_tokens": 10,
+            "completion_tokens": 2,
+            "total_tokens": 12,
+            "cached_tokens": 8,
+        }
+        assert OpenAIService._extract_token_stats(anthropic_usage)["cached_tokens"] == 4
+        assert OpenAIService._extract_token_stats({"prompt_tokens": 3})["cached_tokens"] == 0
+
     async def test_complete_with_retry_success(self, temp_config_file):
         """Test completion succeeds after retry."""
         service = OpenAIService(config_path=temp_config_file)
@@ -367,6 +428,325 @@ class TestCompletion:
             assert "InvalidRequest" in result["error"]
             assert mock_completion.call_count == 1  # No retry
 
+    async def test_complete_reports_queue_wait(self, temp_config_file):
+        """Test that client-side throttling is reported apart from latency."""
+        with open(temp_config_file) as f:
+            config = yaml.safe_load(f)
+        config["rate_limits"] = {"models": {"main": {"requests_per_minute": 600}}}
+        with open(temp_config_file, "w") as f:
+            yaml.dump(config, f)
+        service = OpenAIService(config_path=temp_config_file)
+        service._get_rate_governor("main", "gpt-4.1")._requests.reserve(600)
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Throttled"))]
+        mock_response.usage = MagicMock(total_tokens=10, prompt_tokens=5, completion_tokens=5)
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+            result = await service.complete(
+                messages=[{"role": "user", "content": "Hello"}], model="main"
+            )
+
+        assert result["success"] is True
+        assert result["queue_wait_ms"] >= 50  # 10 requests/s refill
+        assert result["latency_ms"] < result["queue_wait_ms"]
+
+    async def test_complete_retry_honours_retry_after(self, temp_config_file):
+        """Test that Retry-After from a rate limit sets the backoff."""
+        service = OpenAIService(config_path=temp_config_file)
+        governor = service._get_rate_governor("main", "gpt-4.1")
+        governor._clock = itertools.count(step=100).__next__  # Pause elapses at once
+
+        rate_limit = Exception("RateLimitError: Too many requests")
+        rate_limit.response = MagicMock(headers={"retry-after": "12"})
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="ok"))]
+        mock_response.usage = MagicMock(total_tokens=2, prompt_tokens=1, completion_tokens=1)
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = [rate_limit, mock_response]
+            with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+                result = await service.complete(
+                    messages=[{"role": "user", "content": "Test"}], model="main"
+                )
+
+        assert result["success"] is True
+        assert mock_sleep.await_args_list[0].args[0] >= 12
+        assert governor.stats["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    """Test the response cache in complete()."""
+
+    @pytest.fixture
+    def cached_service(self, temp_config_file):
+        with open(temp_config_file) as f:
+            config = yaml.safe_load(f)
+        config["response_cache"] = {"enabled": True}
+        with open(temp_config_file, "w") as f:
+            yaml.dump(config, f)
+        return OpenAIService(config_path=temp_config_file)
+
+    @pytest.fixture
+    def mock_response(self):
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="cached answer", tool_calls=None))]
+        response.usage = MagicMock(total_tokens=10, prompt_tokens=8, completion_tokens=2)
+        return response
+
+    async def test_deterministic_call_served_from_cache(self, cached_service, mock_response):
+        """Test that a temperature 0 call is only sent once."""
+        messages = [{"role": "user", "content": "Classify this"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+            first = await cached_service.complete(messages, model="main", temperature=0)
+            second = await cached_service.complete(messages, model="main", temperature=0)
+
+        assert mock_completion.call_count == 1
+        assert first["cache_hit"] is False
+        assert second["cache_hit"] is True
+        assert second["content"] == "cached answer"
+        assert second["usage"]["total_tokens"] == 0
+        assert cached_service.response_cache.stats["hits"] == 1
+
+    async def test_non_deterministic_and_bypassed_calls_not_cached(
+        self, cached_service, mock_response
+    ):
+        """Test that sampling calls and cache=False always reach the model."""
+        messages = [{"role": "user", "content": "Write a poem"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+            await cached_service.complete(messages, model="main", temperature=0.7)
+            await cached_service.complete(messages, model="main", temperature=0.7)
+            await cached_service.complete(messages, model="main", temperature=0, cache=False)
+            await cached_service.complete(messages, model="main", temperature=0, cache=False)
+
+        assert mock_completion.call_count == 4
+        assert cached_service.response_cache.stats["bypassed"] == 4
+        assert "cache" not in mock_completion.call_args.kwargs
+
+    async def test_flagged_call_cached(self, cached_service, mock_response):
+        """Test that cache=True caches a non-zero temperature call."""
+        messages = [{"role": "user", "content": "Route this"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+            await cached_service.complete(messages, model="main", temperature=0.1, cache=True)
+            result = await cached_service.complete(
+                messages, model="main", temperature=0.1, cache=True
+            )
+
+        assert mock_completion.call_count == 1
+        assert result["cache_hit"] is True
+
+    async def test_failures_not_cached(self, cached_service, mock_response):
+        """Test that errors are never stored."""
+        messages = [{"role": "user", "content": "Classify this"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = [Exception("InvalidRequest"), mock_response]
+            failed = await cached_service.complete(messages, model="main", temperature=0)
+            result = await cached_service.complete(messages, model="main", temperature=0)
+
+        assert failed["success"] is False
+        assert result["success"] is True
+        assert result["cache_hit"] is False
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescing:
+    """Test single-flight coalescing in complete()."""
+
+    @staticmethod
+    def slow_completion(content: str):
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content=content, tool_calls=None))]
+        response.usage = MagicMock(total_tokens=10, prompt_tokens=8, completion_tokens=2)
+
+        async def acompletion(**kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        return acompletion
+
+    @staticmethod
+    def coalescing_config(config_path: str) -> str:
+        with open(config_path) as f:
+            config = yaml.safe_load(f)
+        config["coalesce_requests"] = True
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return config_path
+
+    async def test_coalescing_is_opt_in(self, temp_config_file):
+        """Test that identical calls each reach the model unless enabled."""
+        service = OpenAIService(config_path=temp_config_file)
+        messages = [{"role": "user", "content": "Classify this"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.slow_completion("separate")
+            results = await asyncio.gather(
+                *(service.complete(messages, model="main", temperature=0) for _ in range(3))
+            )
+
+        assert service.coalesce_requests is False
+        assert mock_completion.call_count == 3
+        assert not any(result.get("coalesced") for result in results)
+
+    async def test_identical_deterministic_calls_share_one_request(self, temp_config_file):
+        """Test that concurrent temperature 0 calls are sent once."""
+        service = OpenAIService(config_path=self.coalescing_config(temp_config_file))
+        messages = [{"role": "user", "content": "Classify this"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.slow_completion("shared")
+            results = await asyncio.gather(
+                *(service.complete(messages, model="main", temperature=0) for _ in range(3))
+            )
+
+        assert mock_completion.call_count == 1
+        assert all(result["content"] == "shared" for result in results)
+        coalesced = [result for result in results if result.get("coalesced")]
+        assert len(coalesced) == 2
+        assert all(result["usage"]["total_tokens"] == 0 for result in coalesced)
+
+    async def test_sampling_calls_not_coalesced(self, temp_config_file):
+        """Test that non-deterministic calls each reach the model."""
+        service = OpenAIService(config_path=self.coalescing_config(temp_config_file))
+        messages = [{"role": "user", "content": "Write a poem"}]
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.slow_completion("poem")
+            await asyncio.gather(
+                service.complete(messages, model="main", temperature=0.7),
+                service.complete(messages, model="main", temperature=0.7),
+                service.complete(messages, model="main", temperature=0, cache=False),
+                service.complete(messages, model="main", temperature=0, cache=False),
+            )
+
+        assert mock_completion.call_count == 4
+
+
+@pytest.mark.asyncio
+class TestLoadBalancing:
+    """Test deployment pools, failover, fallback aliases and hedging."""
+
+    @staticmethod
+    def pooled_config(config_path: str, **load_balancing) -> str:
+        with open(config_path) as f:
+            config = yaml.safe_load(f)
+        config["models"]["main"] = [
+            {"model": "gpt-4.1", "weight": 1},
+            {"model": "gpt-4.1-eu", "weight": 1},
+        ]
+        config["load_balancing"] = load_balancing
+        with open(config_path, "w") as f:
+            yaml.dump(config, f)
+        return config_path
+
+    @staticmethod
+    def completion_by_model(handlers: dict):
+        async def acompletion(**kwargs):
+            handler = handlers[kwargs["model"]]
+            if isinstance(handler, Exception):
+                raise handler
+            if handler:
+                await asyncio.sleep(handler)
+            response = MagicMock()
+            response.choices = [
+                MagicMock(message=MagicMock(content=kwargs["model"], tool_calls=None))
+            ]
+            response.usage = MagicMock(total_tokens=10, prompt_tokens=8, completion_tokens=2)
+            return response
+
+        return acompletion
+
+    async def test_retry_fails_over_to_healthy_deployment(self, temp_config_file):
+        """Test that a failing deployment is skipped once its circuit opens."""
+        service = OpenAIService(
+            config_path=self.pooled_config(temp_config_file, failure_threshold=1)
+        )
+        handlers = {"gpt-4.1": TimeoutError("Timeout"), "gpt-4.1-eu": 0}
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.completion_by_model(handlers)
+            with patch("asyncio.sleep", new_callable=AsyncMock):
+                results = [
+                    await service.complete([{"role": "user", "content": "Hi"}], model="main")
+                    for _ in range(4)
+                ]
+
+        assert all(result["success"] for result in results)
+        assert all(result["model"] == "gpt-4.1-eu" for result in results)
+        assert mock_completion.call_count <= 5  # gpt-4.1 is tried at most once
+        health = service._get_deployment_pool("main").snapshot()["deployments"]
+        assert health[0]["state"] == "open"
+        assert health[1]["state"] == "closed"
+
+    async def test_open_circuits_route_to_fallback_alias(self, temp_config_file):
+        """Test that requests use the fallback alias while all circuits are open."""
+        with open(temp_config_file) as f:
+            config = yaml.safe_load(f)
+        config["load_balancing"] = {"failure_threshold": 1, "fallbacks": {"main": "fast"}}
+        with open(temp_config_file, "w") as f:
+            yaml.dump(config, f)
+        service = OpenAIService(config_path=temp_config_file)
+        unavailable = Exception("Service unavailable")
+        unavailable.status_code = 503
+        handlers = {"gpt-4.1": unavailable, "gpt-4.1-mini": 0}
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.completion_by_model(handlers)
+            failed = await service.complete([{"role": "user", "content": "Hi"}], model="main")
+            result = await service.complete([{"role": "user", "content": "Hi"}], model="main")
+
+        assert failed["success"] is False
+        assert result["success"] is True
+        assert result["model"] == "gpt-4.1-mini"
+
+    async def test_request_errors_do_not_open_circuit(self, temp_config_file):
+        """Test that bad requests are not counted against the deployment."""
+        service = OpenAIService(
+            config_path=self.pooled_config(temp_config_file, failure_threshold=1)
+        )
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = ValueError("Invalid message format")
+            await service.complete([{"role": "user", "content": "Hi"}], model="main")
+
+        pool = service._get_deployment_pool("main")
+        assert all(health.state == "closed" for health, _ in pool.members)
+
+    async def test_slow_request_is_hedged(self, temp_config_file):
+        """Test that a request slower than p95 is duplicated to another deployment."""
+        service = OpenAIService(
+            config_path=self.pooled_config(
+                temp_config_file, hedge_min_samples=1, hedge_min_delay_ms=0
+            )
+        )
+        pool = service._get_deployment_pool("main")
+        slow, fast = (health for health, _ in pool.members)
+        slow.record_latency(20)
+        fast.record_latency(30)  # Worse score, so the slow deployment is picked first
+        handlers = {"gpt-4.1": 5.0, "gpt-4.1-eu": 0}
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.side_effect = self.completion_by_model(handlers)
+            result = await asyncio.wait_for(
+                service.complete([{"role": "user", "content": "Hi"}], model="main"),
+                timeout=2,
+            )
+
+        assert result["hedged"] is True
+        assert result["model"] == "gpt-4.1-eu"
+        assert pool.hedges == 1
+        assert pool.hedge_wins == 1
+        assert slow.latency_ewma_ms > 20  # Hedged-out latency is recorded
+
 
 @pytest.mark.asyncio
 class TestGenerate:
@@ -645,6 +1025,37 @@ class TestTracing:
                 assert call_args["success"] is True
                 assert call_args["response"] == "Traced response"
 
+    async def test_tracing_records_tool_calls(self, tracing_config_file):
+        """Test traces include tool calls so they can be replayed."""
+        service = OpenAIService(config_path=tracing_config_file)
+
+        tool_call = MagicMock(id="call_1", type="function")
+        tool_call.function.name = "file_read"
+        tool_call.function.arguments = '{"path": "a.txt"}'
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content=None, tool_calls=[tool_call]))]
+        mock_response.usage = {"total_tokens": 10}
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+            mock_completion.return_value = mock_response
+
+            with patch.object(
+                service, "_trace_to_file", new_callable=AsyncMock
+            ) as mock_trace_file:
+                await service.complete(
+                    messages=[{"role": "user", "content": "Trace me"}], model="main"
+                )
+                await asyncio.sleep(0.1)
+
+                call_args = mock_trace_file.call_args[0][0]
+                assert call_args["tool_calls"] == [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "file_read", "arguments": '{"path": "a.txt"}'},
+                    }
+                ]
+
     async def test_tracing_failure(self, tracing_config_file):
         """Test tracing captures failures."""
         service = OpenAIService(config_path=tracing_config_file)
@@ -672,6 +1083,7 @@ class TestTracing:
         trace_data = {"test": "data"}
 
         await service._trace_to_file(trace_data)
+        await close_trace_writers()
 
         trace_path = tmp_path / "traces/llm_traces.jsonl"
         assert trace_path.exists()
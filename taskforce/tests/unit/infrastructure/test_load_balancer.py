@@ -0,0 +1,236 @@
+"""
+Unit tests for deployment load balancing.
+
+Tests pool parsing, EWMA scoring, weighted picking, circuit breaker
+transitions, hedge delays, error classification and shared health.
+"""
+
+import pytest
+
+from taskforce.infrastructure.llm.load_balancer import (
+    DeploymentHealth,
+    DeploymentPool,
+    LoadBalancingConfig,
+    get_deployment_pool,
+    get_pool_health,
+    is_deployment_error,
+    parse_pool,
+    reset_deployment_pools,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(*weights, **config) -> DeploymentPool:
+    lb_config = LoadBalancingConfig(**config)
+    members = [
+        (DeploymentHealth(f"deployment-{i}", lb_config), weight)
+        for i, weight in enumerate(weights)
+    ]
+    return DeploymentPool("main", members, lb_config)
+
+
+def test_parse_pool_accepts_names_and_weighted_entries():
+    assert parse_pool("gpt-4.1") == [("gpt-4.1", 1.0)]
+    assert parse_pool(["a", {"deployment": "b", "weight": 3}, {"model": "c"}]) == [
+        ("a", 1.0),
+        ("b", 3.0),
+        ("c", 1.0),
+    ]
+
+    with pytest.raises(ValueError):
+        parse_pool([])
+    with pytest.raises(ValueError):
+        parse_pool([{"deployment": "a", "weight": 0}])
+
+
+def test_config_from_dict_clamps_values():
+    config = LoadBalancingConfig.from_dict(
+        {"ewma_alpha": 5, "failure_threshold": 0, "fallbacks": {"main": "fast"}}
+    )
+
+    assert config.ewma_alpha == 1.0
+    assert config.failure_threshold == 1
+    assert config.fallbacks == {"main": "fast"}
+    assert LoadBalancingConfig.from_dict(None) == LoadBalancingConfig()
+
+
+def test_latency_ewma_and_error_penalty():
+    health = DeploymentHealth("d", LoadBalancingConfig(ewma_alpha=0.5, error_penalty=1.0))
+
+    health.record_success(100)
+    health.record_success(200)
+    assert health.latency_ewma_ms == 150
+
+    health.record_failure()
+    assert health.score() == pytest.approx(150 * 1.5)
+
+
+def test_pick_prefers_lower_weighted_score():
+    pool = make_pool(1, 1)
+    slow, fast = (health for health, _ in pool.members)
+    slow.record_success(500)
+    fast.record_success(100)
+
+    assert all(pool.pick() is fast for _ in range(20))
+
+
+def test_pick_prefers_unobserved_deployments():
+    pool = make_pool(1, 1)
+    observed, fresh = (health for health, _ in pool.members)
+    observed.record_success(10)
+
+    assert pool.pick() is fresh
+
+
+def test_weights_scale_scores():
+    pool = make_pool(4, 1)
+    heavy, light = (health for health, _ in pool.members)
+    heavy.record_success(300)
+    light.record_success(100)
+
+    assert pool.pick() is heavy  # 300 / 4 < 100 / 1
+
+
+def test_circuit_opens_half_opens_and_closes():
+    clock = FakeClock()
+    config = LoadBalancingConfig(failure_threshold=2, cooldown_seconds=30)
+    health = DeploymentHealth("d", config, clock=clock)
+
+    health.record_failure()
+    assert health.state == "closed"
+    health.record_failure()
+    assert health.state == "open"
+    assert not health.available
+
+    clock.now += 30
+    assert health.state == "half_open"
+    health.begin()
+    assert not health.available  # Only one probe at a time
+
+    health.record_success(50)
+    assert health.state == "closed"
+    assert health.consecutive_failures == 0
+
+
+def test_failed_probe_reopens_circuit():
+    clock = FakeClock()
+    health = DeploymentHealth(
+        "d", LoadBalancingConfig(failure_threshold=1, cooldown_seconds=10), clock=clock
+    )
+    health.record_failure()
+    clock.now += 10
+
+    health.begin()
+    health.record_failure()
+
+    assert health.state == "open"
+    assert health.opened_at == clock.now
+
+
+def test_abandoned_probe_is_released():
+    clock = FakeClock()
+    health = DeploymentHealth(
+        "d", LoadBalancingConfig(failure_threshold=1, cooldown_seconds=0), clock=clock
+    )
+    health.record_failure()
+    health.begin()
+
+    health.abandon()
+
+    assert health.available
+
+
+def test_pool_with_all_circuits_open():
+    pool = make_pool(1, 1, failure_threshold=1)
+    first, second = (health for health, _ in pool.members)
+    first._clock = second._clock = FakeClock()
+    first.record_failure()
+    second._clock.now += 1
+    second.record_failure()
+
+    assert not pool.available
+    assert pool.pick() is first  # Opened first
+    assert pool.pick_alternate(exclude={"deployment-1"}) is None
+
+
+def test_hedge_delay_uses_latency_percentile():
+    pool = make_pool(1, 1, hedge_min_samples=10, hedge_min_delay_ms=0)
+    health = pool.members[0][0]
+
+    for latency in range(1, 10):
+        health.record_success(latency * 10)
+    assert pool.hedge_delay(health) is None  # Too few samples
+
+    health.record_success(1000)
+    assert pool.hedge_delay(health) == pytest.approx(1.0)
+
+
+def test_hedge_delay_disabled_for_single_deployment_and_config():
+    single = make_pool(1, hedge_min_samples=1)
+    single.members[0][0].record_success(100)
+    disabled = make_pool(1, 1, hedging=False, hedge_min_samples=1)
+    disabled.members[0][0].record_success(100)
+
+    assert single.hedge_delay(single.members[0][0]) is None
+    assert disabled.hedge_delay(disabled.members[0][0]) is None
+
+
+def test_is_deployment_error():
+    class RateLimitError(Exception):
+        pass
+
+    class APIConnectionError(Exception):
+        pass
+
+    server_error = Exception("upstream failed")
+    server_error.status_code = 502
+    bad_request = Exception("invalid")
+    bad_request.status_code = 400
+
+    assert is_deployment_error(RateLimitError("slow down"))
+    assert is_deployment_error(APIConnectionError("reset"))
+    assert is_deployment_error(TimeoutError())
+    assert is_deployment_error(server_error)
+    assert not is_deployment_error(bad_request)
+    assert not is_deployment_error(ValueError("bad input"))
+
+
+def test_pools_share_deployment_health():
+    reset_deployment_pools()
+    config = LoadBalancingConfig()
+
+    main = get_deployment_pool("main", [("a", 1.0), ("b", 1.0)], config)
+    other = get_deployment_pool("other", [("b", 2.0)], config)
+
+    assert get_deployment_pool("main", [("a", 1.0), ("b", 1.0)], config) is main
+    assert main.members[1][0] is other.members[0][0]
+    assert get_deployment_pool("main", [("a", 1.0)], config) is not main
+    assert {pool["alias"] for pool in get_pool_health()} == {"main", "other"}
+    reset_deployment_pools()
+
+
+def test_pools_are_kept_per_configuration():
+    """Services with different configs for an alias do not rebuild each other's pool."""
+    reset_deployment_pools()
+    targets = [("a", 1.0), ("b", 1.0)]
+    default = LoadBalancingConfig()
+    no_hedging = LoadBalancingConfig(hedging=False)
+
+    first = get_deployment_pool("main", targets, default)
+    second = get_deployment_pool("main", targets, no_hedging)
+    first.hedges = 3
+
+    assert second is not first
+    assert get_deployment_pool("main", targets, default) is first
+    assert get_deployment_pool("main", targets, LoadBalancingConfig()).hedges == 3
+    assert get_deployment_pool("main", targets, no_hedging) is second
+    assert first.members[0][0] is second.members[0][0]  # Deployment health is shared
+    assert len(get_pool_health()) == 2
+    reset_deployment_pools()
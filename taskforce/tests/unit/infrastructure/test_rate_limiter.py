@@ -0,0 +1,169 @@
+"""
+Unit tests for LLM admission control.
+
+Tests token buckets, in-flight limits, Retry-After pauses, adaptive rate
+scaling, Retry-After parsing, jittered backoff and shared governors.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from taskforce.infrastructure.llm.rate_limiter import (
+    RateGovernor,
+    RateLimitConfig,
+    TokenBucket,
+    backoff_delay,
+    get_rate_governor,
+    is_rate_limit_error,
+    reset_rate_governors,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_reserves_and_refills():
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock)  # 1 per second
+
+    for _ in range(60):
+        assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+    clock.now += 3
+    assert bucket.reserve(1) == 0.0
+
+
+def test_token_bucket_rate_scale_slows_refill():
+    bucket = TokenBucket(60, FakeClock())
+    bucket.reserve(60)
+
+    assert bucket.reserve(1, rate_scale=0.5) == pytest.approx(2.0)
+
+
+def test_token_bucket_adjust_reconciles_reservation():
+    bucket = TokenBucket(1000, FakeClock())
+    bucket.reserve(1000)
+
+    bucket.adjust(400)  # Estimate was 400 tokens too high
+
+    assert bucket.reserve(400) == 0.0
+
+
+def test_rate_limit_config_from_dict():
+    config = RateLimitConfig.from_dict({"requests_per_minute": 10, "max_in_flight": -1})
+
+    assert config == RateLimitConfig(requests_per_minute=10, tokens_per_minute=0, max_in_flight=0)
+    assert RateLimitConfig.from_dict(None) == RateLimitConfig()
+
+
+async def test_governor_limits_in_flight_requests():
+    governor = RateGovernor("deployment", RateLimitConfig(max_in_flight=2))
+    active = 0
+    peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with governor.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    assert governor.stats["admitted"] == 6
+    assert governor.stats["in_flight"] == 0
+
+
+async def test_governor_reports_queue_wait_for_token_budget():
+    governor = RateGovernor("deployment", RateLimitConfig(tokens_per_minute=6000))
+
+    first = await governor.acquire(estimated_tokens=6000)
+    governor.release()
+    second = await governor.acquire(estimated_tokens=5)  # 100 tokens/s refill
+    governor.release()
+
+    assert first.wait_ms == 0
+    assert second.wait_ms >= 30
+    assert governor.stats["throttled"] == 1
+
+
+async def test_governor_pauses_for_retry_after():
+    governor = RateGovernor("deployment", RateLimitConfig())
+
+    governor.record_rate_limited(retry_after=0.05)
+    admission = await governor.acquire()
+    governor.release()
+
+    assert admission.wait_ms >= 40
+    assert governor.stats["rate_limited"] == 1
+
+
+def test_governor_adaptive_rate_scale():
+    governor = RateGovernor("deployment", RateLimitConfig(requests_per_minute=60))
+    admission = SimpleNamespace(estimated_tokens=0)
+
+    governor.record_rate_limited()
+    governor.record_rate_limited()
+    assert governor.stats["rate_scale"] == pytest.approx(0.25)
+
+    for _ in range(100):
+        governor.record_success(admission)
+    assert governor.stats["rate_scale"] == 1.0
+
+
+def test_is_rate_limit_error():
+    class RateLimitError(Exception):
+        pass
+
+    assert is_rate_limit_error(RateLimitError("slow down"))
+    assert is_rate_limit_error(Exception("Error code: 429"))
+    assert not is_rate_limit_error(ValueError("bad input"))
+
+
+def test_retry_after_seconds_from_headers():
+    error = Exception("429")
+    error.response = SimpleNamespace(headers={"Retry-After": "7"})
+    assert retry_after_seconds(error) == 7.0
+
+    error.response = SimpleNamespace(headers={"retry-after-ms": "1500", "retry-after": "7"})
+    assert retry_after_seconds(error) == 1.5
+
+    error.response = SimpleNamespace(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry_after_seconds(error) == 0.0  # Date in the past
+
+    assert retry_after_seconds(Exception("no headers")) is None
+
+
+def test_backoff_delay_is_jittered_and_bounded():
+    delays = {backoff_delay(3, 2.0, 60.0) for _ in range(50)}
+
+    assert all(4.0 <= delay <= 8.0 for delay in delays)
+    assert len(delays) > 1
+    assert backoff_delay(10, 2.0, 60.0, jitter=False) == 60.0
+
+
+def test_backoff_delay_honours_retry_after():
+    assert backoff_delay(0, 2.0, 60.0, retry_after=20.0) >= 20.0
+    assert backoff_delay(0, 2.0, 60.0, retry_after=20.0, jitter=False) == 20.0
+
+
+def test_governors_shared_per_deployment():
+    reset_rate_governors()
+    config = RateLimitConfig(requests_per_minute=10)
+
+    first = get_rate_governor("azure/gpt-4.1", config)
+
+    assert get_rate_governor("azure/gpt-4.1", config) is first
+    assert get_rate_governor("azure/gpt-5", config) is not first
+    reset_rate_governors()
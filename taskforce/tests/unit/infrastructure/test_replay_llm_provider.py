@@ -0,0 +1,233 @@
+"""
+Unit tests for ReplayLLMProvider.
+
+Tests fixture loading from OpenAIService JSONL traces, request matching,
+latency models, streaming events and driving a LeanAgent offline.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from taskforce.core.domain.lean_agent import LeanAgent
+from taskforce.infrastructure.llm.replay_service import (
+    LatencyModel,
+    ReplayLLMProvider,
+    ReplayRecord,
+    conversation_fingerprint,
+)
+
+TOOL_CALL = {
+    "id": "call_1",
+    "type": "function",
+    "function": {"name": "file_read", "arguments": json.dumps({"path": "notes/readme.txt"})},
+}
+
+
+def trace(messages, response=None, tool_calls=None, success=True, latency_ms=800):
+    return {
+        "timestamp": "2025-01-01T00:00:00",
+        "model": "gpt-4.1",
+        "messages": messages,
+        "response": response,
+        "tool_calls": tool_calls,
+        "usage": {"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+        "latency_ms": latency_ms,
+        "success": success,
+        "error": None if success else "boom",
+    }
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    mission = [{"role": "system", "content": "Plan v1"}, {"role": "user", "content": "Mission"}]
+    tool_turn = [
+        *mission,
+        {"role": "assistant", "content": None, "tool_calls": [TOOL_CALL]},
+        {"role": "tool", "tool_call_id": "call_1", "name": "file_read", "content": "data"},
+    ]
+    path = tmp_path / "llm_traces.jsonl"
+    lines = [
+        trace(mission, tool_calls=[TOOL_CALL]),
+        trace(mission, success=False),
+        trace(tool_turn, response="The readme says hello."),
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+    return path
+
+
+class TestReplayLLMProvider:
+    """Tests for replaying recorded responses."""
+
+    def test_from_trace_file_skips_failures(self, trace_file):
+        provider = ReplayLLMProvider.from_trace_file(trace_file)
+
+        assert len(provider.records) == 2
+        assert provider.records[0].tool_calls == [TOOL_CALL]
+        assert provider.records[1].content == "The readme says hello."
+
+    def test_fingerprint_ignores_system_messages(self):
+        a = [{"role": "system", "content": "Plan v1"}, {"role": "user", "content": "Hi"}]
+        b = [{"role": "system", "content": "Plan v2"}, {"role": "user", "content": "Hi"}]
+
+        assert conversation_fingerprint(a) == conversation_fingerprint(b)
+
+    @pytest.mark.asyncio
+    async def test_complete_matches_by_fingerprint(self, trace_file):
+        provider = ReplayLLMProvider.from_trace_file(trace_file)
+        messages = [
+            {"role": "user", "content": "Mission"},
+            {"role": "assistant", "content": None, "tool_calls": [TOOL_CALL]},
+            {"role": "tool", "tool_call_id": "call_1", "name": "file_read", "content": "data"},
+        ]
+
+        result = await provider.complete(messages, model="main")
+
+        assert result["success"] is True
+        assert result["content"] == "The readme says hello."
+        assert result["usage"]["total_tokens"] == 120
+        assert provider.stats["fingerprint_matches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_complete_falls_back_to_order_and_exhausts(self):
+        provider = ReplayLLMProvider([ReplayRecord(content="first"), ReplayRecord(content="second")])
+        other = [{"role": "user", "content": "unrelated"}]
+
+        assert (await provider.complete(other))["content"] == "first"
+        assert (await provider.complete(other))["content"] == "second"
+        exhausted = await provider.complete(other)
+
+        assert exhausted["success"] is False
+        assert exhausted["error_type"] == "ReplayExhaustedError"
+        assert provider.stats["sequential_matches"] == 2
+        assert provider.stats["exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_loop_restarts_replay(self):
+        provider = ReplayLLMProvider([ReplayRecord(content="only")], loop=True)
+
+        results = [await provider.complete([{"role": "user", "content": "x"}]) for _ in range(3)]
+
+        assert [r["content"] for r in results] == ["only"] * 3
+
+    @pytest.mark.asyncio
+    async def test_usage_estimated_when_not_recorded(self):
+        provider = ReplayLLMProvider([ReplayRecord(content="x" * 40)])
+
+        result = await provider.complete([{"role": "user", "content": "hello"}])
+
+        assert result["usage"]["completion_tokens"] == 10
+        assert result["usage"]["prompt_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_generate_aliases_generated_text(self):
+        provider = ReplayLLMProvider([ReplayRecord(content="generated")])
+
+        result = await provider.generate("Prompt", context={"key": "value"})
+
+        assert result["generated_text"] == "generated"
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_tokens_tool_calls_and_done(self):
+        provider = ReplayLLMProvider(
+            [ReplayRecord(content="Reading the file now.", tool_calls=[TOOL_CALL])]
+        )
+
+        events = [e async for e in provider.complete_stream([{"role": "user", "content": "x"}])]
+        types = [e["type"] for e in events]
+
+        assert "".join(e["content"] for e in events if e["type"] == "token") == (
+            "Reading the file now."
+        )
+        assert types.index("tool_call_start") < types.index("tool_call_end")
+        deltas = "".join(e["arguments_delta"] for e in events if e["type"] == "tool_call_delta")
+        assert deltas == TOOL_CALL["function"]["arguments"]
+        assert types[-1] == "done"
+
+    @pytest.mark.asyncio
+    async def test_stream_exhausted_yields_error(self):
+        provider = ReplayLLMProvider([])
+
+        events = [e async for e in provider.complete_stream([{"role": "user", "content": "x"}])]
+
+        assert events == [{"type": "error", "message": "Replay fixtures exhausted after 0 records"}]
+
+
+class TestLatencyModel:
+    """Tests for synthetic latency."""
+
+    def test_none_has_no_delay(self):
+        assert LatencyModel().timings(ReplayRecord(latency_ms=900), 50) == (0.0, 0.0)
+
+    def test_recorded_splits_ttft_and_generation(self):
+        model = LatencyModel(mode="recorded", time_to_first_token_ms=200, speedup=2)
+
+        ttft, generation = model.timings(ReplayRecord(latency_ms=1000), 50)
+
+        assert ttft == pytest.approx(0.1)
+        assert generation == pytest.approx(0.4)
+
+    def test_synthetic_uses_token_rate(self):
+        model = LatencyModel(mode="synthetic", time_to_first_token_ms=100, tokens_per_second=100)
+
+        ttft, generation = model.timings(ReplayRecord(), 50)
+
+        assert ttft == pytest.approx(0.1)
+        assert generation == pytest.approx(0.5)
+
+    def test_jitter_is_reproducible_with_seed(self):
+        a = LatencyModel(mode="synthetic", jitter=0.5, seed=7)
+        b = LatencyModel(mode="synthetic", jitter=0.5, seed=7)
+
+        assert a.timings(ReplayRecord(), 10) == b.timings(ReplayRecord(), 10)
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            LatencyModel(mode="realistic")
+
+    @pytest.mark.asyncio
+    async def test_complete_sleeps_for_simulated_latency(self, monkeypatch):
+        latency = LatencyModel(mode="synthetic", time_to_first_token_ms=20, tokens_per_second=1000)
+        provider = ReplayLLMProvider(
+            [ReplayRecord(content="x", usage={"completion_tokens": 10})], latency=latency
+        )
+        delays = []
+        sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            await sleep(0)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+
+        await provider.complete([{"role": "user", "content": "x"}])
+
+        assert delays == [pytest.approx(0.03)]  # 20ms TTFT + 10 tokens at 1000/s
+
+
+class TestReplayWithLeanAgent:
+    """LeanAgent runs end-to-end against recorded traces."""
+
+    @pytest.mark.asyncio
+    async def test_agent_replays_recorded_mission(self, trace_file):
+        state_manager = AsyncMock()
+        state_manager.load_state.return_value = {}
+        tool = MagicMock()
+        tool.name = "file_read"
+        tool.description = "Read a file"
+        tool.parameters_schema = {"type": "object", "properties": {"path": {"type": "string"}}}
+        tool.execute = AsyncMock(return_value={"success": True, "output": "data"})
+        agent = LeanAgent(
+            state_manager=state_manager,
+            llm_provider=ReplayLLMProvider.from_trace_file(trace_file),
+            tools=[tool],
+            system_prompt="Test",
+        )
+
+        result = await agent.execute("Mission", "s1")
+
+        assert result.status == "completed"
+        assert result.final_message == "The readme says hello."
+        tool.execute.assert_awaited_once_with(path="notes/readme.txt")
@@ -0,0 +1,122 @@
+"""
+Unit tests for the LLM response cache.
+
+Tests key normalization, LRU eviction, TTL expiry, the SQLite tier,
+statistics and shared caches per configuration.
+"""
+
+from taskforce.infrastructure.llm.response_cache import (
+    LLMResponseCache,
+    ResponseCacheConfig,
+    compute_cache_key,
+    get_response_cache,
+    reset_response_caches,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "Classify"},
+    {"role": "user", "content": "Hello"},
+]
+
+
+def test_cache_key_ignores_bookkeeping_fields_and_key_order():
+    annotated = [
+        {"content": "Classify", "role": "system", "_pinned": True},
+        {"role": "user", "content": "Hello", "tool_calls": None},
+    ]
+
+    assert compute_cache_key("gpt-4.1", MESSAGES) == compute_cache_key("gpt-4.1", annotated)
+
+
+def test_cache_key_covers_model_tools_and_params():
+    base = compute_cache_key("gpt-4.1", MESSAGES, params={"temperature": 0})
+    tools = [{"type": "function", "function": {"name": "search"}}]
+
+    assert compute_cache_key("gpt-5", MESSAGES, params={"temperature": 0}) != base
+    assert compute_cache_key("gpt-4.1", MESSAGES, params={"temperature": 0, "max_tokens": 5}) != base
+    assert compute_cache_key("gpt-4.1", MESSAGES, tools=tools, params={"temperature": 0}) != base
+
+
+async def test_memory_hit_returns_independent_copy():
+    cache = LLMResponseCache(ResponseCacheConfig(enabled=True))
+    await cache.put("k", {"success": True, "content": "answer"})
+
+    first = await cache.get("k")
+    first["content"] = "mutated"
+
+    assert (await cache.get("k"))["content"] == "answer"
+    assert await cache.get("other") is None
+    assert cache.stats["hits"] == 2
+    assert cache.stats["memory_hits"] == 2
+    assert cache.stats["misses"] == 1
+
+
+async def test_lru_evicts_least_recently_used():
+    cache = LLMResponseCache(ResponseCacheConfig(enabled=True, max_entries=2))
+    await cache.put("a", {"content": "a"})
+    await cache.put("b", {"content": "b"})
+    await cache.get("a")
+    await cache.put("c", {"content": "c"})
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert cache.stats["evictions"] == 1
+
+
+async def test_expired_entries_are_misses(monkeypatch):
+    cache = LLMResponseCache(ResponseCacheConfig(enabled=True, ttl_seconds=10))
+    now = 1000.0
+    monkeypatch.setattr("taskforce.infrastructure.llm.response_cache.time.time", lambda: now)
+    await cache.put("k", {"content": "old"})
+
+    now = 1011.0
+
+    assert await cache.get("k") is None
+    assert cache.stats["size"] == 0
+
+
+async def test_disk_tier_survives_new_cache_instance(tmp_path):
+    config = ResponseCacheConfig(enabled=True, disk_path=str(tmp_path / "cache.sqlite3"))
+    writer = LLMResponseCache(config)
+    await writer.put("k", {"success": True, "content": "persisted"}, model="gpt-4.1")
+    writer.close()
+
+    reader = LLMResponseCache(config)
+    result = await reader.get("k")
+    again = await reader.get("k")
+    reader.close()
+
+    assert result["content"] == "persisted"
+    assert again["content"] == "persisted"
+    assert reader.stats["disk_hits"] == 1
+    assert reader.stats["memory_hits"] == 1
+
+
+def test_config_from_dict_defaults():
+    config = ResponseCacheConfig.from_dict({"enabled": True, "max_entries": 0})
+
+    assert config.enabled is True
+    assert config.max_entries == 1
+    assert config.disk_path is None
+    assert ResponseCacheConfig.from_dict(None).enabled is False
+
+
+def test_caches_shared_per_disk_path(tmp_path):
+    reset_response_caches()
+    memory = ResponseCacheConfig(enabled=True)
+    disk = ResponseCacheConfig(enabled=True, disk_path=str(tmp_path / "cache.sqlite3"))
+
+    assert get_response_cache(memory) is get_response_cache(ResponseCacheConfig(enabled=True))
+    assert get_response_cache(disk) is not get_response_cache(memory)
+    reset_response_caches()
+
+
+async def test_zero_ttl_never_expires(monkeypatch):
+    cache = LLMResponseCache(ResponseCacheConfig(enabled=True, ttl_seconds=0))
+    now = 1000.0
+    monkeypatch.setattr("taskforce.infrastructure.llm.response_cache.time.time", lambda: now)
+    await cache.put("k", {"content": "kept"})
+
+    now = 10**9
+
+    assert (await cache.get("k"))["content"] == "kept"
@@ -0,0 +1,170 @@
+"""
+Unit tests for tool result selectors.
+
+Tests selector parsing, field paths, byte/char/line ranges, chunks,
+max_chars paging and that ranges only read what they need.
+"""
+
+import io
+import json
+
+import pytest
+
+from taskforce.infrastructure.cache.result_selector import (
+    ResultSelector,
+    parse_selector,
+    select_from_file,
+)
+
+
+def select(document: str, selector: str, max_chars: int | None = None) -> dict:
+    data = document.encode("utf-8")
+    return select_from_file(
+        io.BytesIO(data), parse_selector(selector), len(data), len(document), max_chars
+    )
+
+
+class CountingReader(io.BytesIO):
+    """BytesIO recording how many bytes were read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_parse_selector_variants():
+    assert str(parse_selector("lines=10:20")) == "lines=10:20"
+    assert str(parse_selector("chars=5:")) == "chars=5:"
+    assert str(parse_selector("chunk=2/4")) == "chunk=2/4"
+    assert str(parse_selector("output|lines=0:5")) == "output|lines=0:5"
+
+    field = parse_selector('$.data.items[0]["a.b"][1:3]')
+    assert field.unit is None
+    assert field.path == ("data", "items", 0, "a.b", slice(1, 3))
+
+
+@pytest.mark.parametrize(
+    "selector",
+    ["", "chunk=0/3", "chunk=4/3", "lines=5:2", "data..items", "items[x]"],
+)
+def test_parse_selector_rejects_malformed(selector):
+    with pytest.raises(ValueError):
+        parse_selector(selector)
+
+
+def test_char_and_byte_ranges():
+    document = "0123456789" * 10
+
+    assert select(document, "chars=10:15")["output"] == "01234"
+    result = select(document, "bytes=95:")
+    assert result["output"] == "56789"
+    assert result["has_more"] is False
+    assert result["range"] == {"unit": "bytes", "start": 95, "end": 100, "total": 100}
+
+
+def test_char_range_on_multibyte_document():
+    document = "äöü" * 10 + "end"
+
+    result = select(document, "chars=30:33")
+
+    assert result["output"] == "end"
+    assert result["has_more"] is False
+
+
+def test_line_ranges_and_paging():
+    document = "".join(f"line {i}\n" for i in range(10))
+
+    result = select(document, "lines=2:4")
+    assert result["output"] == "line 2\nline 3\n"
+    assert result["has_more"] is True
+    assert result["next_selector"] == "lines=4:6"
+
+    last = select(document, "lines=8:")
+    assert last["output"] == "line 8\nline 9\n"
+    assert last["has_more"] is False
+    assert last["next_selector"] is None
+
+
+def test_line_range_stops_at_max_chars():
+    document = "".join(f"line {i}\n" for i in range(100))
+
+    result = select(document, "lines=0:", max_chars=20)
+
+    assert result["output"] == "line 0\nline 1\n"
+    assert result["next_selector"] == "lines=2:"
+
+
+def test_long_single_line_is_cut():
+    result = select("x" * 1000, "lines=0:1", max_chars=10)
+
+    assert result["output"] == "x" * 10
+
+
+def test_chunks_cover_document():
+    document = "abcdefghij"
+
+    parts = [select(document, f"chunk={i}/3") for i in range(1, 4)]
+
+    assert "".join(part["output"] for part in parts) == document
+    assert parts[0]["next_selector"] == "chunk=2/3"
+    assert parts[2]["has_more"] is False
+
+
+def test_chunk_without_count_is_rejected():
+    with pytest.raises(ValueError, match="chunk count"):
+        select_from_file(io.BytesIO(b"abc"), ResultSelector(unit="chunk", start=1), 3, 3)
+
+
+def test_max_chars_pages_through_char_ranges():
+    document = "a" * 25
+
+    first = select(document, "chars=0:", max_chars=10)
+    second = select(document, first["next_selector"], max_chars=10)
+    third = select(document, second["next_selector"], max_chars=10)
+
+    assert [first["output"], second["output"], third["output"]] == ["a" * 10, "a" * 10, "a" * 5]
+    assert third["has_more"] is False
+
+
+def test_field_selection():
+    document = json.dumps(
+        {"success": True, "output": "one\ntwo\nthree", "data": {"items": [{"t": "x"}, {"t": "y"}]}},
+        indent=2,
+    )
+
+    assert select(document, "data.items[1].t")["output"] == "y"
+    assert select(document, "$.data.items[0:1]")["output"] == [{"t": "x"}]
+    assert select(document, "output|lines=1:2")["output"] == "two\n"
+
+    with pytest.raises(ValueError, match="not found"):
+        select(document, "data.missing")
+
+
+def test_large_field_is_paged():
+    document = json.dumps({"output": "z" * 100})
+
+    result = select(document, "output", max_chars=40)
+
+    assert result["output"] == "z" * 40
+    assert result["next_selector"] == "output|chars=40:"
+
+
+def test_ranges_read_only_needed_blocks():
+    document = ("x" * 99 + "\n") * 20000  # ~2 MB
+    reader = CountingReader(document.encode("utf-8"))
+
+    result = select_from_file(
+        reader, parse_selector("lines=10:12"), len(document), len(document)
+    )
+
+    assert result["output"] == ("x" * 99 + "\n") * 2
+    assert reader.bytes_read <= 128 * 1024
+
+    reader = CountingReader(document.encode("utf-8"))
+    select_from_file(reader, parse_selector("chars=1500000:1500100"), len(document), len(document))
+    assert reader.bytes_read == 100
@@ -0,0 +1,202 @@
+"""
+Unit tests for SQLiteToolResultStore implementation.
+
+Tests cover:
+- Storing and retrieving tool results (inline and side files)
+- Deletion and session cleanup
+- Storage statistics
+- WAL mode and indexes
+- Migration from the FileToolResultStore directory layout
+"""
+
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from taskforce.infrastructure.cache.sqlite_tool_result_store import (
+    SQLiteToolResultStore,
+)
+from taskforce.infrastructure.cache.tool_result_store import FileToolResultStore
+
+
+@pytest.fixture
+def tmpdir():
+    with tempfile.TemporaryDirectory() as path:
+        yield Path(path)
+
+
+@pytest.fixture
+def store(tmpdir):
+    """Create a temporary SQLiteToolResultStore with a small inline threshold."""
+    store = SQLiteToolResultStore(tmpdir / "results.sqlite3", inline_threshold=1024)
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_put_and_fetch_inline_result(store):
+    """Test storing and retrieving a small result kept in the row."""
+    result = {"success": True, "output": "Test output", "data": {"key": "value"}}
+
+    metadata = {"step": 3}
+    handle = await store.put("test_tool", result, "session_1", metadata=metadata)
+    fetched = await store.fetch(handle)
+
+    assert fetched == result
+    assert handle.metadata == {"step": 3, "session_id": "session_1", "success": True}
+    assert metadata == {"step": 3}  # Caller's dict is copied, not mutated
+    assert not store.side_files_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_put_and_fetch_side_file_result(store):
+    """Test that payloads above the inline threshold go to side files."""
+    result = {"success": True, "output": "x" * 5000}
+
+    handle = await store.put("file_read", result, "session_1")
+
+    assert await store.fetch(handle) == result
+    assert len(list(store.side_files_dir.glob("*/*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_with_max_chars(store):
+    """Test fetching with a character limit truncates large fields."""
+    handle = await store.put("tool", {"success": True, "output": "x" * 10000}, "s1")
+
+    fetched = await store.fetch(handle, max_chars=1000)
+
+    assert len(fetched["output"]) < 10000
+    assert "[TRUNCATED]" in fetched["output"]
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_row_and_side_file(store):
+    """Test deleting results."""
+    small = await store.put("tool", {"success": True, "output": "small"}, "s1")
+    large = await store.put("tool", {"success": True, "output": "x" * 5000}, "s1")
+
+    assert await store.delete(small) is True
+    assert await store.delete(large) is True
+    assert await store.delete(large) is False
+
+    assert await store.fetch(small) is None
+    assert not list(store.side_files_dir.glob("*/*.json"))
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session(store):
+    """Test cleaning up all results for a session."""
+    for i in range(3):
+        await store.put(f"tool_{i}", {"success": True, "output": "x" * 2000 * i}, "session_1")
+    kept = await store.put("tool", {"success": True, "output": "keep"}, "session_2")
+
+    assert await store.cleanup_session("session_1") == 3
+
+    assert await store.fetch(kept) is not None
+    assert not list(store.side_files_dir.glob("*/*.json"))
+    assert (await store.get_stats())["total_results"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_stats(store):
+    """Test statistics come from aggregates over the table."""
+    empty = await store.get_stats()
+    assert empty["total_results"] == 0
+    assert empty["total_bytes"] == 0
+    assert empty["oldest_result"] is None
+
+    first = await store.put("search", {"success": True, "output": "a"}, "s1")
+    await store.put("search", {"success": True, "output": "x" * 5000}, "s1")
+    await store.put("file_read", {"success": False, "error": "boom"}, "s2")
+
+    stats = await store.get_stats()
+    assert stats["total_results"] == 3
+    assert stats["total_bytes"] > 5000
+    assert stats["side_file_results"] == 1
+    assert stats["results_by_tool"] == {"search": 2, "file_read": 1}
+    assert stats["oldest_result"] == first.created_at
+    assert stats["oldest_result"] <= stats["newest_result"]
+    assert stats["db_bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_database_uses_wal_and_indexes(store):
+    """Test journal mode and the indexed columns."""
+    await store.put("tool", {"success": True}, "s1")
+
+    db = sqlite3.connect(store.db_path)
+    try:
+        journal_mode = db.execute("PRAGMA journal_mode").fetchone()[0]
+        indexed = {
+            db.execute(f"PRAGMA index_info({name})").fetchone()[2]
+            for (name,) in db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = 'tool_results' AND name LIKE 'idx_%'"
+            )
+        }
+    finally:
+        db.close()
+
+    assert journal_mode == "wal"
+    assert indexed == {"session_id", "tool", "created_at"}
+
+
+@pytest.mark.asyncio
+async def test_migrate_from_file_store(tmpdir):
+    """Test importing plain and content-addressed file stores keeps handles valid."""
+    plain = FileToolResultStore(tmpdir / "files")
+    content_addressed = FileToolResultStore(tmpdir / "files", content_addressed=True)
+    handles = [
+        await plain.put("search", {"success": True, "output": "plain"}, "s1"),
+        await plain.put("file_read", {"success": True, "output": "x" * 5000}, "s1"),
+        await content_addressed.put("search", {"success": True, "output": "shared"}, "s2"),
+    ]
+    (tmpdir / "files" / "handles" / "broken.json").write_text("{not json")
+
+    store = SQLiteToolResultStore(tmpdir / "results.sqlite3", inline_threshold=1024)
+    try:
+        report = await store.migrate_from_file_store(tmpdir / "files", batch_size=2)
+
+        assert report == {"migrated": 3, "skipped": 0, "failed": 1}
+        for handle in handles:
+            assert await store.fetch(handle) == await plain.fetch(handle)
+        stats = await store.get_stats()
+        assert stats["side_file_results"] == 1
+        assert stats["results_by_tool"] == {"search": 2, "file_read": 1}
+        assert await store.cleanup_session("s1") == 2
+
+        rerun = await store.migrate_from_file_store(tmpdir / "files")
+        assert rerun["skipped"] == 1  # s2 result already imported
+    finally:
+        store.close()
+
+    # Source is left untouched
+    handle_files = list((tmpdir / "files" / "handles").glob("*.json"))
+    assert len(handle_files) == 4
+    assert json.loads((tmpdir / "files" / "handles" / f"{handles[0].id}.json").read_text())
+
+
+@pytest.mark.asyncio
+async def test_migrate_from_missing_directory(store, tmpdir):
+    """Test migrating a directory without a store."""
+    assert await store.migrate_from_file_store(tmpdir / "missing") == {
+        "migrated": 0,
+        "skipped": 0,
+        "failed": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_handle_and_list_handles(store):
+    """Test handle lookups by ID and session."""
+    first = await store.put("tool", {"success": True, "output": "a"}, "s1", metadata={"step": 1})
+    await store.put("tool", {"success": True, "output": "b"}, "s2")
+
+    assert await store.get_handle(first.id) == first
+    assert await store.get_handle("unknown") is None
+    assert [h.id for h in await store.list_handles("s1")] == [first.id]
+    assert len(await store.list_handles()) == 2
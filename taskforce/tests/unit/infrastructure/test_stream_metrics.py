@@ -0,0 +1,87 @@
+"""
+Unit tests for streaming performance metrics.
+
+Tests time to first token, time to first tool call, inter-token gaps,
+throughput and the per profile/alias/deployment aggregates.
+"""
+
+import pytest
+
+from taskforce.infrastructure.llm.stream_metrics import (
+    StreamTimer,
+    get_stream_stats,
+    record_stream_metrics,
+    reset_stream_stats,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_timer_measures_first_token_gaps_and_throughput():
+    clock = FakeClock()
+    timer = StreamTimer(clock)
+
+    clock.now += 0.5
+    timer.mark_output()
+    for gap in (0.1, 0.1, 0.3):
+        clock.now += gap
+        timer.mark_output()
+    metrics = timer.finish()
+
+    assert metrics["ttft_ms"] == 500.0
+    assert metrics["inter_token_mean_ms"] == pytest.approx(166.7)
+    assert metrics["inter_token_p95_ms"] == 300.0
+    assert metrics["inter_token_max_ms"] == 300.0
+    assert metrics["output_chunks"] == 4
+    assert metrics["tokens_per_second"] == pytest.approx(4 / 0.5)
+    assert metrics["stream_ms"] == 1000.0
+    assert metrics["first_tool_call_ms"] is None
+
+
+def test_timer_prefers_reported_completion_tokens():
+    clock = FakeClock()
+    timer = StreamTimer(clock)
+    timer.mark_output()
+    timer.mark_tool_call_start()
+    clock.now += 2.0
+    timer.mark_tool_call_start()  # Only the first tool call counts
+    timer.mark_output()
+
+    metrics = timer.finish(completion_tokens=50)
+
+    assert metrics["tokens_per_second"] == 25.0
+    assert metrics["first_tool_call_ms"] == 0.0
+
+
+def test_timer_without_output():
+    metrics = StreamTimer(FakeClock()).finish()
+
+    assert metrics["ttft_ms"] is None
+    assert metrics["inter_token_mean_ms"] is None
+    assert metrics["tokens_per_second"] is None
+    assert metrics["output_chunks"] == 0
+
+
+def test_stats_aggregated_per_profile_alias_and_deployment():
+    reset_stream_stats()
+    fast = {"ttft_ms": 100.0, "tokens_per_second": 80.0, "first_tool_call_ms": None}
+    slow = {"ttft_ms": 300.0, "tokens_per_second": 20.0, "first_tool_call_ms": 400.0}
+
+    record_stream_metrics("dev", "main", "azure/eastus", fast)
+    record_stream_metrics("dev", "main", "azure/eastus", slow)
+    record_stream_metrics("prod", "main", "azure/eastus", fast)
+
+    stats = {(entry["profile"], entry["model"]): entry for entry in get_stream_stats()}
+    dev = stats[("dev", "azure/eastus")]
+    assert dev["streams"] == 2
+    assert dev["ttft_p50_ms"] == 100.0
+    assert dev["ttft_p95_ms"] == 300.0
+    assert dev["first_tool_call_p50_ms"] == 400.0
+    assert stats[("prod", "azure/eastus")]["streams"] == 1
+    reset_stream_stats()
@@ -0,0 +1,187 @@
+"""
+Unit tests for TieredToolResultStore.
+
+Tests cover:
+- Hot tier hits, LRU eviction by bytes and range reads bypassing memory
+- Per-session and global disk quotas
+- TTL expiry on fetch and by the background GC task
+- Index bootstrap from the cold tier and statistics
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from taskforce.infrastructure.cache.sqlite_tool_result_store import SQLiteToolResultStore
+from taskforce.infrastructure.cache.tiered_tool_result_store import TieredToolResultStore
+from taskforce.infrastructure.cache.tool_result_store import FileToolResultStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+def result(size: int, marker: str = "x") -> dict:
+    return {"success": True, "output": marker * size}
+
+
+@pytest.fixture
+def cold(tmp_path):
+    return FileToolResultStore(tmp_path / "results")
+
+
+@pytest.mark.asyncio
+async def test_repeated_fetches_are_served_from_memory(cold):
+    store = TieredToolResultStore(cold)
+    handle = await store.put("file_read", result(1000), "s1")
+
+    first = await store.fetch(handle)
+    (cold.results_dir / f"{handle.id}.json").unlink()  # Disk copy gone
+    second = await store.fetch(handle)
+
+    assert first == second == result(1000)
+    stats = await store.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["memory_misses"] == 1
+    assert stats["memory_hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_field_selections_use_memory_and_ranges_go_to_disk(cold):
+    store = TieredToolResultStore(cold)
+    handle = await store.put("file_read", {"success": True, "output": "a\nb\nc\n"}, "s1")
+    await store.fetch(handle)
+
+    field = await store.fetch(handle, selector="output|lines=1:2")
+    document = await store.fetch(handle, selector="chars=0:10")
+
+    assert field["output"] == "b\n"
+    assert len(document["output"]) == 10
+    stats = await store.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["range_reads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_is_byte_bounded_lru(cold):
+    store = TieredToolResultStore(cold, memory_max_bytes=2500)
+    handles = [await store.put("tool", result(1000, str(i)), "s1") for i in range(3)]
+
+    for handle in handles:
+        await store.fetch(handle)
+    await store.fetch(handles[2])  # Hit: most recent
+
+    stats = await store.get_stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_bytes"] <= 2500
+    assert stats["memory_evictions"] == 1
+    assert stats["bytes_evicted_memory"] > 1000
+    assert stats["memory_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_session_quota_evicts_least_recently_used(cold):
+    store = TieredToolResultStore(cold, session_quota_bytes=2500)
+    first = await store.put("tool", result(1000, "a"), "s1")
+    second = await store.put("tool", result(1000, "b"), "s1")
+    other = await store.put("tool", result(1000, "c"), "s2")
+    await store.fetch(first)  # first is now more recent than second
+
+    third = await store.put("tool", result(1000, "d"), "s1")
+
+    assert await store.fetch(second) is None
+    assert await store.fetch(first) is not None
+    assert await store.fetch(third) is not None
+    assert await store.fetch(other) is not None
+    stats = await store.get_stats()
+    assert stats["quota_evictions"] == 1
+    assert stats["bytes_evicted"] == second.size_bytes
+    assert stats["total_results"] == 3
+
+
+@pytest.mark.asyncio
+async def test_global_quota_keeps_newest_result(cold):
+    store = TieredToolResultStore(cold, global_quota_bytes=1500)
+    await store.put("tool", result(1000, "a"), "s1")
+    await store.put("tool", result(1000, "b"), "s2")
+    newest = await store.put("tool", result(5000, "c"), "s3")
+
+    stats = await store.get_stats()
+    assert stats["tracked_results"] == 1
+    assert stats["quota_evictions"] == 2
+    assert await store.fetch(newest) == result(5000, "c")
+
+
+@pytest.mark.asyncio
+async def test_ttl_expires_on_fetch_and_by_gc(cold):
+    clock = FakeClock()
+    store = TieredToolResultStore(cold, ttl_seconds=60, clock=clock)
+    old = await store.put("tool", result(10, "a"), "s1")
+    other = await store.put("tool", result(10, "b"), "s1")
+    try:
+        clock.now += 61
+
+        assert await store.get_handle(old.id) is None
+        assert await store.fetch(old) is None
+        assert await store.collect_garbage() == 1
+
+        stats = await store.get_stats()
+        assert stats["ttl_evictions"] == 2
+        assert stats["total_results"] == 0
+        assert await cold.fetch(other) is None
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_background_gc_task(cold):
+    clock = FakeClock()
+    store = TieredToolResultStore(cold, ttl_seconds=1, gc_interval_seconds=0.01, clock=clock)
+    handle = await store.put("tool", result(10), "s1")
+    clock.now += 2
+
+    for _ in range(100):
+        if (await store.get_stats())["ttl_evictions"]:
+            break
+        await asyncio.sleep(0.01)
+    await store.close()
+
+    assert await cold.get_handle(handle.id) is None
+
+
+@pytest.mark.asyncio
+async def test_index_is_loaded_from_cold_tier(tmp_path):
+    cold = SQLiteToolResultStore(tmp_path / "results.sqlite3")
+    try:
+        previous = await cold.put("tool", result(1000, "a"), "s1")
+        store = TieredToolResultStore(cold, session_quota_bytes=1500)
+
+        await store.put("tool", result(1000, "b"), "s1")
+
+        assert await cold.get_handle(previous.id) is None
+        stats = await store.get_stats()
+        assert stats["tracked_results"] == 1
+        assert stats["quota_evictions"] == 1
+    finally:
+        cold.close()
+
+
+@pytest.mark.asyncio
+async def test_delete_and_cleanup_session_cover_both_tiers(cold):
+    store = TieredToolResultStore(cold)
+    handle = await store.put("tool", result(100), "s1")
+    await store.put("tool", result(100), "s2")
+    await store.fetch(handle)
+
+    assert await store.delete(handle) is True
+    assert await store.fetch(handle) is None
+    assert await store.cleanup_session("s2") == 1
+
+    stats = await store.get_stats()
+    assert stats["memory_entries"] == 0
+    assert stats["tracked_bytes"] == 0
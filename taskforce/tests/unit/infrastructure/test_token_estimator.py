@@ -0,0 +1,212 @@
+"""
+Unit tests for tokenizer-backed token estimation.
+
+Tests local-only encoding loading, alias resolution, the content-hash LRU
+cache, and the accuracy of the heuristic and tokenizer estimators against
+recorded LLM traces (throughput: scripts/benchmark_token_estimator.py).
+"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from taskforce.core.domain.token_budgeter import HeuristicTokenEstimator, TokenBudgeter
+from taskforce.infrastructure.llm import token_estimator as module
+from taskforce.infrastructure.llm.token_estimator import (
+    TiktokenEstimator,
+    create_token_estimator,
+    encoding_name_for_model,
+    load_local_encoding,
+)
+from taskforce.infrastructure.llm.trace_format import iter_traces
+
+TRACES_PATH = Path(__file__).parents[3] / "traces" / "llm_traces.jsonl"
+O200K_URL = "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+
+
+@pytest.fixture
+def o200k():
+    """Locally available o200k_base encoding (skip if not bundled)."""
+    encoding = load_local_encoding("o200k_base")
+    if encoding is None:
+        pytest.skip("o200k_base tokenizer not available locally")
+    return encoding
+
+
+@pytest.fixture
+def llm_config(tmp_path):
+    """Write a minimal llm_config.yaml and return its path."""
+
+    def _write(tokenizer: dict | None = None) -> str:
+        config = {
+            "models": {"main": "gpt-4.1", "legacy": "gpt-4-turbo", "custom": "my-model"},
+        }
+        if tokenizer is not None:
+            config["tokenizer"] = tokenizer
+        path = tmp_path / "llm_config.yaml"
+        path.write_text(yaml.safe_dump(config))
+        return str(path)
+
+    return _write
+
+
+class TestEncodingResolution:
+    """Tests for model -> encoding resolution."""
+
+    def test_known_models(self):
+        assert encoding_name_for_model("gpt-4.1") == "o200k_base"
+        assert encoding_name_for_model("gpt-4-turbo") == "cl100k_base"
+
+    def test_provider_prefix_ignored(self):
+        assert encoding_name_for_model("azure/gpt-5-mini") == "o200k_base"
+
+    def test_unknown_model_uses_default(self):
+        assert encoding_name_for_model("my-model", default="cl100k_base") == "cl100k_base"
+
+    def test_override_wins(self):
+        assert encoding_name_for_model("gpt-4.1", {"gpt-4.1": "cl100k_base"}) == "cl100k_base"
+
+
+class TestLocalLoading:
+    """Tests for offline encoding loading."""
+
+    def test_missing_encoding_never_downloads(self, monkeypatch, tmp_path):
+        """Encodings without local files fall back instead of fetching."""
+        import tiktoken.load
+
+        downloads = []
+        original_read_file = tiktoken.load.read_file
+        monkeypatch.setattr(tiktoken.load, "read_file", downloads.append)
+        monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path / "missing-cache"))
+        monkeypatch.setattr(module, "_ENCODINGS", {})
+        monkeypatch.setattr(module, "_bundled_tokenizer_dir", lambda: None)
+
+        assert load_local_encoding("r50k_base") is None
+        assert load_local_encoding("unknown_base") is None
+        assert downloads == []
+        monkeypatch.undo()
+        assert tiktoken.load.read_file is original_read_file
+
+    def test_loads_encoding_file_from_cache_dir(self, o200k, monkeypatch, tmp_path):
+        """<encoding>.tiktoken files are built into an Encoding without tiktoken's loader."""
+        import tiktoken.load
+
+        bundled = module._find_bpe_file(O200K_URL, None)
+        (tmp_path / "o200k_base.tiktoken").write_bytes(bundled.read_bytes())
+        monkeypatch.setattr(module, "_ENCODINGS", {})
+        monkeypatch.setattr(module, "_bundled_tokenizer_dir", lambda: None)
+        monkeypatch.setattr(tiktoken.load, "read_file_cached", None)  # Must not be used
+
+        encoding = load_local_encoding("o200k_base", str(tmp_path))
+
+        assert encoding.encode_ordinary("Hello tokenizer") == o200k.encode_ordinary(
+            "Hello tokenizer"
+        )
+        assert encoding.n_vocab == o200k.n_vocab
+
+    def test_definitions_come_from_tiktoken(self, o200k, monkeypatch):
+        """Encodings building on others (o200k_harmony) load locally as well."""
+        import tiktoken.load
+        from tiktoken_ext import openai_public
+
+        monkeypatch.setattr(module, "_ENCODINGS", {})
+        monkeypatch.setattr(tiktoken.load, "read_file_cached", None)  # Must not be used
+
+        harmony = load_local_encoding("o200k_harmony")
+
+        assert harmony.encode_ordinary("Hello") == o200k.encode_ordinary("Hello")
+        assert harmony.n_vocab > o200k.n_vocab
+        assert openai_public.load_tiktoken_bpe is tiktoken.load.load_tiktoken_bpe
+
+    def test_corrupt_encoding_file_falls_back(self, monkeypatch, tmp_path):
+        (tmp_path / "cl100k_base.tiktoken").write_bytes(b"SGVsbG8= 0\n")
+        monkeypatch.setattr(module, "_ENCODINGS", {})
+        monkeypatch.setattr(module, "_bundled_tokenizer_dir", lambda: None)
+        monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path / "missing-cache"))
+
+        assert load_local_encoding("cl100k_base", str(tmp_path)) is None
+
+    def test_factory_falls_back_to_heuristic(self, llm_config, monkeypatch):
+        monkeypatch.setattr(module, "load_local_encoding", lambda name, cache_dir=None: None)
+
+        estimator = create_token_estimator(llm_config(), "main")
+
+        assert isinstance(estimator, HeuristicTokenEstimator)
+
+    def test_disabled_tokenizer(self, llm_config):
+        estimator = create_token_estimator(llm_config({"enabled": False}), "main")
+
+        assert estimator.name == "heuristic"
+
+    def test_alias_resolution(self, llm_config, o200k):
+        estimator = create_token_estimator(llm_config(), "main")
+
+        assert estimator.name == "tiktoken:o200k_base"
+
+    def test_alias_override(self, llm_config, monkeypatch):
+        loaded = []
+        monkeypatch.setattr(
+            module, "load_local_encoding", lambda name, cache_dir=None: loaded.append(name)
+        )
+
+        create_token_estimator(llm_config({"encodings": {"custom": "cl100k_base"}}), "custom")
+
+        assert loaded == ["cl100k_base"]
+
+
+class TestTiktokenEstimator:
+    """Tests for the tokenizer-backed estimator."""
+
+    def test_counts_match_encoding(self, o200k):
+        estimator = TiktokenEstimator(o200k)
+        text = "Bitte fasse die Dokumente zusammen: {\"ids\": [1, 2, 3]}"
+
+        assert estimator.count_tokens(text) == len(o200k.encode_ordinary(text))
+        assert estimator.count_tokens("") == 0
+
+    def test_special_tokens_counted_as_text(self, o200k):
+        estimator = TiktokenEstimator(o200k)
+
+        assert estimator.count_tokens("<|endoftext|>") > 1
+
+    def test_lru_cache(self, o200k):
+        estimator = TiktokenEstimator(o200k, cache_size=2)
+
+        estimator.count_tokens("a")
+        estimator.count_tokens("a")
+        estimator.count_tokens("b")
+        estimator.count_tokens("c")
+
+        assert estimator.stats["hits"] == 1
+        assert estimator.stats["misses"] == 3
+        assert estimator.stats["size"] == 2
+
+    def test_budgeter_uses_estimator(self, o200k):
+        budgeter = TokenBudgeter(estimator=TiktokenEstimator(o200k))
+        messages = [{"role": "user", "content": "Hallo Welt"}]
+
+        expected = (
+            TokenBudgeter.SYSTEM_PROMPT_OVERHEAD_TOKENS
+            + TokenBudgeter.MESSAGE_OVERHEAD_TOKENS
+            + len(o200k.encode_ordinary("Hallo Welt"))
+        )
+        assert budgeter.estimate_tokens(messages) == expected
+
+
+@pytest.mark.skipif(not TRACES_PATH.exists(), reason="no recorded traces")
+def test_tokenizer_more_accurate_than_heuristic(o200k):
+    """Tokenizer estimates are closer to the recorded prompt_tokens."""
+    traces = [r for r in iter_traces(TRACES_PATH) if r.get("usage", {}).get("prompt_tokens")]
+    if not traces:
+        pytest.skip("no traces with usage data")
+
+    def mean_error(estimator) -> float:
+        budgeter = TokenBudgeter(estimator=estimator)
+        return sum(
+            abs(budgeter.estimate_tokens(r["messages"]) - r["usage"]["prompt_tokens"])
+            / r["usage"]["prompt_tokens"]
+            for r in traces
+        ) / len(traces)
+
+    assert mean_error(TiktokenEstimator(o200k)) < mean_error(HeuristicTokenEstimator())
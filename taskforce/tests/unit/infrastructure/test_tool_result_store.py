@@ -7,6 +7,7 @@ Tests cover:
 - Preview creation
 - Session cleanup
 - Storage statistics
+- Content-addressed, compressed storage with reference counting
 """
 
 import json
@@ -306,3 +307,151 @@ async def test_error_result_storage(store):
     assert fetched["success"] is False
     assert fetched["error"] == "Tool execution failed"
 
+
+
+@pytest.fixture
+async def ca_store():
+    """Create a temporary content-addressed FileToolResultStore."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield FileToolResultStore(store_dir=tmpdir, content_addressed=True)
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_round_trip(ca_store):
+    """Test that results come back unchanged from compressed blobs."""
+    result = {"success": True, "output": "Ünïcode " * 50, "data": {"b": 1, "a": [1, 2]}}
+
+    handle = await ca_store.put("test_tool", result, "session_1")
+    fetched = await ca_store.fetch(handle)
+
+    assert fetched == result
+    assert "content_hash" in handle.metadata
+    assert not (Path(ca_store.store_dir) / "results" / f"{handle.id}.json").exists()
+    assert list(Path(ca_store.store_dir).glob("blobs/*/*.json.gz"))
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_deduplicates_identical_payloads(ca_store):
+    """Test that identical results are stored once, independent of key order."""
+    first = await ca_store.put("tool", {"success": True, "output": "x" * 5000}, "s1")
+    second = await ca_store.put("tool", {"output": "x" * 5000, "success": True}, "s2")
+
+    assert first.id != second.id
+    assert first.metadata["content_hash"] == second.metadata["content_hash"]
+
+    stats = await ca_store.get_stats()
+    assert stats["total_results"] == 2
+    assert stats["unique_blobs"] == 1
+    assert stats["dedup_hits"] == 1
+    assert stats["logical_bytes"] == first.size_bytes + second.size_bytes
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_delete_is_reference_counted(ca_store):
+    """Test that a shared blob survives until its last handle is deleted."""
+    result = {"success": True, "output": "shared"}
+    first = await ca_store.put("tool", result, "s1")
+    second = await ca_store.put("tool", result, "s2")
+
+    assert await ca_store.delete(first) is True
+    assert await ca_store.fetch(first) is None
+    assert await ca_store.fetch(second) == result
+
+    assert await ca_store.delete(second) is True
+    assert not list(Path(ca_store.store_dir).glob("blobs/*/*"))
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_keeps_blob_with_unknown_refs(ca_store):
+    """Test that a blob without a reference count is never removed."""
+    result = {"success": True, "output": "shared"}
+    first = await ca_store.put("tool", result, "s1")
+    second = await ca_store.put("tool", result, "s2")
+    (refs_path,) = Path(ca_store.store_dir).glob("blobs/*/*.refs")
+    refs_path.unlink()  # e.g. lost in a crash
+
+    assert await ca_store.delete(first) is True
+    assert await ca_store.fetch(second) == result
+
+    third = await ca_store.put("tool", result, "s3")
+    assert await ca_store.delete(third) is True
+    assert await ca_store.fetch(second) == result
+
+
+@pytest.mark.asyncio
+async def test_put_does_not_mutate_caller_metadata(store, ca_store):
+    """Test that put copies the metadata passed by the caller."""
+    metadata = {"step": 1}
+
+    for result_store in (store, ca_store):
+        handle = await result_store.put("tool", {"success": True}, "s1", metadata)
+        assert handle.metadata["session_id"] == "s1"
+
+    assert metadata == {"step": 1}
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_cleanup_session(ca_store):
+    """Test session cleanup keeps blobs still referenced by other sessions."""
+    result = {"success": True, "output": "document"}
+    await ca_store.put("tool", result, "session_1")
+    await ca_store.put("tool", {"success": True, "output": "other"}, "session_1")
+    kept = await ca_store.put("tool", result, "session_2")
+
+    assert await ca_store.cleanup_session("session_1") == 2
+
+    assert await ca_store.fetch(kept) == result
+    stats = await ca_store.get_stats()
+    assert stats["total_results"] == 1
+    assert stats["unique_blobs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_reduces_writes_and_footprint():
+    """Test repeated large results against the plain layout."""
+    result = {
+        "success": True,
+        "output": "\n".join(f"line {i}: lorem ipsum dolor sit amet" for i in range(2000)),
+    }
+
+    with tempfile.TemporaryDirectory() as plain_dir, tempfile.TemporaryDirectory() as ca_dir:
+        plain = FileToolResultStore(store_dir=plain_dir)
+        content_addressed = FileToolResultStore(store_dir=ca_dir, content_addressed=True)
+        for i in range(5):
+            await plain.put("file_read", result, f"session_{i}")
+            await content_addressed.put("file_read", result, f"session_{i}")
+
+        plain_stats = await plain.get_stats()
+        ca_stats = await content_addressed.get_stats()
+
+    # One compressed blob plus five compact handles
+    assert ca_stats["unique_blobs"] == 1
+    assert ca_stats["dedup_hits"] == 4
+    assert plain_stats["dedup_hits"] == 0
+    assert ca_stats["bytes_written"] * 10 < plain_stats["bytes_written"]
+    assert ca_stats["total_bytes"] * 10 < plain_stats["total_bytes"]
+    assert ca_stats["logical_bytes"] < plain_stats["logical_bytes"]  # Compact JSON
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_store_reads_plain_results():
+    """Test that switching a store to content addressing keeps old results readable."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = FileToolResultStore(store_dir=tmpdir)
+        handle = await plain.put("tool", {"success": True, "output": "old"}, "s1")
+
+        content_addressed = FileToolResultStore(store_dir=tmpdir, content_addressed=True)
+
+        assert await content_addressed.fetch(handle) == {"success": True, "output": "old"}
+        assert await content_addressed.delete(handle) is True
+
+
+@pytest.mark.asyncio
+async def test_list_handles(store):
+    """Test listing stored handles, optionally per session."""
+    first = await store.put("tool", {"success": True, "output": "a"}, "session_1")
+    await store.put("tool", {"success": True, "output": "b"}, "session_2")
+    third = await store.put("tool", {"success": True, "output": "c"}, "session_1")
+
+    assert len(await store.list_handles()) == 3
+    assert [h.id for h in await store.list_handles("session_1")] == [first.id, third.id]
@@ -0,0 +1,140 @@
+"""
+Unit tests for the delta-encoded trace format.
+
+Tests copy spans, blob references, conversation matching, rotation-safe
+reading and compatibility with full (legacy) trace records.
+"""
+
+import json
+
+from taskforce.infrastructure.llm.trace_format import (
+    TraceDeltaEncoder,
+    iter_traces,
+    trace_files,
+)
+
+SYSTEM = {"role": "system", "content": "You are a helpful agent. " * 40}
+
+
+def write_records(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+
+
+def conversation(steps: int, mission: str = "Summarize the report"):
+    """Growing message lists of one mission, one per LLM call."""
+    messages = [SYSTEM, {"role": "user", "content": mission}]
+    calls = []
+    for step in range(steps):
+        calls.append(list(messages))
+        messages.append({"role": "assistant", "content": None, "tool_calls": [{"id": f"c{step}"}]})
+        messages.append({"role": "tool", "tool_call_id": f"c{step}", "content": f"{step} " * 400})
+    return calls
+
+
+class TestTraceDeltaEncoder:
+    """Tests for encoding full records into delta records."""
+
+    def test_follow_up_call_copies_previous_messages(self):
+        encoder = TraceDeltaEncoder()
+        calls = conversation(3)
+
+        first = encoder.encode({"messages": calls[0], "response": "a"})
+        second = encoder.encode({"messages": calls[1], "response": "b"})
+
+        assert second["conversation"] == first["conversation"]
+        assert second["messages_delta"][0] == {"$copy": [0, 2]}
+        assert len(second["messages_delta"]) == 3
+        assert "messages" not in second
+        assert second["response"] == "b"
+
+    def test_large_content_written_once(self):
+        encoder = TraceDeltaEncoder(blob_min_chars=100)
+        messages = [{"role": "user", "content": "q"}]
+
+        first = encoder.encode({"messages": [SYSTEM, *messages]})
+        changed = {"role": "system", "content": SYSTEM["content"] + "x"}
+        encoder.encode({"messages": [changed, *messages]})
+        third = encoder.encode({"messages": [SYSTEM, *messages, {"role": "user", "content": "r"}]})
+
+        assert len(first["blobs"]) == 1
+        assert "blobs" not in third
+        assert third["messages_delta"][0]["content"] == {"$blob": next(iter(first["blobs"]))}
+
+    def test_interleaved_conversations_are_kept_apart(self):
+        encoder = TraceDeltaEncoder()
+        first_calls = conversation(3, mission="Mission A")
+        second_calls = conversation(3, mission="Mission B")
+
+        ids = set()
+        for call_a, call_b in zip(first_calls, second_calls, strict=True):
+            a = encoder.encode({"messages": call_a})
+            b = encoder.encode({"messages": call_b})
+            ids.update((a["conversation"], b["conversation"]))
+            if len(call_a) > 2:
+                assert a["messages_delta"][0]["$copy"][1] == len(call_a) - 2
+
+        assert len(ids) == 2
+
+    def test_reset_forgets_state(self):
+        encoder = TraceDeltaEncoder()
+        calls = conversation(2)
+        first = encoder.encode({"messages": calls[0]})
+        encoder.reset()
+
+        second = encoder.encode({"messages": calls[1]})
+
+        assert second["conversation"] != first["conversation"]
+        assert "blobs" in second
+
+    def test_record_without_messages_unchanged(self):
+        record = {"model": "gpt-4.1", "response": "ok"}
+
+        assert TraceDeltaEncoder().encode(record) is record
+
+
+class TestIterTraces:
+    """Tests for rebuilding full records."""
+
+    def test_round_trip_rebuilds_full_prompts(self, tmp_path):
+        encoder = TraceDeltaEncoder()
+        calls = conversation(10)
+        path = tmp_path / "traces.jsonl"
+        write_records(path, [encoder.encode({"messages": call, "step": i}) for i, call in enumerate(calls)])
+
+        records = list(iter_traces(path))
+
+        assert [record["messages"] for record in records] == calls
+        assert [record["step"] for record in records] == list(range(10))
+
+    def test_delta_is_an_order_of_magnitude_smaller(self, tmp_path):
+        encoder = TraceDeltaEncoder()
+        calls = conversation(40)
+        full_path = tmp_path / "full.jsonl"
+        delta_path = tmp_path / "delta.jsonl"
+        write_records(full_path, [{"messages": call} for call in calls])
+        write_records(delta_path, [encoder.encode({"messages": call}) for call in calls])
+
+        assert full_path.stat().st_size > 10 * delta_path.stat().st_size
+
+    def test_reads_legacy_full_records(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        legacy = {"messages": [{"role": "user", "content": "hi"}], "response": "hello"}
+        write_records(path, [legacy])
+
+        assert list(iter_traces(path)) == [legacy]
+
+    def test_references_resolved_across_rotated_files(self, tmp_path):
+        encoder = TraceDeltaEncoder()
+        calls = conversation(4)
+        path = tmp_path / "traces.jsonl"
+        encoded = [encoder.encode({"messages": call}) for call in calls]
+        write_records(tmp_path / "traces.jsonl.2", encoded[:1])
+        write_records(tmp_path / "traces.jsonl.1", encoded[1:3])
+        write_records(path, encoded[3:])
+
+        assert trace_files(path) == [
+            tmp_path / "traces.jsonl.2",
+            tmp_path / "traces.jsonl.1",
+            path,
+        ]
+        assert [record["messages"] for record in iter_traces(path)] == calls
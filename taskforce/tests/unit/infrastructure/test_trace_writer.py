@@ -0,0 +1,267 @@
+"""
+Unit tests for the batched TraceWriter.
+
+Tests batching by size and time, snapshot-on-submit, overflow policies,
+size-based rotation, shared writers per path, clean shutdown and that delta
+records stay decodable across rotations and failed writes.
+"""
+
+import asyncio
+
+import pytest
+
+from taskforce.infrastructure.llm.trace_format import iter_traces, trace_files
+from taskforce.infrastructure.llm.trace_writer import (
+    TraceWriter,
+    TraceWriterConfig,
+    close_trace_writers,
+    get_trace_writer,
+)
+
+
+def read_records(path):
+    return list(iter_traces(path, include_rotated=False))
+
+
+@pytest.mark.asyncio
+async def test_writes_records_in_batches(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(TraceWriterConfig(path=str(path), batch_size=10))
+
+    for index in range(25):
+        await writer.write({"index": index})
+    await writer.close()
+
+    assert [record["index"] for record in read_records(path)] == list(range(25))
+    assert writer.stats["written"] == 25
+    assert writer.stats["batches"] == 3
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_written_after_flush_interval(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), batch_size=100, flush_interval_seconds=0.05)
+    )
+
+    await writer.write({"index": 0})
+    await asyncio.sleep(0.2)
+
+    assert read_records(path) == [{"index": 0}]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_without_waiting_for_interval(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), batch_size=100, flush_interval_seconds=60)
+    )
+
+    await writer.write({"index": 0})
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    assert read_records(path) == [{"index": 0}]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_record_is_snapshotted_on_write(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(TraceWriterConfig(path=str(path)))
+    messages = [{"role": "user", "content": "hi"}]
+
+    await writer.write({"messages": messages})
+    messages.append({"role": "assistant", "content": "later"})
+    await writer.close()
+
+    assert read_records(path)[0]["messages"] == [{"role": "user", "content": "hi"}]
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_discards_when_queue_full(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), max_queue_size=3, overflow="drop")
+    )
+
+    # No await point between writes: the drain task cannot run
+    results = [await writer.write({"index": index}) for index in range(5)]
+    await writer.close()
+
+    assert results == [True, True, True, False, False]
+    assert writer.stats["dropped"] == 2
+    assert len(read_records(path)) == 3
+
+
+@pytest.mark.asyncio
+async def test_sample_policy_keeps_every_nth_under_pressure(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), max_queue_size=100, overflow="sample", sample_every=5)
+    )
+
+    for index in range(100):
+        await writer.write({"index": index})
+    await writer.close()
+
+    # 50 records until half full, then 1 of 5 of the remaining 50
+    assert len(read_records(path)) == 60
+    assert writer.stats["dropped"] == 40
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), max_queue_size=2, batch_size=2, overflow="block")
+    )
+
+    for index in range(10):
+        await writer.write({"index": index})
+    await writer.close()
+
+    assert len(read_records(path)) == 10
+    assert writer.stats["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rotates_by_size(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), batch_size=1, max_bytes=100, backup_count=2)
+    )
+
+    for index in range(10):
+        await writer.write({"index": index, "payload": "x" * 60})
+    await writer.close()
+
+    assert writer.stats["rotations"] >= 2
+    assert (tmp_path / "traces.jsonl.1").exists()
+    assert (tmp_path / "traces.jsonl.2").exists()
+    assert not (tmp_path / "traces.jsonl.3").exists()
+
+
+@pytest.mark.asyncio
+async def test_writers_are_shared_per_path(tmp_path):
+    path = str(tmp_path / "traces.jsonl")
+
+    first = get_trace_writer(TraceWriterConfig(path=path))
+    second = get_trace_writer(TraceWriterConfig(path=path))
+    await first.write({"index": 0})
+    await close_trace_writers()
+
+    assert first is second
+    assert read_records(tmp_path / "traces.jsonl") == [{"index": 0}]
+    assert get_trace_writer(TraceWriterConfig(path=path)) is not first
+
+
+def test_invalid_overflow_policy_rejected():
+    with pytest.raises(ValueError):
+        TraceWriterConfig(overflow="ignore")
+
+
+def test_config_from_file_config():
+    config = TraceWriterConfig.from_file_config(
+        {"path": "t.jsonl", "batch_size": 5, "overflow": "drop", "max_bytes": 0}
+    )
+
+    assert config.path == "t.jsonl"
+    assert config.batch_size == 5
+    assert config.overflow == "drop"
+    assert config.max_bytes == 0
+    assert config.flush_interval_seconds == 1.0
+    assert config.format == "delta"
+
+
+@pytest.mark.asyncio
+async def test_delta_format_shrinks_growing_conversation(tmp_path):
+    delta_path = tmp_path / "delta.jsonl"
+    full_path = tmp_path / "full.jsonl"
+    delta = TraceWriter(TraceWriterConfig(path=str(delta_path)))
+    full = TraceWriter(TraceWriterConfig(path=str(full_path), format="full"))
+    messages = [{"role": "user", "content": "Analyze the corpus"}]
+
+    for step in range(20):
+        record = {"messages": [{"role": "system", "content": f"Plan step {step}"}, *messages]}
+        await delta.write(record)
+        await full.write(record)
+        messages.append({"role": "tool", "tool_call_id": f"c{step}", "content": "x" * 2000})
+    await delta.close()
+    await full.close()
+
+    assert full_path.stat().st_size > 8 * delta_path.stat().st_size
+    assert [record["messages"] for record in read_records(delta_path)] == [
+        record["messages"] for record in read_records(full_path)
+    ]
+
+
+def conversation_records(steps: int) -> list[dict]:
+    """Trace records of one growing conversation (tagged with their step)."""
+    messages = [{"role": "user", "content": "Analyze the corpus"}]
+    records = []
+    for step in range(steps):
+        records.append({"step": step, "messages": list(messages)})
+        messages.append({"role": "tool", "tool_call_id": f"c{step}", "content": f"out {step}"})
+    return records
+
+
+@pytest.mark.asyncio
+async def test_each_rotated_file_decodes_on_its_own(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(
+        TraceWriterConfig(path=str(path), batch_size=1, max_bytes=300, backup_count=20)
+    )
+    records = conversation_records(12)
+
+    # Queued before any of them is written: encoding must not happen on submit
+    for record in records:
+        await writer.write(record)
+    await writer.close()
+
+    assert writer.stats["rotations"] >= 2
+    decoded = [
+        record
+        for file_path in trace_files(path)
+        for record in iter_traces(file_path, include_rotated=False)
+    ]
+    assert [record["messages"] for record in decoded] == [
+        record["messages"] for record in records
+    ]
+
+
+class FailingOnce:
+    """File handle whose first write raises."""
+
+    def __init__(self, file):
+        self.file = file
+        self.failed = False
+
+    def write(self, data):
+        if not self.failed:
+            self.failed = True
+            raise OSError("disk full")
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+
+@pytest.mark.asyncio
+async def test_failed_write_resets_delta_encoder(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    writer = TraceWriter(TraceWriterConfig(path=str(path)))
+    first, lost, last = conversation_records(3)
+
+    await writer.write(first)
+    await writer.flush()
+    writer._file = FailingOnce(writer._file)
+    await writer.write(lost)
+    await writer.flush()
+    await writer.write(last)
+    await writer.close()
+
+    assert [record["messages"] for record in read_records(path)] == [
+        first["messages"],
+        last["messages"],
+    ]
@@ -4,11 +4,14 @@ Unit tests for MCP Client
 Tests MCPClient connection management and tool execution with mocked MCP sessions.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
 
-from taskforce.infrastructure.tools.mcp.client import MCPClient
+from taskforce.infrastructure.tools.mcp.client import MCPClient, MCPConnection
 
 
 class TestMCPClient:
@@ -183,3 +186,86 @@ class TestMCPClient:
         # Verify initialization was called
         mock_session.initialize.assert_called_once()
 
+
+class TestMCPConnection:
+    """Test suite for MCPConnection."""
+
+    @staticmethod
+    def _context(session, tasks: list):
+        """Client context with an anyio task group, like stdio_client/sse_client."""
+
+        @asynccontextmanager
+        async def context():
+            async with anyio.create_task_group():
+                tasks.append(("enter", asyncio.current_task()))
+                try:
+                    yield MCPClient(session, MagicMock(), MagicMock())
+                finally:
+                    tasks.append(("exit", asyncio.current_task()))
+
+        return context()
+
+    @pytest.mark.asyncio
+    async def test_closes_in_owner_task_when_closed_from_another_task(self):
+        """Context is entered and exited in the same task, whoever closes it."""
+        tasks: list = []
+        connection = MCPConnection(self._context(AsyncMock(), tasks))
+
+        client = await asyncio.create_task(connection.__aenter__())
+        assert isinstance(client, MCPClient)
+        assert connection.is_open
+
+        await asyncio.create_task(connection.__aexit__(None, None, None))
+
+        assert [event for event, _ in tasks] == ["enter", "exit"]
+        assert tasks[0][1] is tasks[1][1]
+        assert tasks[0][1] is not asyncio.current_task()
+        assert not connection.is_open
+
+    @pytest.mark.asyncio
+    async def test_open_failure_is_raised(self):
+        """Errors while connecting propagate from __aenter__."""
+
+        @asynccontextmanager
+        async def failing():
+            raise ConnectionError("server not found")
+            yield
+
+        connection = MCPConnection(failing())
+
+        with pytest.raises(ConnectionError, match="server not found"):
+            await connection.__aenter__()
+        assert not connection.is_open
+
+    @pytest.mark.asyncio
+    async def test_is_healthy_pings_server(self):
+        """Healthy while the server answers pings, unhealthy once it stops."""
+        session = AsyncMock()
+        connection = MCPConnection(self._context(session, []), ping_timeout=0.1)
+        await connection.__aenter__()
+
+        assert await connection.is_healthy()
+        session.send_ping.assert_awaited_once()
+
+        session.send_ping.side_effect = ConnectionError("broken pipe")
+        assert not await connection.is_healthy()
+
+        await connection.__aexit__(None, None, None)
+        session.send_ping.side_effect = None
+        assert not await connection.is_healthy()
+
+    @pytest.mark.asyncio
+    async def test_is_healthy_times_out(self):
+        """A server that does not answer within ping_timeout is unhealthy."""
+
+        async def no_answer():
+            await asyncio.sleep(10)
+
+        session = AsyncMock()
+        session.send_ping.side_effect = no_answer
+        connection = MCPConnection(self._context(session, []), ping_timeout=0.01)
+        await connection.__aenter__()
+
+        assert not await connection.is_healthy()
+
+        await connection.__aexit__(None, None, None)